@@ -0,0 +1,47 @@
+"""체형 분석 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 배치 체형 분석 요청당 최대 이미지 수
+BODY_ANALYSIS_BATCH_MAX_FILES = int(os.getenv("BODY_ANALYSIS_BATCH_MAX_FILES", "16"))
+
+# 배치 분석 시 동시에 보내는 포즈 랜드마크 추출 요청 수
+BODY_ANALYSIS_BATCH_CONCURRENCY = int(os.getenv("BODY_ANALYSIS_BATCH_CONCURRENCY", "4"))
+
+# 방향 보정: 랜드마크 좌표 회전으로 처리하고, 핵심 랜드마크 평균 visibility가
+# 이 값보다 낮을 때만 이미지를 회전해 포즈 추론을 다시 수행
+BODY_ORIENTATION_MIN_VISIBILITY = float(os.getenv("BODY_ORIENTATION_MIN_VISIBILITY", "0.5"))
+
+# 체형별 정의(body_type_definitions) 메모리 캐시 TTL (초) - 관리자 수정 시 즉시 갱신
+BODY_DEFINITIONS_CACHE_TTL_SEC = int(os.getenv("BODY_DEFINITIONS_CACHE_TTL_SEC", "600"))
+
+# 동일 이미지 결과 캐시 사용 여부
+BODY_RESULT_CACHE_ENABLED = os.getenv("BODY_RESULT_CACHE_ENABLED", "true").lower() == "true"
+
+# 1단계 캐시: 이미지 해시 -> 포즈 랜드마크 / 측정값 (키·몸무게만 바꿔 다시 분석할 때 재사용)
+BODY_POSE_CACHE_SIZE = int(os.getenv("BODY_POSE_CACHE_SIZE", "256"))
+BODY_POSE_CACHE_TTL_SEC = int(os.getenv("BODY_POSE_CACHE_TTL_SEC", "3600"))
+
+# 2단계 캐시: 이미지 해시 + 키 + 몸무게 -> 최종 분석 결과 (같은 요청 반복 시 즉시 응답)
+BODY_RESULT_CACHE_SIZE = int(os.getenv("BODY_RESULT_CACHE_SIZE", "512"))
+BODY_RESULT_CACHE_TTL_SEC = int(os.getenv("BODY_RESULT_CACHE_TTL_SEC", "1800"))
+
+# Gemini 체형 분석 문구 버킷 캐시 사용 여부
+# 프롬프트 입력(체형 타입, 비율, 키, BMI)을 구간으로 묶어 같은 구간이면 생성된 문구를 재사용
+# (이미지 관찰 내용은 구간 안에서 공유되므로 기본 비활성)
+BODY_GEMINI_CACHE_ENABLED = os.getenv("BODY_GEMINI_CACHE_ENABLED", "false").lower() == "true"
+
+# 버킷당 보관할 문구 변형 수 (채워질 때까지는 새로 생성, 이후 무작위 선택)
+BODY_GEMINI_CACHE_VARIANTS = int(os.getenv("BODY_GEMINI_CACHE_VARIANTS", "3"))
+
+# 최대 버킷 수 / 버킷 TTL (초)
+BODY_GEMINI_CACHE_MAX_BUCKETS = int(os.getenv("BODY_GEMINI_CACHE_MAX_BUCKETS", "2000"))
+BODY_GEMINI_CACHE_TTL_SEC = int(os.getenv("BODY_GEMINI_CACHE_TTL_SEC", "86400"))
+
+# 구간 크기: 측정 비율 / 키 (cm) / BMI
+BODY_GEMINI_RATIO_STEP = float(os.getenv("BODY_GEMINI_RATIO_STEP", "0.05"))
+BODY_GEMINI_HEIGHT_BAND_CM = float(os.getenv("BODY_GEMINI_HEIGHT_BAND_CM", "5"))
+BODY_GEMINI_BMI_BAND = float(os.getenv("BODY_GEMINI_BMI_BAND", "1.0"))
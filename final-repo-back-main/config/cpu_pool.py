@@ -0,0 +1,29 @@
+"""CPU 작업 전용 프로세스 풀 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 프로세스 풀 사용 여부 (false면 기본 스레드 풀에서 실행)
+CPU_POOL_ENABLED = os.getenv("CPU_POOL_ENABLED", "true").lower() == "true"
+
+# 워커 프로세스 수 (0이면 CPU 코어 수 - 1, 최소 1). uvicorn/gunicorn 워커마다 별도 풀이 생김
+CPU_POOL_WORKERS = int(os.getenv("CPU_POOL_WORKERS", "0")) or max(1, (os.cpu_count() or 2) - 1)
+
+# 프로세스 시작 방식 (spawn | forkserver | fork). 모델/스레드가 올라간 프로세스를 fork하지 않도록 기본 spawn
+CPU_POOL_START_METHOD = os.getenv("CPU_POOL_START_METHOD", "spawn")
+
+# 작업별 기본 타임아웃 (초)
+CPU_POOL_TASK_TIMEOUT_SEC = float(os.getenv("CPU_POOL_TASK_TIMEOUT_SEC", "60"))
+
+# 이 크기(KB) 이상인 이미지 배열 / 바이트는 pickle 대신 공유 메모리로 전달
+CPU_POOL_SHM_MIN_KB = int(os.getenv("CPU_POOL_SHM_MIN_KB", "256"))
+
+# 워커 시작 시 미리 import할 모듈 (쉼표 구분, 첫 작업의 import 지연 제거)
+CPU_POOL_PRELOAD_MODULES = [
+    module.strip() for module in os.getenv(
+        "CPU_POOL_PRELOAD_MODULES",
+        "core.image_codec,services.image_service,services.image_filter_service,services.fitting_masks"
+    ).split(",") if module.strip()
+]
@@ -0,0 +1,33 @@
+"""얼굴 분석 / 페이스스왑 백엔드 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 얼굴 분석 백엔드: "remote" (HF Inference Endpoint InsightFace), "local" (ONNX Runtime CPU)
+FACE_BACKEND = os.getenv("FACE_BACKEND", "remote").lower()
+
+# 로컬 백엔드 로딩/추론 실패 시 원격 엔드포인트로 폴백 (INSIGHTFACE_ENDPOINT_URL 설정 시)
+FACE_FALLBACK_TO_REMOTE = os.getenv("FACE_FALLBACK_TO_REMOTE", "true").lower() == "true"
+
+# FACE_BACKEND=remote일 때 원격 엔드포인트가 콜드 스타트 중(upstream warmer "warming")이면 로컬 백엔드 사용
+# 로컬 백엔드가 폴백일 때는 warming 중인 원격 호출을 건너뜀
+FACE_LOCAL_WHEN_REMOTE_WARMING = os.getenv("FACE_LOCAL_WHEN_REMOTE_WARMING", "true").lower() == "true"
+
+# 로컬 ONNX 모델 경로 (InsightFace buffalo_l 패키지의 SCRFD / ArcFace, inswapper_128)
+FACE_DETECTOR_MODEL_PATH = os.getenv("FACE_DETECTOR_MODEL_PATH", "models/insightface/det_10g.onnx")
+FACE_RECOGNIZER_MODEL_PATH = os.getenv("FACE_RECOGNIZER_MODEL_PATH", "models/insightface/w600k_r50.onnx")
+FACE_SWAPPER_MODEL_PATH = os.getenv("FACE_SWAPPER_MODEL_PATH", "models/insightface/inswapper_128.onnx")
+
+# INSwapper 임베딩 변환 행렬(emap) .npy 경로 (없으면 onnx 패키지로 모델에서 추출)
+FACE_SWAPPER_EMAP_PATH = os.getenv("FACE_SWAPPER_EMAP_PATH", "models/insightface/inswapper_128_emap.npy")
+
+# SCRFD 입력 크기 / 감지 임계값 / NMS 임계값
+FACE_DETECTION_SIZE = int(os.getenv("FACE_DETECTION_SIZE", "640"))
+FACE_DETECTION_THRESHOLD = float(os.getenv("FACE_DETECTION_THRESHOLD", "0.5"))
+FACE_NMS_THRESHOLD = float(os.getenv("FACE_NMS_THRESHOLD", "0.4"))
+
+# 얼굴 감지 + 임베딩 결과 캐시 (이미지 해시 키)
+FACE_EMBEDDING_CACHE_SIZE = int(os.getenv("FACE_EMBEDDING_CACHE_SIZE", "256"))
+FACE_EMBEDDING_CACHE_TTL_SEC = int(os.getenv("FACE_EMBEDDING_CACHE_TTL_SEC", "3600"))
@@ -0,0 +1,20 @@
+"""페이스스왑 템플릿 설정"""
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 템플릿 이미지 디렉토리
+FACE_TEMPLATE_DIR = Path(os.getenv(
+    "FACE_TEMPLATE_DIR",
+    str(Path(__file__).parent.parent / "templates" / "face_swap_templates")
+))
+
+# 서버 시작 시 템플릿 레지스트리 로드 (이미지 디코딩 + 템플릿 얼굴 감지)
+FACE_TEMPLATE_PRELOAD = os.getenv("FACE_TEMPLATE_PRELOAD", "true").lower() == "true"
+
+# 템플릿 얼굴 감지 실패 시 (얼굴 분석 엔드포인트 콜드 스타트 등) 재시도 간격 (초) / 최대 시도 횟수
+FACE_TEMPLATE_DETECT_RETRY_SEC = int(os.getenv("FACE_TEMPLATE_DETECT_RETRY_SEC", "30"))
+FACE_TEMPLATE_DETECT_MAX_ATTEMPTS = int(os.getenv("FACE_TEMPLATE_DETECT_MAX_ATTEMPTS", "5"))
@@ -23,3 +23,11 @@ BODY_MASK_IDS = [12, 13, 14, 15]  # left-leg, right-leg, left-arm, right-arm
 # 중립 색상 (base_img 생성용)
 NEUTRAL_COLOR = (128, 128, 128)
 
+# 파싱 작업 해상도 (긴 변 기준 픽셀 수, 0이면 원본 해상도로 파싱)
+SEGFORMER_WORKING_RESOLUTION = int(os.getenv("SEGFORMER_WORKING_RESOLUTION", "1024"))
+
+# 엣지 보존 마스크 업샘플링 (Guided Filter) 파라미터
+MASK_UPSAMPLE_RADIUS = int(os.getenv("MASK_UPSAMPLE_RADIUS", "4"))
+MASK_UPSAMPLE_EPS = float(os.getenv("MASK_UPSAMPLE_EPS", "0.001"))
+# 계수(a, b) 계산 시 마스크를 추가로 축소하는 배율 (Fast Guided Filter의 s, 1이면 마스크 해상도 그대로)
+MASK_UPSAMPLE_SUBSAMPLE = max(1, int(os.getenv("MASK_UPSAMPLE_SUBSAMPLE", "2")))
@@ -0,0 +1,29 @@
+"""카탈로그 이미지 계층 캐시 (메모리 → 디스크 → S3) 설정"""
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 계층 캐시 사용 여부 (false면 /api/images 등이 매 요청 S3에서 스트리밍)
+IMAGE_OBJECT_CACHE_ENABLED = os.getenv("IMAGE_OBJECT_CACHE_ENABLED", "true").lower() == "true"
+
+# 메모리 LRU 바이트 예산 (MB) / 메모리에 올릴 객체 최대 크기 (MB, 초과 객체는 디스크에만 저장)
+IMAGE_MEMORY_CACHE_MB = int(os.getenv("IMAGE_MEMORY_CACHE_MB", "256"))
+IMAGE_MEMORY_CACHE_MAX_ITEM_MB = int(os.getenv("IMAGE_MEMORY_CACHE_MAX_ITEM_MB", "16"))
+
+# 디스크 캐시 사용 여부 / 디렉토리 / 용량 상한 (MB)
+IMAGE_DISK_CACHE_ENABLED = os.getenv("IMAGE_DISK_CACHE_ENABLED", "true").lower() == "true"
+IMAGE_DISK_CACHE_DIR = Path(os.getenv(
+    "IMAGE_DISK_CACHE_DIR",
+    str(Path(__file__).parent.parent / ".cache" / "images")
+))
+# 용량 상한은 디렉토리 전체(모든 워커 합계) 기준
+IMAGE_DISK_CACHE_MB = int(os.getenv("IMAGE_DISK_CACHE_MB", "2048"))
+
+# 다른 워커가 쓴 파일까지 반영해 디스크 사용량을 다시 계산하는 간격 (초, 상한 초과 시에는 즉시)
+IMAGE_DISK_CACHE_RESCAN_SEC = float(os.getenv("IMAGE_DISK_CACHE_RESCAN_SEC", "30"))
+
+# 캐시 항목을 S3 ETag로 재검증하는 간격 (초). 다른 워커에서 덮어쓴 객체도 이 시간 안에 반영
+IMAGE_CACHE_REVALIDATE_SEC = int(os.getenv("IMAGE_CACHE_REVALIDATE_SEC", "300"))
@@ -0,0 +1,22 @@
+"""업로드 이미지 분류(인물/동물) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 로컬 CPU 이미지 분류기 사용 여부
+IMAGE_CLASSIFIER_ENABLED = os.getenv("IMAGE_CLASSIFIER_ENABLED", "true").lower() == "true"
+
+# ImageNet-1k ONNX 분류 모델 (MobileNetV3 등, 입력 224x224) / 클래스 이름 파일 (한 줄에 하나, 1000줄)
+IMAGE_CLASSIFIER_MODEL_PATH = os.getenv("IMAGE_CLASSIFIER_MODEL_PATH", "models/mobilenetv3_large_imagenet.onnx")
+IMAGE_CLASSIFIER_LABELS_PATH = os.getenv("IMAGE_CLASSIFIER_LABELS_PATH", "models/imagenet_labels.txt")
+
+# 동물 클래스(ImageNet 0~397번) 확률 합이 이 값 이상이면 동물 사진으로 차단
+IMAGE_CLASSIFIER_ANIMAL_THRESHOLD = float(os.getenv("IMAGE_CLASSIFIER_ANIMAL_THRESHOLD", "0.6"))
+
+# 사람/의상과 무관한 사물 클래스의 top-1 확률이 이 값 이상이면 인물 사진이 아닌 것으로 차단 (1 이상이면 비활성)
+IMAGE_CLASSIFIER_OBJECT_THRESHOLD = float(os.getenv("IMAGE_CLASSIFIER_OBJECT_THRESHOLD", "0.9"))
+
+# 분류 결과 반환 개수
+IMAGE_CLASSIFIER_TOP_K = int(os.getenv("IMAGE_CLASSIFIER_TOP_K", "5"))
@@ -0,0 +1,28 @@
+"""이미지 디코딩 / 인코딩(코덱) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 디코딩 전 헤더 기준 최대 픽셀 수 (압축 폭탄 차단, Pillow 전역 한도에도 적용)
+IMAGE_MAX_PIXELS = int(os.getenv("IMAGE_MAX_PIXELS", "50000000"))
+
+# 업로드 파일 최대 크기 (MB). 청크 단위로 읽다가 초과하면 중단
+IMAGE_MAX_UPLOAD_MB = int(os.getenv("IMAGE_MAX_UPLOAD_MB", "30"))
+
+# multipart 업로드 파일을 메모리에 둘 최대 크기 (KB). 초과하면 임시 파일로 스풀링
+IMAGE_UPLOAD_SPOOL_MAX_MEMORY_KB = int(os.getenv("IMAGE_UPLOAD_SPOOL_MAX_MEMORY_KB", "1024"))
+
+# 중간 결과 / 로그용 PNG 압축 레벨 (0~9, 낮을수록 빠르고 파일이 큼. Pillow 기본값 6)
+IMAGE_PNG_COMPRESS_LEVEL = int(os.getenv("IMAGE_PNG_COMPRESS_LEVEL", "1"))
+
+# 미리보기(원본 에코, 썸네일, 판별용 LLM 입력) 포맷 (jpeg | webp) / 품질
+IMAGE_PREVIEW_FORMAT = os.getenv("IMAGE_PREVIEW_FORMAT", "jpeg").lower()
+IMAGE_PREVIEW_QUALITY = int(os.getenv("IMAGE_PREVIEW_QUALITY", "85"))
+
+# 미리보기 최대 변 길이 (px). 더 크면 축소 디코딩 후 줄임
+IMAGE_PREVIEW_MAX_SIDE = int(os.getenv("IMAGE_PREVIEW_MAX_SIDE", "1024"))
+
+# 드레스 전처리(preprocess_dress_image, 1024 정사각형) 입력의 축소 디코딩 최대 변 길이 (px)
+IMAGE_GARMENT_MAX_SIDE = int(os.getenv("IMAGE_GARMENT_MAX_SIDE", "1024"))
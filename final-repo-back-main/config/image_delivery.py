@@ -0,0 +1,22 @@
+"""이미지 전달 방식 (프록시 / presigned URL 리다이렉트) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 전달 방식
+# - proxy: 워커가 S3 객체를 받아 전달 (기본, 카탈로그 이미지 계층 캐시 사용)
+# - redirect: 이미지 엔드포인트가 presigned S3 URL로 302 리다이렉트
+# - presigned: redirect + 목록 API가 presigned URL을 직접 반환
+# redirect / presigned는 브라우저가 S3에서 직접 받으므로 버킷 CORS 설정이 필요합니다.
+IMAGE_DELIVERY_MODE = os.getenv("IMAGE_DELIVERY_MODE", "proxy").lower()
+
+# presigned URL 유효 시간 (초)
+IMAGE_PRESIGNED_URL_EXPIRES_SEC = int(os.getenv("IMAGE_PRESIGNED_URL_EXPIRES_SEC", "900"))
+
+# 만료까지 이 시간(초)보다 적게 남은 URL은 재사용하지 않고 새로 서명
+IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC = int(os.getenv("IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC", "120"))
+
+# 생성한 presigned URL 캐시 최대 항목 수
+IMAGE_PRESIGNED_URL_CACHE_SIZE = int(os.getenv("IMAGE_PRESIGNED_URL_CACHE_SIZE", "10000"))
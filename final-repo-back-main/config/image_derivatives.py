@@ -0,0 +1,25 @@
+"""카탈로그 이미지 파생본(썸네일 / WebP / AVIF) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 허용 가로 크기 (px, 쉼표 구분). 목록 밖의 값은 거부 (파생본 캐시 키 수 제한)
+IMAGE_DERIVATIVE_WIDTHS = sorted(
+    int(width) for width in os.getenv("IMAGE_DERIVATIVE_WIDTHS", "200,400,800,1200").split(",") if width.strip()
+)
+
+# 허용 품질 값 (쉼표 구분) / 기본 품질
+IMAGE_DERIVATIVE_QUALITIES = sorted(
+    int(quality) for quality in os.getenv("IMAGE_DERIVATIVE_QUALITIES", "60,75,85").split(",") if quality.strip()
+)
+IMAGE_DERIVATIVE_DEFAULT_QUALITY = int(os.getenv("IMAGE_DERIVATIVE_DEFAULT_QUALITY", "75"))
+
+# 카탈로그 목록 썸네일 기본 가로 크기 (px)
+IMAGE_DERIVATIVE_THUMBNAIL_WIDTH = int(os.getenv("IMAGE_DERIVATIVE_THUMBNAIL_WIDTH", "400"))
+
+# 드레스 업로드 직후 미리 생성할 파생본 ("가로:포맷", 쉼표 구분)
+IMAGE_DERIVATIVE_EAGER = [
+    spec.strip() for spec in os.getenv("IMAGE_DERIVATIVE_EAGER", "200:webp,400:webp,400:jpeg").split(",") if spec.strip()
+]
@@ -0,0 +1,24 @@
+"""이미지 프록시 (HTTP 캐싱 / 스트리밍) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 외부 URL 프록시 허용 호스트 (쉼표 구분). S3 버킷 호스트(AWS_*, LOGS_AWS_*)는 자동으로 허용
+IMAGE_PROXY_ALLOWED_HOSTS = [
+    host.strip().lower() for host in os.getenv("IMAGE_PROXY_ALLOWED_HOSTS", "").split(",") if host.strip()
+]
+
+# 외부 URL 요청 타임아웃 (초) / 동시 연결 수 상한 (업스트림 fan-out 제한)
+IMAGE_PROXY_TIMEOUT_SEC = float(os.getenv("IMAGE_PROXY_TIMEOUT_SEC", "10"))
+IMAGE_PROXY_MAX_CONNECTIONS = int(os.getenv("IMAGE_PROXY_MAX_CONNECTIONS", "20"))
+
+# 스트리밍 청크 크기 (바이트)
+IMAGE_PROXY_CHUNK_SIZE = int(os.getenv("IMAGE_PROXY_CHUNK_SIZE", str(64 * 1024)))
+
+# 덮어쓸 수 있는 키(드레스 원본 등)의 브라우저/CDN 캐시 시간 (초, 이후 ETag로 재검증)
+IMAGE_CACHE_MAX_AGE_SEC = int(os.getenv("IMAGE_CACHE_MAX_AGE_SEC", "3600"))
+
+# 내용 주소 키(내용 해시 / 타임스탬프 로그 키)의 캐시 시간 (초, immutable)
+IMAGE_CACHE_IMMUTABLE_MAX_AGE_SEC = int(os.getenv("IMAGE_CACHE_IMMUTABLE_MAX_AGE_SEC", "31536000"))
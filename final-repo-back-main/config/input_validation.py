@@ -0,0 +1,75 @@
+"""업로드 이미지 입력 검증 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 업스트림(X.AI, Gemini, HF) 호출 전 로컬 입력 검증 사용 여부
+INPUT_VALIDATION_ENABLED = os.getenv("INPUT_VALIDATION_ENABLED", "true").lower() == "true"
+
+# 품질 검사(흐림/노출/균일도)용 축소 디코딩 최대 변 길이 (임계값은 이 크기 기준)
+INPUT_VALIDATION_ANALYSIS_SIZE = int(os.getenv("INPUT_VALIDATION_ANALYSIS_SIZE", "256"))
+
+# 디코딩 전 헤더 기준 최대 픽셀 수 (압축 폭탄 / 과대 이미지 차단)
+INPUT_VALIDATION_MAX_PIXELS = int(os.getenv("INPUT_VALIDATION_MAX_PIXELS", "50000000"))
+
+# 흐림 판정: 축소 회색조 이미지의 Laplacian 분산 최소값
+INPUT_VALIDATION_MIN_BLUR_VARIANCE = float(os.getenv("INPUT_VALIDATION_MIN_BLUR_VARIANCE", "20"))
+
+# 기본 규칙 (규칙 세트에서 덮어씀)
+# - min_side: 짧은 변 최소 픽셀
+# - max_aspect_ratio: 긴 변 / 짧은 변 최대값
+# - min_blur_variance: 흐림 판정 기준 (0이면 검사 안 함)
+# - min_brightness / max_brightness: 평균 밝기(0~255) 범위
+# - max_clipped_ratio: 거의 검정(≤5) 또는 거의 흰색(≥250) 픽셀 비율 최대값
+# - min_std: 밝기 표준편차 최소값 (빈 화면 / 단색 이미지 차단)
+# - min_std_scope: 표준편차 측정 범위 (global: 이미지 전체, tile: 32px 타일별 표준편차 중 최대값 = 배경이 아닌 영역)
+# - allow_grayscale: 흑백 이미지 허용 여부
+# - require_person: 로컬 분류기로 인물 사진 여부 검증 (동물/사물 사진 차단)
+DEFAULT_VALIDATION_RULES = {
+    "min_side": 256,
+    "max_pixels": INPUT_VALIDATION_MAX_PIXELS,
+    "max_aspect_ratio": 4.0,
+    "min_blur_variance": INPUT_VALIDATION_MIN_BLUR_VARIANCE,
+    "min_brightness": 15.0,
+    "max_brightness": 245.0,
+    "max_clipped_ratio": 0.9,
+    "min_std": 5.0,
+    "min_std_scope": "global",
+    "allow_grayscale": True,
+    "require_person": False
+}
+
+# 엔드포인트 입력 종류별 규칙 세트
+VALIDATION_RULE_SETS = {
+    # 합성/트라이온 인물 이미지: 컬러 인물 사진
+    "person": {
+        "allow_grayscale": False,
+        "require_person": True
+    },
+    # 의상 이미지: 흰 배경 상품컷은 밝은 픽셀 비율이 높고 엣지가 적으므로 흐림/클리핑 검사 완화
+    # 흰 배경 + 흰 드레스는 전체 표준편차가 낮으므로 주름/윤곽이 있는 타일 기준으로 균일도 판정
+    "garment": {
+        "min_blur_variance": 0.0,
+        "max_brightness": 252.0,
+        "max_clipped_ratio": 0.98,
+        "min_std": 3.0,
+        "min_std_scope": "tile"
+    },
+    # 배경 이미지: 흐린 배경(보케)도 허용
+    "background": {
+        "min_blur_variance": 0.0,
+        "max_aspect_ratio": 5.0
+    },
+    # 체형 분석 / 포즈 추출: 전신 사진 (인물 검증은 포즈 추출과 병렬로 별도 수행)
+    "body": {
+        "min_side": 320,
+        "max_aspect_ratio": 4.0
+    },
+    # 얼굴 이미지 (페이스스왑)
+    "face": {
+        "min_side": 128,
+        "max_aspect_ratio": 3.0
+    }
+}
@@ -0,0 +1,50 @@
+"""로컬 모델 추론 마이크로 배칭 설정"""
+import os
+import json
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 기본 최대 배치 크기 / 최대 대기 시간(ms)
+MICRO_BATCH_MAX_BATCH_SIZE = int(os.getenv("MICRO_BATCH_MAX_BATCH_SIZE", "8"))
+MICRO_BATCH_MAX_WAIT_MS = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "5"))
+
+# 배치 추론 전용 스레드 수 (모델별 배치는 한 번에 하나씩 실행)
+MICRO_BATCH_WORKERS = int(os.getenv("MICRO_BATCH_WORKERS", "2"))
+
+# 동기 호출(MicroBatcher.run)의 추론 대기 예산 (초, 배치 대기 시간에 더해 적용)
+# 이벤트 루프가 멈추거나 종료 중이면 호출 스레드가 무한 대기하지 않고 TimeoutError
+MICRO_BATCH_RUN_TIMEOUT_SEC = float(os.getenv("MICRO_BATCH_RUN_TIMEOUT_SEC", "30"))
+
+
+def get_micro_batch_config(model_name: str) -> dict:
+    """
+    모델별 마이크로 배칭 설정 반환
+
+    MICRO_BATCH_MODEL_CONFIG 환경변수(JSON)로 모델별 값을 덮어쓸 수 있습니다.
+    예: MICRO_BATCH_MODEL_CONFIG={"pose_onnx": {"max_batch_size": 16, "max_wait_ms": 3}}
+
+    Args:
+        model_name: 모델 이름
+
+    Returns:
+        dict: {"max_batch_size": int, "max_wait_ms": float}
+    """
+    config = {
+        "max_batch_size": MICRO_BATCH_MAX_BATCH_SIZE,
+        "max_wait_ms": MICRO_BATCH_MAX_WAIT_MS
+    }
+
+    raw = os.getenv("MICRO_BATCH_MODEL_CONFIG", "")
+    if raw:
+        try:
+            overrides = json.loads(raw).get(model_name, {})
+            if "max_batch_size" in overrides:
+                config["max_batch_size"] = int(overrides["max_batch_size"])
+            if "max_wait_ms" in overrides:
+                config["max_wait_ms"] = float(overrides["max_wait_ms"])
+        except (ValueError, AttributeError) as e:
+            print(f"[MicroBatching] MICRO_BATCH_MODEL_CONFIG 파싱 실패: {e}")
+
+    return config
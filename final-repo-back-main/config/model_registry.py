@@ -0,0 +1,15 @@
+"""로컬 모델 레지스트리 설정 (지연 로딩 / 메모리 예산 / 유휴 해제)"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 워커 프로세스당 로컬 모델 RAM 예산 (MB) - 초과 시 LRU 순으로 해제
+MODEL_RAM_BUDGET_MB = int(os.getenv("MODEL_RAM_BUDGET_MB", "2048"))
+
+# 마지막 사용 후 이 시간(초) 동안 사용되지 않으면 해제 (0이면 유휴 해제 비활성화)
+MODEL_IDLE_TIMEOUT_SEC = int(os.getenv("MODEL_IDLE_TIMEOUT_SEC", "900"))
+
+# 유휴 모델 점검 주기 (초)
+MODEL_EVICTION_INTERVAL_SEC = int(os.getenv("MODEL_EVICTION_INTERVAL_SEC", "60"))
@@ -0,0 +1,32 @@
+"""포즈 추정 백엔드 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 포즈 추정 백엔드: "remote" (HF Space MediaPipe API), "mediapipe" (로컬 CPU), "onnx" (로컬 ONNX 모델)
+POSE_BACKEND = os.getenv("POSE_BACKEND", "remote").lower()
+
+# 로컬 백엔드 로딩/추론 실패 시 원격 API로 폴백
+POSE_FALLBACK_TO_REMOTE = os.getenv("POSE_FALLBACK_TO_REMOTE", "true").lower() == "true"
+
+# POSE_BACKEND=remote일 때 원격 Space가 콜드 스타트 중(upstream warmer "warming")이면 대신 사용할 로컬 백엔드
+# ("mediapipe" / "onnx", 빈 값이면 사용 안 함). 로컬 백엔드가 폴백일 때는 warming 중인 원격 호출을 건너뜀
+POSE_LOCAL_WHEN_REMOTE_WARMING = os.getenv("POSE_LOCAL_WHEN_REMOTE_WARMING", "mediapipe").lower()
+
+# MediaPipe Pose Landmarker 모델 (.task) 경로
+# https://storage.googleapis.com/mediapipe-models/pose_landmarker/pose_landmarker_full/float16/latest/pose_landmarker_full.task
+MEDIAPIPE_POSE_MODEL_PATH = os.getenv("MEDIAPIPE_POSE_MODEL_PATH", "models/pose_landmarker_full.task")
+
+# 로컬 MediaPipe에서 감지할 최대 인원 수 (여러 명이면 core.body_measurements.select_best_person으로 선택)
+MEDIAPIPE_POSE_NUM_POSES = int(os.getenv("MEDIAPIPE_POSE_NUM_POSES", "2"))
+
+# ONNX 포즈 모델 경로 (BlazePose GHUM 랜드마크 모델, 33개 키포인트 + 보조 6개 출력)
+POSE_ONNX_MODEL_PATH = os.getenv("POSE_ONNX_MODEL_PATH", "models/pose_landmark_full.onnx")
+
+# 포즈 감지 최소 신뢰도
+POSE_MIN_DETECTION_CONFIDENCE = float(os.getenv("POSE_MIN_DETECTION_CONFIDENCE", "0.5"))
+
+# 로컬 추론 입력 이미지 최대 변 길이 (정규화 좌표를 반환하므로 해상도와 무관)
+POSE_LOCAL_MAX_SIDE = int(os.getenv("POSE_LOCAL_MAX_SIDE", "1280"))
@@ -0,0 +1,43 @@
+"""S3 클라이언트 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 클라이언트당 최대 HTTP 연결 수 (botocore 기본 10, S3 I/O 스레드 수 이상으로 설정)
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+
+# 비동기 래퍼가 사용하는 S3 전용 스레드 풀 크기
+S3_IO_WORKERS = int(os.getenv("S3_IO_WORKERS", "16"))
+
+# 연결 / 읽기 타임아웃 (초)
+S3_CONNECT_TIMEOUT_SEC = float(os.getenv("S3_CONNECT_TIMEOUT_SEC", "5"))
+S3_READ_TIMEOUT_SEC = float(os.getenv("S3_READ_TIMEOUT_SEC", "30"))
+
+# 재시도 (adaptive 모드: 스로틀링 시 클라이언트 측 속도 조절)
+S3_MAX_ATTEMPTS = int(os.getenv("S3_MAX_ATTEMPTS", "3"))
+S3_RETRY_MODE = os.getenv("S3_RETRY_MODE", "adaptive")
+
+# 이 크기(MB) 이상이면 멀티파트 업로드 (파트 크기 / 파트 동시 업로드 수)
+S3_MULTIPART_THRESHOLD_MB = int(os.getenv("S3_MULTIPART_THRESHOLD_MB", "8"))
+S3_MULTIPART_CHUNK_MB = int(os.getenv("S3_MULTIPART_CHUNK_MB", "8"))
+S3_MULTIPART_CONCURRENCY = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+
+# 로그 이미지를 내용 해시 키(logs/sha256/ab/cd/<sha256>.png)로 저장해 같은 입력은 한 번만 업로드
+# false면 기존처럼 요청마다 타임스탬프 키(logs/<ms>_<모델>_<종류>.png)로 업로드
+LOG_CONTENT_ADDRESSED = os.getenv("LOG_CONTENT_ADDRESSED", "true").lower() == "true"
+
+# 업로드된 로그 해시 키 존재 여부 메모리 캐시 (최대 항목 수 / TTL 초)
+LOG_EXISTS_CACHE_SIZE = int(os.getenv("LOG_EXISTS_CACHE_SIZE", "50000"))
+LOG_EXISTS_CACHE_TTL_SEC = int(os.getenv("LOG_EXISTS_CACHE_TTL_SEC", "86400"))
+
+# 일괄 삭제: delete_objects 한 번에 보낼 키 수 (S3 최대 1000) / 동시에 실행할 delete_objects 호출 수
+S3_DELETE_BATCH_SIZE = min(int(os.getenv("S3_DELETE_BATCH_SIZE", "1000")), 1000)
+S3_DELETE_CONCURRENCY = int(os.getenv("S3_DELETE_CONCURRENCY", "4"))
+
+# 드레스 일괄 삭제 요청당 최대 드레스 수
+DRESS_BULK_DELETE_MAX_IDS = int(os.getenv("DRESS_BULK_DELETE_MAX_IDS", "5000"))
+
+# 고아 객체 정리에서 제외할 최근 업로드 (분). 업로드 후 DB 등록 전인 객체를 지우지 않도록
+DRESS_ORPHAN_MIN_AGE_MIN = int(os.getenv("DRESS_ORPHAN_MIN_AGE_MIN", "60"))
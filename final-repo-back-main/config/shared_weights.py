@@ -0,0 +1,21 @@
+"""워커 프로세스 간 읽기 전용 모델 가중치 공유 설정"""
+import os
+import tempfile
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 공유 가중치 파일 저장 위치 (tmpfs인 /dev/shm 우선 → 모든 워커가 같은 물리 페이지를 매핑)
+_DEFAULT_SHARED_DIR = (
+    "/dev/shm/marryday-weights"
+    if os.path.isdir("/dev/shm")
+    else os.path.join(tempfile.gettempdir(), "marryday-weights")
+)
+SHARED_WEIGHTS_DIR = os.getenv("SHARED_WEIGHTS_DIR", _DEFAULT_SHARED_DIR)
+
+# 앱 import 시점(워커 fork 전, 예: gunicorn --preload)에 공유 모델을 미리 로드할지 여부
+SHARED_WEIGHTS_PRELOAD = os.getenv("SHARED_WEIGHTS_PRELOAD", "false").lower() == "true"
+
+# ONNX Runtime 세션당 intra-op 스레드 수 (0이면 ONNX Runtime 기본값, 워커가 여러 개면 코어 수 / 워커 수 권장)
+ONNX_INTRA_OP_THREADS = int(os.getenv("ONNX_INTRA_OP_THREADS", "0"))
@@ -0,0 +1,31 @@
+"""단색 배경 상품컷 빠른 누끼 경로 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 빠른 경로 사용 여부 (false면 항상 SegFormer 세그멘테이션 사용)
+UNIFORM_BG_ENABLED = os.getenv("UNIFORM_BG_ENABLED", "true").lower() == "true"
+
+# 배경 판정용 작업 해상도 (긴 변 기준 픽셀 수)
+UNIFORM_BG_WORK_SIZE = int(os.getenv("UNIFORM_BG_WORK_SIZE", "512"))
+
+# 테두리 샘플링 두께 (짧은 변 대비 비율)
+UNIFORM_BG_BORDER_RATIO = float(os.getenv("UNIFORM_BG_BORDER_RATIO", "0.02"))
+
+# LAB 색차(ΔE76) 허용치 - 배경색과 이 값 이하로 차이나면 배경 픽셀로 간주
+UNIFORM_BG_DELTA_E = float(os.getenv("UNIFORM_BG_DELTA_E", "10.0"))
+
+# 빠른 경로 채택 최소 신뢰도 (이보다 낮으면 SegFormer로 폴백)
+UNIFORM_BG_MIN_CONFIDENCE = float(os.getenv("UNIFORM_BG_MIN_CONFIDENCE", "0.9"))
+
+# 의상 영역 비율 허용 범위 (범위를 벗어나면 신뢰도 0)
+UNIFORM_BG_MIN_GARMENT_RATIO = float(os.getenv("UNIFORM_BG_MIN_GARMENT_RATIO", "0.05"))
+UNIFORM_BG_MAX_GARMENT_RATIO = float(os.getenv("UNIFORM_BG_MAX_GARMENT_RATIO", "0.95"))
+
+# 의상-배경 대비: 마스크 경계 안쪽 띠 픽셀과 배경색의 ΔE 중앙값 최소값 (흰 배경 + 흰 드레스처럼 낮으면 폴백)
+UNIFORM_BG_MIN_CONTRAST = float(os.getenv("UNIFORM_BG_MIN_CONTRAST", "12.0"))
+
+# 마스크 경계의 엣지 강도: 경계 픽셀의 LAB 기울기(ΔE/px) 중앙값 최소값 (경계가 실제 엣지 위에 없으면 폴백)
+UNIFORM_BG_MIN_EDGE_STRENGTH = float(os.getenv("UNIFORM_BG_MIN_EDGE_STRENGTH", "4.0"))
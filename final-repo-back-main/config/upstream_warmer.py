@@ -0,0 +1,34 @@
+"""콜드 스타트 업스트림 워밍 유지(warm-keeper) 설정"""
+import os
+from dotenv import load_dotenv
+
+# .env 파일 로드
+load_dotenv()
+
+# 워밍 유지 백그라운드 태스크 사용 여부
+UPSTREAM_WARMER_ENABLED = os.getenv("UPSTREAM_WARMER_ENABLED", "true").lower() == "true"
+
+# 마지막 호출(실제 트래픽 또는 프로브) 이후 이 시간(초)이 지나면 프로브 전송
+# 실제 트래픽이 이 간격 안에 있으면 프로브를 건너뜀
+UPSTREAM_WARM_INTERVAL_SEC = int(os.getenv("UPSTREAM_WARM_INTERVAL_SEC", "240"))
+
+# 콜드 스타트(503 모델 로딩 중) 감지 후 웜 상태가 될 때까지의 재프로브 간격 (초)
+UPSTREAM_WARMING_RETRY_SEC = int(os.getenv("UPSTREAM_WARMING_RETRY_SEC", "15"))
+
+# 마지막 관측(트래픽 / 프로브) 후 이 시간(초)이 지난 "warming" 상태는 무시 (로컬 대체 중 원격 재시도 허용,
+# 워밍 유지 태스크가 꺼져 있어도 로컬 백엔드에 고정되지 않도록)
+UPSTREAM_WARMING_STALE_SEC = int(os.getenv("UPSTREAM_WARMING_STALE_SEC", "120"))
+
+# 스케줄러 점검 주기 (초)
+UPSTREAM_WARMER_TICK_SEC = int(os.getenv("UPSTREAM_WARMER_TICK_SEC", "10"))
+
+# 프로브 요청 타임아웃 (초)
+UPSTREAM_PROBE_TIMEOUT_SEC = int(os.getenv("UPSTREAM_PROBE_TIMEOUT_SEC", "60"))
+
+# 대상별 비활성화 (쉼표 구분, 예: "insightface,segformer_clothes")
+UPSTREAM_WARMER_DISABLED = [
+    name.strip() for name in os.getenv("UPSTREAM_WARMER_DISABLED", "").split(",") if name.strip()
+]
+
+# 보관할 콜드 스타트 이벤트 수 (대상별)
+UPSTREAM_COLD_START_HISTORY = int(os.getenv("UPSTREAM_COLD_START_HISTORY", "50"))
@@ -0,0 +1,320 @@
+"""배열 기반 포즈 랜드마크 및 벡터화된 체형 측정값 계산"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# MediaPipe Pose 랜드마크 배열 형식: (33, 4) float32 = (x, y, z, visibility)
+LANDMARK_COUNT = 33
+LANDMARK_FIELDS = ("x", "y", "z", "visibility")
+LANDMARK_DTYPE = np.float32
+
+# 랜드마크 인덱스
+NOSE = 0
+LEFT_SHOULDER, RIGHT_SHOULDER = 11, 12
+LEFT_ELBOW, RIGHT_ELBOW = 13, 14
+LEFT_WRIST, RIGHT_WRIST = 15, 16
+LEFT_HIP, RIGHT_HIP = 23, 24
+LEFT_KNEE, RIGHT_KNEE = 25, 26
+LEFT_ANKLE, RIGHT_ANKLE = 27, 28
+LEFT_FOOT, RIGHT_FOOT = 31, 32
+
+# 방향 보정 신뢰도 판단에 쓰는 핵심 랜드마크
+CORE_LANDMARKS = (
+    LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP,
+    LEFT_KNEE, RIGHT_KNEE, LEFT_ANKLE, RIGHT_ANKLE,
+)
+
+# 여러 사람 중 선택할 때 확인하는 주요 랜드마크 (어깨, 엉덩이, 발목)와 visibility 기준
+SELECTION_KEY_LANDMARKS = (LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP, LEFT_ANKLE, RIGHT_ANKLE)
+SELECTION_MIN_VISIBILITY = 0.3
+
+# 거리 계산에 쓰는 이름 있는 인덱스 쌍 (한 번의 벡터 연산으로 모두 계산)
+SEGMENT_PAIRS = {
+    "shoulder": (LEFT_SHOULDER, RIGHT_SHOULDER),
+    "hip": (LEFT_HIP, RIGHT_HIP),
+    "left_upper_arm": (LEFT_SHOULDER, LEFT_ELBOW),
+    "left_forearm": (LEFT_ELBOW, LEFT_WRIST),
+    "right_upper_arm": (RIGHT_SHOULDER, RIGHT_ELBOW),
+    "right_forearm": (RIGHT_ELBOW, RIGHT_WRIST),
+    "left_thigh": (LEFT_HIP, LEFT_KNEE),
+    "left_shin": (LEFT_KNEE, LEFT_ANKLE),
+    "right_thigh": (RIGHT_HIP, RIGHT_KNEE),
+    "right_shin": (RIGHT_KNEE, RIGHT_ANKLE),
+}
+
+# 측정에 쓰는 모든 거리: 이름 -> {랜드마크 인덱스: 계수} (두 점의 차 벡터 = 랜드마크 좌표의 선형 결합)
+DISTANCE_TERMS = {
+    **{name: {a: 1.0, b: -1.0} for name, (a, b) in SEGMENT_PAIRS.items()},
+    # 키 추정: 코 → 양발 중심
+    "height": {NOSE: 1.0, LEFT_FOOT: -0.5, RIGHT_FOOT: -0.5},
+    # 상체 길이: 어깨 중심 → 엉덩이 중심
+    "torso": {LEFT_SHOULDER: 0.5, RIGHT_SHOULDER: 0.5, LEFT_HIP: -0.5, RIGHT_HIP: -0.5},
+}
+_DISTANCE_NAMES = list(DISTANCE_TERMS.keys())
+_DIFF_MATRIX = np.zeros((len(_DISTANCE_NAMES), LANDMARK_COUNT))
+for _row, _terms in enumerate(DISTANCE_TERMS.values()):
+    for _index, _weight in _terms.items():
+        _DIFF_MATRIX[_row, _index] = _weight
+
+# 길이 측정값 = 거리의 선형 결합 (가중치 행렬 한 번의 곱으로 계산)
+_LENGTH_TERMS = {
+    "shoulder_width": {"shoulder": 1.0},
+    "hip_width": {"hip": 1.0},
+    "waist_width": {"shoulder": 0.5, "hip": 0.5},   # 어깨 폭과 엉덩이 폭의 평균으로 추정
+    "arm_length": {"left_upper_arm": 0.5, "left_forearm": 0.5, "right_upper_arm": 0.5, "right_forearm": 0.5},
+    "leg_length": {"left_thigh": 0.5, "left_shin": 0.5, "right_thigh": 0.5, "right_shin": 0.5},
+    "torso_length": {"torso": 1.0},
+    "estimated_height": {"height": 1.0},
+}
+_LENGTH_KEYS = list(_LENGTH_TERMS.keys())
+_LENGTH_WEIGHTS = np.zeros((len(_DISTANCE_NAMES), len(_LENGTH_KEYS)))
+for _column, _terms in enumerate(_LENGTH_TERMS.values()):
+    for _name, _weight in _terms.items():
+        _LENGTH_WEIGHTS[_DISTANCE_NAMES.index(_name), _column] = _weight
+
+# 비율 측정값: 이름 -> (분자, 분모, 분모가 0 이하일 때 기본값)
+_RATIO_TERMS = {
+    "shoulder_hip_ratio": ("shoulder_width", "hip_width", 0.0),
+    "waist_shoulder_ratio": ("waist_width", "shoulder_width", 1.0),
+    "waist_hip_ratio": ("waist_width", "hip_width", 1.0),
+    "torso_leg_ratio": ("torso_length", "leg_length", 1.0),
+    "arm_leg_ratio": ("arm_length", "leg_length", 1.0),
+}
+_RATIO_NUMERATOR = np.array([_LENGTH_KEYS.index(n) for n, _, _ in _RATIO_TERMS.values()])
+_RATIO_DENOMINATOR = np.array([_LENGTH_KEYS.index(d) for _, d, _ in _RATIO_TERMS.values()])
+_RATIO_DEFAULT = np.array([default for _, _, default in _RATIO_TERMS.values()])
+
+# 측정값 이름 -> 결과 테이블(길이 열 + 비율 열) 열 인덱스 (같은 값의 별칭 포함)
+_TABLE_COLUMNS = {name: i for i, name in enumerate(_LENGTH_KEYS + list(_RATIO_TERMS.keys()))}
+_TABLE_COLUMNS["lower_body_length"] = _TABLE_COLUMNS["leg_length"]
+_TABLE_COLUMNS["body_length"] = _TABLE_COLUMNS["estimated_height"]
+
+# 측정값 키 (기존 calculate_measurements 반환 순서 유지)
+MEASUREMENT_KEYS = (
+    "shoulder_width",
+    "hip_width",
+    "waist_width",
+    "shoulder_hip_ratio",
+    "waist_shoulder_ratio",
+    "waist_hip_ratio",
+    "arm_length",
+    "leg_length",
+    "torso_length",
+    "lower_body_length",
+    "torso_leg_ratio",
+    "arm_leg_ratio",
+    "estimated_height",
+    "body_length",
+)
+
+# 체형 분류 결과 테이블 (classify_body_type_indices의 인덱스 순서)
+BODY_TYPES = (
+    {"type": "X라인", "confidence": 0.90,
+     "description": "X라인(모래시계형) 체형에 가깝습니다. 어깨와 엉덩이가 비슷하고 허리가 얇은 특징을 보입니다."},
+    {"type": "A라인", "confidence": 0.85,
+     "description": "A라인 체형에 가깝습니다. 어깨보다 엉덩이가 넓은 특징을 보입니다."},
+    {"type": "H라인", "confidence": 0.85,
+     "description": "H라인 체형에 가깝습니다. 어깨와 엉덩이가 비슷한 직선형 특징을 보입니다."},
+    {"type": "O라인", "confidence": 0.80,
+     "description": "O라인 체형에 가깝습니다. 어깨가 넓거나 균형잡힌 둥근 특징을 보입니다."},
+    {"type": "균형형", "confidence": 0.75,
+     "description": "균형잡힌 체형에 가깝습니다."},
+)
+
+
+def landmarks_to_array(landmarks) -> Optional[np.ndarray]:
+    """
+    랜드마크 딕셔너리 리스트를 (33, 4) float32 배열로 변환
+
+    Args:
+        landmarks: PoseLandmarkService 형식 리스트 ([{"id", "x", "y", "z", "visibility"}, ...])
+                   또는 이미 변환된 배열
+
+    Returns:
+        (33, 4) 배열 또는 None (랜드마크가 33개 미만)
+    """
+    if landmarks is None:
+        return None
+    if isinstance(landmarks, np.ndarray):
+        return landmarks.astype(LANDMARK_DTYPE, copy=False) if landmarks.shape == (LANDMARK_COUNT, 4) else None
+    if len(landmarks) < LANDMARK_COUNT:
+        return None
+
+    return np.array(
+        [
+            (landmark.get("x", 0.0), landmark.get("y", 0.0), landmark.get("z", 0.0), landmark.get("visibility", 1.0))
+            for landmark in landmarks[:LANDMARK_COUNT]
+        ],
+        dtype=LANDMARK_DTYPE
+    )
+
+
+def array_to_landmarks(array: np.ndarray) -> List[Dict]:
+    """(33, 4) 배열을 API 응답용 랜드마크 딕셔너리 리스트로 변환"""
+    return [
+        {"id": idx, "x": float(x), "y": float(y), "z": float(z), "visibility": float(v)}
+        for idx, (x, y, z, v) in enumerate(array.tolist())
+    ]
+
+
+def _measurement_table(landmarks: np.ndarray) -> np.ndarray:
+    """
+    랜드마크 배열 → 측정값 테이블 (열 순서는 _TABLE_COLUMNS, float64)
+
+    (33, 4) 입력이면 (측정값 수,), (N, 33, 4) 입력이면 (N, 측정값 수) - 단건은 배치 차원 없이 계산
+    """
+    landmarks = np.asarray(landmarks)
+    if landmarks.shape[-2:] != (LANDMARK_COUNT, 4) or landmarks.ndim not in (2, 3):
+        raise ValueError(f"랜드마크 배열 형식이 올바르지 않습니다: {landmarks.shape} (기대값: (N, 33, 4))")
+
+    # 거리 계산은 float64로 수행 (기존 파이썬 float 계산과 수치 일치)
+    xyz = landmarks[..., :3].astype(np.float64)
+
+    # 모든 차 벡터를 행렬 곱 한 번으로 계산한 뒤 길이: (..., 거리 수)
+    diff = _DIFF_MATRIX @ xyz
+    distances = np.sqrt(np.einsum("...kc,...kc->...k", diff, diff))
+
+    lengths = distances @ _LENGTH_WEIGHTS
+    denominator = lengths[..., _RATIO_DENOMINATOR]
+    positive = denominator > 0
+    ratios = np.where(positive, lengths[..., _RATIO_NUMERATOR] / np.where(positive, denominator, 1.0), _RATIO_DEFAULT)
+    return np.concatenate([lengths, ratios], axis=-1)
+
+
+def compute_measurements(landmarks: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    랜드마크 배열로부터 체형 측정값 계산 (벡터화)
+
+    Args:
+        landmarks: (33, 4) 또는 (N, 33, 4) 배열
+
+    Returns:
+        {측정값 이름: (N,) float64 배열} - 단일 입력이면 N=1
+    """
+    table = np.atleast_2d(_measurement_table(landmarks))
+    return {key: table[:, _TABLE_COLUMNS[key]] for key in MEASUREMENT_KEYS}
+
+
+def measure(landmarks: np.ndarray) -> Dict[str, float]:
+    """
+    단일 (33, 4) 랜드마크 배열의 측정값 딕셔너리 (단건 요청 경로, 기존 calculate_measurements 반환 형식)
+    """
+    row = _measurement_table(landmarks).tolist()
+    return {key: row[_TABLE_COLUMNS[key]] for key in MEASUREMENT_KEYS}
+
+
+def measurements_to_dicts(measurements: Dict[str, np.ndarray]) -> List[Dict[str, float]]:
+    """배치 측정값을 항목별 딕셔너리 리스트로 변환 (기존 반환 형식)"""
+    rows = np.column_stack([measurements[key] for key in MEASUREMENT_KEYS]).tolist()
+    return [dict(zip(MEASUREMENT_KEYS, row)) for row in rows]
+
+
+def classify_body_type_indices(measurements: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    측정값으로부터 체형 분류 (벡터화) - BODY_TYPES 인덱스 배열 반환
+
+    기존 if/elif 순서와 동일하게 앞선 조건이 우선합니다.
+    """
+    shoulder_hip = np.asarray(measurements["shoulder_hip_ratio"])
+    waist_shoulder = np.asarray(measurements["waist_shoulder_ratio"])
+    waist_hip = np.asarray(measurements["waist_hip_ratio"])
+
+    conditions = [
+        (waist_shoulder < 0.82) & (waist_hip < 1.30),                           # X라인
+        shoulder_hip < 1.40,                                                     # A라인
+        (shoulder_hip >= 1.40) & (shoulder_hip <= 1.65) & (waist_shoulder >= 0.82),  # H라인
+        shoulder_hip > 1.65,                                                     # O라인
+    ]
+    return np.select(conditions, [0, 1, 2, 3], default=4)
+
+
+def classify_body_types(measurements: Dict[str, np.ndarray]) -> List[Dict]:
+    """배치 체형 분류 결과 (BODY_TYPES 항목 복사본 리스트)"""
+    return [dict(BODY_TYPES[i]) for i in classify_body_type_indices(measurements).tolist()]
+
+
+def estimate_upright_rotation(landmarks: np.ndarray, image_size: Optional[Tuple[int, int]] = None) -> int:
+    """
+    몸이 똑바로 서도록 하는 시계 방향 회전 각도 추정 (0 / 90 / 180 / 270)
+
+    어깨 중심 → 엉덩이 중심 벡터가 화면 아래(+y)를 향하도록 하는 90도 단위 회전을 고릅니다.
+
+    Args:
+        landmarks: (33, 4) 배열 (정규화 좌표)
+        image_size: (width, height) - 주면 픽셀 비율로 방향을 비교
+    """
+    shoulder_center = (landmarks[LEFT_SHOULDER, :2] + landmarks[RIGHT_SHOULDER, :2]) / 2
+    hip_center = (landmarks[LEFT_HIP, :2] + landmarks[RIGHT_HIP, :2]) / 2
+    dx, dy = (hip_center - shoulder_center).astype(np.float64)
+    if image_size:
+        dx, dy = dx * image_size[0], dy * image_size[1]
+
+    if abs(dy) >= abs(dx):
+        return 0 if dy > 0 else 180
+    # 엉덩이가 어깨 오른쪽 → 시계 방향 90도 회전하면 아래를 향함
+    return 90 if dx > 0 else 270
+
+
+def rotate_landmarks(landmarks: np.ndarray, clockwise_degrees: int) -> np.ndarray:
+    """
+    정규화 랜드마크 좌표를 이미지 회전(시계 방향, expand)에 맞춰 변환
+
+    PIL `image.rotate(-각도, expand=True)`로 회전한 이미지에서 다시 추론한 것과 같은 좌표계가 됩니다.
+    z(깊이)와 visibility는 이미지 평면 회전에 영향받지 않으므로 그대로 둡니다.
+
+    Args:
+        landmarks: (33, 4) 또는 (N, 33, 4) 배열
+        clockwise_degrees: 0 / 90 / 180 / 270 (-90은 270으로 처리)
+    """
+    degrees = clockwise_degrees % 360
+    if degrees == 0:
+        return landmarks
+    if degrees not in (90, 180, 270):
+        raise ValueError(f"90도 단위 회전만 지원합니다: {clockwise_degrees}")
+
+    rotated = landmarks.copy()
+    x, y = landmarks[..., 0], landmarks[..., 1]
+    if degrees == 90:
+        rotated[..., 0], rotated[..., 1] = 1.0 - y, x
+    elif degrees == 180:
+        rotated[..., 0], rotated[..., 1] = 1.0 - x, 1.0 - y
+    else:
+        rotated[..., 0], rotated[..., 1] = y, 1.0 - x
+    return rotated
+
+
+def core_visibility(landmarks: np.ndarray) -> float:
+    """몸통·하체 핵심 랜드마크(어깨, 엉덩이, 무릎, 발목)의 평균 visibility"""
+    return float(landmarks[list(CORE_LANDMARKS), 3].mean())
+
+
+def select_best_person(people: Sequence[np.ndarray]) -> Optional[np.ndarray]:
+    """
+    여러 사람의 (33, 4) 배열 중 가장 적합한 사람 선택
+
+    PoseLandmarkService._select_best_person과 같은 기준입니다. 주요 랜드마크가 2개 이상 보이는 사람 중
+    보이는 랜드마크 bounding box 면적 × 평균 visibility가 가장 큰 사람을 고르고, 없으면 첫 번째 사람을 반환합니다.
+    """
+    if not people:
+        return None
+    if len(people) == 1:
+        return people[0]
+
+    best_person, best_score = None, -1.0
+    for landmarks in people:
+        visible = landmarks[:, 3] >= SELECTION_MIN_VISIBILITY
+        if int(visible[list(SELECTION_KEY_LANDMARKS)].sum()) < 2:
+            continue
+        points = landmarks[visible, :2]
+        width, height = points.max(axis=0) - points.min(axis=0)
+        score = float(width * height * landmarks[:, 3].mean())
+        if score > best_score:
+            best_person, best_score = landmarks, score
+    return best_person if best_person is not None else people[0]
+
+
+def stack_landmarks(landmark_arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """(33, 4) 배열 목록을 (N, 33, 4) 배치로 결합"""
+    if not landmark_arrays:
+        return np.zeros((0, LANDMARK_COUNT, 4), dtype=LANDMARK_DTYPE)
+    return np.stack(landmark_arrays).astype(LANDMARK_DTYPE, copy=False)
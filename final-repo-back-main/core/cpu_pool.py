@@ -0,0 +1,424 @@
+"""
+CPU 작업 전용 프로세스 풀
+
+필터 프리셋, 색상 보정(LAB/CLAHE), 드레스 전처리, 마스크 생성, 큰 PNG 인코딩 / base64 변환처럼
+GIL에 묶이는 CPU 작업을 별도 프로세스에서 실행해 이벤트 루프를 막지 않고 여러 코어를 사용합니다.
+
+- 인자/결과의 큰 이미지 배열(PIL Image, ndarray)과 바이트/문자열은 pickle 대신 공유 메모리로 전달
+  (CPU_POOL_SHM_MIN_KB 이상, dict / list / tuple 안쪽까지)
+- 작업별 타임아웃. 대기 중인 작업은 취소하고, 이미 실행 중인 작업은 결과를 버림 (워커는 작업이 끝나면 재사용)
+- 워커가 비정상 종료되면(BrokenProcessPool) 풀을 새로 만듦
+- 실행할 함수는 워커에서 import 가능한 모듈 최상위 함수여야 함
+"""
+import time
+import asyncio
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from PIL import Image
+
+from config.cpu_pool import (
+    CPU_POOL_ENABLED,
+    CPU_POOL_WORKERS,
+    CPU_POOL_START_METHOD,
+    CPU_POOL_TASK_TIMEOUT_SEC,
+    CPU_POOL_SHM_MIN_KB,
+    CPU_POOL_PRELOAD_MODULES
+)
+
+# 공유 메모리로 전달하는 PIL 이미지 모드 (배열 변환 시 정보 손실 없음)
+_SHM_IMAGE_MODES = ("RGB", "RGBA", "L")
+
+KIND_ARRAY = "array"
+KIND_IMAGE = "image"
+KIND_BYTES = "bytes"
+KIND_STR = "str"
+
+
+class CpuTaskTimeoutError(TimeoutError):
+    """프로세스 풀 작업 타임아웃"""
+
+
+class _SharedBuffer:
+    """공유 메모리 블록 참조 (pickle로 전달되는 것은 이름과 형태 정보뿐)"""
+    __slots__ = ("name", "kind", "shape", "dtype", "mode", "nbytes")
+
+    def __init__(self, name: str, kind: str, shape: tuple, dtype: str, mode: Optional[str], nbytes: int):
+        self.name = name
+        self.kind = kind
+        self.shape = shape
+        self.dtype = dtype
+        self.mode = mode
+        self.nbytes = nbytes
+
+    def __getstate__(self):
+        return (self.name, self.kind, self.shape, self.dtype, self.mode, self.nbytes)
+
+    def __setstate__(self, state):
+        self.name, self.kind, self.shape, self.dtype, self.mode, self.nbytes = state
+
+
+# ============================================
+# 공유 메모리 직렬화 (부모 / 워커 공용)
+# ============================================
+
+def _to_shared(array: np.ndarray, kind: str, mode: Optional[str], handles: List) -> _SharedBuffer:
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    handles.append(shm)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return _SharedBuffer(shm.name, kind, array.shape, array.dtype.str, mode, array.nbytes)
+
+
+def _pack(value: Any, handles: List, min_bytes: int) -> Any:
+    """큰 배열 / 이미지 / 바이트를 공유 메모리로 옮기고 참조로 바꿈 (생성한 블록은 handles에 추가)"""
+    if isinstance(value, Image.Image):
+        if value.mode in _SHM_IMAGE_MODES and value.width * value.height * len(value.getbands()) >= min_bytes:
+            return _to_shared(np.asarray(value), KIND_IMAGE, value.mode, handles)
+        return value
+    if isinstance(value, np.ndarray):
+        if value.nbytes >= min_bytes and value.dtype != object:
+            return _to_shared(np.ascontiguousarray(value), KIND_ARRAY, None, handles)
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) >= min_bytes:
+            return _to_shared(np.frombuffer(value, dtype=np.uint8), KIND_BYTES, None, handles)
+        return value
+    if isinstance(value, str):
+        if len(value) >= min_bytes:
+            return _to_shared(np.frombuffer(value.encode("utf-8"), dtype=np.uint8), KIND_STR, None, handles)
+        return value
+    if isinstance(value, dict):
+        return {key: _pack(item, handles, min_bytes) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_pack(item, handles, min_bytes) for item in value)
+    return value
+
+
+def _from_shared(ref: _SharedBuffer) -> Any:
+    shm = shared_memory.SharedMemory(name=ref.name)
+    try:
+        array = np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=shm.buf).copy()
+    finally:
+        shm.close()
+    if ref.kind == KIND_IMAGE:
+        return Image.fromarray(array, ref.mode)
+    if ref.kind == KIND_BYTES:
+        return array.tobytes()
+    if ref.kind == KIND_STR:
+        return array.tobytes().decode("utf-8")
+    return array
+
+
+def _unpack(value: Any) -> Any:
+    """공유 메모리 참조를 원래 객체로 복원 (블록 해제는 하지 않음)"""
+    if isinstance(value, _SharedBuffer):
+        return _from_shared(value)
+    if isinstance(value, dict):
+        return {key: _unpack(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unpack(item) for item in value)
+    return value
+
+
+def _collect_refs(value: Any, refs: List[_SharedBuffer]):
+    if isinstance(value, _SharedBuffer):
+        refs.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _collect_refs(item, refs)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_refs(item, refs)
+
+
+def _unlink(name: str):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _release_handles(handles: List):
+    for shm in handles:
+        try:
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+# ============================================
+# 워커 프로세스
+# ============================================
+
+def _init_worker(preload_modules: List[str]):
+    """워커 시작 시 OpenCV 내부 스레드를 1개로 제한 (프로세스 수만큼 코어 사용) 후 모듈 미리 import"""
+    try:
+        import cv2
+        cv2.setNumThreads(1)
+    except ImportError:
+        pass
+    for module in preload_modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            print(f"[CpuPool] 워커 모듈 미리 import 실패 ({module}): {e}")
+
+
+def _run_in_worker(fn, args: tuple, kwargs: dict, min_bytes: int, submitted_at: float):
+    """워커에서 실행: 인자 복원 → 함수 실행 → 결과를 공유 메모리로 포장 (블록 해제는 부모가 담당)"""
+    started_at = time.time()
+    result = fn(*_unpack(args), **_unpack(kwargs))
+    handles = []
+    try:
+        packed = _pack(result, handles, min_bytes)
+    except Exception:
+        _release_handles(handles)
+        raise
+    for shm in handles:
+        shm.close()
+    return packed, started_at - submitted_at, time.time() - started_at
+
+
+# ============================================
+# 부모 프로세스
+# ============================================
+
+class CpuProcessPool:
+    """공유 메모리 전달 / 작업별 타임아웃 / 큐 깊이 메트릭을 갖춘 프로세스 풀"""
+
+    def __init__(self, workers: int, start_method: str, default_timeout: float, shm_min_bytes: int):
+        self.workers = workers
+        self.start_method = start_method
+        self.default_timeout = default_timeout
+        self.shm_min_bytes = shm_min_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._inflight = 0
+        self._metrics = {
+            "submitted": 0,
+            "completed": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "abandoned_running": 0,     # 타임아웃 이후에도 워커에서 실행 중인 작업 수 (현재값)
+            "pool_restarts": 0,
+            "max_queue_depth": 0,
+            "shm_bytes_in": 0,
+            "shm_bytes_out": 0,
+            "total_queue_wait_ms": 0.0,
+            "total_run_ms": 0.0,
+            "by_function": {}           # 함수별 {"count", "errors", "timeouts", "total_run_ms"}
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context(self.start_method),
+                        initializer=_init_worker,
+                        initargs=(CPU_POOL_PRELOAD_MODULES,)
+                    )
+                    print(f"[CpuPool] 프로세스 풀 시작: 워커 {self.workers}개 ({self.start_method})")
+        return self._executor
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        """워커 비정상 종료 시 새 풀로 교체"""
+        with self._executor_lock:
+            if self._executor is broken:
+                self._executor = None
+                broken.shutdown(wait=False, cancel_futures=True)
+                with self._metrics_lock:
+                    self._metrics["pool_restarts"] += 1
+                print("[CpuPool] 워커 비정상 종료로 프로세스 풀 재시작")
+
+    def _function_stats(self, name: str) -> Dict:
+        return self._metrics["by_function"].setdefault(
+            name, {"count": 0, "errors": 0, "timeouts": 0, "total_run_ms": 0.0}
+        )
+
+    def _on_done(self, future: Future):
+        with self._metrics_lock:
+            self._inflight -= 1
+
+    async def run(self, fn, args: tuple, kwargs: dict, timeout: Optional[float] = None):
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        timeout = self.default_timeout if timeout is None else timeout
+        handles = []
+        try:
+            packed_args = _pack(args, handles, self.shm_min_bytes)
+            packed_kwargs = _pack(kwargs, handles, self.shm_min_bytes)
+            executor = self._get_executor()
+            try:
+                future = executor.submit(
+                    _run_in_worker, fn, packed_args, packed_kwargs, self.shm_min_bytes, time.time()
+                )
+            except BrokenProcessPool:
+                self._restart(executor)
+                executor = self._get_executor()
+                future = executor.submit(
+                    _run_in_worker, fn, packed_args, packed_kwargs, self.shm_min_bytes, time.time()
+                )
+
+            with self._metrics_lock:
+                self._inflight += 1
+                self._metrics["submitted"] += 1
+                self._metrics["shm_bytes_in"] += sum(shm.size for shm in handles)
+                self._metrics["max_queue_depth"] = max(
+                    self._metrics["max_queue_depth"], self._inflight - self.workers
+                )
+            future.add_done_callback(self._on_done)
+
+            try:
+                packed, queue_wait, run_time = await asyncio.wait_for(
+                    asyncio.shield(asyncio.wrap_future(future)), timeout
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                self._abandon(future, name, timed_out=isinstance(e, asyncio.TimeoutError))
+                if isinstance(e, asyncio.TimeoutError):
+                    raise CpuTaskTimeoutError(f"CPU 작업 타임아웃 ({name}, {timeout}s)") from e
+                raise
+            except BrokenProcessPool:
+                self._restart(executor)
+                self._record_error(name)
+                raise
+            except Exception:
+                self._record_error(name)
+                raise
+
+            refs = []
+            _collect_refs(packed, refs)
+            try:
+                result = _unpack(packed)
+            finally:
+                for ref in refs:
+                    _unlink(ref.name)
+
+            with self._metrics_lock:
+                self._metrics["completed"] += 1
+                self._metrics["shm_bytes_out"] += sum(ref.nbytes for ref in refs)
+                self._metrics["total_queue_wait_ms"] += queue_wait * 1000
+                self._metrics["total_run_ms"] += run_time * 1000
+                stats = self._function_stats(name)
+                stats["count"] += 1
+                stats["total_run_ms"] += run_time * 1000
+            return result
+        finally:
+            _release_handles(handles)
+
+    def _record_error(self, name: str):
+        with self._metrics_lock:
+            self._metrics["errors"] += 1
+            self._function_stats(name)["errors"] += 1
+
+    def _abandon(self, future: Future, name: str, timed_out: bool):
+        """기다리지 않을 작업 정리: 대기 중이면 취소, 실행 중이면 끝난 뒤 결과 공유 메모리 해제"""
+        running = not future.cancel()
+        with self._metrics_lock:
+            if timed_out:
+                self._metrics["timeouts"] += 1
+                self._function_stats(name)["timeouts"] += 1
+            if running:
+                self._metrics["abandoned_running"] += 1
+
+        if running:
+            def _discard(done: Future):
+                with self._metrics_lock:
+                    self._metrics["abandoned_running"] -= 1
+                if done.cancelled() or done.exception() is not None:
+                    return
+                refs = []
+                _collect_refs(done.result()[0], refs)
+                for ref in refs:
+                    _unlink(ref.name)
+
+            future.add_done_callback(_discard)
+
+    def metrics(self) -> Dict:
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+            by_function = {name: dict(stats) for name, stats in self._metrics["by_function"].items()}
+            inflight = self._inflight
+        completed = metrics["completed"]
+        metrics["inflight"] = inflight
+        metrics["queue_depth"] = max(inflight - self.workers, 0)
+        metrics["workers"] = self.workers
+        metrics["start_method"] = self.start_method
+        metrics["started"] = self._executor is not None
+        metrics["avg_queue_wait_ms"] = round(metrics.pop("total_queue_wait_ms") / completed, 2) if completed else None
+        metrics["avg_run_ms"] = round(metrics.pop("total_run_ms") / completed, 2) if completed else None
+        for stats in by_function.values():
+            total_run_ms = stats.pop("total_run_ms")
+            stats["avg_run_ms"] = round(total_run_ms / stats["count"], 2) if stats["count"] else None
+        metrics["by_function"] = by_function
+        return metrics
+
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_pool: Optional[CpuProcessPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_cpu_pool() -> Optional[CpuProcessPool]:
+    """CPU 작업 프로세스 풀 (싱글톤, CPU_POOL_ENABLED=false면 None)"""
+    global _pool
+    if not CPU_POOL_ENABLED:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = CpuProcessPool(
+                    CPU_POOL_WORKERS,
+                    CPU_POOL_START_METHOD,
+                    CPU_POOL_TASK_TIMEOUT_SEC,
+                    CPU_POOL_SHM_MIN_KB * 1024
+                )
+    return _pool
+
+
+async def run_cpu_task(fn, *args, timeout: Optional[float] = None, **kwargs):
+    """
+    CPU 작업을 프로세스 풀에서 실행
+
+    Args:
+        fn: 모듈 최상위 함수 (워커에서 import 가능해야 함)
+        *args, **kwargs: 함수 인자. 큰 PIL Image / ndarray / bytes / str은 공유 메모리로 전달
+        timeout: 작업 타임아웃 (초, None이면 CPU_POOL_TASK_TIMEOUT_SEC)
+
+    Raises:
+        CpuTaskTimeoutError: 타임아웃
+        함수에서 발생한 예외는 그대로 전달
+    """
+    pool = get_cpu_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return await pool.run(fn, args, kwargs, timeout)
+
+
+def get_cpu_pool_metrics() -> Dict:
+    """큐 깊이, 실행 중 작업 수, 평균 큐 대기 / 실행 시간, 타임아웃 / 오류 수, 공유 메모리 전송량, 함수별 통계"""
+    pool = get_cpu_pool()
+    if pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **pool.metrics()}
+
+
+def shutdown_cpu_pool():
+    """프로세스 풀 종료 (앱 shutdown에서 호출)"""
+    if _pool is not None:
+        _pool.shutdown()
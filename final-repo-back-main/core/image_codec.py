@@ -0,0 +1,300 @@
+"""
+이미지 코덱 (디코딩 / 인코딩 공통 모듈)
+
+라우터와 서비스의 이미지 디코딩 / 인코딩을 한 곳에서 처리합니다.
+- 업로드 읽기: 스풀링된 업로드 파일을 청크 단위로 읽고 크기 상한 초과 시 중단
+- 디코딩: 헤더 기준 픽셀 수 상한 검사 → (목표 크기가 있으면) JPEG DCT 축소 디코딩 → EXIF 회전 1회 → 모드 변환
+- 인코딩: 용도별 빠른 설정 (중간 결과 PNG는 낮은 압축 레벨, 미리보기는 JPEG / WebP)
+"""
+import io
+import time
+import base64
+import threading
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from config.image_codec import (
+    IMAGE_MAX_PIXELS,
+    IMAGE_MAX_UPLOAD_MB,
+    IMAGE_PNG_COMPRESS_LEVEL,
+    IMAGE_PREVIEW_FORMAT,
+    IMAGE_PREVIEW_QUALITY,
+    IMAGE_PREVIEW_MAX_SIDE
+)
+
+# Pillow 전역 한도: 이 값을 넘으면 경고, 2배를 넘으면 DecompressionBombError (코덱을 거치지 않는 Image.open에도 적용)
+Image.MAX_IMAGE_PIXELS = IMAGE_MAX_PIXELS
+
+_MB = 1024 * 1024
+_READ_CHUNK_SIZE = _MB
+
+# Pillow 포맷 이름 -> MIME 타입
+_MIME_TYPES = {
+    "PNG": "image/png",
+    "JPEG": "image/jpeg",
+    "WEBP": "image/webp"
+}
+
+ImageSource = Union[bytes, bytearray, memoryview, BinaryIO]
+
+# 코덱 메트릭 (관리자 조회용)
+_metrics_lock = threading.Lock()
+_metrics = {
+    "decoded": 0,
+    "draft_decoded": 0,          # JPEG DCT 축소 디코딩이 적용된 수
+    "decode_errors": 0,
+    "rejected_too_large": 0,     # 픽셀 수 / 업로드 크기 상한 초과
+    "total_decode_ms": 0.0,
+    "encoded": {},               # 포맷별 {"count", "bytes", "total_ms"}
+}
+
+
+class ImageDecodeError(ValueError):
+    """이미지를 읽을 수 없음 (지원하지 않는 포맷, 손상된 파일)"""
+
+
+class ImageTooLargeError(ImageDecodeError):
+    """픽셀 수 또는 업로드 크기 상한 초과"""
+
+
+def _record(**counts):
+    with _metrics_lock:
+        for name, value in counts.items():
+            _metrics[name] += value
+
+
+def _record_encode(fmt: str, size: int, elapsed_ms: float):
+    with _metrics_lock:
+        stats = _metrics["encoded"].setdefault(fmt, {"count": 0, "bytes": 0, "total_ms": 0.0})
+        stats["count"] += 1
+        stats["bytes"] += size
+        stats["total_ms"] += elapsed_ms
+
+
+async def read_upload(upload, max_bytes: Optional[int] = None) -> bytes:
+    """
+    업로드 파일(UploadFile) 읽기
+
+    multipart 파서가 IMAGE_UPLOAD_SPOOL_MAX_MEMORY_KB를 넘는 파일을 임시 파일로 스풀링해 두므로
+    청크 단위로 읽으면서 max_bytes(기본 IMAGE_MAX_UPLOAD_MB)를 넘으면 바로 중단합니다.
+
+    Raises:
+        ImageTooLargeError: 업로드 크기 상한 초과
+    """
+    limit = IMAGE_MAX_UPLOAD_MB * _MB if max_bytes is None else max_bytes
+    chunks = []
+    total = 0
+    while True:
+        chunk = await upload.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        total += len(chunk)
+        if limit and total > limit:
+            _record(rejected_too_large=1)
+            raise ImageTooLargeError(
+                f"업로드 파일이 너무 큽니다: {getattr(upload, 'filename', None) or 'file'} "
+                f"(최대 {round(limit / _MB, 1)}MB)"
+            )
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def open_image(source: ImageSource, max_pixels: Optional[int] = None) -> Image.Image:
+    """
+    헤더만 읽어 이미지 열기 (디코딩 전). 픽셀 수 상한을 넘으면 디코딩하지 않고 거부
+
+    Args:
+        source: 이미지 바이트 또는 파일 객체 (스풀링된 업로드 파일 포함)
+        max_pixels: 최대 픽셀 수 (None이면 IMAGE_MAX_PIXELS, 0이면 검사 안 함)
+    """
+    fp = io.BytesIO(source) if isinstance(source, (bytes, bytearray, memoryview)) else source
+    try:
+        image = Image.open(fp)
+    except Image.DecompressionBombError as e:
+        _record(rejected_too_large=1)
+        raise ImageTooLargeError(str(e)) from e
+    except (UnidentifiedImageError, OSError, ValueError) as e:
+        _record(decode_errors=1)
+        raise ImageDecodeError(f"이미지 파일을 읽을 수 없습니다: {e}") from e
+
+    limit = IMAGE_MAX_PIXELS if max_pixels is None else max_pixels
+    width, height = image.size
+    if limit and width * height > limit:
+        _record(rejected_too_large=1)
+        raise ImageTooLargeError(f"이미지 해상도가 너무 큽니다: {width}x{height} (최대 {limit} 픽셀)")
+    return image
+
+
+def decode_image(
+    source: ImageSource,
+    mode: Optional[str] = "RGB",
+    max_side: Optional[int] = None,
+    exif_transpose: bool = True,
+    max_pixels: Optional[int] = None
+) -> Image.Image:
+    """
+    이미지 디코딩
+
+    Args:
+        source: 이미지 바이트 또는 파일 객체
+        mode: 변환할 모드 ("RGB", "RGBA", "L" 등, None이면 원본 모드 유지)
+        max_side: 결과 긴 변 최대 길이. 지정하면 JPEG는 DCT 단계에서 미리 축소 디코딩하고,
+            그래도 크면 LANCZOS로 줄입니다 (확대는 하지 않음)
+        exif_transpose: EXIF 방향 반영 여부 (디코딩 시 한 번만 적용)
+        max_pixels: 최대 픽셀 수 (None이면 IMAGE_MAX_PIXELS)
+
+    Raises:
+        ImageTooLargeError: 픽셀 수 상한 초과
+        ImageDecodeError: 디코딩 실패
+    """
+    start = time.perf_counter()
+    image = open_image(source, max_pixels)
+    original_size = image.size
+
+    if max_side and image.format == "JPEG":
+        # EXIF 회전 전이므로 양변 모두 max_side 이상이 되도록 요청 (draft는 요청 크기 이상으로만 줄임)
+        image.draft(mode if mode in ("RGB", "L") else None, (max_side, max_side))
+    try:
+        image.load()
+    except Exception as e:
+        _record(decode_errors=1)
+        raise ImageDecodeError(f"이미지 파일을 읽을 수 없습니다: {e}") from e
+    drafted = image.size != original_size
+
+    if exif_transpose:
+        image = ImageOps.exif_transpose(image)
+    if mode and image.mode != mode:
+        image = image.convert(mode)
+    if max_side and max(image.size) > max_side:
+        image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+    _record(decoded=1, draft_decoded=int(drafted), total_decode_ms=(time.perf_counter() - start) * 1000)
+    return image
+
+
+def _normalize_format(fmt: str) -> str:
+    fmt = fmt.upper()
+    return "JPEG" if fmt == "JPG" else fmt
+
+
+def _flatten_alpha(image: Image.Image) -> Image.Image:
+    """투명 영역을 흰 배경으로 채운 RGB (JPEG 인코딩용)"""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image if image.mode in ("RGB", "L") else image.convert("RGB")
+
+
+def save_image(
+    image: Image.Image,
+    fp: BinaryIO,
+    fmt: str = "PNG",
+    quality: Optional[int] = None,
+    compress_level: Optional[int] = None
+):
+    """
+    용도별 빠른 설정으로 저장
+
+    - PNG: compress_level (기본 IMAGE_PNG_COMPRESS_LEVEL)
+    - JPEG: 투명 영역은 흰 배경, quality (기본 IMAGE_PREVIEW_QUALITY)
+    - WEBP: quality (기본 IMAGE_PREVIEW_QUALITY), method 4
+    """
+    fmt = _normalize_format(fmt)
+    start = time.perf_counter()
+    position = fp.tell()
+    if fmt == "PNG":
+        level = IMAGE_PNG_COMPRESS_LEVEL if compress_level is None else compress_level
+        image.save(fp, format="PNG", compress_level=level)
+    elif fmt == "JPEG":
+        _flatten_alpha(image).save(fp, format="JPEG", quality=quality or IMAGE_PREVIEW_QUALITY)
+    elif fmt == "WEBP":
+        image.save(fp, format="WEBP", quality=quality or IMAGE_PREVIEW_QUALITY, method=4)
+    else:
+        image.save(fp, format=fmt)
+    _record_encode(fmt, fp.tell() - position, (time.perf_counter() - start) * 1000)
+
+
+def save_png(image: Image.Image, fp: BinaryIO, compress_level: Optional[int] = None):
+    """PNG 저장 (기본 IMAGE_PNG_COMPRESS_LEVEL)"""
+    save_image(image, fp, "PNG", compress_level=compress_level)
+
+
+def encode_image(
+    image: Image.Image,
+    fmt: str = "PNG",
+    quality: Optional[int] = None,
+    compress_level: Optional[int] = None
+) -> bytes:
+    """이미지를 바이트로 인코딩 (save_image 설정)"""
+    buffer = io.BytesIO()
+    save_image(image, buffer, fmt, quality, compress_level)
+    return buffer.getvalue()
+
+
+def encode_png(image: Image.Image, compress_level: Optional[int] = None) -> bytes:
+    """PNG 바이트 (기본 IMAGE_PNG_COMPRESS_LEVEL)"""
+    return encode_image(image, "PNG", compress_level=compress_level)
+
+
+def mime_type(fmt: str) -> str:
+    return _MIME_TYPES.get(_normalize_format(fmt), "application/octet-stream")
+
+
+def to_base64(image: Image.Image, fmt: str = "PNG", quality: Optional[int] = None) -> str:
+    """이미지를 base64 문자열로 인코딩"""
+    return base64.b64encode(encode_image(image, fmt, quality)).decode("utf-8")
+
+
+def to_data_url(image: Image.Image, fmt: str = "PNG", quality: Optional[int] = None) -> str:
+    """이미지를 data URL로 인코딩 (예: "data:image/png;base64,...")"""
+    return f"data:{mime_type(fmt)};base64,{to_base64(image, fmt, quality)}"
+
+
+def encode_preview(
+    image: Image.Image,
+    max_side: Optional[int] = IMAGE_PREVIEW_MAX_SIDE,
+    fmt: str = IMAGE_PREVIEW_FORMAT,
+    quality: Optional[int] = None
+) -> Tuple[bytes, str]:
+    """
+    미리보기 인코딩 (원본 에코, 썸네일, 판별용 LLM 입력)
+
+    긴 변이 max_side보다 크면 복사본을 줄여서 인코딩합니다 (원본 이미지는 변경하지 않음).
+
+    Returns:
+        (이미지 바이트, MIME 타입)
+    """
+    if max_side and max(image.size) > max_side:
+        image = image.copy()
+        image.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+    return encode_image(image, fmt, quality), mime_type(fmt)
+
+
+def preview_data_url(
+    image: Image.Image,
+    max_side: Optional[int] = IMAGE_PREVIEW_MAX_SIDE,
+    fmt: str = IMAGE_PREVIEW_FORMAT,
+    quality: Optional[int] = None
+) -> str:
+    """미리보기 data URL (encode_preview 설정)"""
+    data, mime = encode_preview(image, max_side, fmt, quality)
+    return f"data:{mime};base64,{base64.b64encode(data).decode('utf-8')}"
+
+
+def get_codec_metrics() -> Dict:
+    """디코딩 / 축소 디코딩 / 거부 수, 평균 디코딩 시간, 포맷별 인코딩 수와 평균 시간"""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+        encoded = {fmt: dict(stats) for fmt, stats in _metrics["encoded"].items()}
+    total_decode_ms = metrics.pop("total_decode_ms")
+    metrics["avg_decode_ms"] = round(total_decode_ms / metrics["decoded"], 2) if metrics["decoded"] else None
+    for stats in encoded.values():
+        stats["avg_ms"] = round(stats.pop("total_ms") / stats["count"], 2) if stats["count"] else None
+    metrics["encoded"] = encoded
+    metrics["max_pixels"] = IMAGE_MAX_PIXELS
+    metrics["png_compress_level"] = IMAGE_PNG_COMPRESS_LEVEL
+    metrics["preview_format"] = IMAGE_PREVIEW_FORMAT
+    return metrics
@@ -0,0 +1,322 @@
+"""로컬 모델 추론용 동적 마이크로 배칭 스케줄러"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from config.micro_batching import get_micro_batch_config, MICRO_BATCH_WORKERS, MICRO_BATCH_RUN_TIMEOUT_SEC
+
+# 배치 함수: 입력 리스트를 받아 같은 순서의 출력 리스트를 반환
+BatchFn = Callable[[List[Any]], List[Any]]
+
+
+class MicroBatcher:
+    """
+    같은 모델에 대한 요청을 최대 max_wait_ms 동안 또는 배치가 가득 찰 때까지 모아
+    한 번의 배치 추론으로 실행하고, 결과를 각 요청 코루틴에 나누어 돌려주는 스케줄러
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_fn: BatchFn,
+        max_batch_size: int,
+        max_wait_ms: float,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """
+        Args:
+            name: 모델 이름 (메트릭 표시용)
+            batch_fn: 배치 추론 함수 (동기, 별도 스레드에서 실행)
+            max_batch_size: 최대 배치 크기
+            max_wait_ms: 첫 요청 도착 후 배치를 모으는 최대 대기 시간 (ms)
+            executor: 배치 실행용 스레드 풀 (None이면 공용 풀 사용)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.executor = executor
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 메트릭
+        self.total_requests = 0
+        self.total_batches = 0
+        self.total_errors = 0
+        self.total_direct_calls = 0
+        self.total_timeouts = 0
+        self.batch_size_histogram: Dict[int, int] = {}
+        self.total_queue_wait = 0.0
+        self.total_inference_time = 0.0
+        self.max_queue_depth = 0
+
+    def _ensure_worker(self):
+        """현재 이벤트 루프에 큐와 워커 태스크를 준비 (lazy)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, item: Any) -> Any:
+        """
+        단일 입력을 큐에 넣고 배치 추론 결과를 기다림
+
+        Args:
+            item: 모델 입력 (예: 전처리된 np.ndarray, 배치 차원 없음)
+
+        Returns:
+            해당 입력에 대한 모델 출력
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        self.total_requests += 1
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return await future
+
+    async def submit_many(self, items: List[Any]) -> List[Any]:
+        """여러 입력을 한꺼번에 큐에 넣고 입력 순서대로 결과 반환 (다른 요청 입력과 함께 배치될 수 있음)"""
+        return list(await asyncio.gather(*(self.submit(item) for item in items)))
+
+    def run(self, items: List[Any]) -> List[Any]:
+        """
+        동기 코드(asyncio.to_thread 워커 스레드 등)에서 배치 큐를 거쳐 추론
+
+        start_micro_batching()으로 바인딩된 이벤트 루프의 큐에 넣고 결과를 기다립니다.
+        바인딩된 루프가 없거나(스크립트) 루프 스레드에서 호출되면 배치 함수를 바로 실행합니다.
+        루프가 멈추거나 종료 중이어도 호출 스레드가 묶이지 않도록
+        max_wait_ms + MICRO_BATCH_RUN_TIMEOUT_SEC 안에 결과가 없으면 요청을 취소하고 TimeoutError를 냅니다.
+
+        Args:
+            items: 모델 입력 리스트 (배치 차원 없음)
+
+        Returns:
+            입력 순서대로의 모델 출력 리스트
+
+        Raises:
+            TimeoutError: 제한 시간 안에 배치 결과를 받지 못한 경우
+        """
+        loop = _event_loop
+        if loop is None or loop.is_closed() or _is_loop_thread(loop):
+            self.total_direct_calls += 1
+            return self.batch_fn(list(items))
+
+        timeout = self.max_wait + MICRO_BATCH_RUN_TIMEOUT_SEC
+        future = asyncio.run_coroutine_threadsafe(self.submit_many(items), loop)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self.total_timeouts += 1
+            raise TimeoutError(
+                f"[MicroBatcher:{self.name}] {timeout:.1f}초 안에 배치 추론 결과를 받지 못했습니다 "
+                f"(이벤트 루프 지연 또는 종료 중, 입력 {len(items)}개)"
+            ) from None
+
+    async def _run(self):
+        """큐에서 요청을 모아 배치 단위로 실행하는 워커 루프"""
+        while True:
+            first = await self._queue.get()
+            batch = [first]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                # 이미 도착한 요청은 대기 없이 바로 추가
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._execute(batch)
+
+    async def _execute(self, batch: List[tuple]):
+        """배치 추론 실행 후 결과를 각 future에 전달"""
+        items = [item for item, _, _ in batch]
+        now = time.perf_counter()
+        self.total_queue_wait += sum(now - enqueued for _, _, enqueued in batch)
+
+        start = time.perf_counter()
+        try:
+            outputs = await self._loop.run_in_executor(
+                self.executor or _get_executor(), self.batch_fn, items
+            )
+            if len(outputs) != len(items):
+                raise RuntimeError(
+                    f"배치 출력 개수 불일치: 입력 {len(items)}개, 출력 {len(outputs)}개"
+                )
+        except Exception as e:
+            self.total_errors += 1
+            print(f"[MicroBatcher:{self.name}] 배치 추론 오류 (배치 크기 {len(items)}): {e}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self.total_inference_time += time.perf_counter() - start
+            self.total_batches += 1
+            self.batch_size_histogram[len(items)] = self.batch_size_histogram.get(len(items), 0) + 1
+
+        for (_, future, _), output in zip(batch, outputs):
+            if not future.done():
+                future.set_result(output)
+
+    def get_metrics(self) -> Dict:
+        """큐/배치 크기 메트릭 반환"""
+        return {
+            "name": self.name,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000.0,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "total_requests": self.total_requests,
+            "total_batches": self.total_batches,
+            "total_errors": self.total_errors,
+            "total_direct_calls": self.total_direct_calls,
+            "total_timeouts": self.total_timeouts,
+            "avg_batch_size": round(self.total_requests / self.total_batches, 2) if self.total_batches else 0.0,
+            "batch_size_histogram": dict(sorted(self.batch_size_histogram.items())),
+            "avg_queue_wait_ms": round(self.total_queue_wait / self.total_requests * 1000.0, 3) if self.total_requests else 0.0,
+            "avg_batch_inference_ms": round(self.total_inference_time / self.total_batches * 1000.0, 3) if self.total_batches else 0.0
+        }
+
+
+def make_onnx_batch_fn(
+    session,
+    input_name: Optional[str] = None,
+    output_names: Optional[List[str]] = None,
+    batched_outputs: bool = True
+) -> BatchFn:
+    """
+    ONNX Runtime 세션을 배치 함수로 감싸기
+
+    각 입력(배치 차원 없는 np.ndarray)을 axis 0으로 쌓아 한 번에 추론하고,
+    모든 출력 텐서를 axis 0 기준으로 나누어 입력별 출력 리스트로 반환합니다.
+    입력이 여러 개인 모델은 항목을 세션 입력 순서의 튜플로 전달합니다.
+    첫 번째 입력 차원이 고정(예: 1)이거나 출력에 배치 차원이 없는 모델은 항목별로 순서대로 실행합니다
+    (배치 효과는 없지만 같은 큐로 직렬화).
+
+    Args:
+        session: onnxruntime.InferenceSession
+        input_name: 입력 텐서 이름 (None이면 세션의 모든 입력)
+        output_names: 출력 텐서 이름 (None이면 모든 출력)
+        batched_outputs: 출력 텐서의 첫 번째 차원이 배치 차원인지 여부
+
+    Returns:
+        BatchFn: 배치 함수
+    """
+    inputs = session.get_inputs()
+    names = [input_name] if input_name else [model_input.name for model_input in inputs]
+    batch_dim = inputs[0].shape[0] if inputs[0].shape else 1
+    stackable = batched_outputs and not isinstance(batch_dim, int)
+
+    def parts(item) -> tuple:
+        return item if isinstance(item, tuple) else (item,)
+
+    def batch_fn(items: List[Any]) -> List[List[np.ndarray]]:
+        if not stackable:
+            results = []
+            for item in items:
+                outputs = session.run(output_names, {
+                    name: part[np.newaxis] for name, part in zip(names, parts(item))
+                })
+                results.append([output[0] for output in outputs] if batched_outputs else list(outputs))
+            return results
+
+        columns = zip(*(parts(item) for item in items))
+        outputs = session.run(output_names, {
+            name: np.stack(column, axis=0) for name, column in zip(names, columns)
+        })
+        return [[output[i] for output in outputs] for i in range(len(items))]
+
+    return batch_fn
+
+
+# 배치 실행 전용 스레드 풀 및 모델별 배처 레지스트리
+_executor: Optional[ThreadPoolExecutor] = None
+_batchers: Dict[str, MicroBatcher] = {}
+_batchers_lock = threading.Lock()
+
+# 동기 코드의 MicroBatcher.run()이 배치 큐로 넘길 이벤트 루프 (start_micro_batching에서 바인딩)
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _is_loop_thread(loop: asyncio.AbstractEventLoop) -> bool:
+    """현재 스레드가 loop를 실행 중인지 여부 (루프 스레드에서 결과를 기다리면 교착)"""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def start_micro_batching():
+    """현재 이벤트 루프를 배치 큐 루프로 바인딩 (startup 이벤트에서 호출)"""
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """배치 실행 전용 스레드 풀 반환 (lazy)"""
+    global _executor
+    if _executor is None:
+        with _batchers_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MICRO_BATCH_WORKERS,
+                    thread_name_prefix="micro-batch"
+                )
+    return _executor
+
+
+def register_batcher(name: str, batch_fn: BatchFn) -> MicroBatcher:
+    """
+    모델별 마이크로 배처 등록 (이미 있으면 배치 함수만 교체한 기존 인스턴스 반환)
+
+    모델 레지스트리가 모델을 해제 후 다시 로드하면 새 세션의 배치 함수로 교체되며 메트릭은 유지됩니다.
+    배치 크기/대기 시간은 config/micro_batching.py의 모델별 설정을 따릅니다.
+
+    Args:
+        name: 모델 이름
+        batch_fn: 배치 추론 함수
+
+    Returns:
+        MicroBatcher: 배처 인스턴스
+    """
+    with _batchers_lock:
+        if name not in _batchers:
+            config = get_micro_batch_config(name)
+            _batchers[name] = MicroBatcher(
+                name,
+                batch_fn,
+                max_batch_size=config["max_batch_size"],
+                max_wait_ms=config["max_wait_ms"]
+            )
+            print(
+                f"[MicroBatcher] '{name}' 등록 "
+                f"(max_batch_size={config['max_batch_size']}, max_wait_ms={config['max_wait_ms']})"
+            )
+        else:
+            _batchers[name].batch_fn = batch_fn
+        return _batchers[name]
+
+
+def get_batcher(name: str) -> Optional[MicroBatcher]:
+    """등록된 마이크로 배처 반환 (없으면 None)"""
+    return _batchers.get(name)
+
+
+def get_all_batcher_metrics() -> List[Dict]:
+    """등록된 모든 마이크로 배처의 메트릭 반환"""
+    return [batcher.get_metrics() for batcher in list(_batchers.values())]
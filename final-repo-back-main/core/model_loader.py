@@ -1,10 +1,16 @@
 """모델 로딩 및 관리"""
 import asyncio
+from functools import partial
 # import torch  # 주석 처리: torch/transformers 미사용
 from typing import Optional
 # from transformers import SegformerImageProcessor, AutoModelForSemanticSegmentation  # 주석 처리: torch/transformers 미사용
 from services.body_analysis_service import BodyAnalysisService
 from services.image_classifier_service import ImageClassifierService
+from core.model_registry import get_model_registry
+from config.pose_backend import POSE_BACKEND, POSE_LOCAL_WHEN_REMOTE_WARMING
+from services.pose_backends import POSE_BACKEND_MODEL_NAMES, load_pose_backend
+from config.face_backend import FACE_BACKEND, FACE_LOCAL_WHEN_REMOTE_WARMING
+from services.face_backends import LOCAL_FACE_MODEL_NAME, load_local_face_backend
 
 # 전역 변수로 모델 저장
 processor = None
@@ -20,8 +26,7 @@ sdxl_pipeline = None
 # 체형 분석 서비스 전역 변수
 body_analysis_service: Optional[BodyAnalysisService] = None
 
-# 이미지 분류 서비스 전역 변수
-image_classifier_service: Optional[ImageClassifierService] = None
+# 이미지 분류 서비스는 모델 레지스트리에서 지연 로딩 (get_image_classifier_service 참고)
 
 
 # ============================================================
@@ -83,6 +88,56 @@ from typing import Optional
 #     return realesrgan_model
 
 
+def _load_image_classifier_service() -> ImageClassifierService:
+    """이미지 분류 서비스 로드 (모델 레지스트리 로더)"""
+    print("이미지 분류 서비스 초기화 중...")
+    service = ImageClassifierService()
+    if service.is_initialized:
+        print("✅ 이미지 분류 서비스 초기화 완료")
+    else:
+        print("⚠️  이미지 분류 서비스 초기화 실패")
+    return service
+
+
+def register_local_models():
+    """
+    로컬 모델을 레지스트리에 등록 (로드는 첫 사용 시 수행)
+
+    기동 시 일괄 로딩 대신 첫 요청에서 모델별 락으로 한 번만 로드하고,
+    RAM 예산 초과/유휴 시간 경과 시 LRU 순으로 해제합니다.
+    """
+    registry = get_model_registry()
+    # 이미지 분류 ONNX 세션은 가중치를 워커 간 공유
+    registry.register("image_classifier", _load_image_classifier_service, shared=True)
+
+    # 로컬 포즈 백엔드 (POSE_BACKEND=mediapipe / onnx, remote면 원격 콜드 스타트 중 대체용)
+    local_pose_backend = POSE_BACKEND if POSE_BACKEND != "remote" else POSE_LOCAL_WHEN_REMOTE_WARMING
+    if local_pose_backend in POSE_BACKEND_MODEL_NAMES:
+        registry.register(
+            POSE_BACKEND_MODEL_NAMES[local_pose_backend],
+            partial(load_pose_backend, local_pose_backend),
+            # ONNX 세션은 가중치를 워커 간 공유 (core/shared_weights.py), 대체용은 사전 로딩하지 않음
+            shared=POSE_BACKEND == "onnx"
+        )
+
+    # 로컬 얼굴 백엔드 (FACE_BACKEND=local, remote면 원격 콜드 스타트 중 대체용, SCRFD + ArcFace + INSwapper ONNX)
+    if FACE_BACKEND == "local" or FACE_LOCAL_WHEN_REMOTE_WARMING:
+        registry.register(LOCAL_FACE_MODEL_NAME, load_local_face_backend, shared=FACE_BACKEND == "local")
+
+
+def preload_shared_models():
+    """
+    공유 가중치 모델 사전 로딩 (워커 fork 전 마스터 프로세스에서 호출)
+
+    SHARED_WEIGHTS_PRELOAD=true 이고 gunicorn --preload로 실행하면 main.py import 시점에
+    호출되어, 워커들이 가중치의 물리 페이지를 공유합니다.
+    """
+    register_local_models()
+    loaded = get_model_registry().preload_shared()
+    if loaded:
+        print(f"✅ 공유 가중치 모델 사전 로딩 완료: {', '.join(loaded)}")
+
+
 async def load_models():
     """애플리케이션 시작 시 DB 초기화 및 서비스 초기화 (torch/transformers 모델 제외)"""
     global body_analysis_service
@@ -110,6 +165,10 @@ async def load_models():
     loop = asyncio.get_event_loop()
     await loop.run_in_executor(None, init_database)
 
+    # 로컬 모델 레지스트리 등록 및 유휴 해제 태스크 시작 (모델 로드는 첫 사용 시)
+    register_local_models()
+    get_model_registry().start_idle_reaper()
+
     # 체형 분석 서비스 초기화 (API 기반, torch/transformers 불필요)
     try:
         print("체형 분석 서비스 초기화 중...")
@@ -185,20 +244,15 @@ def get_body_analysis_service():
 
 
 def get_image_classifier_service():
-    """전역 image_classifier_service 반환 (lazy loading)"""
-    global image_classifier_service
-    if image_classifier_service is None:
-        try:
-            print("이미지 분류 서비스 초기화 중...")
-            image_classifier_service = ImageClassifierService()
-            if image_classifier_service and image_classifier_service.is_initialized:
-                print("✅ 이미지 분류 서비스 초기화 완료")
-            else:
-                print("⚠️  이미지 분류 서비스 초기화 실패")
-        except Exception as e:
-            print(f"❌ 이미지 분류 서비스 로딩 오류: {e}")
-            image_classifier_service = None
-    return image_classifier_service
+    """image_classifier_service 반환 (모델 레지스트리 지연 로딩)"""
+    registry = get_model_registry()
+    if not registry.is_registered("image_classifier"):
+        register_local_models()
+    try:
+        return registry.get("image_classifier")
+    except Exception as e:
+        print(f"❌ 이미지 분류 서비스 로딩 오류: {e}")
+        return None
 
 
 def get_segformer_model():
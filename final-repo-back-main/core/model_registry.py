@@ -0,0 +1,306 @@
+"""로컬 모델 레지스트리 (지연 로딩 / RAM 예산 / LRU 유휴 해제)"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from config.model_registry import (
+    MODEL_RAM_BUDGET_MB,
+    MODEL_IDLE_TIMEOUT_SEC,
+    MODEL_EVICTION_INTERVAL_SEC
+)
+
+
+def _current_rss_bytes() -> int:
+    """현재 프로세스 RSS (Linux /proc 기반, 측정 불가 시 0)"""
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+class ModelEntry:
+    """레지스트리에 등록된 모델 한 개의 상태"""
+
+    def __init__(self, name: str, loader: Callable[[], Any], size_bytes: Optional[int], pinned: bool, shared: bool):
+        self.name = name
+        self.loader = loader
+        self.declared_size = size_bytes
+        self.shared = shared
+        # 공유 가중치 모델은 마스터에서 실제로 사전 로딩된 경우에만 고정 (preload_shared에서 설정)
+        self.pinned = pinned
+        self.lock = threading.Lock()  # 모델별 로딩 락 (동시 첫 요청 시 한 번만 로드)
+
+        self.model: Any = None
+        self.size_bytes = 0
+        self.loaded_at: Optional[float] = None
+        self.last_used: Optional[float] = None
+        self.hit_count = 0
+        self.load_count = 0
+        self.last_load_time = 0.0
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    def info(self) -> Dict:
+        """관리자 조회용 정보"""
+        now = time.time()
+        return {
+            "name": self.name,
+            "loaded": self.is_loaded,
+            "pinned": self.pinned,
+            "shared": self.shared,
+            "size_mb": round(self.size_bytes / (1024 * 1024), 2),
+            "hit_count": self.hit_count,
+            "load_count": self.load_count,
+            "last_load_time_sec": round(self.last_load_time, 3),
+            "idle_sec": round(now - self.last_used, 1) if self.last_used else None,
+            "loaded_at": self.loaded_at
+        }
+
+
+class ModelRegistry:
+    """
+    로컬 모델을 등록해 두고 첫 사용 시 지연 로딩하며,
+    RAM 예산을 넘거나 유휴 시간이 지나면 LRU 순으로 해제하는 레지스트리
+    """
+
+    def __init__(self, ram_budget_mb: int = MODEL_RAM_BUDGET_MB, idle_timeout_sec: int = MODEL_IDLE_TIMEOUT_SEC):
+        """
+        Args:
+            ram_budget_mb: 로드된 모델 합계 RAM 예산 (MB)
+            idle_timeout_sec: 유휴 해제 시간 (초, 0이면 비활성화)
+        """
+        self.ram_budget_bytes = ram_budget_mb * 1024 * 1024
+        self.idle_timeout_sec = idle_timeout_sec
+        self._entries: Dict[str, ModelEntry] = {}
+        self._lru: "OrderedDict[str, None]" = OrderedDict()  # 로드된 모델 (오래된 사용 순)
+        self._lock = threading.Lock()  # 레지스트리 상태 보호용
+        self._reaper_task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        name: str,
+        loader: Callable[[], Any],
+        size_bytes: Optional[int] = None,
+        pinned: bool = False,
+        shared: bool = False
+    ):
+        """
+        모델 로더 등록 (이 시점에는 로드하지 않음)
+
+        Args:
+            name: 모델 이름
+            loader: 모델 객체를 반환하는 로딩 함수
+            size_bytes: 모델 메모리 크기 (None이면 로딩 전후 RSS 차이로 측정)
+            pinned: True면 예산 초과/유휴 시에도 해제하지 않음
+            shared: True면 워커 fork 전 사전 로딩 대상 (core/shared_weights.py로 가중치 공유).
+                사전 로딩에 성공한 경우에만 고정되고, 아니면 일반 모델처럼 예산/유휴 해제 대상
+        """
+        with self._lock:
+            if name in self._entries:
+                return
+            self._entries[name] = ModelEntry(name, loader, size_bytes, pinned, shared)
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._entries
+
+    def get(self, name: str) -> Any:
+        """
+        모델 반환 (미로드 상태면 로드) - 동기 버전
+
+        Args:
+            name: 모델 이름
+
+        Returns:
+            로드된 모델 객체
+
+        Raises:
+            KeyError: 등록되지 않은 모델
+        """
+        entry = self._entries.get(name)
+        if entry is None:
+            raise KeyError(f"등록되지 않은 모델입니다: {name}")
+
+        model = entry.model
+        if model is None:
+            with entry.lock:
+                # 락 대기 중 다른 요청이 로드를 끝냈을 수 있음
+                if entry.model is None:
+                    self._load(entry)
+                model = entry.model
+
+        with self._lock:
+            entry.hit_count += 1
+            entry.last_used = time.time()
+            if name in self._lru:
+                self._lru.move_to_end(name)
+        return model
+
+    async def get_async(self, name: str) -> Any:
+        """모델 반환 - 비동기 버전 (로딩은 스레드에서 수행하여 이벤트 루프를 막지 않음)"""
+        entry = self._entries.get(name)
+        if entry is not None and entry.model is not None:
+            return self.get(name)
+        return await asyncio.to_thread(self.get, name)
+
+    def preload_shared(self) -> List[str]:
+        """
+        공유 가중치 모델(shared=True)을 미리 로드하고 고정
+
+        워커 fork 전 마스터 프로세스에서 호출하면(gunicorn --preload)
+        워커들이 같은 물리 페이지를 copy-on-write로 참조합니다.
+        해제 후 재로딩하면 워커 전용 메모리가 되므로 여기서 로드한 모델만 예산/유휴 해제에서 제외합니다.
+
+        Returns:
+            list: 로드한 모델 이름
+        """
+        loaded = []
+        for name, entry in list(self._entries.items()):
+            if not entry.shared or entry.is_loaded:
+                continue
+            try:
+                self.get(name)
+                entry.hit_count = 0  # 사전 로딩은 사용 횟수에서 제외
+                entry.pinned = True
+                loaded.append(name)
+            except Exception as e:
+                print(f"[ModelRegistry] 공유 모델 '{name}' 사전 로딩 실패: {e}")
+        return loaded
+
+    def _load(self, entry: ModelEntry):
+        """모델 로드 및 예산 반영 (entry.lock 보유 상태에서 호출)"""
+        print(f"[ModelRegistry] '{entry.name}' 로딩 중...")
+        if entry.declared_size:
+            self._ensure_budget(entry.declared_size, exclude=entry.name)
+
+        rss_before = _current_rss_bytes()
+        start = time.time()
+        model = entry.loader()
+        entry.last_load_time = time.time() - start
+        measured = max(0, _current_rss_bytes() - rss_before)
+
+        with self._lock:
+            entry.model = model
+            entry.size_bytes = entry.declared_size or measured
+            entry.loaded_at = time.time()
+            entry.last_used = entry.loaded_at
+            entry.load_count += 1
+            self._lru[entry.name] = None
+            self._lru.move_to_end(entry.name)
+
+        print(
+            f"[ModelRegistry] '{entry.name}' 로딩 완료 "
+            f"({entry.last_load_time:.2f}초, {entry.size_bytes / (1024 * 1024):.1f}MB)"
+        )
+        # 실측 크기로 예산 재확인
+        self._ensure_budget(0, exclude=entry.name)
+
+    def _loaded_bytes(self) -> int:
+        return sum(self._entries[name].size_bytes for name in self._lru)
+
+    def _ensure_budget(self, incoming_bytes: int, exclude: Optional[str] = None):
+        """예산 초과 시 LRU 순으로 해제 (pinned / exclude 제외)"""
+        evicted = []
+        with self._lock:
+            for name in list(self._lru.keys()):
+                if self._loaded_bytes() + incoming_bytes <= self.ram_budget_bytes:
+                    break
+                entry = self._entries[name]
+                if entry.pinned or name == exclude:
+                    continue
+                self._release(entry)
+                evicted.append(name)
+        for name in evicted:
+            print(f"[ModelRegistry] RAM 예산 초과로 '{name}' 해제")
+
+    def _release(self, entry: ModelEntry):
+        """모델 참조 해제 (self._lock 보유 상태에서 호출)"""
+        entry.model = None
+        entry.size_bytes = 0
+        entry.loaded_at = None
+        self._lru.pop(entry.name, None)
+
+    def unload(self, name: str) -> bool:
+        """모델 수동 해제"""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None or not entry.is_loaded:
+                return False
+            self._release(entry)
+        print(f"[ModelRegistry] '{name}' 수동 해제")
+        return True
+
+    def evict_idle(self) -> List[str]:
+        """유휴 시간이 지난 모델 해제"""
+        if self.idle_timeout_sec <= 0:
+            return []
+        now = time.time()
+        evicted = []
+        with self._lock:
+            for name in list(self._lru.keys()):
+                entry = self._entries[name]
+                if entry.pinned or entry.last_used is None:
+                    continue
+                if now - entry.last_used >= self.idle_timeout_sec:
+                    self._release(entry)
+                    evicted.append(name)
+        for name in evicted:
+            print(f"[ModelRegistry] 유휴 시간 초과로 '{name}' 해제")
+        return evicted
+
+    def start_idle_reaper(self, interval_sec: int = MODEL_EVICTION_INTERVAL_SEC):
+        """유휴 모델을 주기적으로 해제하는 백그라운드 태스크 시작"""
+        if self.idle_timeout_sec <= 0:
+            return
+        if self._reaper_task is not None and not self._reaper_task.done():
+            return
+
+        async def reaper():
+            while True:
+                await asyncio.sleep(interval_sec)
+                try:
+                    self.evict_idle()
+                except Exception as e:
+                    print(f"[ModelRegistry] 유휴 해제 오류: {e}")
+
+        self._reaper_task = asyncio.get_running_loop().create_task(reaper())
+
+    def list_models(self) -> Dict:
+        """등록된 모델 목록 및 예산 사용량"""
+        with self._lock:
+            models = [entry.info() for entry in self._entries.values()]
+            loaded_bytes = self._loaded_bytes()
+        return {
+            "ram_budget_mb": round(self.ram_budget_bytes / (1024 * 1024), 2),
+            "loaded_mb": round(loaded_bytes / (1024 * 1024), 2),
+            "idle_timeout_sec": self.idle_timeout_sec,
+            "models": models
+        }
+
+
+# 전역 인스턴스 (lazy initialization)
+_registry_instance: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    전역 ModelRegistry 인스턴스 반환 (Singleton 패턴)
+
+    Returns:
+        ModelRegistry: 모델 레지스트리 인스턴스
+    """
+    global _registry_instance
+
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = ModelRegistry()
+
+    return _registry_instance
@@ -0,0 +1,427 @@
+"""바이트 예산 메모리 LRU + 용량 제한 디스크 캐시 (2단 객체 캐시)
+
+원본 저장소(S3 등)를 모르는 범용 계층이며, 원본 조회와 ETag 재검증은 호출 측 서비스에서 담당합니다.
+"""
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+TIER_MEMORY = "memory"
+TIER_DISK = "disk"
+
+
+class CachedObject:
+    """캐시된 객체 (본문 + 검증용 메타데이터)"""
+
+    __slots__ = ("data", "etag", "last_modified", "content_type", "validated_at")
+
+    def __init__(
+        self,
+        data: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_type: str,
+        validated_at: Optional[float] = None
+    ):
+        self.data = data
+        self.etag = etag
+        self.last_modified = last_modified
+        self.content_type = content_type
+        self.validated_at = time.time() if validated_at is None else validated_at
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+    def meta(self) -> Dict:
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_type": self.content_type,
+            "validated_at": self.validated_at
+        }
+
+
+class MemoryObjectCache:
+    """
+    스레드 안전 바이트 예산 LRU
+
+    - 저장된 본문 크기 합이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - max_item_bytes보다 큰 객체는 저장하지 않음 (큰 객체 하나가 캐시 전체를 밀어내지 않도록)
+    """
+
+    def __init__(self, max_bytes: int, max_item_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, CachedObject]" = OrderedDict()
+        self.bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[CachedObject]:
+        with self._lock:
+            obj = self._data.get(key)
+            if obj is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return obj
+
+    def set(self, key: str, obj: CachedObject) -> bool:
+        """저장 (크기 제한으로 저장하지 않으면 False)"""
+        if obj.size > self.max_item_bytes or obj.size > self.max_bytes:
+            self.delete(key)
+            return False
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.bytes -= old.size
+            self._data[key] = obj
+            self.bytes += obj.size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            obj = self._data.pop(key, None)
+            if obj is None:
+                return False
+            self.bytes -= obj.size
+            return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [key for key in self._data if key.startswith(prefix)]
+            for key in keys:
+                self.bytes -= self._data.pop(key).size
+            return len(keys)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            self.bytes = 0
+            return count
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "items": len(self._data),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions
+            }
+
+
+class DiskObjectCache:
+    """
+    용량 제한 디스크 캐시 (여러 워커가 같은 디렉토리 공유)
+
+    - 키마다 <sha256>.bin (본문) + <sha256>.json (키 / ETag 등 메타데이터) 파일 쌍
+    - 임시 파일에 쓴 뒤 os.replace로 교체 (원자적 쓰기, 다른 워커가 반쯤 쓴 파일을 읽지 않음)
+    - 용량 상한은 디렉토리 전체 기준: 사용량이 상한을 넘거나 rescan_sec이 지나면 디렉토리를 다시 스캔해
+      모든 워커가 쓴 파일 크기를 합산하고, 넘은 만큼 오래 사용하지 않은(본문 수정 시각) 항목부터 삭제
+    - 다른 워커가 쓴 항목도 파일이 있으면 적중 (인덱스는 LRU / 접두사 삭제용 사본)
+    - hits / misses / evictions는 워커별 카운터
+    """
+
+    def __init__(self, directory: Path, max_bytes: int, rescan_sec: float = 30.0):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.rescan_sec = rescan_sec
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # key -> 본문 크기 (LRU 순서)
+        self.bytes = 0
+        self._scanned_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.write_errors = 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        items = self._scan(evict=True)
+        if items:
+            print(f"[ObjectCache] 디스크 캐시 인덱스 복원: {items}개, {self.bytes / (1024 * 1024):.1f}MB ({self.directory})")
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.bin", self.directory / f"{digest}.json"
+
+    def _scan(self, evict: bool = False) -> int:
+        """
+        디렉토리 기준으로 인덱스 / 사용량 재계산 (다른 워커가 쓴 항목 포함)
+
+        evict면 디렉토리 전체 사용량이 max_bytes 이하가 될 때까지 본문 수정 시각이 오래된 항목부터 삭제합니다.
+        최근 사용 순서는 본문 파일 수정 시각 기준 (get에서 갱신)
+
+        Returns:
+            스캔 후 항목 수
+        """
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            data_path = meta_path.with_suffix(".bin")
+            try:
+                with open(meta_path, encoding="utf-8") as f:
+                    key = json.load(f)["key"]
+                stat = data_path.stat()
+            except FileNotFoundError:
+                # 다른 워커가 삭제 중이거나 본문 없는 메타데이터
+                if meta_path.exists() and not data_path.exists():
+                    self._remove_files(meta_path)
+                continue
+            except (OSError, ValueError, KeyError):
+                self._remove_files(data_path, meta_path)
+                continue
+            entries.append((stat.st_mtime, key, stat.st_size))
+        entries.sort()
+
+        total = sum(size for _, _, size in entries)
+        evicted = 0
+        if evict:
+            while total > self.max_bytes and len(entries) > 1:
+                _, key, size = entries.pop(0)
+                data_path, meta_path = self._paths(key)
+                # 메타데이터를 먼저 지워 다른 워커가 본문 없는 항목을 읽지 않도록
+                self._remove_files(meta_path, data_path)
+                total -= size
+                evicted += 1
+
+        with self._lock:
+            self._index = OrderedDict((key, size) for _, key, size in entries)
+            self.bytes = total
+            self.evictions += evicted
+            self._scanned_at = time.time()
+        return len(entries)
+
+    def _enforce_capacity(self):
+        """디렉토리 재스캔 후 상한 초과분 삭제 (같은 워커에서 이미 스캔 중이면 건너뜀)"""
+        if not self._scan_lock.acquire(blocking=False):
+            return
+        try:
+            self._scan(evict=True)
+        finally:
+            self._scan_lock.release()
+
+    @staticmethod
+    def _remove_files(*paths: Path):
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _atomic_write(self, path: Path, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._remove_files(Path(tmp_path))
+            raise
+
+    def get(self, key: str) -> Optional[CachedObject]:
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            # 캐시에 없음 (다른 워커가 제거했으면 인덱스에서도 제거)
+            with self._lock:
+                size = self._index.pop(key, None)
+                if size is not None:
+                    self.bytes -= size
+                self.misses += 1
+            return None
+        except (OSError, ValueError):
+            # 손상된 메타데이터
+            self._drop(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        try:
+            data = data_path.read_bytes()
+            os.utime(data_path)
+        except OSError:
+            # 다른 워커가 삭제 중인 항목
+            self._drop(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            if key not in self._index:
+                # 다른 워커가 쓴 항목
+                self._index[key] = len(data)
+                self.bytes += len(data)
+            self._index.move_to_end(key)
+            self.hits += 1
+        return CachedObject(
+            data,
+            meta.get("etag"),
+            meta.get("last_modified"),
+            meta.get("content_type") or "application/octet-stream",
+            meta.get("validated_at")
+        )
+
+    def set(self, key: str, obj: CachedObject) -> bool:
+        """저장 (쓰기 실패 / 용량 초과 객체면 False)"""
+        if obj.size > self.max_bytes:
+            return False
+        data_path, meta_path = self._paths(key)
+        try:
+            # 본문을 먼저 교체하고 메타데이터를 마지막에 써서, 메타데이터가 있으면 본문도 있도록 보장
+            self._atomic_write(data_path, obj.data)
+            self._atomic_write(meta_path, json.dumps({"key": key, **obj.meta()}).encode("utf-8"))
+        except OSError as e:
+            print(f"[ObjectCache] 디스크 캐시 쓰기 실패 ({key}): {e}")
+            with self._lock:
+                self.write_errors += 1
+            return False
+
+        with self._lock:
+            self.bytes += obj.size - self._index.pop(key, 0)
+            self._index[key] = obj.size
+            # 이 워커가 아는 사용량이 상한을 넘었거나, 다른 워커의 쓰기를 반영할 때가 되면 디렉토리 기준으로 정리
+            needs_scan = self.bytes > self.max_bytes or time.time() - self._scanned_at >= self.rescan_sec
+        if needs_scan:
+            self._enforce_capacity()
+        return True
+
+    def update_meta(self, key: str, obj: CachedObject):
+        """본문은 그대로 두고 메타데이터(재검증 시각 등)만 갱신"""
+        with self._lock:
+            if key not in self._index:
+                return
+        try:
+            self._atomic_write(self._paths(key)[1], json.dumps({"key": key, **obj.meta()}).encode("utf-8"))
+        except OSError as e:
+            print(f"[ObjectCache] 디스크 캐시 메타데이터 갱신 실패 ({key}): {e}")
+
+    def _drop(self, key: str) -> bool:
+        with self._lock:
+            size = self._index.pop(key, None)
+            if size is not None:
+                self.bytes -= size
+        data_path, meta_path = self._paths(key)
+        # 메타데이터를 먼저 지워 다른 워커가 본문 없는 항목을 읽지 않도록
+        self._remove_files(meta_path, data_path)
+        return size is not None
+
+    def delete(self, key: str) -> bool:
+        return self._drop(key)
+
+    def delete_prefix(self, prefix: str) -> int:
+        # 다른 워커가 쓴 키도 지우도록 디렉토리를 먼저 스캔
+        self._scan()
+        with self._lock:
+            keys = [key for key in self._index if key.startswith(prefix)]
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def clear(self) -> int:
+        self._scan()
+        with self._lock:
+            keys = list(self._index)
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def stats(self) -> Dict:
+        """items / bytes는 디렉토리 전체(마지막 스캔 + 이후 이 워커의 변경), 나머지 카운터는 워커별"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "directory": str(self.directory),
+                "items": len(self._index),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "scanned_sec_ago": round(time.time() - self._scanned_at, 1),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "write_errors": self.write_errors
+            }
+
+
+class TieredObjectCache:
+    """
+    메모리 → 디스크 2단 캐시
+
+    디스크에서 찾은 항목은 메모리로 승격하고, 저장/삭제는 두 계층에 함께 반영합니다.
+    """
+
+    def __init__(self, name: str, memory: MemoryObjectCache, disk: Optional[DiskObjectCache] = None):
+        self.name = name
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> Tuple[Optional[CachedObject], Optional[str]]:
+        """(객체, 찾은 계층) 또는 (None, None)"""
+        obj = self.memory.get(key)
+        if obj is not None:
+            return obj, TIER_MEMORY
+        if self.disk is not None:
+            obj = self.disk.get(key)
+            if obj is not None:
+                self.memory.set(key, obj)
+                return obj, TIER_DISK
+        return None, None
+
+    def set(self, key: str, obj: CachedObject):
+        self.memory.set(key, obj)
+        if self.disk is not None:
+            self.disk.set(key, obj)
+
+    def mark_validated(self, key: str, obj: CachedObject):
+        """원본과 같음을 확인한 항목의 재검증 시각 갱신"""
+        obj.validated_at = time.time()
+        if self.disk is not None:
+            self.disk.update_meta(key, obj)
+
+    def delete(self, key: str) -> bool:
+        deleted = self.memory.delete(key)
+        if self.disk is not None:
+            deleted = self.disk.delete(key) or deleted
+        return deleted
+
+    def delete_prefix(self, prefix: str) -> int:
+        count = self.memory.delete_prefix(prefix)
+        if self.disk is not None:
+            count = max(count, self.disk.delete_prefix(prefix))
+        return count
+
+    def clear(self) -> int:
+        count = self.memory.clear()
+        if self.disk is not None:
+            count = max(count, self.disk.clear())
+        return count
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            TIER_MEMORY: self.memory.stats(),
+            TIER_DISK: self.disk.stats() if self.disk is not None else None
+        }
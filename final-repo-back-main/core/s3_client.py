@@ -1,54 +1,210 @@
-"""S3 클라이언트"""
+"""S3 클라이언트
+
+boto3 클라이언트는 자격 증명/리전별로 하나만 만들어 재사용합니다 (클라이언트는 스레드 안전).
+비동기 엔드포인트에서는 *_async 함수를 사용하면 S3 전용 스레드 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+"""
+import io
 import os
 import time
+import hashlib
+import asyncio
+import threading
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse, unquote
+
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Optional
+
+from config.s3 import (
+    S3_MAX_POOL_CONNECTIONS,
+    S3_IO_WORKERS,
+    S3_CONNECT_TIMEOUT_SEC,
+    S3_READ_TIMEOUT_SEC,
+    S3_MAX_ATTEMPTS,
+    S3_RETRY_MODE,
+    S3_MULTIPART_THRESHOLD_MB,
+    S3_MULTIPART_CHUNK_MB,
+    S3_MULTIPART_CONCURRENCY,
+    LOG_CONTENT_ADDRESSED,
+    LOG_EXISTS_CACHE_SIZE,
+    LOG_EXISTS_CACHE_TTL_SEC,
+    S3_DELETE_BATCH_SIZE,
+    S3_DELETE_CONCURRENCY
+)
+from core.ttl_cache import get_ttl_cache
+
+# 버킷 종류: 드레스 이미지 (AWS_*) / 테스트 로그 이미지 (LOGS_AWS_*, 별도 계정)
+S3_BUCKET_MAIN = "main"
+S3_BUCKET_LOGS = "logs"
+
+_ENV_PREFIXES = {
+    S3_BUCKET_MAIN: "AWS",
+    S3_BUCKET_LOGS: "LOGS_AWS"
+}
+
+_MB = 1024 * 1024
+
+_client_config = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    connect_timeout=S3_CONNECT_TIMEOUT_SEC,
+    read_timeout=S3_READ_TIMEOUT_SEC,
+    retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": S3_RETRY_MODE}
+)
+
+_transfer_config = TransferConfig(
+    multipart_threshold=S3_MULTIPART_THRESHOLD_MB * _MB,
+    multipart_chunksize=S3_MULTIPART_CHUNK_MB * _MB,
+    max_concurrency=S3_MULTIPART_CONCURRENCY
+)
+
+# (access_key, secret_key, region) -> boto3 S3 클라이언트
+_clients: Dict[Tuple[str, str, str], object] = {}
+_clients_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# 업로드를 확인한 로그 해시 키 (키 -> True). 같은 입력의 HEAD / PUT 요청 생략
+_log_exists_cache = get_ttl_cache("log_object_exists", LOG_EXISTS_CACHE_SIZE, LOG_EXISTS_CACHE_TTL_SEC)
+
+# 내용 주소 로그 업로드 메트릭 (관리자 조회용)
+_log_metrics_lock = threading.Lock()
+_log_metrics = {
+    "uploads": 0,            # upload_log_to_s3 호출 수
+    "put": 0,                # 실제 업로드
+    "skipped_cached": 0,     # 메모리 캐시로 업로드 생략
+    "skipped_existing": 0,   # HEAD로 기존 객체 확인 후 업로드 생략
+    "bytes_put": 0,
+    "bytes_skipped": 0
+}
+
+# 로그 이미지 MIME 타입 -> 확장자
+_LOG_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/webp": "webp",
+    "image/gif": "gif"
+}
+
+
+def get_bucket_settings(bucket_kind: str = S3_BUCKET_MAIN) -> Optional[Dict[str, str]]:
+    """
+    버킷 종류별 S3 설정 (환경 변수)
+
+    Returns:
+        {"access_key", "secret_key", "bucket", "region"} 또는 None (설정 누락)
+    """
+    prefix = _ENV_PREFIXES[bucket_kind]
+    settings = {
+        "access_key": os.getenv(f"{prefix}_ACCESS_KEY_ID"),
+        "secret_key": os.getenv(f"{prefix}_SECRET_ACCESS_KEY"),
+        "bucket": os.getenv(f"{prefix}_S3_BUCKET_NAME"),
+        "region": os.getenv(f"{prefix}_REGION", "ap-northeast-2")
+    }
+    if not all([settings["access_key"], settings["secret_key"], settings["bucket"]]):
+        return None
+    return settings
+
+
+def get_shared_s3_client(access_key: str, secret_key: str, region: str):
+    """자격 증명/리전별 공유 S3 클라이언트 (처음 호출 시 생성)"""
+    key = (access_key, secret_key, region)
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                # 기본 세션은 스레드 안전하지 않으므로 클라이언트마다 세션 생성
+                session = boto3.session.Session(
+                    aws_access_key_id=access_key,
+                    aws_secret_access_key=secret_key,
+                    region_name=region
+                )
+                client = session.client("s3", config=_client_config)
+                _clients[key] = client
+                print(f"[S3] 클라이언트 생성 (region={region}, max_pool_connections={S3_MAX_POOL_CONNECTIONS})")
+    return client
+
+
+def get_s3_client(bucket_kind: str = S3_BUCKET_MAIN):
+    """
+    버킷 종류별 공유 S3 클라이언트
+
+    Returns:
+        (클라이언트, 버킷 설정) 또는 (None, None) (설정 누락)
+    """
+    settings = get_bucket_settings(bucket_kind)
+    if settings is None:
+        return None, None
+    client = get_shared_s3_client(settings["access_key"], settings["secret_key"], settings["region"])
+    return client, settings
+
+
+def _s3_url(settings: Dict[str, str], s3_key: str) -> str:
+    return f"https://{settings['bucket']}.s3.{settings['region']}.amazonaws.com/{s3_key}"
+
+
+def _put_object(
+    s3_client,
+    bucket_name: str,
+    s3_key: str,
+    file_content: bytes,
+    content_type: str,
+    metadata: Optional[Dict[str, str]] = None
+):
+    """업로드 (S3_MULTIPART_THRESHOLD_MB 이상이면 멀티파트)"""
+    extra_args = {"ContentType": content_type}
+    if metadata:
+        extra_args["Metadata"] = metadata
+    if len(file_content) >= _transfer_config.multipart_threshold:
+        s3_client.upload_fileobj(
+            io.BytesIO(file_content),
+            bucket_name,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=_transfer_config
+        )
+    else:
+        s3_client.put_object(
+            Bucket=bucket_name,
+            Key=s3_key,
+            Body=file_content,
+            **extra_args
+        )
 
 
 def upload_to_s3(file_content: bytes, file_name: str, content_type: str = "image/png", folder: str = "dresses") -> Optional[str]:
     """
     S3에 파일 업로드
-    
+
     Args:
         file_content: 파일 내용 (bytes)
         file_name: 파일명
         content_type: MIME 타입
         folder: S3 폴더 경로 (기본값: "dresses")
-    
+
     Returns:
         S3 URL 또는 None (실패 시)
     """
     try:
-        aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
-        region = os.getenv("AWS_REGION", "ap-northeast-2")
-        
-        if not all([aws_access_key, aws_secret_key, bucket_name]):
+        s3_client, settings = get_s3_client(S3_BUCKET_MAIN)
+        if s3_client is None:
             print("AWS S3 설정이 완료되지 않았습니다.")
             return None
-        
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=region
-        )
-        
+
         # S3에 업로드
         s3_key = f"{folder}/{file_name}"
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=file_content,
-            ContentType=content_type
-        )
-        
+        _put_object(s3_client, settings["bucket"], s3_key, file_content, content_type)
+
         # S3 URL 생성
-        s3_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{s3_key}"
-        return s3_url
-        
+        return _s3_url(settings, s3_key)
+
     except ClientError as e:
         print(f"S3 업로드 오류: {e}")
         return None
@@ -57,54 +213,108 @@ def upload_to_s3(file_content: bytes, file_name: str, content_type: str = "image
         return None
 
 
+def content_addressed_log_key(file_content: bytes, content_type: str = "image/png") -> str:
+    """내용 해시 로그 키 (logs/sha256/<앞 2자리>/<다음 2자리>/<sha256>.<확장자>)"""
+    digest = hashlib.sha256(file_content).hexdigest()
+    extension = _LOG_EXTENSIONS.get(content_type, "bin")
+    return f"logs/sha256/{digest[:2]}/{digest[2:4]}/{digest}.{extension}"
+
+
+def _record_log_upload(**counts):
+    with _log_metrics_lock:
+        for name, value in counts.items():
+            _log_metrics[name] += value
+
+
+def _upload_log_once(
+    s3_client,
+    settings: Dict[str, str],
+    s3_key: str,
+    file_content: bytes,
+    content_type: str,
+    model_id: str,
+    image_type: str
+):
+    """해시 키가 없을 때만 업로드 (메모리 캐시 → HEAD → PUT)"""
+    size = len(file_content)
+    _record_log_upload(uploads=1)
+    if _log_exists_cache.get(s3_key):
+        _record_log_upload(skipped_cached=1, bytes_skipped=size)
+        return
+
+    try:
+        s3_client.head_object(Bucket=settings["bucket"], Key=s3_key)
+        _log_exists_cache.set(s3_key, True)
+        _record_log_upload(skipped_existing=1, bytes_skipped=size)
+        return
+    except ClientError as e:
+        # 404 외 오류(ListBucket 권한이 없으면 없는 키도 403)는 확인 불가로 보고 업로드
+        if e.response["Error"]["Code"] not in ("404", "NoSuchKey", "NotFound"):
+            print(f"[S3] 로그 객체 확인 실패, 업로드 진행 ({s3_key}): {e}")
+
+    # 같은 내용이 동시에 올라가도 결과가 같으므로 별도 잠금 없이 업로드
+    _put_object(
+        s3_client, settings["bucket"], s3_key, file_content, content_type,
+        metadata={"model-id": model_id, "image-type": image_type}
+    )
+    _log_exists_cache.set(s3_key, True)
+    _record_log_upload(put=1, bytes_put=size)
+
+
+def forget_log_objects(s3_keys) -> int:
+    """삭제한 로그 객체를 존재 캐시에서 제거 (다음 업로드 때 다시 올리도록)"""
+    return sum(1 for s3_key in s3_keys if _log_exists_cache.delete(s3_key))
+
+
+def get_log_upload_metrics() -> Dict:
+    """내용 주소 로그 업로드 메트릭 (업로드 / 생략 수, 바이트, 생략 비율)"""
+    with _log_metrics_lock:
+        metrics = dict(_log_metrics)
+    skipped = metrics["skipped_cached"] + metrics["skipped_existing"]
+    metrics["content_addressed"] = LOG_CONTENT_ADDRESSED
+    metrics["dedup_rate"] = round(skipped / metrics["uploads"], 4) if metrics["uploads"] else None
+    return metrics
+
+
 def upload_log_to_s3(file_content: bytes, model_id: str, image_type: str, content_type: str = "image/png") -> Optional[str]:
     """
     S3 logs 폴더에 테스트 이미지 업로드 (별도 S3 계정/버킷 사용)
-    
+
+    LOG_CONTENT_ADDRESSED(기본)면 내용 해시 키(logs/sha256/ab/cd/<sha256>.png)에 저장하고,
+    이미 올라간 내용이면 업로드를 생략하고 같은 URL을 반환합니다.
+
     Args:
         file_content: 파일 내용 (bytes)
         model_id: 모델 ID
         image_type: 이미지 타입 (person, dress, result)
         content_type: MIME 타입
-    
+
     Returns:
         S3 URL 또는 None (실패 시)
     """
     try:
         # 별도 S3 계정 환경변수 사용
-        aws_access_key = os.getenv("LOGS_AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.getenv("LOGS_AWS_SECRET_ACCESS_KEY")
-        bucket_name = os.getenv("LOGS_AWS_S3_BUCKET_NAME")
-        region = os.getenv("LOGS_AWS_REGION", "ap-northeast-2")
-        
-        if not all([aws_access_key, aws_secret_key, bucket_name]):
+        s3_client, settings = get_s3_client(S3_BUCKET_LOGS)
+        if s3_client is None:
             print("로그용 S3 설정이 완료되지 않았습니다. (LOGS_AWS_*)")
             return None
-        
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=region
-        )
-        
+
+        if LOG_CONTENT_ADDRESSED:
+            s3_key = content_addressed_log_key(file_content, content_type)
+            _upload_log_once(s3_client, settings, s3_key, file_content, content_type, model_id, image_type)
+            return _s3_url(settings, s3_key)
+
         # 타임스탬프 기반 파일명 생성
         timestamp = int(time.time() * 1000)
         file_name = f"{timestamp}_{model_id}_{image_type}.png"
         s3_key = f"logs/{file_name}"
-        
+
         # S3에 업로드
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=s3_key,
-            Body=file_content,
-            ContentType=content_type
-        )
-        
+        _put_object(s3_client, settings["bucket"], s3_key, file_content, content_type)
+
         # S3 URL 생성
-        s3_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{s3_key}"
-        return s3_url
-        
+        return _s3_url(settings, s3_key)
+
     except ClientError as e:
         print(f"로그용 S3 업로드 오류: {e}")
         return None
@@ -116,42 +326,31 @@ def upload_log_to_s3(file_content: bytes, model_id: str, image_type: str, conten
 def delete_from_s3(file_name: str) -> bool:
     """
     S3에서 파일 삭제
-    
+
     Args:
         file_name: 삭제할 파일명
-    
+
     Returns:
         삭제 성공 여부 (True/False)
     """
     try:
-        aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
-        region = os.getenv("AWS_REGION", "ap-northeast-2")
-        
-        if not all([aws_access_key, aws_secret_key, bucket_name]):
+        s3_client, settings = get_s3_client(S3_BUCKET_MAIN)
+        if s3_client is None:
             print("AWS S3 설정이 완료되지 않았습니다.")
             return False
-        
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=region
-        )
-        
+
         # S3 키 생성 (업로드 시와 동일한 형식)
         s3_key = f"dresses/{file_name}"
-        
+
         # S3에서 삭제
         s3_client.delete_object(
-            Bucket=bucket_name,
+            Bucket=settings["bucket"],
             Key=s3_key
         )
-        
+
         print(f"S3에서 이미지 삭제 완료: {s3_key}")
         return True
-        
+
     except ClientError as e:
         print(f"S3 삭제 오류: {e}")
         return False
@@ -160,37 +359,90 @@ def delete_from_s3(file_name: str) -> bool:
         return False
 
 
+def delete_objects_batch(s3_keys: List[str], bucket_kind: str = S3_BUCKET_MAIN) -> Dict[str, Optional[str]]:
+    """
+    delete_objects 한 번으로 여러 객체 삭제 (최대 S3_DELETE_BATCH_SIZE개)
+
+    Args:
+        s3_keys: 삭제할 S3 키 목록
+        bucket_kind: 버킷 종류
+
+    Returns:
+        키 -> None (삭제됨, 원래 없던 키 포함) 또는 오류 메시지
+    """
+    if not s3_keys:
+        return {}
+    s3_client, settings = get_s3_client(bucket_kind)
+    if s3_client is None:
+        return {s3_key: "S3 설정이 완료되지 않았습니다." for s3_key in s3_keys}
+
+    try:
+        response = s3_client.delete_objects(
+            Bucket=settings["bucket"],
+            Delete={"Objects": [{"Key": s3_key} for s3_key in s3_keys], "Quiet": True}
+        )
+    except ClientError as e:
+        print(f"[S3] 일괄 삭제 오류 ({len(s3_keys)}개): {e}")
+        return {s3_key: str(e) for s3_key in s3_keys}
+    except Exception as e:
+        print(f"[S3] 일괄 삭제 중 예상치 못한 오류 ({len(s3_keys)}개): {e}")
+        return {s3_key: str(e) for s3_key in s3_keys}
+
+    # Quiet 모드: 응답에는 실패한 키만 포함
+    results = {s3_key: None for s3_key in s3_keys}
+    for error in response.get("Errors", []):
+        results[error["Key"]] = f"{error.get('Code', 'Error')}: {error.get('Message', '')}"
+    return results
+
+
+def list_s3_objects(prefix: str, bucket_kind: str = S3_BUCKET_MAIN) -> Optional[List[Dict]]:
+    """
+    접두사 아래 전체 객체 목록 (list_objects_v2 페이지 순회)
+
+    Returns:
+        [{"key", "size", "last_modified"}] 또는 None (설정 누락 / 오류)
+    """
+    s3_client, settings = get_s3_client(bucket_kind)
+    if s3_client is None:
+        print("AWS S3 설정이 완료되지 않았습니다.")
+        return None
+
+    objects = []
+    try:
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=settings["bucket"], Prefix=prefix):
+            for item in page.get("Contents", []):
+                objects.append({
+                    "key": item["Key"],
+                    "size": item["Size"],
+                    "last_modified": item["LastModified"]
+                })
+    except ClientError as e:
+        print(f"[S3] 객체 목록 조회 오류 ({prefix}): {e}")
+        return None
+    return objects
+
+
 def get_s3_image(file_name: str) -> Optional[bytes]:
     """
     S3에서 이미지 다운로드
-    
+
     Args:
         file_name: 파일명 (예: "Adress1.JPG")
-    
+
     Returns:
         이미지 바이트 데이터 또는 None (실패 시)
     """
     try:
-        aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
-        bucket_name = os.getenv("AWS_S3_BUCKET_NAME")
-        region = os.getenv("AWS_REGION", "ap-northeast-2")
-        
-        if not all([aws_access_key, aws_secret_key, bucket_name]):
+        s3_client, settings = get_s3_client(S3_BUCKET_MAIN)
+        if s3_client is None:
             print("AWS S3 설정이 완료되지 않았습니다.")
             return None
-        
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=region
-        )
-        
+
         # S3에서 파일 다운로드
         s3_key = f"dresses/{file_name}"
         try:
-            response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
+            response = s3_client.get_object(Bucket=settings["bucket"], Key=s3_key)
             return response['Body'].read()
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
@@ -206,34 +458,23 @@ def get_s3_image(file_name: str) -> Optional[bytes]:
 def get_logs_s3_image(file_name: str) -> Optional[bytes]:
     """
     로그용 S3에서 이미지 다운로드 (별도 S3 계정/버킷 사용)
-    
+
     Args:
         file_name: 파일명 (예: "1763098638885_gemini-compose_result.png")
-    
+
     Returns:
         이미지 바이트 데이터 또는 None (실패 시)
     """
     try:
-        aws_access_key = os.getenv("LOGS_AWS_ACCESS_KEY_ID")
-        aws_secret_key = os.getenv("LOGS_AWS_SECRET_ACCESS_KEY")
-        bucket_name = os.getenv("LOGS_AWS_S3_BUCKET_NAME")
-        region = os.getenv("LOGS_AWS_REGION", "ap-northeast-2")
-        
-        if not all([aws_access_key, aws_secret_key, bucket_name]):
+        s3_client, settings = get_s3_client(S3_BUCKET_LOGS)
+        if s3_client is None:
             print("로그용 S3 설정이 완료되지 않았습니다. (LOGS_AWS_*)")
             return None
-        
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_access_key,
-            aws_secret_access_key=aws_secret_key,
-            region_name=region
-        )
-        
+
         # S3에서 파일 다운로드 (logs 폴더)
         s3_key = f"logs/{file_name}"
         try:
-            response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
+            response = s3_client.get_object(Bucket=settings["bucket"], Key=s3_key)
             return response['Body'].read()
         except ClientError as e:
             if e.response['Error']['Code'] == 'NoSuchKey':
@@ -244,3 +485,211 @@ def get_logs_s3_image(file_name: str) -> Optional[bytes]:
     except Exception as e:
         print(f"로그용 S3 이미지 다운로드 중 예상치 못한 오류: {e}")
         return None
+
+
+def open_s3_object(
+    bucket_kind: str,
+    s3_key: str,
+    range_header: Optional[str] = None,
+    if_none_match: Optional[str] = None,
+    if_modified_since: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    조건부 / 범위 요청을 S3에 그대로 전달해 객체 열기 (본문은 스트리밍용으로 읽지 않음)
+
+    Args:
+        bucket_kind: S3_BUCKET_MAIN 또는 S3_BUCKET_LOGS
+        s3_key: 객체 키
+        range_header: HTTP Range 헤더 값 (예: "bytes=0-1023")
+        if_none_match: If-None-Match 헤더 값 (있으면 If-Modified-Since보다 우선)
+        if_modified_since: If-Modified-Since 헤더 값 (HTTP 날짜)
+
+    Returns:
+        {"status": 200 | 206 | 304 | 404 | 416, "body": StreamingBody 또는 None, "headers": 응답 헤더}
+        또는 None (S3 설정 누락)
+    """
+    s3_client, settings = get_s3_client(bucket_kind)
+    if s3_client is None:
+        return None
+
+    params = {"Bucket": settings["bucket"], "Key": s3_key}
+    if range_header:
+        params["Range"] = range_header
+    if if_none_match:
+        params["IfNoneMatch"] = if_none_match
+    elif if_modified_since:
+        try:
+            params["IfModifiedSince"] = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            pass
+
+    try:
+        response = s3_client.get_object(**params)
+    except ClientError as e:
+        status = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        if status == 304:
+            raw = e.response["ResponseMetadata"].get("HTTPHeaders", {})
+            headers = {"ETag": raw["etag"]} if "etag" in raw else {}
+            if "last-modified" in raw:
+                headers["Last-Modified"] = raw["last-modified"]
+            return {"status": 304, "body": None, "headers": headers}
+        if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+            return {"status": 404, "body": None, "headers": {}}
+        if e.response["Error"]["Code"] == "InvalidRange":
+            return {"status": 416, "body": None, "headers": {}}
+        raise
+
+    headers = {
+        "ETag": response["ETag"],
+        "Last-Modified": format_datetime(response["LastModified"].astimezone(timezone.utc), usegmt=True),
+        "Content-Length": str(response["ContentLength"]),
+        "Content-Type": response.get("ContentType") or "application/octet-stream",
+        "Accept-Ranges": "bytes"
+    }
+    if response.get("ContentRange"):
+        headers["Content-Range"] = response["ContentRange"]
+    return {
+        "status": 206 if response.get("ContentRange") else 200,
+        "body": response["Body"],
+        "headers": headers
+    }
+
+
+def parse_s3_url(url: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    DB에 저장된 S3 URL을 (버킷 종류, 객체 키)로 변환
+
+    Returns:
+        (S3_BUCKET_MAIN 또는 S3_BUCKET_LOGS, 키) 또는 None (설정된 버킷의 URL이 아님)
+    """
+    if not url:
+        return None
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    s3_key = unquote(parsed.path.lstrip("/"))
+    if not s3_key:
+        return None
+    for bucket_kind in (S3_BUCKET_MAIN, S3_BUCKET_LOGS):
+        settings = get_bucket_settings(bucket_kind)
+        if settings and host in (
+            f"{settings['bucket']}.s3.{settings['region']}.amazonaws.com".lower(),
+            f"{settings['bucket']}.s3.amazonaws.com".lower()
+        ):
+            return bucket_kind, s3_key
+    return None
+
+
+def generate_presigned_get_url(
+    bucket_kind: str,
+    s3_key: str,
+    expires_in: int,
+    response_cache_control: Optional[str] = None
+) -> Optional[str]:
+    """
+    객체 GET용 presigned URL 생성 (로컬 서명, S3 요청 없음)
+
+    Args:
+        bucket_kind: S3_BUCKET_MAIN 또는 S3_BUCKET_LOGS
+        s3_key: 객체 키
+        expires_in: 유효 시간 (초)
+        response_cache_control: S3 응답의 Cache-Control 헤더로 덮어쓸 값
+
+    Returns:
+        presigned URL 또는 None (S3 설정 누락)
+    """
+    s3_client, settings = get_s3_client(bucket_kind)
+    if s3_client is None:
+        return None
+    params = {"Bucket": settings["bucket"], "Key": s3_key}
+    if response_cache_control:
+        params["ResponseCacheControl"] = response_cache_control
+    return s3_client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
+
+
+# ============================================
+# 비동기 래퍼 (S3 전용 스레드 풀)
+# ============================================
+
+def _get_s3_executor() -> ThreadPoolExecutor:
+    """S3 I/O 전용 스레드 풀 (기본 스레드 풀을 S3 대기로 점유하지 않도록 분리)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=S3_IO_WORKERS, thread_name_prefix="s3-io")
+    return _executor
+
+
+async def run_s3_io(func, *args, **kwargs):
+    """블로킹 S3 호출을 S3 전용 스레드 풀에서 실행"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_s3_executor(), partial(func, *args, **kwargs))
+
+
+async def upload_to_s3_async(file_content: bytes, file_name: str, content_type: str = "image/png", folder: str = "dresses") -> Optional[str]:
+    """upload_to_s3 비동기 버전"""
+    return await run_s3_io(upload_to_s3, file_content, file_name, content_type, folder)
+
+
+async def upload_log_to_s3_async(file_content: bytes, model_id: str, image_type: str, content_type: str = "image/png") -> Optional[str]:
+    """upload_log_to_s3 비동기 버전"""
+    return await run_s3_io(upload_log_to_s3, file_content, model_id, image_type, content_type)
+
+
+async def delete_from_s3_async(file_name: str) -> bool:
+    """delete_from_s3 비동기 버전"""
+    return await run_s3_io(delete_from_s3, file_name)
+
+
+async def delete_objects_async(s3_keys: Iterable[str], bucket_kind: str = S3_BUCKET_MAIN) -> Dict[str, Optional[str]]:
+    """
+    여러 객체 일괄 삭제 (S3_DELETE_BATCH_SIZE개씩 나눈 delete_objects를 최대 S3_DELETE_CONCURRENCY개 동시 실행)
+
+    로그 버킷 키는 삭제 후 존재 캐시에서도 제거합니다.
+
+    Returns:
+        키 -> None (삭제됨) 또는 오류 메시지
+    """
+    keys = list(dict.fromkeys(s3_keys))
+    batches = [keys[i:i + S3_DELETE_BATCH_SIZE] for i in range(0, len(keys), S3_DELETE_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(S3_DELETE_CONCURRENCY)
+
+    async def _delete(batch: List[str]) -> Dict[str, Optional[str]]:
+        async with semaphore:
+            return await run_s3_io(delete_objects_batch, batch, bucket_kind)
+
+    results: Dict[str, Optional[str]] = {}
+    for batch_result in await asyncio.gather(*[_delete(batch) for batch in batches]):
+        results.update(batch_result)
+
+    if bucket_kind == S3_BUCKET_LOGS:
+        forget_log_objects(s3_key for s3_key, error in results.items() if error is None)
+
+    failed = sum(1 for error in results.values() if error is not None)
+    if keys:
+        print(f"[S3] 일괄 삭제: {len(keys) - failed}/{len(keys)}개 삭제 ({len(batches)}회 호출)")
+    return results
+
+
+async def list_s3_objects_async(prefix: str, bucket_kind: str = S3_BUCKET_MAIN) -> Optional[List[Dict]]:
+    """list_s3_objects 비동기 버전"""
+    return await run_s3_io(list_s3_objects, prefix, bucket_kind)
+
+
+async def get_s3_image_async(file_name: str) -> Optional[bytes]:
+    """get_s3_image 비동기 버전"""
+    return await run_s3_io(get_s3_image, file_name)
+
+
+async def get_logs_s3_image_async(file_name: str) -> Optional[bytes]:
+    """get_logs_s3_image 비동기 버전"""
+    return await run_s3_io(get_logs_s3_image, file_name)
+
+
+def shutdown_s3_io():
+    """S3 스레드 풀 종료 (앱 shutdown에서 호출)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
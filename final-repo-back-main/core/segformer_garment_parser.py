@@ -14,6 +14,16 @@ from io import BytesIO
 from PIL import Image
 from dotenv import load_dotenv
 
+from core.mask_upsampling import downscale_for_parsing, upsample_mask
+from core.uniform_background import extract_garment_uniform_background
+from config.uniform_background import UNIFORM_BG_ENABLED
+from core.upstream_warmer import (
+    record_upstream_result,
+    UPSTREAM_SEGFORMER_HUMAN_PARSE,
+    UPSTREAM_SEGFORMER_CLOTHES
+)
+from core.image_codec import save_png
+
 # .env 파일 로드
 load_dotenv()
 
@@ -78,12 +88,15 @@ def parse_garment_image(
     # 이미지를 base64로 인코딩
     def image_to_base64(img: Image.Image) -> str:
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
+        save_png(img, buffer)
         img_bytes = buffer.getvalue()
         return base64.b64encode(img_bytes).decode("utf-8")
     
-    garment_b64 = image_to_base64(garment_img)
     original_size = garment_img.size
+    # 작업 해상도로 축소하여 파싱 (마스크는 원본 크기로 엣지 보존 업샘플링)
+    parse_img = downscale_for_parsing(garment_img)
+    parse_size = parse_img.size
+    garment_b64 = image_to_base64(parse_img)
     
     # HuggingFace Inference API 요청 데이터 형식
     payload = {
@@ -95,6 +108,7 @@ def parse_garment_image(
         print(f"[SegFormer B2 Garment Parser] 엔드포인트: {SEGFORMER_API_URL}")
         print(f"[SegFormer B2 Garment Parser] 모델: {SEGFORMER_MODEL_ID}")
         print(f"[SegFormer B2 Garment Parser] 원본 이미지 크기: {original_size[0]}x{original_size[1]}")
+        print(f"[SegFormer B2 Garment Parser] 파싱 해상도: {parse_size[0]}x{parse_size[1]}")
         
         # HuggingFace Inference API 호출
         response = requests.post(
@@ -105,6 +119,7 @@ def parse_garment_image(
         )
         
         print(f"[SegFormer B2 Garment Parser] 응답 상태 코드: {response.status_code}")
+        record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, response.status_code)
         
         # 410 Gone 오류 처리 (구 엔드포인트 사용 시)
         if response.status_code == 410:
@@ -169,6 +184,7 @@ def parse_garment_image(
                 timeout=API_TIMEOUT
             )
             print(f"[SegFormer B2 Garment Parser] 재시도 후 응답 상태 코드: {response.status_code}")
+            record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, response.status_code)
         
         # 성공 응답 처리
         if response.status_code == 200:
@@ -187,7 +203,7 @@ def parse_garment_image(
                         label_bytes = base64.b64decode(result["label"])
                         pred_seg = np.frombuffer(label_bytes, dtype=np.uint8)
                         # 이미지 크기에 맞게 reshape
-                        pred_seg = pred_seg.reshape((original_size[1], original_size[0]))
+                        pred_seg = pred_seg.reshape((parse_size[1], parse_size[0]))
                     else:
                         pred_seg = np.array(result["label"], dtype=np.uint8)
                 
@@ -231,19 +247,19 @@ def parse_garment_image(
             if pred_seg is None:
                 print("[SegFormer B2 Garment Parser] API 응답에서 세그멘테이션 결과를 추출할 수 없습니다. Fallback 로직 사용...")
                 # 간단한 배경 제거 (중앙 픽셀 기준)
-                garment_array = np.array(garment_img.convert("RGB"))
+                garment_array = np.array(parse_img.convert("RGB"))
                 center_pixel = garment_array[garment_array.shape[0]//2, garment_array.shape[1]//2]
                 diff = np.abs(garment_array - center_pixel).sum(axis=2)
                 threshold = 100
                 pred_seg = (diff > threshold).astype(np.uint8)
                 # 전체를 의상 영역으로 간주 (배경이 없는 경우)
-                if np.sum(pred_seg) < original_size[0] * original_size[1] * 0.1:
-                    pred_seg = np.ones((original_size[1], original_size[0]), dtype=np.uint8)
+                if np.sum(pred_seg) < parse_size[0] * parse_size[1] * 0.1:
+                    pred_seg = np.ones((parse_size[1], parse_size[0]), dtype=np.uint8)
             
-            # pred_seg를 원본 이미지 크기에 맞게 리사이즈 (필요한 경우)
-            if pred_seg.shape != (original_size[1], original_size[0]):
+            # pred_seg를 작업 해상도 크기에 맞게 리사이즈 (필요한 경우)
+            if pred_seg.shape != (parse_size[1], parse_size[0]):
                 pred_seg_img = Image.fromarray(pred_seg, mode='L')
-                pred_seg_img = pred_seg_img.resize(original_size, Image.Resampling.NEAREST)
+                pred_seg_img = pred_seg_img.resize(parse_size, Image.Resampling.NEAREST)
                 pred_seg = np.array(pred_seg_img)
             
             # 의상 관련 레이블 추출
@@ -263,6 +279,9 @@ def parse_garment_image(
             # 배경(0)이 아닌 모든 영역을 의상으로 간주
             garment_mask_array = (pred_seg != 0).astype(np.uint8) * 255
             
+            # 원본 이미지를 가이드로 엣지 보존 업샘플링
+            garment_mask_array = upsample_mask(garment_mask_array, garment_img)
+            
             # 의상 영역이 너무 작으면 전체 이미지를 의상으로 간주 (Fallback)
             mask_ratio = np.sum(garment_mask_array > 0) / (original_size[0] * original_size[1])
             if mask_ratio < 0.05:
@@ -312,6 +331,7 @@ def parse_garment_image(
             
     except requests.exceptions.Timeout:
         print(f"[SegFormer B2 Garment Parser] 타임아웃 오류")
+        record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, None)
         return {
             "success": False,
             "garment_mask": None,
@@ -376,12 +396,15 @@ def parse_garment_image_v3(
     # 이미지를 base64로 인코딩
     def image_to_base64(img: Image.Image) -> str:
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
+        save_png(img, buffer)
         img_bytes = buffer.getvalue()
         return base64.b64encode(img_bytes).decode("utf-8")
     
-    garment_b64 = image_to_base64(garment_img)
     original_size = garment_img.size
+    # 작업 해상도로 축소하여 파싱 (마스크는 원본 크기로 엣지 보존 업샘플링)
+    parse_img = downscale_for_parsing(garment_img)
+    parse_size = parse_img.size
+    garment_b64 = image_to_base64(parse_img)
     
     # HuggingFace Inference API 요청 데이터 형식
     payload = {
@@ -393,6 +416,7 @@ def parse_garment_image_v3(
         print(f"[SegFormer B2 Clothes Parser] 엔드포인트: {SEGFORMER_API_URL_V3}")
         print(f"[SegFormer B2 Clothes Parser] 모델: {SEGFORMER_MODEL_ID_V3}")
         print(f"[SegFormer B2 Clothes Parser] 원본 이미지 크기: {original_size[0]}x{original_size[1]}")
+        print(f"[SegFormer B2 Clothes Parser] 파싱 해상도: {parse_size[0]}x{parse_size[1]}")
         
         # HuggingFace Inference API 호출
         response = requests.post(
@@ -403,6 +427,7 @@ def parse_garment_image_v3(
         )
         
         print(f"[SegFormer B2 Clothes Parser] 응답 상태 코드: {response.status_code}")
+        record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, response.status_code)
         
         # 410 Gone 오류 처리 (구 엔드포인트 사용 시)
         if response.status_code == 410:
@@ -467,6 +492,7 @@ def parse_garment_image_v3(
                 timeout=API_TIMEOUT
             )
             print(f"[SegFormer B2 Clothes Parser] 재시도 후 응답 상태 코드: {response.status_code}")
+            record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, response.status_code)
         
         # 성공 응답 처리
         if response.status_code == 200:
@@ -485,7 +511,7 @@ def parse_garment_image_v3(
                         label_bytes = base64.b64decode(result["label"])
                         pred_seg = np.frombuffer(label_bytes, dtype=np.uint8)
                         # 이미지 크기에 맞게 reshape
-                        pred_seg = pred_seg.reshape((original_size[1], original_size[0]))
+                        pred_seg = pred_seg.reshape((parse_size[1], parse_size[0]))
                     else:
                         pred_seg = np.array(result["label"], dtype=np.uint8)
                 
@@ -529,19 +555,19 @@ def parse_garment_image_v3(
             if pred_seg is None:
                 print("[SegFormer B2 Clothes Parser] API 응답에서 세그멘테이션 결과를 추출할 수 없습니다. Fallback 로직 사용...")
                 # 간단한 배경 제거 (중앙 픽셀 기준)
-                garment_array = np.array(garment_img.convert("RGB"))
+                garment_array = np.array(parse_img.convert("RGB"))
                 center_pixel = garment_array[garment_array.shape[0]//2, garment_array.shape[1]//2]
                 diff = np.abs(garment_array - center_pixel).sum(axis=2)
                 threshold = 100
                 pred_seg = (diff > threshold).astype(np.uint8)
                 # 전체를 의상 영역으로 간주 (배경이 없는 경우)
-                if np.sum(pred_seg) < original_size[0] * original_size[1] * 0.1:
-                    pred_seg = np.ones((original_size[1], original_size[0]), dtype=np.uint8)
+                if np.sum(pred_seg) < parse_size[0] * parse_size[1] * 0.1:
+                    pred_seg = np.ones((parse_size[1], parse_size[0]), dtype=np.uint8)
             
-            # pred_seg를 원본 이미지 크기에 맞게 리사이즈 (필요한 경우)
-            if pred_seg.shape != (original_size[1], original_size[0]):
+            # pred_seg를 작업 해상도 크기에 맞게 리사이즈 (필요한 경우)
+            if pred_seg.shape != (parse_size[1], parse_size[0]):
                 pred_seg_img = Image.fromarray(pred_seg, mode='L')
-                pred_seg_img = pred_seg_img.resize(original_size, Image.Resampling.NEAREST)
+                pred_seg_img = pred_seg_img.resize(parse_size, Image.Resampling.NEAREST)
                 pred_seg = np.array(pred_seg_img)
             
             # 의상 관련 레이블 추출
@@ -558,6 +584,9 @@ def parse_garment_image_v3(
             # 배경(0)이 아닌 모든 영역을 의상으로 간주
             garment_mask_array = (pred_seg != 0).astype(np.uint8) * 255
             
+            # 원본 이미지를 가이드로 엣지 보존 업샘플링
+            garment_mask_array = upsample_mask(garment_mask_array, garment_img)
+            
             # 의상 영역이 너무 작으면 전체 이미지를 의상으로 간주 (Fallback)
             mask_ratio = np.sum(garment_mask_array > 0) / (original_size[0] * original_size[1])
             if mask_ratio < 0.05:
@@ -607,6 +636,7 @@ def parse_garment_image_v3(
             
     except requests.exceptions.Timeout:
         print(f"[SegFormer B2 Clothes Parser] 타임아웃 오류")
+        record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, None)
         return {
             "success": False,
             "garment_mask": None,
@@ -642,9 +672,19 @@ async def parse_garment_image_v4(
             "garment_mask": Optional[Image.Image],  # garment_mask.png
             "garment_only": Optional[Image.Image],  # garment_only.png (RGB)
             "message": str,
+            "path": str,  # "uniform_background" (로컬 빠른 경로) 또는 "segformer"
             "error": Optional[str]
         }
     """
+    # 단색 배경 상품컷이면 SegFormer 호출 없이 로컬에서 누끼 처리
+    if UNIFORM_BG_ENABLED:
+        try:
+            fast_result = await asyncio.to_thread(extract_garment_uniform_background, garment_img)
+            if fast_result is not None:
+                return fast_result
+        except Exception as e:
+            print(f"[SegFormer B2 Clothes Parser V4] 단색 배경 판정 오류 (SegFormer로 폴백): {e}")
+    
     if not HUGGINGFACE_API_KEY:
         error_msg = (
             "HUGGINGFACE_API_KEY가 설정되지 않았습니다!\n\n"
@@ -671,12 +711,15 @@ async def parse_garment_image_v4(
     # 이미지를 base64로 인코딩
     def image_to_base64(img: Image.Image) -> str:
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
+        save_png(img, buffer)
         img_bytes = buffer.getvalue()
         return base64.b64encode(img_bytes).decode("utf-8")
     
-    garment_b64 = image_to_base64(garment_img)
     original_size = garment_img.size
+    # 작업 해상도로 축소하여 파싱 (마스크는 원본 크기로 엣지 보존 업샘플링)
+    parse_img = downscale_for_parsing(garment_img)
+    parse_size = parse_img.size
+    garment_b64 = image_to_base64(parse_img)
     
     # HuggingFace Inference API 요청 데이터 형식
     payload = {
@@ -688,6 +731,7 @@ async def parse_garment_image_v4(
         print(f"[SegFormer B2 Clothes Parser V4] 엔드포인트: {SEGFORMER_API_URL_V3}")
         print(f"[SegFormer B2 Clothes Parser V4] 모델: {SEGFORMER_MODEL_ID_V3}")
         print(f"[SegFormer B2 Clothes Parser V4] 원본 이미지 크기: {original_size[0]}x{original_size[1]}")
+        print(f"[SegFormer B2 Clothes Parser V4] 파싱 해상도: {parse_size[0]}x{parse_size[1]}")
         
         # HuggingFace Inference API 호출 (비동기)
         async with httpx.AsyncClient(timeout=API_TIMEOUT) as client:
@@ -698,6 +742,7 @@ async def parse_garment_image_v4(
             )
         
         print(f"[SegFormer B2 Clothes Parser V4] 응답 상태 코드: {response.status_code}")
+        record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, response.status_code)
         
         # 410 Gone 오류 처리 (구 엔드포인트 사용 시)
         if response.status_code == 410:
@@ -762,6 +807,7 @@ async def parse_garment_image_v4(
                     json=payload
                 )
             print(f"[SegFormer B2 Clothes Parser V4] 재시도 후 응답 상태 코드: {response.status_code}")
+            record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, response.status_code)
         
         # 성공 응답 처리
         if response.status_code == 200:
@@ -780,7 +826,7 @@ async def parse_garment_image_v4(
                         label_bytes = base64.b64decode(result["label"])
                         pred_seg = np.frombuffer(label_bytes, dtype=np.uint8)
                         # 이미지 크기에 맞게 reshape
-                        pred_seg = pred_seg.reshape((original_size[1], original_size[0]))
+                        pred_seg = pred_seg.reshape((parse_size[1], parse_size[0]))
                     else:
                         pred_seg = np.array(result["label"], dtype=np.uint8)
                 
@@ -824,19 +870,19 @@ async def parse_garment_image_v4(
             if pred_seg is None:
                 print("[SegFormer B2 Clothes Parser V4] API 응답에서 세그멘테이션 결과를 추출할 수 없습니다. Fallback 로직 사용...")
                 # 간단한 배경 제거 (중앙 픽셀 기준)
-                garment_array = np.array(garment_img.convert("RGB"))
+                garment_array = np.array(parse_img.convert("RGB"))
                 center_pixel = garment_array[garment_array.shape[0]//2, garment_array.shape[1]//2]
                 diff = np.abs(garment_array - center_pixel).sum(axis=2)
                 threshold = 100
                 pred_seg = (diff > threshold).astype(np.uint8)
                 # 전체를 의상 영역으로 간주 (배경이 없는 경우)
-                if np.sum(pred_seg) < original_size[0] * original_size[1] * 0.1:
-                    pred_seg = np.ones((original_size[1], original_size[0]), dtype=np.uint8)
+                if np.sum(pred_seg) < parse_size[0] * parse_size[1] * 0.1:
+                    pred_seg = np.ones((parse_size[1], parse_size[0]), dtype=np.uint8)
             
-            # pred_seg를 원본 이미지 크기에 맞게 리사이즈 (필요한 경우)
-            if pred_seg.shape != (original_size[1], original_size[0]):
+            # pred_seg를 작업 해상도 크기에 맞게 리사이즈 (필요한 경우)
+            if pred_seg.shape != (parse_size[1], parse_size[0]):
                 pred_seg_img = Image.fromarray(pred_seg, mode='L')
-                pred_seg_img = pred_seg_img.resize(original_size, Image.Resampling.NEAREST)
+                pred_seg_img = pred_seg_img.resize(parse_size, Image.Resampling.NEAREST)
                 pred_seg = np.array(pred_seg_img)
             
             # 의상 관련 레이블 추출
@@ -853,6 +899,9 @@ async def parse_garment_image_v4(
             # 배경(0)이 아닌 모든 영역을 의상으로 간주
             garment_mask_array = (pred_seg != 0).astype(np.uint8) * 255
             
+            # 원본 이미지를 가이드로 엣지 보존 업샘플링
+            garment_mask_array = upsample_mask(garment_mask_array, garment_img)
+            
             # 의상 영역이 너무 작으면 전체 이미지를 의상으로 간주 (Fallback)
             mask_ratio = np.sum(garment_mask_array > 0) / (original_size[0] * original_size[1])
             if mask_ratio < 0.05:
@@ -880,7 +929,8 @@ async def parse_garment_image_v4(
                 "success": True,
                 "garment_mask": garment_mask,
                 "garment_only": garment_only_rgb,  # RGB 모드로 반환
-                "message": "SegFormer B2 Clothes Parsing 완료 (V4)"
+                "message": "SegFormer B2 Clothes Parsing 완료 (V4)",
+                "path": "segformer"
             }
         else:
             # 기타 오류
@@ -902,6 +952,7 @@ async def parse_garment_image_v4(
             
     except httpx.TimeoutException:
         print(f"[SegFormer B2 Clothes Parser V4] 타임아웃 오류")
+        record_upstream_result(UPSTREAM_SEGFORMER_CLOTHES, None)
         return {
             "success": False,
             "garment_mask": None,
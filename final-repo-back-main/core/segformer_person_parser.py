@@ -10,6 +10,9 @@ from io import BytesIO
 from PIL import Image
 from dotenv import load_dotenv
 
+from core.mask_upsampling import downscale_for_parsing, upsample_mask, upsample_label_map
+from core.upstream_warmer import record_upstream_result, UPSTREAM_SEGFORMER_HUMAN_PARSE
+from core.image_codec import save_png
 from config.hf_segformer import (
     HUGGINGFACE_API_KEY,
     SEGFORMER_API_URL,
@@ -72,12 +75,15 @@ def parse_person_image(
     # 이미지를 base64로 인코딩
     def image_to_base64(img: Image.Image) -> str:
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
+        save_png(img, buffer)
         img_bytes = buffer.getvalue()
         return base64.b64encode(img_bytes).decode("utf-8")
     
-    person_b64 = image_to_base64(person_img)
     original_size = person_img.size
+    # 작업 해상도로 축소하여 파싱 (마스크는 원본 크기로 엣지 보존 업샘플링)
+    parse_img = downscale_for_parsing(person_img)
+    parse_size = parse_img.size
+    person_b64 = image_to_base64(parse_img)
     
     # HuggingFace Inference API 요청 데이터 형식
     payload = {
@@ -88,6 +94,7 @@ def parse_person_image(
         print(f"[SegFormer B2 Person Parser] Parsing 요청 시작")
         print(f"[SegFormer B2 Person Parser] 엔드포인트: {SEGFORMER_API_URL}")
         print(f"[SegFormer B2 Person Parser] 원본 이미지 크기: {original_size[0]}x{original_size[1]}")
+        print(f"[SegFormer B2 Person Parser] 파싱 해상도: {parse_size[0]}x{parse_size[1]}")
         
         # HuggingFace Inference API 호출
         response = requests.post(
@@ -98,6 +105,7 @@ def parse_person_image(
         )
         
         print(f"[SegFormer B2 Person Parser] 응답 상태 코드: {response.status_code}")
+        record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, response.status_code)
         
         # 오류 처리
         if response.status_code == 410:
@@ -155,6 +163,7 @@ def parse_person_image(
                 timeout=API_TIMEOUT
             )
             print(f"[SegFormer B2 Person Parser] 재시도 후 응답 상태 코드: {response.status_code}")
+            record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, response.status_code)
         
         # 성공 응답 처리
         if response.status_code == 200:
@@ -168,7 +177,7 @@ def parse_person_image(
                     if isinstance(result["label"], str):
                         label_bytes = base64.b64decode(result["label"])
                         pred_seg = np.frombuffer(label_bytes, dtype=np.uint8)
-                        pred_seg = pred_seg.reshape((original_size[1], original_size[0]))
+                        pred_seg = pred_seg.reshape((parse_size[1], parse_size[0]))
                     else:
                         pred_seg = np.array(result["label"], dtype=np.uint8)
                 elif "mask" in result:
@@ -204,24 +213,27 @@ def parse_person_image(
             if pred_seg is None:
                 print("[SegFormer B2 Person Parser] API 응답에서 세그멘테이션 결과를 추출할 수 없습니다. Fallback 로직 사용...")
                 # 간단한 배경 제거
-                person_array = np.array(person_img.convert("RGB"))
+                person_array = np.array(parse_img.convert("RGB"))
                 center_pixel = person_array[person_array.shape[0]//2, person_array.shape[1]//2]
                 diff = np.abs(person_array - center_pixel).sum(axis=2)
                 threshold = 100
                 pred_seg = (diff > threshold).astype(np.uint8)
-                if np.sum(pred_seg) < original_size[0] * original_size[1] * 0.1:
-                    pred_seg = np.ones((original_size[1], original_size[0]), dtype=np.uint8) * 11  # face로 가정
+                if np.sum(pred_seg) < parse_size[0] * parse_size[1] * 0.1:
+                    pred_seg = np.ones((parse_size[1], parse_size[0]), dtype=np.uint8) * 11  # face로 가정
             
-            # pred_seg를 원본 이미지 크기에 맞게 리사이즈 (필요한 경우)
-            if pred_seg.shape != (original_size[1], original_size[0]):
+            # pred_seg를 작업 해상도 크기에 맞게 리사이즈 (필요한 경우)
+            if pred_seg.shape != (parse_size[1], parse_size[0]):
                 pred_seg_img = Image.fromarray(pred_seg, mode='L')
-                pred_seg_img = pred_seg_img.resize(original_size, Image.Resampling.NEAREST)
+                pred_seg_img = pred_seg_img.resize(parse_size, Image.Resampling.NEAREST)
                 pred_seg = np.array(pred_seg_img)
             
-            # 레이블별 마스크 생성
-            face_mask_array = np.isin(pred_seg, FACE_MASK_IDS).astype(np.uint8) * 255
-            cloth_mask_array = np.isin(pred_seg, CLOTH_MASK_IDS).astype(np.uint8) * 255
-            body_mask_array = np.isin(pred_seg, BODY_MASK_IDS).astype(np.uint8) * 255
+            # 레이블별 마스크 생성 (작업 해상도) 후 원본 이미지를 가이드로 엣지 보존 업샘플링
+            face_mask_array = upsample_mask(np.isin(pred_seg, FACE_MASK_IDS).astype(np.uint8) * 255, person_img)
+            cloth_mask_array = upsample_mask(np.isin(pred_seg, CLOTH_MASK_IDS).astype(np.uint8) * 255, person_img)
+            body_mask_array = upsample_mask(np.isin(pred_seg, BODY_MASK_IDS).astype(np.uint8) * 255, person_img)
+            
+            # 레이블 맵은 값 보존을 위해 최근접 보간
+            pred_seg = upsample_label_map(pred_seg, original_size)
             
             print(f"[SegFormer B2 Person Parser] 성공! 마스크 추출 완료")
             print(f"[SegFormer B2 Person Parser] face_mask 비율: {np.sum(face_mask_array > 0) / (original_size[0] * original_size[1]):.2%}")
@@ -257,6 +269,7 @@ def parse_person_image(
             
     except requests.exceptions.Timeout:
         print(f"[SegFormer B2 Person Parser] 타임아웃 오류")
+        record_upstream_result(UPSTREAM_SEGFORMER_HUMAN_PARSE, None)
         return {
             "success": False,
             "parsing_mask": None,
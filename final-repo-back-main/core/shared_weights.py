@@ -0,0 +1,178 @@
+"""워커 프로세스 간 읽기 전용 모델 가중치 공유 (mmap / 공유 메모리)"""
+import os
+import hashlib
+from pathlib import Path
+from typing import Callable, List, Optional, Set
+
+import numpy as np
+
+from config.shared_weights import SHARED_WEIGHTS_DIR, ONNX_INTRA_OP_THREADS
+
+
+def _safe_key(key: str) -> str:
+    """파일명으로 쓸 수 있는 키 (원본 키 해시 접미사 포함)"""
+    readable = "".join(c if c.isalnum() or c in "-_." else "_" for c in key)[:80]
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+    return f"{readable}-{digest}"
+
+
+def file_fingerprint(path) -> str:
+    """
+    원본 파일 지문 (절대 경로 / 크기 / 수정 시각)
+
+    배열 내용을 읽지 않고 공유 파일 버전을 구분하므로, 이미 기록된 공유 파일이 있으면
+    워커가 전용 복사본을 만들지 않고 바로 매핑할 수 있습니다.
+    """
+    stat = os.stat(path)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def attach_shared_array(path, shape=None, dtype=None) -> np.ndarray:
+    """
+    공유 파일을 읽기 전용 memmap으로 매핑 (shape / dtype을 넘기면 일치 여부 확인)
+
+    Raises:
+        ValueError: 파일 헤더가 기대한 배열과 다르거나 파일이 잘린 경우
+    """
+    array = np.load(path, mmap_mode="r")
+    if shape is None and dtype is None:
+        return array
+    dtype = np.dtype(dtype if dtype is not None else array.dtype)
+    shape = tuple(shape) if shape is not None else array.shape
+    if array.shape != shape or array.dtype != dtype or array.nbytes != int(np.prod(shape)) * dtype.itemsize:
+        raise ValueError(
+            f"공유 가중치 파일이 기대한 배열과 다릅니다: {path} "
+            f"({array.dtype}{array.shape}, 기대: {dtype}{shape})"
+        )
+    return array
+
+
+# 이 프로세스가 기록하거나 매핑한 공유 파일 (종료 시 cleanup_shared_weights로 삭제)
+_owned_paths: Set[Path] = set()
+
+
+def share_array(key: str, version: str, loader: Callable[[], np.ndarray]) -> np.ndarray:
+    """
+    NumPy 가중치를 공유 메모리(/dev/shm) 파일로 내보내고 읽기 전용 memmap으로 반환
+
+    같은 키 / 버전의 파일이 이미 있으면 loader를 호출하지 않고 그대로 매핑하므로
+    모든 워커가 같은 물리 페이지를 참조합니다 (fork/spawn 방식 모두 동작).
+    버전은 원본 파일 지문(file_fingerprint)처럼 배열을 읽지 않고 얻는 값을 사용하며,
+    버전이 바뀌면 새 파일을 기록하고 같은 키의 이전 파일은 삭제합니다.
+    잘린 파일(기록 중 중단 등)은 매핑에 실패하므로 다시 기록합니다.
+
+    Args:
+        key: 배열 식별자 (예: "face_swapper/emap")
+        version: 가중치 버전 (예: file_fingerprint(원본 경로))
+        loader: 공유 파일이 없을 때만 호출되는 배열 로딩 함수
+
+    Returns:
+        np.ndarray: 읽기 전용 memmap 배열
+    """
+    shared_dir = Path(SHARED_WEIGHTS_DIR)
+    shared_dir.mkdir(parents=True, exist_ok=True)
+    path = shared_dir / f"{_safe_key(key)}-{version}.npy"
+
+    if path.exists():
+        try:
+            array = attach_shared_array(path)
+            _owned_paths.add(path)
+            return array
+        except (ValueError, OSError) as e:
+            print(f"[SharedWeights] 공유 파일 매핑 실패: {path} ({e}) → 다시 기록")
+
+    # 임시 파일에 기록 후 원자적 교체 (동시에 기록하는 워커가 있어도 안전)
+    array = loader()
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.ascontiguousarray(array), allow_pickle=False)
+    os.replace(tmp_path, path)
+    del array
+
+    # 같은 키의 이전 가중치 파일 정리 (이미 매핑한 워커는 기존 페이지를 계속 사용)
+    for stale in shared_dir.glob(f"{_safe_key(key)}-*.npy"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    _owned_paths.add(path)
+    return attach_shared_array(path)
+
+
+def share_npy_file(key: str, path) -> np.ndarray:
+    """.npy 가중치 파일을 공유 memmap으로 로드 (버전: 원본 파일 지문)"""
+    return share_array(key, file_fingerprint(path), lambda: np.load(path, allow_pickle=False))
+
+
+def cleanup_shared_weights() -> int:
+    """
+    이 프로세스가 기록하거나 매핑한 공유 파일 삭제 (shutdown 이벤트에서 호출)
+
+    이미 매핑한 다른 워커는 삭제 후에도 기존 페이지를 계속 사용하고,
+    이후 시작된 워커는 파일을 다시 기록합니다.
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    removed = 0
+    for path in list(_owned_paths):
+        if path.exists():
+            path.unlink(missing_ok=True)
+            removed += 1
+        _owned_paths.discard(path)
+    if removed:
+        print(f"[SharedWeights] 공유 가중치 파일 {removed}개 삭제")
+    return removed
+
+
+def create_shared_onnx_session(model_path: str, providers: Optional[List[str]] = None):
+    """
+    가중치를 워커 간 공유할 수 있도록 설정한 ONNX Runtime 세션 생성
+
+    - 외부 데이터(.onnx.data) 초기화 텐서는 ONNX Runtime이 파일을 mmap하여 사용
+    - prepacking을 끄면 가중치를 프로세스 전용 버퍼로 재배치하지 않으므로
+      mmap된 페이지(페이지 캐시)를 모든 워커가 그대로 공유
+    - 워커 fork 전에 생성하면(gunicorn --preload) 세션 내부 버퍼도 copy-on-write로 공유
+
+    Args:
+        model_path: ONNX 모델 경로 (대용량 모델은 외부 데이터 형식 권장)
+        providers: 실행 프로바이더 (기본값: CPU)
+
+    Returns:
+        onnxruntime.InferenceSession
+    """
+    import onnxruntime as ort
+
+    options = ort.SessionOptions()
+    options.add_session_config_entry("session.disable_prepacking", "1")
+    # 워커 수만큼 스레드가 늘어나지 않도록 세션당 스레드 수 제한
+    options.intra_op_num_threads = ONNX_INTRA_OP_THREADS
+
+    return ort.InferenceSession(
+        model_path,
+        sess_options=options,
+        providers=providers or ["CPUExecutionProvider"]
+    )
+
+
+def clear_shared_weights(prefix: Optional[str] = None) -> int:
+    """
+    공유 가중치 파일 삭제 (모델 교체 시 사용, 이미 매핑한 워커는 기존 페이지를 계속 사용)
+
+    Args:
+        prefix: 이 접두사로 시작하는 키만 삭제 (None이면 전체)
+
+    Returns:
+        int: 삭제한 파일 수
+    """
+    shared_dir = Path(SHARED_WEIGHTS_DIR)
+    if not shared_dir.exists():
+        return 0
+
+    readable_prefix = _safe_key(prefix).rsplit("-", 1)[0] if prefix else ""
+    removed = 0
+    for path in shared_dir.glob("*.npy"):
+        if path.name.startswith(readable_prefix):
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
@@ -0,0 +1,128 @@
+"""크기 제한 LRU + TTL 메모리 캐시"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    스레드 안전 LRU + TTL 캐시
+
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - ttl_sec이 지난 항목은 조회 시 만료 처리
+    - 조회 hit/miss, 제거(eviction), 만료 횟수 집계
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl_sec: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_sec = ttl_sec
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (저장 시각, 값)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """값 조회 (없거나 만료되면 default)"""
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+
+            stored_at, value = item
+            if now - stored_at >= self.ttl_sec:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """값 저장 (용량 초과 시 LRU 제거)"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.time(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """항목 삭제"""
+        with self._lock:
+            return self._data.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> int:
+        """전체 삭제 후 삭제된 항목 수 반환"""
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            return count
+
+    def items(self) -> List[tuple]:
+        """만료되지 않은 항목 스냅샷 [(key, 저장 시각, 값)] (hit/miss 집계 제외)"""
+        now = time.time()
+        with self._lock:
+            return [
+                (key, stored_at, value)
+                for key, (stored_at, value) in self._data.items()
+                if now - stored_at < self.ttl_sec
+            ]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict:
+        """관리자 조회용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_sec": self.ttl_sec,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+# 이름별 캐시 (관리자 메트릭 조회용)
+_caches: Dict[str, TTLCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_ttl_cache(name: str, maxsize: int, ttl_sec: float) -> TTLCache:
+    """이름으로 캐시 반환 (없으면 생성)"""
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            cache = TTLCache(name, maxsize, ttl_sec)
+            _caches[name] = cache
+        return cache
+
+
+def find_ttl_cache(name: str) -> Optional[TTLCache]:
+    """이름으로 등록된 캐시 조회 (없으면 None)"""
+    return _caches.get(name)
+
+
+def get_all_cache_stats() -> List[Dict]:
+    """등록된 모든 캐시 통계"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    return [cache.stats() for cache in caches]
@@ -0,0 +1,206 @@
+"""단색 배경 상품컷 감지 및 로컬 누끼 (SegFormer 호출 없이 처리)"""
+import numpy as np
+import cv2
+from typing import Dict, Optional
+from PIL import Image
+
+from core.mask_upsampling import downscale_for_parsing, upsample_mask
+from config.uniform_background import (
+    UNIFORM_BG_WORK_SIZE,
+    UNIFORM_BG_BORDER_RATIO,
+    UNIFORM_BG_DELTA_E,
+    UNIFORM_BG_MIN_CONFIDENCE,
+    UNIFORM_BG_MIN_GARMENT_RATIO,
+    UNIFORM_BG_MAX_GARMENT_RATIO,
+    UNIFORM_BG_MIN_CONTRAST,
+    UNIFORM_BG_MIN_EDGE_STRENGTH
+)
+
+
+def _to_lab(rgb: np.ndarray) -> np.ndarray:
+    """uint8 RGB 배열을 CIE LAB(float32, L: 0~100, a/b: -128~127)로 변환"""
+    lab = cv2.cvtColor(rgb, cv2.COLOR_RGB2LAB).astype(np.float32)
+    lab[..., 0] *= 100.0 / 255.0
+    lab[..., 1:] -= 128.0
+    return lab
+
+
+def _border_pixels(arr: np.ndarray, border: int) -> np.ndarray:
+    """이미지 테두리(상/하/좌/우 띠) 픽셀을 (N, C) 형태로 반환"""
+    return np.concatenate([
+        arr[:border].reshape(-1, arr.shape[-1]),
+        arr[-border:].reshape(-1, arr.shape[-1]),
+        arr[border:-border, :border].reshape(-1, arr.shape[-1]),
+        arr[border:-border, -border:].reshape(-1, arr.shape[-1]),
+    ])
+
+
+def _boundary_quality(lab: np.ndarray, mask: np.ndarray, background_lab: np.ndarray):
+    """
+    마스크 경계 품질
+
+    Returns:
+        (contrast, edge_strength):
+        - contrast: 경계 안쪽 띠(의상 쪽) 픽셀과 배경색의 ΔE 중앙값
+        - edge_strength: 경계 픽셀의 LAB 기울기 크기 중앙값 (ΔE/px, Sobel 3x3 / 4)
+    """
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+    eroded = cv2.erode(mask, kernel, iterations=2)
+    inner_ring = (mask > 0) & (eroded == 0)
+    boundary = cv2.morphologyEx(mask, cv2.MORPH_GRADIENT, kernel) > 0
+    if not inner_ring.any() or not boundary.any():
+        return 0.0, 0.0
+
+    contrast = float(np.median(np.linalg.norm(lab[inner_ring] - background_lab, axis=1)))
+    grad_x = cv2.Sobel(lab, cv2.CV_32F, 1, 0, ksize=3)
+    grad_y = cv2.Sobel(lab, cv2.CV_32F, 0, 1, ksize=3)
+    gradient = np.sqrt((grad_x ** 2 + grad_y ** 2).sum(axis=2)) / 4.0
+    edge_strength = float(np.median(gradient[boundary]))
+    return contrast, edge_strength
+
+
+def detect_uniform_background(
+    garment_img: Image.Image,
+    delta_e: float = UNIFORM_BG_DELTA_E
+) -> Dict:
+    """
+    테두리 픽셀의 LAB 색 균일도로 단색 배경 여부 판정 후 배경 제거 마스크 생성
+
+    테두리에서 샘플링한 배경색과 ΔE가 작은 픽셀 중 테두리와 연결된 영역만
+    배경으로 간주합니다 (테두리 기준 flood fill). 드레스 내부의 배경색과 비슷한
+    영역은 테두리와 연결되지 않으므로 의상으로 유지됩니다.
+
+    신뢰도는 테두리 균일도에 마스크 경계의 의상-배경 대비와 엣지 강도를 반영하며,
+    둘 중 하나라도 임계값 미만이면(흰 배경 + 흰 드레스 등) 단색 배경으로 채택하지 않습니다.
+
+    Args:
+        garment_img: 의상 이미지 (PIL Image)
+        delta_e: 배경 판정 LAB 색차 허용치
+
+    Returns:
+        dict: {
+            "uniform": bool,  # 신뢰도가 임계값 이상인지
+            "confidence": float,  # 0.0 ~ 1.0
+            "border_uniformity": float,  # 배경색과 일치하는 테두리 픽셀 비율
+            "contrast": float,  # 경계 안쪽 의상 픽셀과 배경색의 ΔE 중앙값
+            "edge_strength": float,  # 마스크 경계의 LAB 기울기 중앙값 (ΔE/px)
+            "garment_ratio": float,  # 의상 영역 비율
+            "background_lab": list,  # 추정 배경색 (LAB)
+            "mask": Optional[np.ndarray]  # 작업 해상도 의상 마스크 (0 또는 255)
+        }
+    """
+    work_img = downscale_for_parsing(garment_img.convert("RGB"), UNIFORM_BG_WORK_SIZE)
+    rgb = np.asarray(work_img, dtype=np.uint8)
+    height, width = rgb.shape[:2]
+    border = max(2, int(min(height, width) * UNIFORM_BG_BORDER_RATIO))
+
+    if height <= border * 2 or width <= border * 2:
+        return {
+            "uniform": False,
+            "confidence": 0.0,
+            "border_uniformity": 0.0,
+            "contrast": 0.0,
+            "edge_strength": 0.0,
+            "garment_ratio": 0.0,
+            "background_lab": [],
+            "mask": None
+        }
+
+    lab = _to_lab(rgb)
+
+    # 테두리 샘플링 → 배경색(중앙값) 및 균일도
+    border_lab = _border_pixels(lab, border)
+    background_lab = np.median(border_lab, axis=0)
+    border_diff = np.linalg.norm(border_lab - background_lab, axis=1)
+    border_uniformity = float(np.mean(border_diff <= delta_e))
+
+    # 배경색 후보 픽셀 중 테두리와 연결된 영역만 배경으로 간주
+    candidate = (np.linalg.norm(lab - background_lab, axis=2) <= delta_e).astype(np.uint8)
+    _, labels = cv2.connectedComponents(candidate, connectivity=4)
+    border_labels = np.unique(_border_pixels(labels[..., None], 1))
+    border_labels = border_labels[border_labels != 0]
+    background = np.isin(labels, border_labels) & (candidate > 0)
+
+    # 모폴로지 정리: 작은 구멍/잡티 제거
+    mask = (~background).astype(np.uint8) * 255
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+
+    # 의상 영역 중 작은 조각 제거 (전체 면적의 1% 미만)
+    count, comp_labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    min_area = height * width * 0.01
+    keep = [i for i in range(1, count) if stats[i, cv2.CC_STAT_AREA] >= min_area]
+    mask = np.isin(comp_labels, keep).astype(np.uint8) * 255
+
+    garment_ratio = float(np.mean(mask > 0))
+    contrast, edge_strength = _boundary_quality(lab, mask, background_lab)
+
+    # 대비 / 엣지 강도가 임계값에 못 미치는 만큼 신뢰도를 낮추고, 하나라도 미만이면 폴백
+    confidence = (
+        border_uniformity
+        * min(1.0, contrast / UNIFORM_BG_MIN_CONTRAST)
+        * min(1.0, edge_strength / UNIFORM_BG_MIN_EDGE_STRENGTH)
+    )
+    boundary_ok = contrast >= UNIFORM_BG_MIN_CONTRAST and edge_strength >= UNIFORM_BG_MIN_EDGE_STRENGTH
+    if not (UNIFORM_BG_MIN_GARMENT_RATIO <= garment_ratio <= UNIFORM_BG_MAX_GARMENT_RATIO):
+        confidence = 0.0
+
+    return {
+        "uniform": boundary_ok and confidence >= UNIFORM_BG_MIN_CONFIDENCE,
+        "confidence": confidence,
+        "border_uniformity": border_uniformity,
+        "contrast": round(contrast, 2),
+        "edge_strength": round(edge_strength, 2),
+        "garment_ratio": garment_ratio,
+        "background_lab": [round(float(v), 2) for v in background_lab],
+        "mask": mask
+    }
+
+
+def extract_garment_uniform_background(garment_img: Image.Image) -> Optional[Dict]:
+    """
+    단색 배경 상품컷이면 로컬에서 garment_only 추출
+
+    Args:
+        garment_img: 의상 이미지 (PIL Image)
+
+    Returns:
+        Optional[dict]: 신뢰도가 충분하면 parse_garment_image_v4와 동일한 형식의 결과
+                        ("path": "uniform_background" 포함), 아니면 None
+    """
+    detection = detect_uniform_background(garment_img)
+    if not detection["uniform"]:
+        print(
+            f"[Uniform Background] 단색 배경 아님 → SegFormer 폴백 "
+            f"(신뢰도: {detection['confidence']:.2f}, 대비: {detection['contrast']:.1f}, "
+            f"엣지: {detection['edge_strength']:.1f}, 의상 비율: {detection['garment_ratio']:.2%})"
+        )
+        return None
+
+    garment_rgb = garment_img.convert("RGB")
+
+    # 원본 이미지를 가이드로 엣지 보존 업샘플링
+    garment_mask_array = upsample_mask(detection["mask"], garment_rgb)
+    garment_mask = Image.fromarray(garment_mask_array, mode='L')
+
+    # garment_only 이미지 생성 (RGBA → RGB, parse_garment_image_v4와 동일)
+    garment_array = np.array(garment_rgb)
+    garment_only_rgba = np.zeros((garment_array.shape[0], garment_array.shape[1], 4), dtype=np.uint8)
+    garment_only_rgba[:, :, :3] = garment_array
+    garment_only_rgba[:, :, 3] = garment_mask_array
+    garment_only_rgb = Image.fromarray(garment_only_rgba, mode='RGBA').convert("RGB")
+
+    print(
+        f"[Uniform Background] 단색 배경 감지 → 로컬 누끼 완료 "
+        f"(신뢰도: {detection['confidence']:.2f}, 의상 비율: {detection['garment_ratio']:.2%})"
+    )
+
+    return {
+        "success": True,
+        "garment_mask": garment_mask,
+        "garment_only": garment_only_rgb,
+        "message": "단색 배경 로컬 누끼 완료",
+        "path": "uniform_background",
+        "confidence": detection["confidence"]
+    }
@@ -0,0 +1,297 @@
+"""콜드 스타트가 잦은 업스트림(HF Inference / HF Space / InsightFace) 워밍 유지"""
+import asyncio
+import base64
+import io
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+from PIL import Image
+
+from config.upstream_warmer import (
+    UPSTREAM_WARMER_ENABLED,
+    UPSTREAM_WARM_INTERVAL_SEC,
+    UPSTREAM_WARMING_RETRY_SEC,
+    UPSTREAM_WARMING_STALE_SEC,
+    UPSTREAM_WARMER_TICK_SEC,
+    UPSTREAM_PROBE_TIMEOUT_SEC,
+    UPSTREAM_WARMER_DISABLED,
+    UPSTREAM_COLD_START_HISTORY
+)
+
+# 업스트림 상태
+STATUS_UNKNOWN = "unknown"
+STATUS_WARM = "warm"
+STATUS_WARMING = "warming"  # 503 모델 로딩 중 / 타임아웃 → 로컬 폴백 권장
+STATUS_ERROR = "error"
+
+# 콜드 스타트로 간주하는 상태 코드
+COLD_START_STATUS_CODES = {503, 504}
+
+# 업스트림 이름
+UPSTREAM_SEGFORMER_HUMAN_PARSE = "segformer_human_parse"
+UPSTREAM_SEGFORMER_CLOTHES = "segformer_clothes"
+UPSTREAM_MEDIAPIPE_POSE = "mediapipe_pose"
+UPSTREAM_INSIGHTFACE = "insightface"
+
+# 프로브 함수: 응답 상태 코드 반환 (타임아웃/연결 오류 시 None)
+ProbeFn = Callable[[httpx.AsyncClient], Awaitable[Optional[int]]]
+
+
+class UpstreamState:
+    """업스트림 한 개의 워밍 상태"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.status = STATUS_UNKNOWN
+        self.last_status_code: Optional[int] = None
+        self.last_traffic_at: Optional[float] = None  # 실제 요청 트래픽
+        self.last_probe_at: Optional[float] = None
+        self.last_success_at: Optional[float] = None
+        self.probe_count = 0
+        self.skipped_probes = 0  # 프로브 주기가 됐지만 실제 트래픽으로 웜 상태라 건너뛴 프로브 수
+        self.last_skipped_at: Optional[float] = None  # 마지막으로 건너뛴 프로브 시각 (주기당 한 번만 집계)
+        self.cold_start_events = deque(maxlen=UPSTREAM_COLD_START_HISTORY)
+
+    def info(self) -> Dict:
+        """관리자 조회용 정보"""
+        return {
+            "name": self.name,
+            "status": self.status,
+            "last_status_code": self.last_status_code,
+            "last_traffic_at": self.last_traffic_at,
+            "last_probe_at": self.last_probe_at,
+            "last_success_at": self.last_success_at,
+            "probe_count": self.probe_count,
+            "skipped_probes": self.skipped_probes,
+            "cold_start_count": len(self.cold_start_events),
+            "cold_start_events": list(self.cold_start_events)
+        }
+
+
+_states: Dict[str, UpstreamState] = {}
+_warmer_task: Optional[asyncio.Task] = None
+
+
+def _get_state(name: str) -> UpstreamState:
+    state = _states.get(name)
+    if state is None:
+        state = _states.setdefault(name, UpstreamState(name))
+    return state
+
+
+def record_upstream_result(name: str, status_code: Optional[int], source: str = "traffic"):
+    """
+    업스트림 호출 결과 기록 (실제 요청 코드와 프로브에서 공통 사용)
+
+    Args:
+        name: 업스트림 이름
+        status_code: 응답 상태 코드 (타임아웃/연결 오류는 None)
+        source: "traffic" (실제 요청) 또는 "probe"
+    """
+    state = _get_state(name)
+    now = time.time()
+    state.last_status_code = status_code
+    if source == "traffic":
+        state.last_traffic_at = now
+    else:
+        state.last_probe_at = now
+        state.probe_count += 1
+
+    if status_code is None or status_code in COLD_START_STATUS_CODES:
+        if state.status != STATUS_WARMING:
+            # 콜드 스타트 이벤트 시작
+            state.cold_start_events.append({
+                "detected_at": now,
+                "source": source,
+                "status_code": status_code,
+                "warm_after_sec": None
+            })
+            print(f"[UpstreamWarmer] '{name}' 콜드 스타트 감지 ({source}, 상태 코드: {status_code})")
+        state.status = STATUS_WARMING
+    elif 200 <= status_code < 300:
+        if state.status == STATUS_WARMING and state.cold_start_events:
+            event = state.cold_start_events[-1]
+            if event["warm_after_sec"] is None:
+                event["warm_after_sec"] = round(now - event["detected_at"], 1)
+                print(f"[UpstreamWarmer] '{name}' 웜 상태 복귀 ({event['warm_after_sec']}초 소요)")
+        state.status = STATUS_WARM
+        state.last_success_at = now
+    else:
+        state.status = STATUS_ERROR
+
+
+def get_upstream_status(name: str) -> str:
+    """
+    업스트림 상태 반환 ("warm" / "warming" / "error" / "unknown")
+
+    포즈 / 얼굴 분석 서비스는 "warming"이면 업스트림 대기 대신 로컬 백엔드를 사용합니다.
+    """
+    state = _states.get(name)
+    return state.status if state is not None else STATUS_UNKNOWN
+
+
+def is_upstream_warming(name: str) -> bool:
+    """
+    업스트림이 콜드 스타트(모델 로딩) 중인지 여부
+
+    마지막 관측이 UPSTREAM_WARMING_STALE_SEC보다 오래됐으면 False (실제 요청으로 다시 확인)
+    """
+    state = _states.get(name)
+    if state is None or state.status != STATUS_WARMING:
+        return False
+    last_observed = max(state.last_traffic_at or 0.0, state.last_probe_at or 0.0)
+    return time.time() - last_observed < UPSTREAM_WARMING_STALE_SEC
+
+
+def get_all_upstream_states() -> List[Dict]:
+    """모든 업스트림 상태 반환"""
+    return [state.info() for state in list(_states.values())]
+
+
+@lru_cache(maxsize=None)
+def _probe_image_bytes(fmt: str) -> bytes:
+    """프로브용 작은 이미지 (64x64 회색, 한 번 생성 후 캐시)"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (128, 128, 128)).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def _segformer_probe(url: str, api_key: str) -> ProbeFn:
+    """HF Inference 세그멘테이션 프로브"""
+    payload = {
+        "inputs": f"data:image/png;base64,{base64.b64encode(_probe_image_bytes('PNG')).decode('utf-8')}"
+    }
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+    async def probe(client: httpx.AsyncClient) -> Optional[int]:
+        response = await client.post(url, headers=headers, json=payload)
+        return response.status_code
+
+    return probe
+
+
+def _mediapipe_probe(space_url: str) -> ProbeFn:
+    """MediaPipe HF Space 프로브 (PoseLandmarkService와 동일한 업로드 형식)"""
+    api_url = f"{space_url}/analyze_pose" if not space_url.endswith("/analyze_pose") else space_url
+
+    async def probe(client: httpx.AsyncClient) -> Optional[int]:
+        files = {"image": ("probe.jpg", _probe_image_bytes("JPEG"), "image/jpeg")}
+        response = await client.post(api_url, files=files)
+        return response.status_code
+
+    return probe
+
+
+def _insightface_probe(endpoint_url: str, api_key: str) -> ProbeFn:
+    """InsightFace Inference Endpoint 프로브"""
+    payload = {
+        "inputs": {
+            "image": f"data:image/jpeg;base64,{base64.b64encode(_probe_image_bytes('JPEG')).decode('utf-8')}"
+        }
+    }
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+
+    async def probe(client: httpx.AsyncClient) -> Optional[int]:
+        response = await client.post(endpoint_url, headers=headers, json=payload)
+        return response.status_code
+
+    return probe
+
+
+def get_configured_probes() -> Dict[str, ProbeFn]:
+    """설정된 업스트림별 프로브 함수 (URL/키가 없는 대상은 제외)"""
+    from config.hf_segformer import HUGGINGFACE_API_KEY, SEGFORMER_API_URL
+    from config.settings import MEDIAPIPE_SPACE_URL, INSIGHTFACE_ENDPOINT_URL, INSIGHTFACE_API_KEY
+    from config.pose_backend import POSE_BACKEND, POSE_FALLBACK_TO_REMOTE
+    from config.face_backend import FACE_BACKEND, FACE_FALLBACK_TO_REMOTE
+    from core.segformer_garment_parser import SEGFORMER_API_URL_V3
+
+    probes: Dict[str, ProbeFn] = {}
+    if HUGGINGFACE_API_KEY:
+        probes[UPSTREAM_SEGFORMER_HUMAN_PARSE] = _segformer_probe(SEGFORMER_API_URL, HUGGINGFACE_API_KEY)
+        probes[UPSTREAM_SEGFORMER_CLOTHES] = _segformer_probe(SEGFORMER_API_URL_V3, HUGGINGFACE_API_KEY)
+    # 로컬 포즈 백엔드를 폴백 없이 쓰면 원격 Space는 호출되지 않으므로 제외
+    if MEDIAPIPE_SPACE_URL and (POSE_BACKEND == "remote" or POSE_FALLBACK_TO_REMOTE):
+        probes[UPSTREAM_MEDIAPIPE_POSE] = _mediapipe_probe(MEDIAPIPE_SPACE_URL)
+    if INSIGHTFACE_ENDPOINT_URL and INSIGHTFACE_API_KEY and (FACE_BACKEND == "remote" or FACE_FALLBACK_TO_REMOTE):
+        probes[UPSTREAM_INSIGHTFACE] = _insightface_probe(INSIGHTFACE_ENDPOINT_URL, INSIGHTFACE_API_KEY)
+
+    return {name: probe for name, probe in probes.items() if name not in UPSTREAM_WARMER_DISABLED}
+
+
+def _probe_due(state: UpstreamState, now: float) -> bool:
+    """
+    프로브 필요 여부 (트래픽 적응형)
+
+    - 콜드 스타트 중이면 짧은 간격으로 재프로브
+    - 실제 트래픽 또는 프로브가 워밍 간격 안에 있으면 건너뜀
+    """
+    if state.status == STATUS_WARMING:
+        return state.last_probe_at is None or now - state.last_probe_at >= UPSTREAM_WARMING_RETRY_SEC
+
+    last_touch = max(state.last_traffic_at or 0.0, state.last_probe_at or 0.0)
+    return now - last_touch >= UPSTREAM_WARM_INTERVAL_SEC
+
+
+def _probe_skipped_by_traffic(state: UpstreamState, now: float) -> bool:
+    """
+    프로브만 기준으로는 주기가 됐지만 실제 트래픽 덕분에 건너뛰는 경우인지 (_probe_due가 False일 때 호출)
+
+    스케줄러 틱마다가 아니라 워밍 간격당 한 번만 True를 반환합니다.
+    """
+    if state.status != STATUS_WARM or state.last_traffic_at is None:
+        return False
+    last_scheduled = max(state.last_probe_at or 0.0, state.last_skipped_at or 0.0)
+    return now - last_scheduled >= UPSTREAM_WARM_INTERVAL_SEC
+
+
+async def _run_probe(name: str, probe: ProbeFn, client: httpx.AsyncClient):
+    """프로브 한 번 실행 후 결과 기록"""
+    try:
+        status_code = await probe(client)
+    except (httpx.TimeoutException, httpx.TransportError) as e:
+        print(f"[UpstreamWarmer] '{name}' 프로브 연결 실패: {e}")
+        status_code = None
+    record_upstream_result(name, status_code, source="probe")
+
+
+async def _warmer_loop(probes: Dict[str, ProbeFn]):
+    """워밍 유지 스케줄러 루프"""
+    async with httpx.AsyncClient(timeout=UPSTREAM_PROBE_TIMEOUT_SEC) as client:
+        in_flight: Dict[str, asyncio.Task] = {}
+        while True:
+            now = time.time()
+            for name, probe in probes.items():
+                if name in in_flight and not in_flight[name].done():
+                    continue
+                state = _get_state(name)
+                if _probe_due(state, now):
+                    in_flight[name] = asyncio.create_task(_run_probe(name, probe, client))
+                elif _probe_skipped_by_traffic(state, now):
+                    state.skipped_probes += 1
+                    state.last_skipped_at = now
+            await asyncio.sleep(UPSTREAM_WARMER_TICK_SEC)
+
+
+def start_upstream_warmer():
+    """워밍 유지 백그라운드 태스크 시작 (앱 startup에서 호출)"""
+    global _warmer_task
+
+    if not UPSTREAM_WARMER_ENABLED:
+        print("[UpstreamWarmer] 비활성화됨 (UPSTREAM_WARMER_ENABLED=false)")
+        return
+    if _warmer_task is not None and not _warmer_task.done():
+        return
+
+    probes = get_configured_probes()
+    if not probes:
+        print("[UpstreamWarmer] 설정된 업스트림이 없어 시작하지 않습니다.")
+        return
+
+    for name in probes:
+        _get_state(name)
+    _warmer_task = asyncio.get_running_loop().create_task(_warmer_loop(probes))
+    print(f"[UpstreamWarmer] 시작 - 대상: {', '.join(probes.keys())}")
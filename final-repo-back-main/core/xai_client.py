@@ -8,6 +8,7 @@ from typing import Dict, Optional
 from io import BytesIO
 from PIL import Image
 
+from core.image_codec import save_png
 from config.settings import XAI_API_KEY, XAI_API_BASE_URL, XAI_IMAGE_MODEL, XAI_PROMPT_MODEL
 from config.prompts import COMMON_PROMPT_REQUIREMENT
 
@@ -198,7 +199,7 @@ async def generate_prompt_from_images(
     # 이미지를 base64로 인코딩
     def image_to_base64(img: Image.Image) -> str:
         buffer = BytesIO()
-        img.save(buffer, format="PNG")
+        save_png(img, buffer)
         img_bytes = buffer.getvalue()
         return base64.b64encode(img_bytes).decode("utf-8")
     
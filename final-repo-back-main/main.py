@@ -1,12 +1,23 @@
 """FastAPI 메인 애플리케이션"""
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.formparsers import MultiPartParser
 from pathlib import Path
 
 from config.cors import CORS_ORIGINS, CORS_CREDENTIALS, CORS_METHODS, CORS_HEADERS
-from core.model_loader import load_models
+from core.model_loader import load_models, preload_shared_models
+from core.upstream_warmer import start_upstream_warmer
+from core.micro_batcher import start_micro_batching
+from core.s3_client import shutdown_s3_io
+from core.cpu_pool import shutdown_cpu_pool
+from core.shared_weights import cleanup_shared_weights
+from core.image_codec import ImageDecodeError, ImageTooLargeError
+from services.face_swap_templates import start_face_template_loading
+from config.shared_weights import SHARED_WEIGHTS_PRELOAD
+from config.image_codec import IMAGE_UPLOAD_SPOOL_MAX_MEMORY_KB
 
 # 디렉토리 생성
 Path("static").mkdir(exist_ok=True)
@@ -27,6 +38,27 @@ app = FastAPI(
     },
 )
 
+# 업로드 파일 스풀링: 이 크기를 넘는 multipart 파일은 메모리 대신 임시 파일에 보관
+MultiPartParser.max_file_size = IMAGE_UPLOAD_SPOOL_MAX_MEMORY_KB * 1024
+
+# 이미지 크기 초과 / 디코딩 실패는 서버 오류가 아닌 입력 오류로 응답
+@app.exception_handler(ImageTooLargeError)
+async def image_too_large_handler(request: Request, exc: ImageTooLargeError):
+    return JSONResponse({
+        "success": False,
+        "error": "Image too large",
+        "message": str(exc)
+    }, status_code=413)
+
+
+@app.exception_handler(ImageDecodeError)
+async def image_decode_error_handler(request: Request, exc: ImageDecodeError):
+    return JSONResponse({
+        "success": False,
+        "error": "Invalid image",
+        "message": str(exc)
+    }, status_code=400)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -50,7 +82,8 @@ from routers import (
     info, web, segmentation, composition, prompt, 
     body_analysis, admin, dress_management, image_processing,
     proxy, models, tryon_router, body_generation, fitting_router,
-    custom_v3_router, custom_v4_router, review, auth, visitor_router
+    custom_v3_router, custom_v4_router, review, auth, visitor_router,
+    metrics
 )
 
 app.include_router(info.router)
@@ -72,9 +105,30 @@ app.include_router(custom_v3_router.router)
 app.include_router(custom_v4_router.router)
 app.include_router(review.router)
 app.include_router(visitor_router.router)
+app.include_router(metrics.router)
+
+# 공유 가중치 모델 사전 로딩 (gunicorn --preload 시 워커 fork 전 마스터에서 한 번 실행)
+if SHARED_WEIGHTS_PRELOAD:
+    preload_shared_models()
 
 # Startup 이벤트
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 DB 초기화 및 서비스 초기화"""
-    await load_models()
\ No newline at end of file
+    await load_models()
+    # 워커 스레드의 로컬 모델 추론을 이벤트 루프의 마이크로 배치 큐로 모음
+    start_micro_batching()
+    # 콜드 스타트가 잦은 업스트림 워밍 유지
+    start_upstream_warmer()
+    # 페이스스왑 템플릿 이미지 디코딩 및 템플릿 얼굴 사전 감지
+    start_face_template_loading()
+
+
+# Shutdown 이벤트
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 이미지 프록시 HTTP 클라이언트 / S3 I/O 스레드 풀 / CPU 작업 프로세스 풀 / 공유 가중치 파일 정리"""
+    await proxy.close_proxy_http_client()
+    shutdown_s3_io()
+    shutdown_cpu_pool()
+    cleanup_shared_weights()
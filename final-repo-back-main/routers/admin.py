@@ -15,6 +15,7 @@ from fastapi.responses import JSONResponse
 from typing import Optional
 from services.database import get_db_connection
 from services.category_service import load_category_rules, save_category_rules
+from services.image_delivery_service import add_presigned_urls
 from config.auth_middleware import require_admin
 
 router = APIRouter()
@@ -169,6 +170,8 @@ async def get_admin_logs(
                 for log in logs:
                     log['processing_time'] = log['run_time']
                     log['model_name'] = log['model']
+                    # presigned 전달 모드면 *_presigned_url 추가
+                    add_presigned_urls(log, ('result_url', 'person_url', 'dress_url'))
                 
                 return JSONResponse({
                     "success": True,
@@ -276,19 +279,23 @@ async def get_admin_log_detail(request: Request, log_id: int):
                 else:
                     processing_time = "-"
                 
+                data = {
+                    "id": log.get('id') or log.get('idx'),
+                    "person_url": log.get('person_url'),
+                    "dress_url": log.get('dress_url'),
+                    "result_url": log.get('result_url'),
+                    "model": log.get('model'),
+                    "prompt": log.get('prompt'),
+                    "success": log.get('success'),
+                    "processing_time": processing_time,
+                    "created_at": created_at
+                }
+                # presigned 전달 모드면 *_presigned_url 추가
+                add_presigned_urls(data, ('person_url', 'dress_url', 'result_url'))
+                
                 return JSONResponse({
                     "success": True,
-                    "data": {
-                        "id": log.get('id') or log.get('idx'),
-                        "person_url": log.get('person_url'),
-                        "dress_url": log.get('dress_url'),
-                        "result_url": log.get('result_url'),
-                        "model": log.get('model'),
-                        "prompt": log.get('prompt'),
-                        "success": log.get('success'),
-                        "processing_time": processing_time,
-                        "created_at": created_at
-                    }
+                    "data": data
                 })
         finally:
             connection.close()
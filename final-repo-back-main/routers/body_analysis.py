@@ -1,21 +1,50 @@
 """체형 분석 라우터"""
 import time
-import io
+import asyncio
 import traceback
-from fastapi import APIRouter, File, UploadFile, Form, Query
+from fastapi import APIRouter, BackgroundTasks, File, UploadFile, Form, Query, Request
 from fastapi.responses import JSONResponse
-from PIL import Image
 
-from core.model_loader import get_body_analysis_service, get_image_classifier_service
+from core.model_loader import get_body_analysis_service
+from services.image_classifier_service import validate_person_upload, ERROR_ANIMAL_DETECTED
+from services.input_validation_service import validate_upload_images_async
 from services.body_service import determine_body_features, analyze_body_with_gemini
 from services.database import get_db_connection
-from services.body_analysis_database import save_body_analysis_result, get_body_logs, get_body_logs_count
+from services.body_analysis_database import (
+    save_body_analysis_result,
+    get_body_logs,
+    get_body_logs_count,
+    get_cached_body_definitions,
+    invalidate_body_definitions_cache,
+    update_body_type_definition
+)
+from config.auth_middleware import require_admin
+from core.body_measurements import stack_landmarks
+from core.image_codec import read_upload, decode_image, ImageDecodeError
+from config.body_analysis import BODY_ANALYSIS_BATCH_MAX_FILES, BODY_ANALYSIS_BATCH_CONCURRENCY
+from services.body_analysis_cache import (
+    compute_image_hash,
+    get_cached_pose,
+    set_cached_pose,
+    get_cached_result,
+    set_cached_result
+)
+from services.body_gemini_cache import list_buckets, purge_buckets
 import numpy as np
-from typing import Optional
+from typing import Optional, List
 
 router = APIRouter()
 
 
+def _discard_task(task: asyncio.Task):
+    """결과를 쓰지 않을 작업 정리: 취소하고, 이미 끝났으면 예외를 회수 (미회수 예외 경고 방지)
+
+    스레드에서 실행 중인 추출 자체는 중단되지 않으며 끝난 뒤 결과만 버려짐
+    """
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
 @router.post("/api/pose-landmark-visualizer", tags=["랜드마크 시각화"])
 async def pose_landmark_visualizer(
     file: UploadFile = File(..., description="이미지 파일")
@@ -36,8 +65,15 @@ async def pose_landmark_visualizer(
             }, status_code=500)
         
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        
+        # 입력 검증 (디코딩/해상도/품질, 포즈 추출 전 차단)
+        rejection = await validate_upload_images_async({"file": (contents, "body")}, "pose-landmark-visualizer")
+        if rejection:
+            return JSONResponse({"success": False, **rejection}, status_code=400)
+        
+        # EXIF 방향 적용 (extract_landmarks와 같은 좌표계로 이미지 크기 반환)
+        image = decode_image(contents)
         
         # 랜드마크 추출 (시각화용이므로 원본 이미지 방향 그대로 표시)
         landmarks = body_analysis_service.extract_landmarks(image, auto_correct_orientation=False)
@@ -84,6 +120,8 @@ async def pose_landmark_visualizer(
             "message": "랜드마크 추출 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         print(f"랜드마크 시각화 오류: {traceback.format_exc()}")
         return JSONResponse({
@@ -104,51 +142,41 @@ async def validate_person(
     """
     try:
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        
+        # 0. 입력 검증 (디코딩/해상도/품질)
+        input_rejection = await validate_upload_images_async({"file": (contents, "body")}, "validate-person")
+        if input_rejection:
+            return JSONResponse({
+                "success": True,
+                "is_person": False,
+                "is_face_only": False,
+                "face_detected": False,
+                "landmarks_count": 0,
+                "detection_type": None,
+                "error_code": input_rejection["error_code"],
+                "reasons": input_rejection["reasons"],
+                "message": input_rejection["message"]
+            })
+        
+        image = decode_image(contents)
         
         classification_result = None
-        is_animal_detected = False
         
-        # 1. 동물 감지 검증 (우선 검증)
-        try:
-            image_classifier_service = get_image_classifier_service()
-            if image_classifier_service and image_classifier_service.is_initialized:
-                classification_result = image_classifier_service.classify_image(image)
-                
-                if classification_result:
-                    # 동물 키워드 확인 (즉시 차단)
-                    animal_keywords = [
-                        "animal", "dog", "cat", "bear", "monkey", "ape", "gorilla",
-                        "orangutan", "chimpanzee", "elephant", "lion", "tiger",
-                        "bird", "fish", "horse", "cow", "pig", "sheep", "goat",
-                        "rabbit", "mouse", "rat", "hamster", "squirrel", "deer",
-                        "wolf", "fox", "panda", "koala", "kangaroo", "zebra",
-                        "giraffe", "camel", "donkey", "mule", "llama", "alpaca"
-                    ]
-                    
-                    for category in classification_result:
-                        category_name_lower = category["category_name"].lower()
-                        if any(keyword in category_name_lower for keyword in animal_keywords):
-                            is_animal_detected = True
-                            print(f"❌ 동물 감지: {category['category_name']} (신뢰도: {category['score']:.2f}) - 즉시 차단")
-                            break
-                    
-                    # 동물이 감지되면 즉시 차단
-                    if is_animal_detected:
-                        print(f"❌ 동물 감지로 인해 즉시 차단")
-                        return JSONResponse({
-                            "success": True,
-                            "is_person": False,
-                            "is_face_only": False,
-                            "face_detected": False,
-                            "landmarks_count": 0,
-                            "detection_type": None,
-                            "classification_result": classification_result[:3],
-                            "message": "인물사진을 업로드해주세요."
-                        })
-        except Exception as e:
-            print(f"동물 감지 검증 오류 (무시): {e}")
+        # 1. 동물/사물 사진 검증 (로컬 분류기, 우선 검증)
+        rejection = await asyncio.to_thread(validate_person_upload, image, "validate-person")
+        if rejection:
+            return JSONResponse({
+                "success": True,
+                "is_person": False,
+                "is_face_only": False,
+                "face_detected": False,
+                "landmarks_count": 0,
+                "detection_type": None,
+                "error_code": rejection["error_code"],
+                "classification_result": rejection["top_categories"],
+                "message": rejection["message"]
+            })
         
         # 2. 전신 랜드마크 확인 (가장 중요 - 체형분석에서는 전신 랜드마크가 필수)
         body_analysis_service = get_body_analysis_service()
@@ -265,6 +293,8 @@ async def validate_person(
                 "message": "전신 사진을 넣어주세요."
             })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         print(f"사람 감지 오류: {e}")
@@ -276,8 +306,44 @@ async def validate_person(
         }, status_code=500)
 
 
+def _save_body_analysis_log(
+    run_time: float,
+    height: float,
+    weight: float,
+    bmi: Optional[float],
+    body_features: List[str],
+    gemini_analysis_text: Optional[str]
+):
+    """체형 분석 결과 DB 저장 (응답 후 백그라운드 실행)"""
+    try:
+        # 체형 특징을 문자열로 변환 (쉼표로 구분)
+        characteristic_str = ', '.join(body_features) if body_features else None
+        
+        # 프롬프트는 간단히 저장 (필요시 상세 프롬프트 저장 가능)
+        prompt_text = '체형 분석 (MediaPipe + Gemini)'
+        
+        # 키/몸무게가 없으면 0으로 저장 (NOT NULL 제약 조건)
+        result_id = save_body_analysis_result(
+            model='body_analysis',
+            run_time=run_time,
+            height=height if height else 0.0,
+            weight=weight if weight else 0.0,
+            prompt=prompt_text,
+            bmi=bmi if bmi else 0.0,
+            characteristic=characteristic_str,
+            analysis_results=gemini_analysis_text
+        )
+        if result_id:
+            print(f"✅ 체형 분석 결과 저장 완료 (ID: {result_id}, 처리시간: {run_time:.2f}초)")
+        else:
+            print("⚠️  체형 분석 결과 저장 실패")
+    except Exception as e:
+        print(f"⚠️  체형 분석 결과 저장 중 오류: {e}")
+
+
 @router.post("/api/analyze-body", tags=["체형 분석"])
 async def analyze_body(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(..., description="전신 이미지 파일"),
     height: float = Form(..., description="키 (cm)"),
     weight: float = Form(..., description="몸무게 (kg)")
@@ -287,8 +353,21 @@ async def analyze_body(
     
     MediaPipe Pose Landmarker로 포즈 랜드마크를 추출하고,
     체형 비율을 계산한 후 Gemini API로 상세 분석을 수행합니다.
+    
+    - 동물 감지와 포즈 랜드마크 추출은 동시에 실행
+    - Gemini 분석은 측정값이 나오는 즉시 시작 (체형별 정의는 메모리 캐시)
+    - DB 로그 저장은 응답 후 백그라운드에서 실행
+    - 응답의 stage_timings에 단계별 소요 시간(초) 포함
+    - 같은 이미지는 포즈 결과를 캐시에서 재사용하고, 키·몸무게까지 같으면 최종 결과를 바로 반환
+      (응답의 cache: "result" / "pose" / null)
     """
     start_time = time.time()
+    stage_timings = {}
+    
+    def mark(stage: str, stage_start: float) -> float:
+        now = time.time()
+        stage_timings[stage] = round(now - stage_start, 3)
+        return now
     
     try:
         # 체형 분석 서비스 확인
@@ -301,60 +380,72 @@ async def analyze_body(
             }, status_code=500)
         
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
-        
-        # 0. 동물 감지 검증 (validatePerson과 동일한 방식)
-        is_animal_detected = False
-        image_classifier_service = get_image_classifier_service()
-        if image_classifier_service and image_classifier_service.is_initialized:
-            try:
-                classification_result = image_classifier_service.classify_image(image)
-                
-                if classification_result:
-                    # 동물 키워드 확인 (즉시 차단)
-                    animal_keywords = [
-                        "animal", "dog", "cat", "bear", "monkey", "ape", "gorilla",
-                        "orangutan", "chimpanzee", "elephant", "lion", "tiger",
-                        "bird", "fish", "horse", "cow", "pig", "sheep", "goat",
-                        "rabbit", "mouse", "rat", "hamster", "squirrel", "deer",
-                        "wolf", "fox", "panda", "koala", "kangaroo", "zebra",
-                        "giraffe", "camel", "donkey", "mule", "llama", "alpaca"
-                    ]
-                    
-                    for category in classification_result:
-                        category_name_lower = category["category_name"].lower()
-                        if any(keyword in category_name_lower for keyword in animal_keywords):
-                            is_animal_detected = True
-                            print(f"❌ 동물 감지: {category['category_name']} (신뢰도: {category['score']:.2f}) - 즉시 차단")
-                            break
-                    
-                    # 동물이 감지되면 즉시 차단
-                    if is_animal_detected:
-                        return JSONResponse({
-                            "success": False,
-                            "error": "Animal detected",
-                            "is_animal": True,
-                            "message": "인물사진을 업로드해주세요."
-                        }, status_code=400)
-            except Exception as e:
-                print(f"동물 감지 검증 오류 (무시): {e}")
-        
-        # 1. 포즈 랜드마크 추출 (전신 감지)
-        landmarks = body_analysis_service.extract_landmarks(image)
-        
-        if landmarks is None:
+        stage_start = time.time()
+        contents = await read_upload(file)
+        image_hash = compute_image_hash(contents)
+        
+        # 2단계 캐시: 같은 이미지 + 같은 키/몸무게면 최종 결과 즉시 반환
+        cached_result = get_cached_result(image_hash, height, weight)
+        if cached_result is not None:
+            run_time = time.time() - start_time
+            stage_timings["total"] = round(run_time, 3)
             return JSONResponse({
-                "success": False,
-                "error": "No pose detected",
-                "message": "전신 사진을 넣어주세요."
-            }, status_code=400)
+                **cached_result,
+                "run_time": run_time,
+                "stage_timings": stage_timings,
+                "cache": "result"
+            })
         
-        # 2. 체형 측정값 계산
-        measurements = body_analysis_service.calculate_measurements(landmarks)
+        # 0. 입력 검증 (디코딩/해상도/품질, 디코딩 / 포즈 캐시 조회 / 업스트림 호출 전 차단)
+        input_rejection = await validate_upload_images_async({"file": (contents, "body")}, "analyze-body")
+        if input_rejection:
+            return JSONResponse({"success": False, **input_rejection}, status_code=400)
         
-        # 3. 체형 타입 분류 (랜드마크 기반)
-        body_type = body_analysis_service.classify_body_type(measurements)
+        image = decode_image(contents)
+        stage_start = mark("decode", stage_start)
+        
+        # 1단계 캐시: 같은 이미지면 동물 감지 / 포즈 추출 / 측정값 계산 생략
+        cached_pose = get_cached_pose(image_hash)
+        if cached_pose is not None:
+            measurements = cached_pose["measurements"]
+            body_type = cached_pose["body_type"]
+        else:
+            # 0~1. 동물/사물 사진 검증(로컬 분류기)과 포즈 랜드마크 추출(전신 감지, 방향 자동 보정)을 동시에 실행
+            landmarks_task = asyncio.create_task(asyncio.to_thread(
+                body_analysis_service.extract_landmark_array, image, auto_correct_orientation=True
+            ))
+            try:
+                rejection = await asyncio.to_thread(validate_person_upload, image, "analyze-body")
+            except BaseException:
+                _discard_task(landmarks_task)
+                raise
+            stage_timings["validation"] = round(time.time() - stage_start, 3)
+            if rejection:
+                _discard_task(landmarks_task)
+                return JSONResponse({
+                    "success": False,
+                    "error": "Animal detected" if rejection["error_code"] == ERROR_ANIMAL_DETECTED else "Not a person",
+                    "error_code": rejection["error_code"],
+                    "is_animal": rejection["error_code"] == ERROR_ANIMAL_DETECTED,
+                    "message": rejection["message"]
+                }, status_code=400)
+            
+            landmarks = await landmarks_task
+            stage_start = mark("pose", stage_start)
+            
+            if landmarks is None:
+                return JSONResponse({
+                    "success": False,
+                    "error": "No pose detected",
+                    "message": "전신 사진을 넣어주세요."
+                }, status_code=400)
+            
+            # 2. 체형 측정값 계산
+            measurements = body_analysis_service.calculate_measurements(landmarks)
+            
+            # 3. 체형 타입 분류 (랜드마크 기반)
+            body_type = body_analysis_service.classify_body_type(measurements)
+            set_cached_pose(image_hash, landmarks, measurements, body_type)
         
         # 4. BMI 계산 및 체형 특징 판단
         bmi = None
@@ -364,8 +455,9 @@ async def analyze_body(
             height_m = height / 100.0
             bmi = weight / (height_m ** 2)
             body_features = determine_body_features(body_type, bmi, height, measurements)
+        stage_start = mark("measurements", stage_start)
         
-        # 5. Gemini API로 상세 분석
+        # 5. Gemini API로 상세 분석 (측정값이 나오는 즉시 시작)
         gemini_analysis = None
         gemini_analysis_text = None
         try:
@@ -376,37 +468,18 @@ async def analyze_body(
                 gemini_analysis_text = gemini_analysis['detailed_analysis']
         except Exception as e:
             print(f"Gemini 분석 실패: {e}")
+        mark("gemini", stage_start)
         
         # 6. 처리 시간 계산
         run_time = time.time() - start_time
+        stage_timings["total"] = round(run_time, 3)
         
-        # 7. 분석 결과를 DB에 저장
-        try:
-            # 체형 특징을 문자열로 변환 (쉼표로 구분)
-            characteristic_str = ', '.join(body_features) if body_features else None
-            
-            # 프롬프트는 간단히 저장 (필요시 상세 프롬프트 저장 가능)
-            prompt_text = '체형 분석 (MediaPipe + Gemini)'
-            
-            # 키/몸무게가 없으면 0으로 저장 (NOT NULL 제약 조건)
-            result_id = save_body_analysis_result(
-                model='body_analysis',
-                run_time=run_time,
-                height=height if height else 0.0,
-                weight=weight if weight else 0.0,
-                prompt=prompt_text,
-                bmi=bmi if bmi else 0.0,
-                characteristic=characteristic_str,
-                analysis_results=gemini_analysis_text
-            )
-            if result_id:
-                print(f"✅ 체형 분석 결과 저장 완료 (ID: {result_id}, 처리시간: {run_time:.2f}초)")
-            else:
-                print("⚠️  체형 분석 결과 저장 실패")
-        except Exception as e:
-            print(f"⚠️  체형 분석 결과 저장 중 오류: {e}")
+        # 7. 분석 결과 DB 저장 (응답 후 백그라운드 실행)
+        background_tasks.add_task(
+            _save_body_analysis_log, run_time, height, weight, bmi, body_features, gemini_analysis_text
+        )
         
-        return JSONResponse({
+        result = {
             "success": True,
             "body_analysis": {
                 "body_type": body_type.get('type', 'unknown'),
@@ -414,10 +487,21 @@ async def analyze_body(
                 "measurements": measurements
             },
             "gemini_analysis": gemini_analysis,
-            "run_time": run_time,
             "message": "체형 분석이 완료되었습니다."
+        }
+        # Gemini 분석까지 성공한 결과만 2단계 캐시에 저장 (일시적 실패 결과 재사용 방지)
+        if gemini_analysis_text:
+            set_cached_result(image_hash, height, weight, result)
+        
+        return JSONResponse({
+            **result,
+            "run_time": run_time,
+            "stage_timings": stage_timings,
+            "cache": "pose" if cached_pose is not None else None
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         print(f"체형 분석 오류: {traceback.format_exc()}")
         return JSONResponse({
@@ -427,6 +511,144 @@ async def analyze_body(
         }, status_code=500)
 
 
+@router.post("/api/analyze-body/batch", tags=["체형 분석"])
+async def analyze_body_batch(
+    files: List[UploadFile] = File(..., description="전신 이미지 파일 목록"),
+    heights: Optional[List[float]] = Form(None, description="키 (cm) 목록 (파일 순서와 동일)"),
+    weights: Optional[List[float]] = Form(None, description="몸무게 (kg) 목록 (파일 순서와 동일)")
+):
+    """
+    여러 전신 이미지 일괄 체형 분석 (랜드마크 기반)
+    
+    이미지별로 포즈 랜드마크를 추출한 뒤 (N, 33, 4) 배열로 묶어
+    측정값 계산과 체형 분류를 한 번에 수행합니다. Gemini 상세 분석은 포함하지 않습니다.
+    """
+    start_time = time.time()
+    
+    try:
+        body_analysis_service = get_body_analysis_service()
+        if not body_analysis_service or not body_analysis_service.is_initialized:
+            return JSONResponse({
+                "success": False,
+                "error": "Body analysis service not initialized",
+                "message": "체형 분석 서비스가 초기화되지 않았습니다. 모델 파일을 확인해주세요."
+            }, status_code=500)
+        
+        if len(files) > BODY_ANALYSIS_BATCH_MAX_FILES:
+            return JSONResponse({
+                "success": False,
+                "error": "Too many files",
+                "message": f"한 번에 최대 {BODY_ANALYSIS_BATCH_MAX_FILES}장까지 분석할 수 있습니다."
+            }, status_code=400)
+        
+        for name, values in (("heights", heights), ("weights", weights)):
+            if values and len(values) != len(files):
+                return JSONResponse({
+                    "success": False,
+                    "error": f"Invalid {name}",
+                    "message": f"{name} 개수({len(values)})가 파일 개수({len(files)})와 다릅니다."
+                }, status_code=400)
+        
+        # 1. 이미지별 포즈 랜드마크 추출 (업스트림 호출이므로 동시성 제한 후 병렬 실행)
+        semaphore = asyncio.Semaphore(BODY_ANALYSIS_BATCH_CONCURRENCY)
+        
+        async def extract(upload: UploadFile):
+            contents = await read_upload(upload)
+            # 입력 검증 실패 시 차단 사유(dict) 반환
+            rejection = await validate_upload_images_async({"file": (contents, "body")}, "analyze-body-batch")
+            if rejection:
+                return rejection
+            image = decode_image(contents)
+            async with semaphore:
+                return await asyncio.to_thread(
+                    body_analysis_service.extract_landmark_array, image, auto_correct_orientation=True
+                )
+        
+        landmark_arrays = await asyncio.gather(*(extract(upload) for upload in files), return_exceptions=True)
+        
+        # 2. 감지된 항목만 (N, 33, 4) 배치로 묶어 측정값 계산 및 체형 분류
+        detected = [i for i, array in enumerate(landmark_arrays) if isinstance(array, np.ndarray)]
+        positions = {index: position for position, index in enumerate(detected)}
+        measurements_list = body_analysis_service.calculate_measurements_batch(
+            stack_landmarks([landmark_arrays[i] for i in detected])
+        ) if detected else []
+        body_types = body_analysis_service.classify_body_types_batch(measurements_list)
+        
+        # 3. 항목별 결과 구성
+        results = []
+        for i, upload in enumerate(files):
+            if isinstance(landmark_arrays[i], Exception):
+                results.append({
+                    "index": i,
+                    "filename": upload.filename,
+                    "success": False,
+                    "error": str(landmark_arrays[i]),
+                    "message": "이미지를 처리할 수 없습니다."
+                })
+                continue
+            if isinstance(landmark_arrays[i], dict):
+                results.append({
+                    "index": i,
+                    "filename": upload.filename,
+                    "success": False,
+                    **landmark_arrays[i]
+                })
+                continue
+            if i not in positions:
+                results.append({
+                    "index": i,
+                    "filename": upload.filename,
+                    "success": False,
+                    "error": "No pose detected",
+                    "message": "전신 사진을 넣어주세요."
+                })
+                continue
+            
+            position = positions[i]
+            measurements = measurements_list[position]
+            body_type = body_types[position]
+            height = heights[i] if heights else None
+            weight = weights[i] if weights else None
+            
+            bmi = None
+            body_features = []
+            if height and weight:
+                height_m = height / 100.0
+                bmi = weight / (height_m ** 2)
+                body_features = determine_body_features(body_type, bmi, height, measurements)
+            
+            results.append({
+                "index": i,
+                "filename": upload.filename,
+                "success": True,
+                "body_analysis": {
+                    "body_type": body_type.get('type', 'unknown'),
+                    "body_features": body_features,
+                    "measurements": measurements
+                },
+                "bmi": bmi
+            })
+        
+        return JSONResponse({
+            "success": True,
+            "results": results,
+            "analyzed_count": len(detected),
+            "total_count": len(files),
+            "run_time": time.time() - start_time,
+            "message": f"{len(detected)}/{len(files)}장 체형 분석이 완료되었습니다."
+        })
+        
+    except ImageDecodeError:
+        raise
+    except Exception as e:
+        print(f"배치 체형 분석 오류: {traceback.format_exc()}")
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "message": f"배치 체형 분석 중 오류 발생: {str(e)}"
+        }, status_code=500)
+
+
 @router.get("/api/admin/body-logs", tags=["관리자"])
 async def get_body_analysis_logs(
     page: int = Query(1, ge=1, description="페이지 번호"),
@@ -483,6 +705,112 @@ async def get_body_analysis_logs(
         }, status_code=500)
 
 
+@router.get("/api/admin/body-definitions", tags=["관리자"])
+async def get_body_definitions(request: Request):
+    """
+    체형별 정의 목록 조회 (메모리 캐시)
+    """
+    await require_admin(request)
+    
+    definitions = get_cached_body_definitions()
+    return JSONResponse({
+        "success": True,
+        "data": [dict(definition) for definition in definitions.values()],
+        "total": len(definitions)
+    })
+
+
+@router.put("/api/admin/body-definitions/{body_feature}", tags=["관리자"])
+async def update_body_definition(request: Request, body_feature: str):
+    """
+    체형별 정의 수정
+    
+    strengths, style_tips, recommended_dresses, avoid_dresses 중 전달된 항목만 수정하고
+    메모리 캐시를 갱신합니다.
+    """
+    await require_admin(request)
+    
+    try:
+        body = await request.json()
+        updated = await asyncio.to_thread(update_body_type_definition, body_feature, body)
+        if not updated:
+            return JSONResponse({
+                "success": False,
+                "error": "Not updated",
+                "message": f"'{body_feature}' 체형 정의를 수정하지 못했습니다. 체형 특징과 수정 항목을 확인해주세요."
+            }, status_code=404)
+        
+        definition = get_cached_body_definitions().get(body_feature)
+        return JSONResponse({
+            "success": True,
+            "data": dict(definition) if definition else None,
+            "message": "체형 정의가 수정되었습니다."
+        })
+    except Exception as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "message": f"체형 정의 수정 중 오류 발생: {str(e)}"
+        }, status_code=500)
+
+
+@router.post("/api/admin/body-definitions/refresh", tags=["관리자"])
+async def refresh_body_definitions(request: Request):
+    """
+    체형별 정의 캐시 갱신 (DB를 직접 수정한 경우)
+    """
+    await require_admin(request)
+    
+    invalidate_body_definitions_cache()
+    definitions = await asyncio.to_thread(get_cached_body_definitions)
+    return JSONResponse({
+        "success": True,
+        "total": len(definitions),
+        "message": "체형별 정의 캐시를 갱신했습니다."
+    })
+
+
+@router.get("/api/admin/body-gemini-cache", tags=["관리자"])
+async def get_body_gemini_cache(request: Request):
+    """
+    Gemini 체형 분석 문구 버킷 캐시 조회
+    
+    버킷 키(양자화된 체형 타입/비율/키/BMI/체형 특징)별 저장된 문구 변형을 반환합니다.
+    """
+    await require_admin(request)
+    
+    buckets = list_buckets()
+    return JSONResponse({
+        "success": True,
+        "data": buckets,
+        "total": len(buckets)
+    })
+
+
+@router.delete("/api/admin/body-gemini-cache", tags=["관리자"])
+async def purge_body_gemini_cache(
+    request: Request,
+    bucket_key: Optional[str] = Query(None, description="삭제할 버킷 키 (없으면 전체 삭제)")
+):
+    """
+    Gemini 체형 분석 문구 버킷 삭제
+    """
+    await require_admin(request)
+    
+    purged = purge_buckets(bucket_key)
+    if bucket_key is not None and purged == 0:
+        return JSONResponse({
+            "success": False,
+            "message": "해당 버킷이 없습니다."
+        }, status_code=404)
+    
+    return JSONResponse({
+        "success": True,
+        "purged": purged,
+        "message": f"버킷 {purged}개를 삭제했습니다."
+    })
+
+
 @router.get("/api/admin/body-logs/{log_id}", tags=["관리자"])
 async def get_body_analysis_log_detail(log_id: int):
     """
@@ -572,8 +900,15 @@ async def get_pose_landmarks(
     """
     try:
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        
+        # 입력 검증 (디코딩/해상도/품질, 포즈 추출 전 차단)
+        rejection = await validate_upload_images_async({"file": (contents, "body")}, "pose-landmarks")
+        if rejection:
+            return JSONResponse({"success": False, **rejection}, status_code=400)
+        
+        # EXIF 방향 적용 (extract_landmarks와 같은 좌표계로 이미지 크기 반환)
+        image = decode_image(contents)
         
         # 포즈 랜드마크 추출 (기존과 동일한 방식)
         body_analysis_service = get_body_analysis_service()
@@ -596,6 +931,8 @@ async def get_pose_landmarks(
             "message": "포즈 랜드마크 추출 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         print(f"포즈 랜드마크 추출 오류: {e}")
@@ -2,12 +2,16 @@
 import io
 import time
 import base64
-from fastapi import APIRouter, File, UploadFile, Form
+import asyncio
+from fastapi import APIRouter, File, UploadFile, Form, Request
 from fastapi.responses import JSONResponse
-from PIL import Image
 from typing import Optional
 
-from services.face_swap_service import FaceSwapService
+from core.image_codec import read_upload, decode_image, save_png, ImageDecodeError
+from services.face_swap_service import get_face_swap_service
+from services.face_swap_templates import get_face_template_registry, reload_face_templates
+from services.input_validation_service import validate_upload_images_async
+from config.auth_middleware import require_admin
 
 router = APIRouter()
 
@@ -18,15 +22,8 @@ async def get_templates():
     사용 가능한 템플릿 이미지 목록 조회
     """
     try:
-        service = FaceSwapService()
-        template_images = service.get_template_images()
-        
-        templates = []
-        for template_path in template_images:
-            templates.append({
-                "name": template_path.name,
-                "path": str(template_path)
-            })
+        registry = await asyncio.to_thread(get_face_template_registry)
+        templates = [template.info() for template in registry.list()]
         
         return JSONResponse({
             "success": True,
@@ -63,7 +60,7 @@ async def face_swap(
     
     try:
         # 이미지 읽기
-        contents = await file.read()
+        contents = await read_upload(file)
         if not contents:
             return JSONResponse({
                 "success": False,
@@ -71,13 +68,18 @@ async def face_swap(
                 "message": "이미지 파일이 비어있습니다."
             }, status_code=400)
         
-        source_image = Image.open(io.BytesIO(contents)).convert("RGB")
+        # 입력 검증 (디코딩/해상도/품질, 얼굴 분석 호출 전 차단)
+        rejection = await validate_upload_images_async({"file": (contents, "face")}, "body-generation")
+        if rejection:
+            return JSONResponse({"success": False, **rejection}, status_code=400)
+        
+        source_image = decode_image(contents)
         
-        # 페이스스왑 서비스 초기화
-        service = FaceSwapService()
+        # 페이스스왑 서비스 (싱글톤)
+        service = get_face_swap_service()
         
-        # 이미지 타입 감지 (전신 vs 얼굴/상체)
-        image_type_info = service.detect_image_type(source_image)
+        # 이미지 타입 감지 (전신 vs 얼굴/상체, 로컬 얼굴/포즈 모델 추론은 워커 스레드에서 마이크로 배처로)
+        image_type_info = await asyncio.to_thread(service.detect_image_type, source_image)
         image_type = image_type_info.get("type", "unknown")
         confidence = image_type_info.get("confidence", 0.0)
         
@@ -98,27 +100,32 @@ async def face_swap(
                 "message": "페이스스왑 서비스를 사용할 수 없습니다. HuggingFace Inference Endpoint 설정을 확인해주세요."
             }, status_code=500)
         
-        # 템플릿 이미지 가져오기
-        template_images = service.get_template_images()
-        if len(template_images) == 0:
+        # 템플릿 선택 (서버 시작 시 디코딩된 레지스트리, 이름이 없거나 찾지 못하면 첫 번째 템플릿)
+        registry = await asyncio.to_thread(get_face_template_registry)
+        template = registry.get(template_name)
+        if template is None:
             return JSONResponse({
                 "success": False,
                 "error": "No templates",
                 "message": "템플릿 이미지가 없습니다. templates/face_swap_templates/ 디렉토리에 템플릿 이미지를 추가해주세요."
             }, status_code=500)
         
-        # 템플릿 선택
-        if template_name:
-            template_path = next((t for t in template_images if t.name == template_name), None)
-            if template_path is None:
-                template_path = template_images[0]
-        else:
-            template_path = template_images[0]
-        
-        target_image = Image.open(template_path).convert("RGB")
+        # 사전 감지가 꺼져 있거나 실패한 템플릿은 여기서 한 번 감지해 캐시
+        template_ready = template.is_detected or await asyncio.to_thread(
+            registry.ensure_detected, template, service.face_analysis_service
+        )
+        if not template_ready:
+            return JSONResponse({
+                "success": False,
+                "error": "Template not ready",
+                "message": "템플릿 얼굴을 감지하지 못했습니다. 얼굴 분석 서비스 상태를 확인한 뒤 다시 시도해주세요."
+            }, status_code=503)
         
-        # 페이스스왑 수행
-        result_image = service.swap_face(source_image, target_image)
+        # 페이스스왑 수행 (템플릿 얼굴은 레지스트리 캐시, 소스 얼굴은 이미지 타입 감지 결과 재사용)
+        result_image = await asyncio.to_thread(
+            service.swap_face, source_image, template.image,
+            target_faces=template.faces, source_faces=image_type_info.get("faces")
+        )
         
         if result_image is None:
             return JSONResponse({
@@ -129,7 +136,7 @@ async def face_swap(
         
         # 결과 이미지를 base64로 인코딩
         result_buffered = io.BytesIO()
-        result_image.save(result_buffered, format="PNG")
+        save_png(result_image, result_buffered)
         result_base64 = base64.b64encode(result_buffered.getvalue()).decode()
         
         # 처리 시간 계산
@@ -138,13 +145,15 @@ async def face_swap(
         return JSONResponse({
             "success": True,
             "result_image": f"data:image/png;base64,{result_base64}",
-            "template_name": template_path.name,
+            "template_name": template.name,
             "image_type": image_type,
             "image_type_confidence": round(confidence, 2),
             "run_time": round(run_time, 2),
             "message": f"페이스스왑 완료 (처리 시간: {run_time:.2f}초)"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         print(f"페이스스왑 오류: {traceback.format_exc()}")
@@ -154,3 +163,21 @@ async def face_swap(
             "message": f"페이스스왑 중 오류 발생: {str(e)}"
         }, status_code=500)
 
+
+@router.post("/api/admin/body-generation/templates/reload", tags=["관리자"])
+async def reload_templates(request: Request):
+    """
+    페이스스왑 템플릿 다시 로드
+
+    템플릿 디렉토리를 다시 읽어 이미지를 디코딩하고 템플릿 얼굴을 감지합니다.
+    """
+    await require_admin(request)
+    
+    registry = await reload_face_templates()
+    templates = [template.info() for template in registry.list()]
+    return JSONResponse({
+        "success": True,
+        "templates": templates,
+        "count": len(templates),
+        "message": f"템플릿 {len(templates)}개를 다시 로드했습니다."
+    })
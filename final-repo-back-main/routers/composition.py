@@ -15,12 +15,15 @@ from botocore.exceptions import ClientError
 from google import genai
 
 from core.llm_clients import generate_custom_prompt_from_images
-from core.s3_client import upload_log_to_s3
+from core.s3_client import upload_log_to_s3_async
+from core.image_codec import read_upload, decode_image, save_png, preview_data_url, ImageDecodeError
 # from core.model_loader import _load_segformer_b2_models, _load_rtmpose_model, _load_realesrgan_model  # 주석 처리: torch/transformers 미사용
 from services.image_service import preprocess_dress_image
 from services.log_service import save_test_log
+from services.input_validation_service import validate_upload_images_async
 from services.tryon_service import generate_custom_tryon_v2
 from config.settings import GEMINI_FLASH_MODEL
+from config.image_codec import IMAGE_GARMENT_MAX_SIDE
 from config.prompts import GEMINI_DEFAULT_COMPOSITION_PROMPT
 
 router = APIRouter()
@@ -48,8 +51,8 @@ async def compose_dress(
     """
     try:
         # 이미지 읽기
-        person_contents = await person_image.read()
-        dress_contents = await dress_image.read()
+        person_contents = await read_upload(person_image)
+        dress_contents = await read_upload(dress_image)
         
         if not person_contents or not dress_contents:
             return JSONResponse({
@@ -60,9 +63,26 @@ async def compose_dress(
                 "llm": None
             }, status_code=400)
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_contents, "person"),
+                "dress_image": (dress_contents, "garment")
+            },
+            "compose-dress"
+        )
+        if rejection:
+            return JSONResponse({
+                "success": False,
+                "prompt": "",
+                "result_image": "",
+                "llm": None,
+                **rejection
+            }, status_code=400)
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_contents)).convert("RGB")
-        dress_img = Image.open(io.BytesIO(dress_contents)).convert("RGB")
+        person_img = decode_image(person_contents)
+        dress_img = decode_image(dress_contents, max_side=IMAGE_GARMENT_MAX_SIDE)
         
         # 커스텀 트라이온 V2 서비스 호출
         result = await generate_custom_tryon_v2(person_img, dress_img)
@@ -87,6 +107,8 @@ async def compose_dress(
                 "error": result.get("error", "")
             }, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -138,8 +160,8 @@ async def compose_gpt4o_gemini(
             status_code=500,
         )
 
-    person_bytes = await person_image.read()
-    dress_bytes = await dress_image.read()
+    person_bytes = await read_upload(person_image)
+    dress_bytes = await read_upload(dress_image)
 
     if not person_bytes or not dress_bytes:
         return JSONResponse(
@@ -151,9 +173,22 @@ async def compose_gpt4o_gemini(
             status_code=400,
         )
 
+    # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+    rejection = await validate_upload_images_async(
+        {
+            "person_image": (person_bytes, "person"),
+            "dress_image": (dress_bytes, "garment")
+        },
+        "gpt4o-gemini-compose"
+    )
+    if rejection:
+        return JSONResponse({"success": False, **rejection}, status_code=400)
+
     try:
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        dress_img = Image.open(io.BytesIO(dress_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        dress_img = decode_image(dress_bytes)
+    except ImageDecodeError:
+        raise
     except Exception as exc:
         return JSONResponse(
             {
@@ -165,15 +200,15 @@ async def compose_gpt4o_gemini(
         )
 
     person_buffered = io.BytesIO()
-    person_img.save(person_buffered, format="PNG")
+    save_png(person_img, person_buffered)
     person_base64 = base64.b64encode(person_buffered.getvalue()).decode()
 
     dress_buffered = io.BytesIO()
-    dress_img.save(dress_buffered, format="PNG")
+    save_png(dress_img, dress_buffered)
     dress_base64 = base64.b64encode(dress_buffered.getvalue()).decode()
 
-    person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
-    dress_s3_url = upload_log_to_s3(dress_buffered.getvalue(), model_id, "dress") or ""
+    person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
+    dress_s3_url = await upload_log_to_s3_async(dress_buffered.getvalue(), model_id, "dress") or ""
     result_s3_url = ""
 
     client = genai.Client(api_key=api_key)
@@ -283,10 +318,10 @@ async def compose_gpt4o_gemini(
             status_code=500,
         )
 
-    result_img = Image.open(io.BytesIO(image_parts[0]))
+    result_img = decode_image(image_parts[0], mode=None)
     result_buffered = io.BytesIO()
-    result_img.save(result_buffered, format="PNG")
-    result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+    save_png(result_img, result_buffered)
+    result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
 
     run_time = time.time() - start_time
     save_test_log(
@@ -906,20 +941,26 @@ async def hr_viton_compose(
     """
     try:
         # 이미지 읽기
-        person_contents = await person_image.read()
-        dress_contents = await dress_image.read()
+        person_contents = await read_upload(person_image)
+        dress_contents = await read_upload(dress_image)
         
-        person_img = Image.open(io.BytesIO(person_contents)).convert("RGB")
-        dress_img = Image.open(io.BytesIO(dress_contents)).convert("RGB")
+        # 입력 검증 (디코딩/해상도/품질/인물 여부)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_contents, "person"),
+                "dress_image": (dress_contents, "garment")
+            },
+            "hr-viton-compose"
+        )
+        if rejection:
+            return JSONResponse({"success": False, **rejection}, status_code=400)
         
-        # 원본 이미지들을 base64로 인코딩
-        person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_base64 = base64.b64encode(person_buffered.getvalue()).decode()
+        person_img = decode_image(person_contents)
+        dress_img = decode_image(dress_contents)
         
-        dress_buffered = io.BytesIO()
-        dress_img.save(dress_buffered, format="PNG")
-        dress_base64 = base64.b64encode(dress_buffered.getvalue()).decode()
+        # 원본 이미지 미리보기 (JPEG / WebP)
+        person_preview = preview_data_url(person_img)
+        dress_preview = preview_data_url(dress_img)
         
         # HR-VITON 구현 (간단한 버전)
         # 실제로는 HR-VITON 저장소의 코드를 사용해야 함
@@ -945,17 +986,19 @@ async def hr_viton_compose(
         
         # 결과 이미지를 base64로 인코딩
         result_buffered = io.BytesIO()
-        result_img.save(result_buffered, format="PNG")
+        save_png(result_img, result_buffered)
         result_base64 = base64.b64encode(result_buffered.getvalue()).decode()
         
         return JSONResponse({
             "success": True,
-            "person_image": f"data:image/png;base64,{person_base64}",
-            "dress_image": f"data:image/png;base64,{dress_base64}",
+            "person_image": person_preview,
+            "dress_image": dress_preview,
             "result_image": f"data:image/png;base64,{result_base64}",
             "message": "HR-VITON 가상 피팅 완료 (참고: 실제 HR-VITON 모델 구현 필요)"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -1,10 +1,10 @@
 """CustomV3 통합 트라이온 라우터"""
-import io
 from fastapi import APIRouter, File, UploadFile
 from fastapi.responses import JSONResponse
-from PIL import Image
 
+from core.image_codec import read_upload, decode_image, ImageDecodeError
 from services.custom_v3_service import generate_unified_tryon_custom_v3
+from services.input_validation_service import validate_upload_images_async
 from schemas.tryon_schema import UnifiedTryonResponse
 
 router = APIRouter()
@@ -32,9 +32,9 @@ async def compose_custom_v3_endpoint(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        garment_bytes = await garment_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        garment_bytes = await read_upload(garment_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not garment_bytes or not background_bytes:
             return JSONResponse(
@@ -48,10 +48,25 @@ async def compose_custom_v3_endpoint(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "garment_image": (garment_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "custom-v3-compose"
+        )
+        if rejection:
+            return JSONResponse(
+                {"success": False, "prompt": "", "result_image": "", "llm": None, **rejection},
+                status_code=400,
+            )
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        garment_img = Image.open(io.BytesIO(garment_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        garment_img = decode_image(garment_bytes)
+        background_img = decode_image(background_bytes)
         
         # CustomV3 통합 트라이온 서비스 호출
         result = await generate_unified_tryon_custom_v3(person_img, garment_img, background_img)
@@ -62,6 +77,8 @@ async def compose_custom_v3_endpoint(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -6,15 +6,23 @@ import io
 import pymysql
 from pathlib import Path
 from typing import List, Optional
-from fastapi import APIRouter, File, UploadFile, Form, Query, Request
+from fastapi import APIRouter, BackgroundTasks, File, UploadFile, Form, Query, Request
 from fastapi.responses import JSONResponse, StreamingResponse, Response
-from PIL import Image
 
 from services.database import get_db_connection
 from services.category_service import detect_style_from_filename
 from services.dress_check_service import get_dress_check_service
-from core.s3_client import upload_to_s3, delete_from_s3
+from services.dress_service import bulk_delete_dresses, reconcile_orphan_dress_objects
+from core.s3_client import upload_to_s3_async, delete_from_s3_async
+from services.catalog_image_cache import invalidate_catalog_image
+from services.image_derivative_service import catalog_image_urls, warm_derivatives_async
+from services.image_delivery_service import add_presigned_urls, invalidate_presigned_url
+from core.s3_client import S3_BUCKET_MAIN
+from core.image_codec import read_upload, decode_image, preview_data_url, ImageDecodeError
 from config.settings import AWS_S3_BUCKET_NAME, AWS_REGION
+from config.image_codec import IMAGE_PREVIEW_MAX_SIDE
+from config.s3 import DRESS_BULK_DELETE_MAX_IDS
+from config.auth_middleware import require_admin
 
 router = APIRouter()
 
@@ -58,6 +66,13 @@ async def get_dresses(
                     LIMIT %s OFFSET %s
                 """, (limit, offset))
                 dresses = cursor.fetchall()
+
+                # S3에 있는 이미지는 썸네일 / 파생본 URL 추가 (목록에서 원본 대신 사용)
+                # presigned 전달 모드면 원본 presigned URL도 추가 (presigned_url)
+                for dress in dresses:
+                    if dress.get("url") and dress["url"].startswith("https://"):
+                        dress.update(catalog_image_urls(dress["image_name"]))
+                    add_presigned_urls(dress, ("url",))
                 
                 return JSONResponse({
                     "success": True,
@@ -189,11 +204,14 @@ async def add_dress(request: Request):
 
 @router.post("/api/admin/dresses/upload", tags=["드레스 관리"])
 async def upload_dresses(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     styles: str = Form(...)
 ):
     """
     여러 드레스 이미지를 업로드하고 S3에 저장
+
+    저장된 이미지의 썸네일 / WebP 파생본(IMAGE_DERIVATIVE_EAGER)은 응답 후 백그라운드에서 미리 생성합니다.
     
     Args:
         files: 업로드할 이미지 파일 리스트
@@ -220,7 +238,7 @@ async def upload_dresses(
             for file in files:
                 try:
                     # 파일 내용 읽기
-                    file_content = await file.read()
+                    file_content = await read_upload(file)
                     file_name = file.filename
                     
                     # 파일명 처리
@@ -243,7 +261,7 @@ async def upload_dresses(
                     
                     # S3 업로드
                     content_type = file.content_type or "image/png"
-                    s3_url = upload_to_s3(file_content, file_name, content_type)
+                    s3_url = await upload_to_s3_async(file_content, file_name, content_type)
                     
                     if not s3_url:
                         results.append({
@@ -253,6 +271,9 @@ async def upload_dresses(
                         })
                         fail_count += 1
                         continue
+
+                    # 같은 키를 덮어썼을 수 있으므로 카탈로그 이미지 캐시 무효화
+                    invalidate_catalog_image(file_name)
                     
                     # DB 저장
                     with connection.cursor() as cursor:
@@ -290,9 +311,11 @@ async def upload_dresses(
                                 "file_name": file_name,
                                 "success": True,
                                 "style": style,
-                                "url": s3_url
+                                "url": s3_url,
+                                **catalog_image_urls(file_name)
                             })
                             success_count += 1
+                            background_tasks.add_task(warm_derivatives_async, file_name)
                         except pymysql.IntegrityError as e:
                             results.append({
                                 "file_name": file_name,
@@ -317,6 +340,8 @@ async def upload_dresses(
             "success_count": success_count,
             "fail_count": fail_count
         })
+    except ImageDecodeError:
+        raise
     except Exception as e:
         return JSONResponse({
             "success": False,
@@ -361,7 +386,9 @@ async def delete_dress(dress_id: int):
                 s3_deleted = False
                 if url and url.startswith('https://'):
                     # S3 URL인 경우 삭제 시도
-                    s3_deleted = delete_from_s3(file_name)
+                    s3_deleted = await delete_from_s3_async(file_name)
+                    invalidate_catalog_image(file_name)
+                    invalidate_presigned_url(S3_BUCKET_MAIN, f"dresses/{file_name}")
                 
                 # 데이터베이스에서 삭제
                 cursor.execute("DELETE FROM dresses WHERE idx = %s", (dress_id,))
@@ -387,6 +414,107 @@ async def delete_dress(dress_id: int):
         }, status_code=500)
 
 
+@router.post("/api/admin/dresses/bulk-delete", tags=["드레스 관리"])
+async def bulk_delete_dresses_endpoint(request: Request):
+    """
+    드레스 일괄 삭제
+    
+    요청 본문 {"dress_ids": [1, 2, ...]}의 드레스 레코드를 한 트랜잭션으로 삭제한 뒤,
+    S3 이미지를 delete_objects(1,000개 단위)로 동시에 삭제하고 드레스별 결과를 반환합니다.
+    """
+    # 인증 확인
+    await require_admin(request)
+    
+    try:
+        body = await request.json()
+        dress_ids = body.get("dress_ids")
+        
+        if not isinstance(dress_ids, list) or not dress_ids:
+            return JSONResponse({
+                "success": False,
+                "error": "Missing dress_ids",
+                "message": "dress_ids(드레스 ID 목록)는 필수 입력 항목입니다."
+            }, status_code=400)
+        
+        try:
+            dress_ids = [int(dress_id) for dress_id in dress_ids]
+        except (ValueError, TypeError):
+            return JSONResponse({
+                "success": False,
+                "error": "Invalid dress_ids",
+                "message": "dress_ids는 정수 목록이어야 합니다."
+            }, status_code=400)
+        
+        if len(dress_ids) > DRESS_BULK_DELETE_MAX_IDS:
+            return JSONResponse({
+                "success": False,
+                "error": "Too many dress_ids",
+                "message": f"한 번에 최대 {DRESS_BULK_DELETE_MAX_IDS}개까지 삭제할 수 있습니다."
+            }, status_code=400)
+        
+        result = await bulk_delete_dresses(dress_ids)
+        if not result["success"]:
+            return JSONResponse({
+                "success": False,
+                "error": result["error"],
+                "message": result["message"]
+            }, status_code=500)
+        
+        message = result.pop("message")
+        result.pop("success")
+        return JSONResponse({
+            "success": True,
+            "message": message,
+            "data": result
+        })
+        
+    except Exception as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "message": f"드레스 일괄 삭제 중 오류 발생: {str(e)}"
+        }, status_code=500)
+
+
+@router.post("/api/admin/dresses/orphans/reconcile", tags=["드레스 관리"])
+async def reconcile_dress_orphans(
+    request: Request,
+    dry_run: bool = Query(True, description="true면 고아 이미지 목록만 조회 (삭제하지 않음)")
+):
+    """
+    고아 드레스 이미지 정리
+    
+    S3 dresses/ 아래 객체 중 DB에 없는 이미지를 찾고, dry_run=false면 일괄 삭제합니다.
+    최근 업로드(DRESS_ORPHAN_MIN_AGE_MIN분 이내) 객체는 제외합니다.
+    """
+    # 인증 확인
+    await require_admin(request)
+    
+    try:
+        result = await reconcile_orphan_dress_objects(dry_run=dry_run)
+        if not result["success"]:
+            return JSONResponse({
+                "success": False,
+                "error": result["error"],
+                "message": result["message"]
+            }, status_code=500)
+        
+        message = result.pop("message")
+        result.pop("success")
+        return JSONResponse({
+            "success": True,
+            "message": message,
+            "data": result
+        })
+        
+    except Exception as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "message": f"고아 이미지 정리 중 오류 발생: {str(e)}"
+        }, status_code=500)
+
+
 @router.get("/api/admin/dresses/export", tags=["드레스 관리"])
 async def export_dresses(format: str = Query("json", description="내보내기 형식 (json, csv)")):
     """
@@ -463,7 +591,7 @@ async def import_dresses(file: UploadFile = File(...)):
         import pymysql
         
         # 파일 내용 읽기
-        file_content = await file.read()
+        file_content = await read_upload(file)
         file_name = file.filename.lower()
         
         # 파일 확장자 확인
@@ -629,6 +757,8 @@ async def import_dresses(file: UploadFile = File(...)):
         finally:
             connection.close()
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -708,11 +838,12 @@ async def batch_check_dresses(
         for index, file in enumerate(files):
             try:
                 # 파일 읽기
-                file_content = await file.read()
+                file_content = await read_upload(file)
                 
                 # 이미지로 변환
                 try:
-                    image = Image.open(io.BytesIO(file_content)).convert("RGB")
+                    # 판별(LLM 입력)과 썸네일에는 미리보기 크기면 충분하므로 축소 디코딩
+                    image = decode_image(file_content, max_side=IMAGE_PREVIEW_MAX_SIDE)
                 except Exception as e:
                     results.append({
                         "index": index,
@@ -733,13 +864,8 @@ async def batch_check_dresses(
                 # 썸네일 생성 (base64)
                 thumbnail = None
                 try:
-                    # 썸네일 크기로 리사이즈
-                    image.thumbnail((200, 200))
-                    import base64
-                    buffered = io.BytesIO()
-                    image.save(buffered, format="PNG")
-                    thumbnail = base64.b64encode(buffered.getvalue()).decode()
-                    thumbnail = f"data:image/png;base64,{thumbnail}"
+                    # 썸네일 크기로 줄인 미리보기 (JPEG / WebP)
+                    thumbnail = preview_data_url(image, max_side=200)
                 except Exception:
                     pass  # 썸네일 생성 실패해도 계속 진행
                 
@@ -769,6 +895,8 @@ async def batch_check_dresses(
             "message": f"{len(results)}개 이미지 처리 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -5,17 +5,15 @@ from fastapi.responses import JSONResponse
 from PIL import Image
 from typing import Optional
 
-from services.fitting_service import (
-    parse_person_with_b2,
-    extract_face_patch,
-    generate_base_image,
-    generate_inpaint_mask,
-    build_preprocessed_person_payload,
-    compose_v2_5
-)
+from core.image_codec import read_upload, decode_image, save_png, ImageDecodeError
+from core.cpu_pool import run_cpu_task
+from services.fitting_service import parse_person_with_b2, compose_v2_5
+from services.fitting_masks import build_person_masks, build_preprocessed_person_payload
 from services.tryon_service import generate_unified_tryon_v3, generate_unified_tryon_v4
+from services.input_validation_service import validate_upload_images_async
 from schemas.fitting_schema import PersonPreprocessResult
 from schemas.tryon_schema import UnifiedTryonResponse
+from config.image_codec import IMAGE_GARMENT_MAX_SIDE
 
 router = APIRouter()
 
@@ -42,7 +40,7 @@ async def preprocess_person(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
+        person_bytes = await read_upload(person_image)
         
         if not person_bytes:
             return JSONResponse(
@@ -56,8 +54,25 @@ async def preprocess_person(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부)
+        rejection = await validate_upload_images_async(
+            {"person_image": (person_bytes, "person")},
+            "fit-v2.5-preprocess-person"
+        )
+        if rejection:
+            return JSONResponse(
+                {
+                    "face_mask": "",
+                    "face_patch": "",
+                    "base_img": "",
+                    "inpaint_mask": "",
+                    **rejection
+                },
+                status_code=400,
+            )
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
         
         # Step 1: SegFormer B2 Human Parsing
         print("[Preprocess Person] Step 1: SegFormer B2 Human Parsing...")
@@ -79,27 +94,19 @@ async def preprocess_person(
         parsing_mask = parsing_result.get("parsing_mask")
         face_mask_array = parsing_result.get("face_mask")
         
-        # Step 2: face_patch 추출
-        print("[Preprocess Person] Step 2: face_patch 추출...")
-        face_patch = extract_face_patch(person_img, parsing_mask)
-        
-        # Step 3: base_img 생성
-        print("[Preprocess Person] Step 3: base_img 생성...")
-        base_img = generate_base_image(person_img, parsing_mask)
-        
-        # Step 4: inpaint_mask 생성
-        print("[Preprocess Person] Step 4: inpaint_mask 생성...")
-        inpaint_mask = generate_inpaint_mask(parsing_mask)
+        # Step 2~4: face_patch 추출, base_img 생성, inpaint_mask 생성 (프로세스 풀)
+        print("[Preprocess Person] Step 2~4: face_patch / base_img / inpaint_mask 생성...")
+        face_patch, base_img, inpaint_mask = await run_cpu_task(build_person_masks, person_img, parsing_mask)
         
         # Step 5: face_mask를 base64로 변환 (응답용)
         import base64
         face_mask_img = Image.fromarray(face_mask_array, mode='L')
         face_mask_buffer = io.BytesIO()
-        face_mask_img.save(face_mask_buffer, format="PNG")
+        save_png(face_mask_img, face_mask_buffer)
         face_mask_base64 = base64.b64encode(face_mask_buffer.getvalue()).decode("utf-8")
         
         # payload 생성
-        payload = build_preprocessed_person_payload(face_patch, base_img, inpaint_mask)
+        payload = await run_cpu_task(build_preprocessed_person_payload, face_patch, base_img, inpaint_mask)
         
         print("[Preprocess Person] Step 5: 인물 전처리 완료")
         
@@ -111,6 +118,8 @@ async def preprocess_person(
             "message": "인물 전처리가 성공적으로 완료되었습니다."
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -152,9 +161,9 @@ async def compose_v2_5_endpoint(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        garment_bytes = await garment_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        garment_bytes = await read_upload(garment_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not garment_bytes or not background_bytes:
             return JSONResponse(
@@ -168,10 +177,25 @@ async def compose_v2_5_endpoint(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "garment_image": (garment_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "fit-v2.5-compose"
+        )
+        if rejection:
+            return JSONResponse(
+                {"success": False, "prompt": "", "result_image": "", "llm": None, **rejection},
+                status_code=400,
+            )
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        garment_img = Image.open(io.BytesIO(garment_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        garment_img = decode_image(garment_bytes, max_side=IMAGE_GARMENT_MAX_SIDE)
+        background_img = decode_image(background_bytes)
         
         # use_person_preprocess 파라미터 변환
         use_preprocess = use_person_preprocess.lower() == "true"
@@ -190,6 +214,8 @@ async def compose_v2_5_endpoint(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -227,9 +253,9 @@ async def compose_v3_endpoint(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        garment_bytes = await garment_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        garment_bytes = await read_upload(garment_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not garment_bytes or not background_bytes:
             return JSONResponse(
@@ -243,10 +269,25 @@ async def compose_v3_endpoint(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "garment_image": (garment_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "fit-v3-compose"
+        )
+        if rejection:
+            return JSONResponse(
+                {"success": False, "prompt": "", "result_image": "", "llm": None, **rejection},
+                status_code=400,
+            )
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        garment_img = Image.open(io.BytesIO(garment_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        garment_img = decode_image(garment_bytes)
+        background_img = decode_image(background_bytes)
         
         # V3 통합 트라이온 서비스 호출
         result = await generate_unified_tryon_v3(person_img, garment_img, background_img)
@@ -257,6 +298,8 @@ async def compose_v3_endpoint(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -294,9 +337,9 @@ async def compose_v4_endpoint(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        garment_bytes = await garment_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        garment_bytes = await read_upload(garment_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not garment_bytes or not background_bytes:
             return JSONResponse(
@@ -310,10 +353,25 @@ async def compose_v4_endpoint(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "garment_image": (garment_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "fit-v4-compose"
+        )
+        if rejection:
+            return JSONResponse(
+                {"success": False, "prompt": "", "result_image": "", "llm": None, **rejection},
+                status_code=400,
+            )
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        garment_img = Image.open(io.BytesIO(garment_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        garment_img = decode_image(garment_bytes)
+        background_img = decode_image(background_bytes)
         
         # V4 통합 트라이온 서비스 호출
         result = await generate_unified_tryon_v4(person_img, garment_img, background_img)
@@ -324,6 +382,8 @@ async def compose_v4_endpoint(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -18,12 +18,14 @@ from PIL import Image
 from core.xai_client import generate_image_from_text
 from config.settings import GEMINI_FLASH_MODEL
 from services.log_service import save_test_log
-from core.s3_client import upload_log_to_s3
+from core.s3_client import upload_log_to_s3_async
+from core.image_codec import read_upload, decode_image, save_png, to_base64, preview_data_url, ImageDecodeError
+from core.cpu_pool import run_cpu_task
 from services.image_filter_service import (
     apply_filter_preset,
-    apply_frame,
-    apply_frame_preset,
+    apply_filter_with_frame,
     apply_sticker,
+    harmonize_colors,
     process_image_with_filters_and_stickers
 )
 import time
@@ -127,66 +129,33 @@ async def color_harmonize(
     이미지의 조명과 색상을 조정하여 자연스러운 결과를 만듭니다.
     """
     try:
-        import cv2
-        
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
-        
-        # 원본 이미지를 base64로 인코딩
-        buffered_original = io.BytesIO()
-        image.save(buffered_original, format="PNG")
-        original_base64 = base64.b64encode(buffered_original.getvalue()).decode()
+        contents = await read_upload(file)
+        image = decode_image(contents)
         
-        # OpenCV 형식으로 변환
-        img_array = np.array(image)
-        img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        # 원본 이미지 미리보기 (JPEG / WebP)
+        original_preview = preview_data_url(image)
         
+        # 참조 이미지가 있으면 색상 전이, 없으면 CLAHE 자동 보정 (프로세스 풀)
+        ref_image = None
         if reference_file:
-            # 참조 이미지가 있으면 색상 전이
-            ref_contents = await reference_file.read()
-            ref_image = Image.open(io.BytesIO(ref_contents)).convert("RGB")
-            ref_array = np.array(ref_image)
-            ref_bgr = cv2.cvtColor(ref_array, cv2.COLOR_RGB2BGR)
-            
-            # LAB 색공간으로 변환
-            img_lab = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2LAB)
-            ref_lab = cv2.cvtColor(ref_bgr, cv2.COLOR_BGR2LAB)
-            
-            # 색상 전이 (LAB 색공간에서)
-            img_lab[:, :, 1] = ref_lab[:, :, 1]  # a 채널
-            img_lab[:, :, 2] = ref_lab[:, :, 2]  # b 채널
-            
-            # BGR로 변환
-            result_bgr = cv2.cvtColor(img_lab, cv2.COLOR_LAB2BGR)
-        else:
-            # 자동 색상 보정 (CLAHE 사용)
-            lab = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2LAB)
-            l, a, b = cv2.split(lab)
-            
-            # CLAHE 적용 (대비 향상)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-            l = clahe.apply(l)
-            
-            # LAB 합성
-            lab = cv2.merge([l, a, b])
-            result_bgr = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+            ref_contents = await read_upload(reference_file)
+            ref_image = decode_image(ref_contents)
         
-        # 결과 이미지 변환
-        result_img = Image.fromarray(cv2.cvtColor(result_bgr, cv2.COLOR_BGR2RGB))
+        result_img = await run_cpu_task(harmonize_colors, image, ref_image)
         
-        # 결과 이미지를 base64로 인코딩
-        buffered_result = io.BytesIO()
-        result_img.save(buffered_result, format="PNG")
-        result_base64 = base64.b64encode(buffered_result.getvalue()).decode()
+        # 결과 이미지를 base64로 인코딩 (프로세스 풀)
+        result_base64 = await run_cpu_task(to_base64, result_img)
         
         return JSONResponse({
             "success": True,
-            "original_image": f"data:image/png;base64,{original_base64}",
+            "original_image": original_preview,
             "result_image": f"data:image/png;base64,{result_base64}",
             "message": "Color Harmonization 색상 보정 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -346,22 +315,26 @@ async def generate_image_xai(
                         base64_data = result["result_image"]
                     
                     image_bytes = base64.b64decode(base64_data)
-                    result_s3_url = upload_log_to_s3(image_bytes, model_name, "result") or ""
+                    result_s3_url = await upload_log_to_s3_async(image_bytes, model_name, "result") or ""
                 except Exception as e:
                     print(f"결과 이미지 S3 업로드 실패: {e}")
             
             # 사람 이미지와 드레스 이미지가 제공된 경우 S3에 업로드
             if person_image:
                 try:
-                    person_bytes = await person_image.read()
-                    person_s3_url = upload_log_to_s3(person_bytes, model_name, "person") or ""
+                    person_bytes = await read_upload(person_image)
+                    person_s3_url = await upload_log_to_s3_async(person_bytes, model_name, "person") or ""
+                except ImageDecodeError:
+                    raise
                 except Exception as e:
                     print(f"사람 이미지 S3 업로드 실패: {e}")
             
             if dress_image:
                 try:
-                    dress_bytes = await dress_image.read()
-                    dress_s3_url = upload_log_to_s3(dress_bytes, model_name, "dress") or None
+                    dress_bytes = await read_upload(dress_image)
+                    dress_s3_url = await upload_log_to_s3_async(dress_bytes, model_name, "dress") or None
+                except ImageDecodeError:
+                    raise
                 except Exception as e:
                     print(f"드레스 이미지 S3 업로드 실패: {e}")
             
@@ -390,15 +363,19 @@ async def generate_image_xai(
                 
                 if person_image:
                     try:
-                        person_bytes = await person_image.read()
-                        person_s3_url = upload_log_to_s3(person_bytes, model_name, "person") or ""
+                        person_bytes = await read_upload(person_image)
+                        person_s3_url = await upload_log_to_s3_async(person_bytes, model_name, "person") or ""
+                    except ImageDecodeError:
+                        raise
                     except Exception as e:
                         print(f"사람 이미지 S3 업로드 실패: {e}")
                 
                 if dress_image:
                     try:
-                        dress_bytes = await dress_image.read()
-                        dress_s3_url = upload_log_to_s3(dress_bytes, model_name, "dress") or None
+                        dress_bytes = await read_upload(dress_image)
+                        dress_s3_url = await upload_log_to_s3_async(dress_bytes, model_name, "dress") or None
+                    except ImageDecodeError:
+                        raise
                     except Exception as e:
                         print(f"드레스 이미지 S3 업로드 실패: {e}")
                 
@@ -418,6 +395,8 @@ async def generate_image_xai(
                 "message": result.get("message", "이미지 생성 실패")
             }, status_code=500)
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         run_time = time.time() - start_time
@@ -433,15 +412,19 @@ async def generate_image_xai(
             
             if person_image:
                 try:
-                    person_bytes = await person_image.read()
-                    person_s3_url = upload_log_to_s3(person_bytes, model_name, "person") or ""
+                    person_bytes = await read_upload(person_image)
+                    person_s3_url = await upload_log_to_s3_async(person_bytes, model_name, "person") or ""
+                except ImageDecodeError:
+                    raise
                 except:
                     pass
             
             if dress_image:
                 try:
-                    dress_bytes = await dress_image.read()
-                    dress_s3_url = upload_log_to_s3(dress_bytes, model_name, "dress") or None
+                    dress_bytes = await read_upload(dress_image)
+                    dress_s3_url = await upload_log_to_s3_async(dress_bytes, model_name, "dress") or None
+                except ImageDecodeError:
+                    raise
                 except:
                     pass
             
@@ -476,19 +459,19 @@ async def tps_warp(
         import cv2
         
         # 이미지 읽기
-        shoes_contents = await shoes_image.read()
-        person_contents = await person_image.read()
+        shoes_contents = await read_upload(shoes_image)
+        person_contents = await read_upload(person_image)
         
-        shoes_img = Image.open(io.BytesIO(shoes_contents)).convert("RGB")
-        person_img = Image.open(io.BytesIO(person_contents)).convert("RGB")
+        shoes_img = decode_image(shoes_contents)
+        person_img = decode_image(person_contents)
         
         # 원본 이미지들을 base64로 인코딩
         shoes_buffered = io.BytesIO()
-        shoes_img.save(shoes_buffered, format="PNG")
+        save_png(shoes_img, shoes_buffered)
         shoes_base64 = base64.b64encode(shoes_buffered.getvalue()).decode()
         
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
+        save_png(person_img, person_buffered)
         person_base64 = base64.b64encode(person_buffered.getvalue()).decode()
         
         # OpenCV 형식으로 변환
@@ -530,7 +513,7 @@ async def tps_warp(
         
         # 결과 이미지를 base64로 인코딩
         result_buffered = io.BytesIO()
-        result_img.save(result_buffered, format="PNG")
+        save_png(result_img, result_buffered)
         result_base64 = base64.b64encode(result_buffered.getvalue()).decode()
         
         return JSONResponse({
@@ -541,6 +524,8 @@ async def tps_warp(
             "message": "TPS Warp 구두 합성 완료 (참고: 정교한 워핑 알고리즘 필요)"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -657,30 +642,28 @@ async def apply_image_filters(
     """
     try:
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        image = decode_image(contents)
         
-        # 원본 이미지를 base64로 인코딩
-        buffered_original = io.BytesIO()
-        image.save(buffered_original, format="PNG")
-        original_base64 = base64.b64encode(buffered_original.getvalue()).decode()
+        # 원본 이미지 미리보기 (JPEG / WebP)
+        original_preview = preview_data_url(image)
         
         # 필터 적용
-        result_img = apply_filter_preset(image, filter_preset)
+        result_img = await run_cpu_task(apply_filter_preset, image, filter_preset)
         
-        # 결과 이미지를 base64로 인코딩
-        buffered_result = io.BytesIO()
-        result_img.save(buffered_result, format="PNG")
-        result_base64 = base64.b64encode(buffered_result.getvalue()).decode()
+        # 결과 이미지를 base64로 인코딩 (프로세스 풀)
+        result_base64 = await run_cpu_task(to_base64, result_img)
         
         return JSONResponse({
             "success": True,
-            "original_image": f"data:image/png;base64,{original_base64}",
+            "original_image": original_preview,
             "result_image": f"data:image/png;base64,{result_base64}",
             "filter_preset": filter_preset,
             "message": f"필터 적용 완료 ({filter_preset})"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -705,16 +688,14 @@ async def apply_filter_and_frame(
     """
     try:
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
-        
-        # 필터 적용
-        result_img = apply_filter_preset(image, filter_preset)
+        contents = await read_upload(file)
+        image = decode_image(contents)
         
-        # 프레임 적용 (프레임 프리셋 사용)
+        # 프레임 프리셋 / 커스텀 프레임 결정
+        frame_preset_name = "none"
+        frame_options = None
         if frame_type != "none":
             # 프레임 프리셋 이름 결정 (색상 기반)
-            frame_preset_name = "none"
             if frame_color == "#000000" and frame_width == 15:
                 frame_preset_name = "black"
             elif frame_color == "#FFFFFF" and frame_width == 15:
@@ -726,22 +707,22 @@ async def apply_filter_and_frame(
             elif frame_color == "#0066FF" and frame_width == 15:
                 frame_preset_name = "blue"
             
-            if frame_preset_name != "none":
-                result_img = apply_frame_preset(result_img, frame_preset_name)
-            else:
+            if frame_preset_name == "none":
                 # 커스텀 프레임
-                result_img = apply_frame(
-                    result_img,
-                    frame_type,
-                    frame_color,
-                    frame_width,
-                    None
-                )
+                frame_options = {
+                    "frame_type": frame_type,
+                    "frame_color": frame_color,
+                    "frame_width": frame_width,
+                    "frame_image": None
+                }
         
-        # 결과 이미지를 base64로 인코딩
-        buffered_result = io.BytesIO()
-        result_img.save(buffered_result, format="PNG")
-        result_base64 = base64.b64encode(buffered_result.getvalue()).decode()
+        # 필터 + 프레임 적용 (프로세스 풀)
+        result_img = await run_cpu_task(
+            apply_filter_with_frame, image, filter_preset, frame_preset_name, frame_options
+        )
+        
+        # 결과 이미지를 base64로 인코딩 (프로세스 풀)
+        result_base64 = await run_cpu_task(to_base64, result_img)
         
         return JSONResponse({
             "success": True,
@@ -750,6 +731,8 @@ async def apply_filter_and_frame(
             "message": "필터 및 프레임 적용 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -777,19 +760,18 @@ async def add_sticker(
     """
     try:
         # 이미지 읽기
-        contents = await file.read()
-        base_image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        base_image = decode_image(contents)
         
-        sticker_contents = await sticker_file.read()
-        sticker_image = Image.open(io.BytesIO(sticker_contents))
+        sticker_contents = await read_upload(sticker_file)
+        sticker_image = decode_image(sticker_contents, mode=None)
         
-        # 원본 이미지를 base64로 인코딩
-        buffered_original = io.BytesIO()
-        base_image.save(buffered_original, format="PNG")
-        original_base64 = base64.b64encode(buffered_original.getvalue()).decode()
+        # 원본 이미지 미리보기 (JPEG / WebP)
+        original_preview = preview_data_url(base_image)
         
         # 스티커 적용
-        result_img = apply_sticker(
+        result_img = await run_cpu_task(
+            apply_sticker,
             base_image,
             sticker_image,
             x=x,
@@ -800,18 +782,18 @@ async def add_sticker(
             rotation=rotation
         )
         
-        # 결과 이미지를 base64로 인코딩
-        buffered_result = io.BytesIO()
-        result_img.save(buffered_result, format="PNG")
-        result_base64 = base64.b64encode(buffered_result.getvalue()).decode()
+        # 결과 이미지를 base64로 인코딩 (프로세스 풀)
+        result_base64 = await run_cpu_task(to_base64, result_img)
         
         return JSONResponse({
             "success": True,
-            "original_image": f"data:image/png;base64,{original_base64}",
+            "original_image": original_preview,
             "result_image": f"data:image/png;base64,{result_base64}",
             "message": "스티커 추가 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -891,21 +873,19 @@ async def apply_filters_and_stickers(
                 sticker_rotation_list.append(0.0)
         
         # 이미지 읽기
-        contents = await file.read()
-        image = Image.open(io.BytesIO(contents)).convert("RGB")
+        contents = await read_upload(file)
+        image = decode_image(contents)
         
-        # 원본 이미지를 base64로 인코딩
-        buffered_original = io.BytesIO()
-        image.save(buffered_original, format="PNG")
-        original_base64 = base64.b64encode(buffered_original.getvalue()).decode()
+        # 원본 이미지 미리보기 (JPEG / WebP)
+        original_preview = preview_data_url(image)
         
         # 프레임 옵션 준비
         frame_options = None
         if frame_type != "none":
             frame_image_obj = None
             if frame_image:
-                frame_contents = await frame_image.read()
-                frame_image_obj = Image.open(io.BytesIO(frame_contents))
+                frame_contents = await read_upload(frame_image)
+                frame_image_obj = decode_image(frame_contents, mode=None)
             
             frame_options = {
                 "frame_type": frame_type,
@@ -918,8 +898,8 @@ async def apply_filters_and_stickers(
         stickers = []
         if sticker_files_list:
             for i, sticker_file in enumerate(sticker_files_list):
-                sticker_contents = await sticker_file.read()
-                sticker_img = Image.open(io.BytesIO(sticker_contents))
+                sticker_contents = await read_upload(sticker_file)
+                sticker_img = decode_image(sticker_contents, mode=None)
                 
                 # width와 height는 값이 있을 때만 사용
                 # width_list와 height_list는 유효한 값만 포함하므로 인덱스가 다를 수 있음
@@ -956,26 +936,27 @@ async def apply_filters_and_stickers(
                 stickers.append(sticker_data)
         
         # 통합 처리
-        result_img = process_image_with_filters_and_stickers(
+        result_img = await run_cpu_task(
+            process_image_with_filters_and_stickers,
             image,
             filter_preset=filter_preset,
             frame_options=frame_options,
             stickers=stickers
         )
         
-        # 결과 이미지를 base64로 인코딩
-        buffered_result = io.BytesIO()
-        result_img.save(buffered_result, format="PNG")
-        result_base64 = base64.b64encode(buffered_result.getvalue()).decode()
+        # 결과 이미지를 base64로 인코딩 (프로세스 풀)
+        result_base64 = await run_cpu_task(to_base64, result_img)
         
         return JSONResponse({
             "success": True,
-            "original_image": f"data:image/png;base64,{original_base64}",
+            "original_image": original_preview,
             "result_image": f"data:image/png;base64,{result_base64}",
             "filter_preset": filter_preset,
             "message": "필터 및 스티커 적용 완료"
         })
         
+    except ImageDecodeError:
+        raise
     except Exception as e:
         traceback.print_exc()
         return JSONResponse({
@@ -0,0 +1,244 @@
+"""런타임 메트릭 라우터 (관리자)"""
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from config.auth_middleware import require_admin
+from core.micro_batcher import get_all_batcher_metrics
+from core.model_registry import get_model_registry
+from core.upstream_warmer import get_all_upstream_states
+from core.ttl_cache import get_all_cache_stats, find_ttl_cache
+from core.s3_client import get_log_upload_metrics
+from core.image_codec import get_codec_metrics
+from core.cpu_pool import get_cpu_pool_metrics
+from services.body_gemini_cache import get_gemini_cache_metrics
+from services.catalog_image_cache import get_catalog_image_cache_metrics, clear_catalog_image_cache
+from services.image_derivative_service import get_derivative_metrics
+from services.image_classifier_service import get_person_validation_metrics
+from services.input_validation_service import get_input_validation_metrics
+
+router = APIRouter()
+
+
+@router.get("/api/admin/metrics/micro-batching", tags=["관리자"])
+async def get_micro_batching_metrics(request: Request):
+    """
+    로컬 모델 마이크로 배칭 메트릭 조회
+
+    모델별 큐 깊이, 배치 크기 분포, 평균 대기/추론 시간을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_all_batcher_metrics()
+    })
+
+
+@router.get("/api/admin/metrics/models", tags=["관리자"])
+async def get_loaded_models(request: Request):
+    """
+    로컬 모델 레지스트리 상태 조회
+
+    등록된 모델별 로드 여부, 메모리 크기, 사용(hit) 횟수, 유휴 시간과 RAM 예산 사용량을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_model_registry().list_models()
+    })
+
+
+@router.post("/api/admin/metrics/models/{model_name}/unload", tags=["관리자"])
+async def unload_model(request: Request, model_name: str):
+    """
+    로컬 모델 수동 해제
+
+    다음 사용 시 다시 지연 로딩됩니다.
+    """
+    await require_admin(request)
+
+    unloaded = get_model_registry().unload(model_name)
+    return JSONResponse({
+        "success": unloaded,
+        "message": f"'{model_name}' 모델을 해제했습니다." if unloaded else f"'{model_name}' 모델이 로드되어 있지 않습니다."
+    }, status_code=200 if unloaded else 404)
+
+
+@router.get("/api/admin/metrics/upstreams", tags=["관리자"])
+async def get_upstream_states(request: Request):
+    """
+    업스트림 워밍 상태 조회
+
+    업스트림별 현재 상태(warm / warming / error / unknown), 마지막 트래픽/프로브 시각,
+    콜드 스타트 이벤트(감지 시각, 웜 상태 복귀까지 걸린 시간)를 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_all_upstream_states()
+    })
+
+
+@router.get("/api/admin/metrics/caches", tags=["관리자"])
+async def get_cache_stats(request: Request):
+    """
+    메모리 결과 캐시 상태 조회
+
+    캐시별 항목 수, hit/miss 횟수와 적중률, LRU 제거 / TTL 만료 횟수를 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_all_cache_stats()
+    })
+
+
+@router.get("/api/admin/metrics/body-gemini-cache", tags=["관리자"])
+async def get_body_gemini_cache_metrics(request: Request):
+    """
+    Gemini 체형 분석 문구 버킷 캐시 메트릭 조회
+
+    조회 수, 적중률, 절약한 Gemini 호출 수, 버킷 수를 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_gemini_cache_metrics()
+    })
+
+
+@router.post("/api/admin/metrics/caches/{cache_name}/clear", tags=["관리자"])
+async def clear_cache(request: Request, cache_name: str):
+    """
+    메모리 결과 캐시 비우기
+    """
+    await require_admin(request)
+
+    cache = find_ttl_cache(cache_name)
+    if cache is None:
+        return JSONResponse({
+            "success": False,
+            "message": f"'{cache_name}' 캐시가 없습니다."
+        }, status_code=404)
+
+    cleared = cache.clear()
+    return JSONResponse({
+        "success": True,
+        "cleared": cleared,
+        "message": f"'{cache_name}' 캐시 {cleared}개 항목을 삭제했습니다."
+    })
+
+
+@router.get("/api/admin/metrics/person-validation", tags=["관리자"])
+async def get_person_validation_stats(request: Request):
+    """
+    업로드 인물 사진 검증(로컬 분류기) 메트릭 조회
+
+    검증/통과/생략 횟수, 에러 코드별·엔드포인트별 차단 횟수, 평균 검증 시간을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_person_validation_metrics()
+    })
+
+
+@router.get("/api/admin/metrics/input-validation", tags=["관리자"])
+async def get_input_validation_stats(request: Request):
+    """
+    업로드 이미지 입력 검증 메트릭 조회
+
+    검증/통과 횟수, 에러 코드별·엔드포인트별 차단 횟수, 평균 검증 시간을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_input_validation_metrics()
+    })
+
+
+@router.get("/api/admin/metrics/image-cache", tags=["관리자"])
+async def get_image_cache_stats(request: Request):
+    """
+    카탈로그 이미지 계층 캐시(메모리 → 디스크 → S3) 메트릭 조회
+
+    전체/계층별 적중률, ETag 재검증 결과, S3 다운로드 횟수와 바이트, 계층별 사용 용량,
+    파생본(썸네일) 적중률 / 생성 수 / 평균 생성 시간 / 원본 대비 크기 비율을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": {
+            **get_catalog_image_cache_metrics(),
+            "derivatives": get_derivative_metrics()
+        }
+    })
+
+
+@router.post("/api/admin/metrics/image-cache/clear", tags=["관리자"])
+async def clear_image_cache(request: Request):
+    """
+    카탈로그 이미지 계층 캐시 비우기 (메모리 + 디스크)
+    """
+    await require_admin(request)
+
+    cleared = clear_catalog_image_cache()
+    return JSONResponse({
+        "success": True,
+        "cleared": cleared,
+        "message": f"이미지 캐시 {cleared}개 항목을 삭제했습니다."
+    })
+
+
+@router.get("/api/admin/metrics/log-uploads", tags=["관리자"])
+async def get_log_upload_stats(request: Request):
+    """
+    내용 주소 로그 이미지 업로드 메트릭 조회
+
+    업로드 요청 수, 실제 업로드 수, 메모리 캐시 / HEAD 확인으로 생략한 수와 바이트, 생략 비율을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_log_upload_metrics()
+    })
+
+
+@router.get("/api/admin/metrics/image-codec", tags=["관리자"])
+async def get_image_codec_stats(request: Request):
+    """
+    이미지 코덱 메트릭 조회
+
+    디코딩 수, JPEG 축소 디코딩 수, 픽셀 수 / 업로드 크기 상한 초과로 거부한 수, 평균 디코딩 시간,
+    포맷별 인코딩 수 / 바이트 / 평균 시간을 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_codec_metrics()
+    })
+
+
+@router.get("/api/admin/metrics/cpu-pool", tags=["관리자"])
+async def get_cpu_pool_stats(request: Request):
+    """
+    CPU 작업 프로세스 풀 메트릭 조회
+
+    워커 수, 실행 중 작업 수, 큐 깊이(현재 / 최대), 평균 큐 대기 / 실행 시간, 타임아웃 / 오류 수,
+    풀 재시작 수, 공유 메모리 전송량, 함수별 실행 통계를 반환합니다.
+    """
+    await require_admin(request)
+
+    return JSONResponse({
+        "success": True,
+        "data": get_cpu_pool_metrics()
+    })
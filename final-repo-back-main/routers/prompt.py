@@ -6,10 +6,8 @@ import os
 import base64
 import io
 import traceback
-from PIL import Image
 from urllib.parse import urlparse
 import requests
-import boto3
 from botocore.exceptions import ClientError
 
 from core.llm_clients import (
@@ -19,14 +17,29 @@ from core.llm_clients import (
     call_gpt4o_v2_short_prompt
 )
 from core.xai_client import generate_prompt_from_images
+from core.s3_client import get_shared_s3_client, run_s3_io
+from core.image_codec import read_upload, decode_image, save_png, ImageDecodeError
+from core.cpu_pool import run_cpu_task
 from config.settings import GPT4O_MODEL_NAME, GPT4O_V2_MODEL_NAME, GEMINI_PROMPT_MODEL, XAI_PROMPT_MODEL
 from services.image_service import preprocess_dress_image
+from services.input_validation_service import validate_upload_images_async
 from schemas.common import ShortPromptResponse
 from openai import OpenAI
 
 router = APIRouter()
 
 
+async def _validate_prompt_uploads(person_bytes: bytes, dress_bytes: bytes, endpoint: str):
+    """사람 / 드레스 이미지 입력 검증 (compose 규칙 세트, LLM 호출 전 차단)"""
+    return await validate_upload_images_async(
+        {
+            "person_image": (person_bytes, "person"),
+            "dress_image": (dress_bytes, "garment")
+        },
+        endpoint
+    )
+
+
 @router.post("/api/gemini/generate-prompt", tags=["프롬프트 생성"])
 async def generate_prompt(
     person_image: UploadFile = File(..., description="사람 이미지 파일"),
@@ -50,14 +63,11 @@ async def generate_prompt(
             }, status_code=500)
         
         # 사람 이미지 읽기
-        person_contents = await person_image.read()
-        person_img = Image.open(io.BytesIO(person_contents))
+        person_contents = await read_upload(person_image)
         
-        # 드레스 이미지 처리
-        dress_img = None
+        # 드레스 이미지 처리 (업로드 또는 URL 다운로드 바이트)
         if dress_image:
-            dress_contents = await dress_image.read()
-            dress_img = Image.open(io.BytesIO(dress_contents))
+            dress_contents = await read_upload(dress_image)
         elif dress_url:
             try:
                 if not dress_url.startswith('http'):
@@ -75,14 +85,9 @@ async def generate_prompt(
                 if not all([aws_access_key, aws_secret_key]):
                     response = requests.get(dress_url, timeout=10)
                     response.raise_for_status()
-                    dress_img = Image.open(io.BytesIO(response.content))
+                    dress_contents = response.content
                 else:
-                    s3_client = boto3.client(
-                        's3',
-                        aws_access_key_id=aws_access_key,
-                        aws_secret_access_key=aws_secret_key,
-                        region_name=region
-                    )
+                    s3_client = get_shared_s3_client(aws_access_key, aws_secret_key, region)
                     
                     if '.s3.' in parsed_url.netloc or '.s3-' in parsed_url.netloc:
                         bucket_name = parsed_url.netloc.split('.')[0]
@@ -94,9 +99,9 @@ async def generate_prompt(
                         else:
                             raise ValueError(f"S3 URL 형식을 파싱할 수 없습니다.")
                     
-                    s3_response = s3_client.get_object(Bucket=bucket_name, Key=s3_key)
-                    image_data = s3_response['Body'].read()
-                    dress_img = Image.open(io.BytesIO(image_data))
+                    dress_contents = await run_s3_io(
+                        lambda: s3_client.get_object(Bucket=bucket_name, Key=s3_key)['Body'].read()
+                    )
                     
             except Exception as e:
                 print(f"드레스 이미지 다운로드 오류: {e}")
@@ -112,9 +117,17 @@ async def generate_prompt(
                 "message": "드레스 이미지 파일 또는 URL이 필요합니다."
             }, status_code=400)
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, Gemini 호출 전 차단)
+        rejection = await _validate_prompt_uploads(person_contents, dress_contents, "gemini-prompt")
+        if rejection:
+            return JSONResponse({**llm_info, "success": False, **rejection}, status_code=400)
+        
+        person_img = decode_image(person_contents, mode=None)
+        dress_img = decode_image(dress_contents, mode=None)
+        
         # 드레스 이미지 전처리
         print("드레스 이미지 전처리 시작...")
-        dress_img = preprocess_dress_image(dress_img, target_size=1024)
+        dress_img = await run_cpu_task(preprocess_dress_image, dress_img, 1024)
         print("드레스 이미지 전처리 완료")
         
         # 맞춤 프롬프트 생성
@@ -169,6 +182,8 @@ MANDATORY FOOTWEAR CHANGE - THIS IS CRITICAL:
                 "is_default": True
             })
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         print(f"프롬프트 생성 API 오류: {str(e)}")
         traceback.print_exc()
@@ -201,8 +216,8 @@ async def generate_gpt4o_prompt(
                 status_code=500,
             )
 
-        person_bytes = await person_image.read()
-        dress_bytes = await dress_image.read()
+        person_bytes = await read_upload(person_image)
+        dress_bytes = await read_upload(dress_image)
 
         if not person_bytes or not dress_bytes:
             return JSONResponse(
@@ -215,6 +230,11 @@ async def generate_gpt4o_prompt(
                 status_code=400,
             )
 
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, GPT-4o 호출 전 차단)
+        rejection = await _validate_prompt_uploads(person_bytes, dress_bytes, "gpt4o-gemini-prompt")
+        if rejection:
+            return JSONResponse({**llm_info, "success": False, **rejection}, status_code=400)
+
         person_b64 = base64.b64encode(person_bytes).decode("utf-8")
         dress_b64 = base64.b64encode(dress_bytes).decode("utf-8")
         person_mime = person_image.content_type or "image/png"
@@ -248,6 +268,8 @@ async def generate_gpt4o_prompt(
         prompt_text = _extract_gpt4o_prompt(response)
         
         return JSONResponse({**llm_info, "success": True, "prompt": prompt_text})
+    except ImageDecodeError:
+        raise
     except Exception as exc:
         print(f"GPT-4o 프롬프트 생성 중 오류: {exc}")
         traceback.print_exc()
@@ -284,8 +306,8 @@ async def generate_short_prompt(
                 status_code=500,
             )
 
-        person_bytes = await person_image.read()
-        dress_bytes = await dress_image.read()
+        person_bytes = await read_upload(person_image)
+        dress_bytes = await read_upload(dress_image)
 
         if not person_bytes or not dress_bytes:
             return JSONResponse(
@@ -298,22 +320,27 @@ async def generate_short_prompt(
                 status_code=400,
             )
 
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, GPT-4o 호출 전 차단)
+        rejection = await _validate_prompt_uploads(person_bytes, dress_bytes, "prompt-short")
+        if rejection:
+            return JSONResponse({**llm_info, "success": False, **rejection}, status_code=400)
+
         # 이미지 전처리
-        person_img = Image.open(io.BytesIO(person_bytes))
-        dress_img = Image.open(io.BytesIO(dress_bytes))
+        person_img = decode_image(person_bytes, mode=None)
+        dress_img = decode_image(dress_bytes, mode=None)
         
         # 드레스 이미지 전처리
         print("드레스 이미지 전처리 시작...")
-        dress_img = preprocess_dress_image(dress_img, target_size=1024)
+        dress_img = await run_cpu_task(preprocess_dress_image, dress_img, 1024)
         print("드레스 이미지 전처리 완료")
 
         # Base64 인코딩
         person_buffer = io.BytesIO()
-        person_img.save(person_buffer, format="PNG")
+        save_png(person_img, person_buffer)
         person_b64 = base64.b64encode(person_buffer.getvalue()).decode("utf-8")
         
         dress_buffer = io.BytesIO()
-        dress_img.save(dress_buffer, format="PNG")
+        save_png(dress_img, dress_buffer)
         dress_b64 = base64.b64encode(dress_buffer.getvalue()).decode("utf-8")
         
         person_mime = person_image.content_type or "image/png"
@@ -348,6 +375,8 @@ async def generate_short_prompt(
                 status_code=502,
             )
             
+    except ImageDecodeError:
+        raise
     except Exception as exc:
         print(f"Short prompt 생성 중 오류: {exc}")
         traceback.print_exc()
@@ -374,8 +403,8 @@ async def generate_xai_prompt(
         llm_info = {"llm": XAI_PROMPT_MODEL}
         
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        dress_bytes = await dress_image.read()
+        person_bytes = await read_upload(person_image)
+        dress_bytes = await read_upload(dress_image)
         
         if not person_bytes or not dress_bytes:
             return JSONResponse(
@@ -388,13 +417,18 @@ async def generate_xai_prompt(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, x.ai 호출 전 차단)
+        rejection = await _validate_prompt_uploads(person_bytes, dress_bytes, "xai-prompt")
+        if rejection:
+            return JSONResponse({**llm_info, "success": False, **rejection}, status_code=400)
+        
         # 이미지 전처리
-        person_img = Image.open(io.BytesIO(person_bytes))
-        dress_img = Image.open(io.BytesIO(dress_bytes))
+        person_img = decode_image(person_bytes, mode=None)
+        dress_img = decode_image(dress_bytes, mode=None)
         
         # 드레스 이미지 전처리
         print("드레스 이미지 전처리 시작...")
-        dress_img = preprocess_dress_image(dress_img, target_size=1024)
+        dress_img = await run_cpu_task(preprocess_dress_image, dress_img, 1024)
         print("드레스 이미지 전처리 완료")
         
         # x.ai로 프롬프트 생성
@@ -435,6 +469,8 @@ async def generate_xai_prompt(
                 status_code=502,
             )
             
+    except ImageDecodeError:
+        raise
     except Exception as exc:
         print(f"x.ai 프롬프트 생성 중 오류: {exc}")
         traceback.print_exc()
@@ -1,67 +1,406 @@
-"""이미지 프록시 라우터"""
-import os
-import requests
-from fastapi import APIRouter, Query
-from fastapi.responses import JSONResponse, Response
+"""이미지 프록시 라우터
+
+S3 객체와 허용된 외부 URL을 청크 단위로 스트리밍하고 HTTP 캐싱 헤더를 붙입니다.
+- If-None-Match / If-Modified-Since: S3(또는 외부 서버)에 그대로 전달해 304 응답
+- Range: 206 부분 응답
+- 내용 주소 키(내용 해시 / 타임스탬프 로그 키)는 immutable 장기 캐시, 그 외 키는 max-age 후 ETag 재검증
+- 드레스 카탈로그 이미지(dresses/)는 계층 캐시(메모리 → 디스크 → S3)에서 제공하고 조건부 / 범위 요청을 앱에서 처리
+- /api/thumbnails: 허용된 크기 / 포맷 / 품질의 파생본(썸네일, WebP, AVIF)을 같은 캐시에서 제공
+- IMAGE_DELIVERY_MODE=redirect / presigned: S3 객체는 presigned URL로 302 리다이렉트 (워커가 바이트를 중계하지 않음)
+"""
+import re
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+import httpx
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import JSONResponse, RedirectResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from urllib.parse import urlparse, unquote
-from core.s3_client import get_s3_image, get_logs_s3_image
+
+from core.object_cache import CachedObject
+from core.s3_client import S3_BUCKET_MAIN, S3_BUCKET_LOGS, get_bucket_settings, open_s3_object, run_s3_io
+from services.catalog_image_cache import get_catalog_image_async
+from services.image_delivery_service import is_redirect_delivery, get_presigned_url
+from services.image_derivative_service import (
+    FORMAT_AUTO,
+    get_derivative_async,
+    negotiate_format,
+    validate_derivative_params
+)
+from config.image_cache import IMAGE_OBJECT_CACHE_ENABLED
+from config.image_derivatives import IMAGE_DERIVATIVE_THUMBNAIL_WIDTH, IMAGE_DERIVATIVE_DEFAULT_QUALITY
+from config.image_proxy import (
+    IMAGE_PROXY_ALLOWED_HOSTS,
+    IMAGE_PROXY_TIMEOUT_SEC,
+    IMAGE_PROXY_MAX_CONNECTIONS,
+    IMAGE_PROXY_CHUNK_SIZE,
+    IMAGE_CACHE_MAX_AGE_SEC,
+    IMAGE_CACHE_IMMUTABLE_MAX_AGE_SEC
+)
 
 router = APIRouter()
 
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, OPTIONS",
+    "Access-Control-Allow-Headers": "*"
+}
+
+# 내용이 바뀌지 않는 키: sha256 경로/해시 파일명, 타임스탬프(ms) 로그 키
+_CONTENT_ADDRESSED_KEY = re.compile(r"(^|/)sha256/|[0-9a-f]{64}|^logs/\d{13}_")
+
+# 단일 범위 요청 (bytes=시작-끝, bytes=시작-, bytes=-마지막N)
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# 외부 응답에서 그대로 전달할 헤더
+_PASSTHROUGH_HEADERS = (
+    "content-type", "content-length", "content-range", "content-encoding", "etag", "last-modified", "accept-ranges"
+)
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_lock = threading.Lock()
+
+
+class ProxyHostNotAllowed(Exception):
+    """허용 목록에 없는 호스트로의 요청 (리다이렉트 포함)"""
+
+
+def is_content_addressed_key(s3_key: str) -> bool:
+    return bool(_CONTENT_ADDRESSED_KEY.search(s3_key))
+
+
+def cache_control_for_key(s3_key: str, private: bool = False) -> str:
+    """키 종류별 Cache-Control 헤더 값"""
+    scope = "private" if private else "public"
+    if is_content_addressed_key(s3_key):
+        return f"{scope}, max-age={IMAGE_CACHE_IMMUTABLE_MAX_AGE_SEC}, immutable"
+    return f"{scope}, max-age={IMAGE_CACHE_MAX_AGE_SEC}"
+
+
+def is_allowed_proxy_host(host: Optional[str]) -> bool:
+    """
+    외부 URL 허용 여부
+
+    허용 호스트 = IMAGE_PROXY_ALLOWED_HOSTS + S3 버킷 호스트.
+    정확히 일치하거나, "."으로 시작하는 항목이면 하위 도메인 일치
+    """
+    if not host:
+        return False
+    allowed_hosts = set(IMAGE_PROXY_ALLOWED_HOSTS)
+    for bucket_kind in (S3_BUCKET_MAIN, S3_BUCKET_LOGS):
+        settings = get_bucket_settings(bucket_kind)
+        if settings:
+            allowed_hosts.add(f"{settings['bucket']}.s3.{settings['region']}.amazonaws.com".lower())
+            allowed_hosts.add(f"{settings['bucket']}.s3.amazonaws.com".lower())
+
+    host = host.lower()
+    return any(host == allowed or (allowed.startswith(".") and host.endswith(allowed)) for allowed in allowed_hosts)
+
+
+async def _check_request_host(request: httpx.Request):
+    """리다이렉트 대상까지 허용 목록 검사"""
+    if request.url.scheme not in ("http", "https") or not is_allowed_proxy_host(request.url.host):
+        raise ProxyHostNotAllowed(request.url.host)
+
+
+def get_proxy_http_client() -> httpx.AsyncClient:
+    """외부 이미지 요청용 공유 비동기 HTTP 클라이언트 (동시 연결 수 제한)"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.AsyncClient(
+                    timeout=IMAGE_PROXY_TIMEOUT_SEC,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=IMAGE_PROXY_MAX_CONNECTIONS,
+                        max_keepalive_connections=IMAGE_PROXY_MAX_CONNECTIONS
+                    ),
+                    event_hooks={"request": [_check_request_host]}
+                )
+    return _http_client
+
+
+async def close_proxy_http_client():
+    """외부 이미지 HTTP 클라이언트 종료 (앱 shutdown에서 호출)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _conditional_headers(request: Request) -> Dict[str, str]:
+    return {
+        name: request.headers[name]
+        for name in ("if-none-match", "if-modified-since", "range")
+        if name in request.headers
+    }
+
+
+def _not_found_response(headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse({
+        "success": False,
+        "error": "Image not found",
+        "message": "이미지를 찾을 수 없습니다."
+    }, status_code=404, headers=headers)
+
+
+def _host_not_allowed_response() -> JSONResponse:
+    return JSONResponse({
+        "success": False,
+        "error": "Host not allowed",
+        "message": "허용되지 않은 이미지 주소입니다."
+    }, status_code=403)
+
+
+async def _iter_s3_body(body):
+    """S3 본문을 청크 단위로 읽기 (S3 전용 스레드 풀)"""
+    try:
+        while True:
+            chunk = await run_s3_io(body.read, IMAGE_PROXY_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+
+async def s3_object_response(
+    bucket_kind: str,
+    s3_key: str,
+    request: Request,
+    private: bool = False,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Optional[Response]:
+    """
+    S3 객체 스트리밍 응답 (200 / 206 / 304 / 416)
+
+    Returns:
+        응답 또는 None (객체 없음 / S3 설정 누락 - 호출 측에서 404 처리)
+    """
+    conditional = _conditional_headers(request)
+    result = await run_s3_io(
+        open_s3_object,
+        bucket_kind,
+        s3_key,
+        range_header=conditional.get("range"),
+        if_none_match=conditional.get("if-none-match"),
+        if_modified_since=conditional.get("if-modified-since")
+    )
+    if result is None or result["status"] == 404:
+        return None
+
+    headers = {**(extra_headers or {}), **result["headers"], "Cache-Control": cache_control_for_key(s3_key, private)}
+    if result["status"] in (304, 416):
+        headers.pop("Content-Type", None)
+        return Response(status_code=result["status"], headers=headers)
+
+    media_type = headers.pop("Content-Type")
+    return StreamingResponse(
+        _iter_s3_body(result["body"]),
+        status_code=result["status"],
+        headers=headers,
+        media_type=media_type
+    )
+
+
+def _etag_matches(if_none_match: str, etag: Optional[str]) -> bool:
+    if not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교 (W/ 접두어 무시)
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in if_none_match.split(","))
+
+
+def _not_modified_since(if_modified_since: str, last_modified: Optional[str]) -> bool:
+    if not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+
+def _parse_range(range_header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 범위 헤더 해석
+
+    Returns:
+        (시작, 끝) 포함 구간, 만족할 수 없는 범위면 None. 해석할 수 없는 형식이면 (0, size - 1) 전체
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match or match.groups() == ("", ""):
+        return 0, size - 1
+    start, end = match.groups()
+    if start == "":
+        length = int(end)
+        if length == 0:
+            return None
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+def cached_object_response(
+    obj: CachedObject,
+    s3_key: str,
+    request: Request,
+    private: bool = False,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    캐시된 객체 응답 (200 / 206 / 304 / 416, S3 요청 없음)
+
+    If-None-Match가 있으면 ETag로, 없으면 If-Modified-Since로 304를 판단합니다.
+    """
+    headers = {**(extra_headers or {}), "Cache-Control": cache_control_for_key(s3_key, private), "Accept-Ranges": "bytes"}
+    if obj.etag:
+        headers["ETag"] = obj.etag
+    if obj.last_modified:
+        headers["Last-Modified"] = obj.last_modified
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if (if_none_match and _etag_matches(if_none_match, obj.etag)) or (
+        not if_none_match and if_modified_since and _not_modified_since(if_modified_since, obj.last_modified)
+    ):
+        return Response(status_code=304, headers=headers)
+
+    size = obj.size
+    range_header = request.headers.get("range")
+    if range_header and size:
+        byte_range = _parse_range(range_header, size)
+        if byte_range is None:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+        start, end = byte_range
+        if (start, end) != (0, size - 1):
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return Response(obj.data[start:end + 1], status_code=206, headers=headers, media_type=obj.content_type)
+
+    return Response(obj.data, headers=headers, media_type=obj.content_type)
+
+
+def presigned_redirect_response(
+    bucket_kind: str,
+    s3_key: str,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Optional[Response]:
+    """
+    presigned S3 URL로 302 리다이렉트 (객체 존재 여부는 S3가 응답)
+
+    리다이렉트 응답은 캐시된 URL이 유효한 동안 브라우저가 재사용할 수 있도록 private max-age를 붙입니다.
+
+    Returns:
+        응답 또는 None (S3 설정 누락)
+    """
+    presigned = get_presigned_url(bucket_kind, s3_key)
+    if presigned is None:
+        return None
+    return RedirectResponse(
+        presigned["url"],
+        status_code=302,
+        headers={**(extra_headers or {}), "Cache-Control": f"private, max-age={presigned['max_age']}"}
+    )
+
+
+async def dress_image_response(
+    file_name: str,
+    request: Request,
+    private: bool = False,
+    extra_headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """드레스 이미지 응답 (리다이렉트 모드면 presigned URL, 아니면 계층 캐시 / S3 스트리밍). 없으면 404"""
+    s3_key = f"dresses/{file_name}"
+    if is_redirect_delivery():
+        response = presigned_redirect_response(S3_BUCKET_MAIN, s3_key, extra_headers)
+        return response or _not_found_response(extra_headers)
+
+    if not IMAGE_OBJECT_CACHE_ENABLED:
+        response = await s3_object_response(S3_BUCKET_MAIN, s3_key, request, private, extra_headers)
+        return response or _not_found_response(extra_headers)
+
+    obj = await get_catalog_image_async(s3_key)
+    if obj is None:
+        return _not_found_response(extra_headers)
+    return cached_object_response(obj, s3_key, request, private, extra_headers)
+
+
+async def remote_image_response(url: str, request: Request, private: bool = False) -> Response:
+    """
+    허용된 외부 URL 이미지 스트리밍 응답 (조건부 / 범위 요청 헤더 전달)
+
+    허용 목록에 없는 호스트는 403, 업스트림 오류 상태는 JSON 오류로 반환
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not is_allowed_proxy_host(parsed.hostname):
+        print(f"[ImageProxy] 허용되지 않은 호스트 차단: {parsed.hostname}")
+        return _host_not_allowed_response()
+
+    client = get_proxy_http_client()
+    try:
+        upstream = await client.send(
+            client.build_request("GET", url, headers=_conditional_headers(request)),
+            stream=True
+        )
+    except ProxyHostNotAllowed as e:
+        print(f"[ImageProxy] 허용되지 않은 호스트로의 리다이렉트 차단: {e}")
+        return _host_not_allowed_response()
+
+    if upstream.status_code not in (200, 206, 304):
+        await upstream.aclose()
+        return JSONResponse({
+            "success": False,
+            "error": f"HTTP {upstream.status_code}",
+            "message": "이미지를 다운로드할 수 없습니다."
+        }, status_code=upstream.status_code)
+
+    headers = {name: upstream.headers[name] for name in _PASSTHROUGH_HEADERS if name in upstream.headers}
+    headers["Cache-Control"] = upstream.headers.get("cache-control") or cache_control_for_key(parsed.path.lstrip("/"), private)
+    if upstream.status_code == 304:
+        await upstream.aclose()
+        headers.pop("content-type", None)
+        return Response(status_code=304, headers=headers)
+
+    media_type = headers.pop("content-type", "image/png")
+    return StreamingResponse(
+        upstream.aiter_raw(IMAGE_PROXY_CHUNK_SIZE),
+        status_code=upstream.status_code,
+        headers=headers,
+        media_type=media_type,
+        background=BackgroundTask(upstream.aclose)
+    )
+
 
 @router.get("/api/proxy-image", tags=["이미지 프록시"])
-async def proxy_image_by_url(url: str = Query(..., description="S3 이미지 URL")):
+async def proxy_image_by_url(request: Request, url: str = Query(..., description="S3 이미지 URL")):
     """
     S3 URL로 이미지 프록시 (썸네일용)
-    
+
     프론트엔드에서 S3 이미지를 직접 로드할 때 CORS 문제를 해결하기 위한 프록시
     """
     try:
         # S3 URL에서 파일명 추출
         parsed_url = urlparse(url)
         path_parts = parsed_url.path.strip('/').split('/')
-        
+
         if len(path_parts) >= 2 and path_parts[0] == 'dresses':
-            file_name = path_parts[1]
             # URL 디코딩
-            file_name = unquote(file_name)
-            
-            # S3에서 이미지 다운로드
-            image_data = get_s3_image(file_name)
-            
-            if image_data:
-                return Response(
-                    content=image_data,
-                    media_type="image/png"
-                )
-            else:
-                return JSONResponse({
-                    "success": False,
-                    "error": "Image not found",
-                    "message": "이미지를 찾을 수 없습니다."
-                }, status_code=404)
-        else:
-            # 직접 URL로 다운로드 시도
-            try:
-                response = requests.get(url, timeout=10)
-                if response.status_code == 200:
-                    return Response(
-                        content=response.content,
-                        media_type=response.headers.get("Content-Type", "image/png")
-                    )
-                else:
-                    return JSONResponse({
-                        "success": False,
-                        "error": f"HTTP {response.status_code}",
-                        "message": "이미지를 다운로드할 수 없습니다."
-                    }, status_code=response.status_code)
-            except Exception as e:
-                return JSONResponse({
-                    "success": False,
-                    "error": str(e),
-                    "message": f"이미지 다운로드 중 오류: {str(e)}"
-                }, status_code=500)
-                
+            file_name = unquote(path_parts[1])
+
+            # 카탈로그 이미지 캐시 (메모리 → 디스크 → S3)
+            return await dress_image_response(file_name, request)
+
+        # 직접 URL로 다운로드 시도 (허용된 호스트만)
+        return await remote_image_response(url, request)
+
     except Exception as e:
         return JSONResponse({
             "success": False,
@@ -73,131 +412,116 @@ async def proxy_image_by_url(url: str = Query(..., description="S3 이미지 URL
 @router.options("/api/images/{file_name:path}", tags=["이미지 프록시"])
 async def proxy_s3_image_options(file_name: str):
     """CORS preflight 요청 처리"""
-    return Response(
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, OPTIONS",
-            "Access-Control-Allow-Headers": "*"
-        }
-    )
+    return Response(headers=CORS_HEADERS)
 
 
 @router.get("/api/images/{file_name:path}", tags=["이미지 프록시"])
-async def proxy_s3_image(file_name: str):
+async def proxy_s3_image(request: Request, file_name: str):
     """
     S3 이미지 프록시
-    
-    파일명으로 S3에서 이미지를 다운로드하여 반환합니다.
-    CORS 문제를 해결하기 위한 프록시입니다.
+
+    파일명으로 카탈로그 이미지 캐시(메모리 → 디스크 → S3)에서 이미지를 반환합니다. CORS 문제를 해결하기 위한 프록시입니다.
+    ETag / Last-Modified 조건부 요청(304)과 Range 요청(206)을 지원합니다.
     """
     try:
         # URL 디코딩
         file_name = unquote(file_name)
-        
-        # S3에서 이미지 다운로드
-        image_data = get_s3_image(file_name)
-        
-        if image_data:
-            # CORS 헤더 추가
-            headers = {
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "GET, OPTIONS",
-                "Access-Control-Allow-Headers": "*",
-                "Content-Type": "image/png"
-            }
-            
-            return Response(
-                content=image_data,
-                headers=headers,
-                media_type="image/png"
-            )
-        else:
+
+        # 카탈로그 이미지 캐시 (메모리 → 디스크 → S3, CORS 헤더 추가)
+        return await dress_image_response(file_name, request, extra_headers=CORS_HEADERS)
+
+    except Exception as e:
+        return JSONResponse({
+            "success": False,
+            "error": str(e),
+            "message": f"이미지 프록시 처리 중 오류: {str(e)}"
+        }, status_code=500)
+
+
+@router.options("/api/thumbnails/{file_name:path}", tags=["이미지 프록시"])
+async def dress_thumbnail_options(file_name: str):
+    """CORS preflight 요청 처리"""
+    return Response(headers=CORS_HEADERS)
+
+
+@router.get("/api/thumbnails/{file_name:path}", tags=["이미지 프록시"])
+async def get_dress_thumbnail(
+    request: Request,
+    file_name: str,
+    w: int = Query(IMAGE_DERIVATIVE_THUMBNAIL_WIDTH, description="가로 크기 (px, 허용 목록: IMAGE_DERIVATIVE_WIDTHS)"),
+    format: str = Query(FORMAT_AUTO, description="auto / webp / avif / jpeg (auto는 Accept 헤더로 선택)"),
+    q: int = Query(IMAGE_DERIVATIVE_DEFAULT_QUALITY, description="품질 (허용 목록: IMAGE_DERIVATIVE_QUALITIES)")
+):
+    """
+    드레스 이미지 파생본 (썸네일 / WebP / AVIF)
+
+    원본을 지정한 가로 크기 이하로 줄이고 포맷을 바꾼 이미지를 반환합니다.
+    파생본은 (원본, 파라미터) 단위로 카탈로그 이미지 캐시에 저장되며, 원본이 바뀌면 다시 생성됩니다.
+    """
+    try:
+        file_name = unquote(file_name)
+        fmt = format.lower()
+        error = validate_derivative_params(w, fmt, q)
+        if error:
             return JSONResponse({
                 "success": False,
-                "error": "Image not found",
-                "message": "이미지를 찾을 수 없습니다."
-            }, status_code=404)
-            
+                "error": "Invalid derivative parameters",
+                "message": error
+            }, status_code=400, headers=CORS_HEADERS)
+
+        headers = dict(CORS_HEADERS)
+        if fmt == FORMAT_AUTO:
+            fmt = negotiate_format(request.headers.get("accept"))
+            headers["Vary"] = "Accept"
+
+        obj = await get_derivative_async(file_name, w, fmt, q)
+        if obj is None:
+            return _not_found_response(headers)
+        return cached_object_response(obj, f"dresses/{file_name}", request, extra_headers=headers)
+
     except Exception as e:
         return JSONResponse({
             "success": False,
             "error": str(e),
-            "message": f"이미지 프록시 처리 중 오류: {str(e)}"
+            "message": f"썸네일 생성 중 오류: {str(e)}"
         }, status_code=500)
 
 
 @router.get("/api/admin/s3-image-proxy", tags=["관리자"])
-async def get_s3_image_proxy(url: str = Query(..., description="S3 이미지 URL")):
+async def get_s3_image_proxy(request: Request, url: str = Query(..., description="S3 이미지 URL")):
     """
     관리자용 S3 이미지 프록시
-    
-    S3 URL을 받아서 이미지를 다운로드하여 반환합니다.
+
+    S3 URL을 받아서 이미지를 스트리밍합니다. (브라우저 캐시만 허용, private)
     """
     try:
         # URL에서 파일명 추출
         parsed_url = urlparse(url)
         path_parts = parsed_url.path.strip('/').split('/')
-        
+
         if len(path_parts) >= 2:
             folder = path_parts[0]
-            file_name = path_parts[1]
-            file_name = unquote(file_name)
-            
+            # 하위 경로 포함 (내용 주소 로그 키: logs/sha256/ab/cd/<해시>.png)
+            file_name = unquote('/'.join(path_parts[1:]))
+
             # dresses 폴더인 경우 기본 S3 클라이언트 사용
             if folder == 'dresses':
-                image_data = get_s3_image(file_name)
-                if image_data:
-                    return Response(
-                        content=image_data,
-                        media_type="image/png"
-                    )
-                else:
-                    return JSONResponse({
-                        "success": False,
-                        "error": "Image not found",
-                        "message": "이미지를 찾을 수 없습니다."
-                    }, status_code=404)
-            
+                return await dress_image_response(file_name, request, private=True)
+
             # logs 폴더인 경우 로그용 S3 클라이언트 사용
             elif folder == 'logs':
-                image_data = get_logs_s3_image(file_name)
-                if image_data:
-                    return Response(
-                        content=image_data,
-                        media_type="image/png"
-                    )
+                if is_redirect_delivery():
+                    response = presigned_redirect_response(S3_BUCKET_LOGS, f"logs/{file_name}")
                 else:
-                    return JSONResponse({
-                        "success": False,
-                        "error": "Image not found",
-                        "message": "이미지를 찾을 수 없습니다."
-                    }, status_code=404)
-        
-        # 직접 URL로 다운로드 시도 (fallback)
-        try:
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                return Response(
-                    content=response.content,
-                    media_type=response.headers.get("Content-Type", "image/png")
-                )
-            else:
-                return JSONResponse({
-                    "success": False,
-                    "error": f"HTTP {response.status_code}",
-                    "message": "이미지를 다운로드할 수 없습니다."
-                }, status_code=response.status_code)
-        except Exception as e:
-            return JSONResponse({
-                "success": False,
-                "error": str(e),
-                "message": f"이미지 다운로드 중 오류: {str(e)}"
-            }, status_code=500)
-                
+                    response = await s3_object_response(S3_BUCKET_LOGS, f"logs/{file_name}", request, private=True)
+                return response or _not_found_response()
+
+        # 직접 URL로 다운로드 시도 (fallback, 허용된 호스트만)
+        return await remote_image_response(url, request, private=True)
+
     except Exception as e:
         return JSONResponse({
             "success": False,
             "error": str(e),
             "message": f"프록시 처리 중 오류: {str(e)}"
         }, status_code=500)
-
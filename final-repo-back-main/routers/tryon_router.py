@@ -1,16 +1,32 @@
 """통합 트라이온 라우터"""
-import io
+import asyncio
 from fastapi import APIRouter, File, UploadFile
 from fastapi.responses import JSONResponse
-from PIL import Image
 
+from core.image_codec import read_upload, decode_image, ImageDecodeError
 from services.tryon_service import generate_unified_tryon, generate_unified_tryon_v2
-from services.face_swap_service import FaceSwapService
+from services.face_swap_service import get_face_swap_service
+from services.input_validation_service import validate_upload_images_async
 from schemas.tryon_schema import UnifiedTryonResponse
+from config.image_codec import IMAGE_GARMENT_MAX_SIDE
 
 router = APIRouter()
 
 
+def _input_rejection_response(rejection: dict) -> JSONResponse:
+    """입력 검증 실패 응답"""
+    return JSONResponse(
+        {
+            "success": False,
+            "prompt": "",
+            "result_image": "",
+            "llm": None,
+            **rejection
+        },
+        status_code=400,
+    )
+
+
 @router.post("/api/tryon/unified", tags=["통합 트라이온"], response_model=UnifiedTryonResponse)
 async def unified_tryon(
     person_image: UploadFile = File(..., description="사람 이미지 파일"),
@@ -30,9 +46,9 @@ async def unified_tryon(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        dress_bytes = await dress_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        dress_bytes = await read_upload(dress_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not dress_bytes or not background_bytes:
             return JSONResponse(
@@ -46,14 +62,26 @@ async def unified_tryon(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "dress_image": (dress_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "tryon-unified"
+        )
+        if rejection:
+            return _input_rejection_response(rejection)
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        dress_img = Image.open(io.BytesIO(dress_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        dress_img = decode_image(dress_bytes, max_side=IMAGE_GARMENT_MAX_SIDE)
+        background_img = decode_image(background_bytes)
         
         # 이미지 타입 감지 (전신 vs 상체/얼굴)
-        face_swap_service = FaceSwapService()
-        image_type_info = face_swap_service.detect_image_type(person_img)
+        face_swap_service = get_face_swap_service()
+        image_type_info = await asyncio.to_thread(face_swap_service.detect_image_type, person_img)
         image_type = image_type_info.get("type", "unknown")
         confidence = image_type_info.get("confidence", 0.0)
         
@@ -86,6 +114,8 @@ async def unified_tryon(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -125,9 +155,9 @@ async def compose_xai_gemini_v2(
     """
     try:
         # 이미지 읽기
-        person_bytes = await person_image.read()
-        garment_bytes = await garment_image.read()
-        background_bytes = await background_image.read()
+        person_bytes = await read_upload(person_image)
+        garment_bytes = await read_upload(garment_image)
+        background_bytes = await read_upload(background_image)
         
         if not person_bytes or not garment_bytes or not background_bytes:
             return JSONResponse(
@@ -141,10 +171,22 @@ async def compose_xai_gemini_v2(
                 status_code=400,
             )
         
+        # 입력 검증 (디코딩/해상도/품질/인물 여부, 업스트림 호출 전 차단)
+        rejection = await validate_upload_images_async(
+            {
+                "person_image": (person_bytes, "person"),
+                "garment_image": (garment_bytes, "garment"),
+                "background_image": (background_bytes, "background")
+            },
+            "compose-xai-gemini-v2"
+        )
+        if rejection:
+            return _input_rejection_response(rejection)
+        
         # PIL Image로 변환
-        person_img = Image.open(io.BytesIO(person_bytes)).convert("RGB")
-        garment_img = Image.open(io.BytesIO(garment_bytes)).convert("RGB")
-        background_img = Image.open(io.BytesIO(background_bytes)).convert("RGB")
+        person_img = decode_image(person_bytes)
+        garment_img = decode_image(garment_bytes, max_side=IMAGE_GARMENT_MAX_SIDE)
+        background_img = decode_image(background_bytes)
         
         # V2 통합 트라이온 서비스 호출
         result = await generate_unified_tryon_v2(person_img, garment_img, background_img)
@@ -155,6 +197,8 @@ async def compose_xai_gemini_v2(
             status_code = 500 if "error" in result else 400
             return JSONResponse(result, status_code=status_code)
             
+    except ImageDecodeError:
+        raise
     except Exception as e:
         import traceback
         error_detail = traceback.format_exc()
@@ -10,4 +10,6 @@ class UnifiedTryonResponse(BaseModel):
     result_image: str  # base64 인코딩된 이미지
     message: Optional[str] = None
     llm: Optional[str] = None  # 사용된 LLM 정보 (예: "xai-gemini-unified")
+    garment_parsing_path: Optional[str] = None  # 의상 누끼 경로 (예: "uniform_background", "segformer")
+    error_code: Optional[str] = None  # 입력 검증 실패 코드 (예: "ANIMAL_DETECTED", "NOT_A_PERSON")
 
@@ -0,0 +1,72 @@
+"""
+체형 분석 동일 이미지 결과 캐시 (2단계)
+
+- 1단계 (pose): 이미지 내용 해시 -> 포즈 랜드마크 ((33, 4) 배열), 측정값, 체형 타입
+- 2단계 (result): 이미지 해시 + 사용자 입력(키, 몸무게) -> 최종 분석 결과
+"""
+import hashlib
+from typing import Dict, Optional
+
+import numpy as np
+
+from core.ttl_cache import get_ttl_cache
+from config.body_analysis import (
+    BODY_RESULT_CACHE_ENABLED,
+    BODY_POSE_CACHE_SIZE,
+    BODY_POSE_CACHE_TTL_SEC,
+    BODY_RESULT_CACHE_SIZE,
+    BODY_RESULT_CACHE_TTL_SEC
+)
+
+POSE_CACHE_NAME = "body_analysis_pose"
+RESULT_CACHE_NAME = "body_analysis_result"
+
+_pose_cache = get_ttl_cache(POSE_CACHE_NAME, BODY_POSE_CACHE_SIZE, BODY_POSE_CACHE_TTL_SEC)
+_result_cache = get_ttl_cache(RESULT_CACHE_NAME, BODY_RESULT_CACHE_SIZE, BODY_RESULT_CACHE_TTL_SEC)
+
+
+def compute_image_hash(contents: bytes) -> str:
+    """업로드된 이미지 바이트의 SHA-256 해시"""
+    return hashlib.sha256(contents).hexdigest()
+
+
+def _result_key(image_hash: str, height: Optional[float], weight: Optional[float]) -> tuple:
+    """2단계 캐시 키 (입력값은 소수 첫째 자리까지 정규화)"""
+    return (
+        image_hash,
+        round(float(height), 1) if height else None,
+        round(float(weight), 1) if weight else None
+    )
+
+
+def get_cached_pose(image_hash: str) -> Optional[Dict]:
+    """1단계 캐시 조회: {"landmarks", "measurements", "body_type"} 또는 None"""
+    if not BODY_RESULT_CACHE_ENABLED:
+        return None
+    return _pose_cache.get(image_hash)
+
+
+def set_cached_pose(image_hash: str, landmarks: np.ndarray, measurements: Dict, body_type: Dict):
+    """1단계 캐시 저장 (동물 검증과 전신 감지를 통과한 이미지만)"""
+    if not BODY_RESULT_CACHE_ENABLED:
+        return
+    _pose_cache.set(image_hash, {
+        "landmarks": landmarks,
+        "measurements": measurements,
+        "body_type": body_type
+    })
+
+
+def get_cached_result(image_hash: str, height: Optional[float], weight: Optional[float]) -> Optional[Dict]:
+    """2단계 캐시 조회: 최종 분석 결과 또는 None"""
+    if not BODY_RESULT_CACHE_ENABLED:
+        return None
+    return _result_cache.get(_result_key(image_hash, height, weight))
+
+
+def set_cached_result(image_hash: str, height: Optional[float], weight: Optional[float], result: Dict):
+    """2단계 캐시 저장 (Gemini 분석까지 성공한 결과만)"""
+    if not BODY_RESULT_CACHE_ENABLED:
+        return
+    _result_cache.set(_result_key(image_hash, height, weight), result)
+
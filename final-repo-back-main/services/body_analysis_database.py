@@ -5,10 +5,15 @@
 import pymysql
 import os
 import json
-from typing import Optional, Dict, List
+import threading
+import time
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping
 from dotenv import load_dotenv
 from pathlib import Path
 
+from config.body_analysis import BODY_DEFINITIONS_CACHE_TTL_SEC
+
 # .env 파일 로드 (상위 디렉토리에서도 찾기)
 env_path = Path(__file__).parent.parent / '.env'
 if env_path.exists():
@@ -103,28 +108,20 @@ def get_body_type_definition(body_feature: str) -> Optional[Dict]:
         connection.close()
 
 
-def get_multiple_body_definitions(body_features: List[str]) -> List[Dict]:
+def _load_all_body_definitions() -> Optional[List[Dict]]:
     """
-    여러 체형 특징에 대한 정의 데이터 조회
-    
-    Args:
-        body_features: 체형 특징 리스트
+    body_type_definitions 전체 조회 (캐시 로딩용)
     
     Returns:
-        List[Dict]: 체형별 정의 데이터 리스트
+        List[Dict]: 체형별 정의 데이터 리스트 (DB 오류 시 None)
     """
-    if not body_features:
-        return []
-    
     connection = get_db_connection()
     if connection is None:
-        return []
+        return None
     
     try:
         with connection.cursor() as cursor:
-            # 여러 체형 특징 조회
-            placeholders = ','.join(['%s'] * len(body_features))
-            sql = f"""
+            sql = """
                 SELECT 
                     body_feature,
                     strengths,
@@ -132,28 +129,130 @@ def get_multiple_body_definitions(body_features: List[str]) -> List[Dict]:
                     recommended_dresses,
                     avoid_dresses
                 FROM body_type_definitions
-                WHERE body_feature IN ({placeholders})
+                ORDER BY id
             """
-            cursor.execute(sql, body_features)
+            cursor.execute(sql)
             results = cursor.fetchall()
             
-            definitions = []
-            for result in results:
-                definitions.append({
-                    'body_feature': result.get('body_feature'),
-                    'strengths': result.get('strengths', ''),
-                    'style_tips': result.get('style_tips', ''),
-                    'recommended_dresses': result.get('recommended_dresses', ''),
-                    'avoid_dresses': result.get('avoid_dresses', '')
-                })
-            
-            return definitions
+            return [{
+                'body_feature': result.get('body_feature'),
+                'strengths': result.get('strengths', ''),
+                'style_tips': result.get('style_tips', ''),
+                'recommended_dresses': result.get('recommended_dresses', ''),
+                'avoid_dresses': result.get('avoid_dresses', '')
+            } for result in results]
                 
     except pymysql.Error as e:
         print(f"[WARN] DB 조회 오류: {e}")
+        return None
+    finally:
+        connection.close()
+
+
+# 체형별 정의 메모리 캐시 (읽기 전용 매핑, TTL 경과 또는 관리자 수정 시 다시 로드)
+_definitions_cache: Optional[Mapping[str, Mapping[str, str]]] = None
+_definitions_loaded_at = 0.0
+_definitions_lock = threading.Lock()
+
+
+def get_cached_body_definitions() -> Mapping[str, Mapping[str, str]]:
+    """
+    체형별 정의 전체를 메모리 캐시에서 반환 (없거나 TTL이 지나면 DB에서 다시 로드)
+    
+    Returns:
+        Mapping: {body_feature: 정의} 읽기 전용 매핑 (DB 순서 유지, DB 오류 시 빈 매핑)
+    """
+    global _definitions_cache, _definitions_loaded_at
+    
+    cache = _definitions_cache
+    if cache is not None and time.time() - _definitions_loaded_at < BODY_DEFINITIONS_CACHE_TTL_SEC:
+        return cache
+    
+    with _definitions_lock:
+        # 락 대기 중 다른 요청이 로드를 끝냈을 수 있음
+        if _definitions_cache is not None and time.time() - _definitions_loaded_at < BODY_DEFINITIONS_CACHE_TTL_SEC:
+            return _definitions_cache
+        
+        definitions = _load_all_body_definitions()
+        if definitions is None:
+            # DB 오류 시 이전 캐시 유지 (없으면 빈 매핑, 다음 요청에서 재시도)
+            return _definitions_cache if _definitions_cache is not None else MappingProxyType({})
+        
+        _definitions_cache = MappingProxyType({
+            definition['body_feature']: MappingProxyType(definition) for definition in definitions
+        })
+        _definitions_loaded_at = time.time()
+        print(f"[BodyDefinitions] 체형별 정의 캐시 로드 완료: {len(definitions)}개")
+        return _definitions_cache
+
+
+def invalidate_body_definitions_cache():
+    """체형별 정의 캐시 무효화 (관리자 수정 후 호출, 다음 조회 시 다시 로드)"""
+    global _definitions_cache
+    
+    with _definitions_lock:
+        _definitions_cache = None
+    print("[BodyDefinitions] 체형별 정의 캐시 무효화")
+
+
+def get_multiple_body_definitions(body_features: List[str]) -> List[Dict]:
+    """
+    여러 체형 특징에 대한 정의 데이터 조회 (메모리 캐시 사용)
+    
+    Args:
+        body_features: 체형 특징 리스트
+    
+    Returns:
+        List[Dict]: 체형별 정의 데이터 리스트 (DB 순서)
+    """
+    if not body_features:
         return []
+    
+    requested = set(body_features)
+    return [
+        dict(definition)
+        for body_feature, definition in get_cached_body_definitions().items()
+        if body_feature in requested
+    ]
+
+
+def update_body_type_definition(body_feature: str, fields: Dict[str, str]) -> bool:
+    """
+    체형별 정의 수정 (관리자) - 성공 시 캐시 무효화
+    
+    Args:
+        body_feature: 체형 특징
+        fields: 수정할 컬럼 (strengths, style_tips, recommended_dresses, avoid_dresses)
+    
+    Returns:
+        bool: 수정된 행이 있으면 True
+    """
+    allowed = ('strengths', 'style_tips', 'recommended_dresses', 'avoid_dresses')
+    updates = {key: value for key, value in fields.items() if key in allowed and value is not None}
+    if not updates:
+        return False
+    
+    connection = get_db_connection()
+    if connection is None:
+        return False
+    
+    try:
+        with connection.cursor() as cursor:
+            set_clause = ', '.join(f"{key} = %s" for key in updates)
+            sql = f"UPDATE body_type_definitions SET {set_clause} WHERE body_feature = %s"
+            cursor.execute(sql, (*updates.values(), body_feature))
+            connection.commit()
+            updated = cursor.rowcount > 0
+    except pymysql.Error as e:
+        print(f"[WARN] 체형별 정의 수정 오류: {e}")
+        connection.rollback()
+        return False
     finally:
         connection.close()
+    
+    if updated:
+        invalidate_body_definitions_cache()
+    return updated
 
 
 def format_body_type_info_for_prompt(definitions: List[Dict]) -> str:
@@ -2,10 +2,24 @@
 체형 분석 서비스 클래스
 HuggingFace Spaces API를 사용한 체형 분석
 """
-from PIL import Image
+from PIL import Image, ImageOps
 import numpy as np
 from typing import Dict, Optional, List, Tuple
 from services.pose_landmark_service import PoseLandmarkService
+from core.body_measurements import (
+    BODY_TYPES,
+    landmarks_to_array,
+    compute_measurements,
+    measure,
+    measurements_to_dicts,
+    classify_body_type_indices,
+    classify_body_types,
+    array_to_landmarks,
+    estimate_upright_rotation,
+    rotate_landmarks,
+    core_visibility
+)
+from config.body_analysis import BODY_ORIENTATION_MIN_VISIBILITY
 
 
 class BodyAnalysisService:
@@ -26,81 +40,30 @@ class BodyAnalysisService:
         else:
             print("⚠️  체형 분석 서비스 초기화 실패")
     
-    def _detect_orientation(self, landmarks: List[Dict]) -> Dict[str, float]:
+    def _detect_orientation(self, landmark_array: np.ndarray, image_size: Optional[Tuple[int, int]] = None) -> Dict[str, float]:
         """
         랜드마크로부터 이미지 방향 감지
         
         Args:
-            landmarks: 랜드마크 좌표 리스트
+            landmark_array: (33, 4) 랜드마크 배열
+            image_size: (width, height) - 주면 픽셀 비율로 방향 판단
             
         Returns:
-            방향 정보 딕셔너리
+            방향 정보 딕셔너리 (rotation_angle: 시계 방향 회전 각도, 90 / -90 / 180)
         """
-        if not landmarks or len(landmarks) < 33:
-            return {"is_vertical": True, "rotation_angle": 0.0, "needs_rotation": False}
+        # 어깨 중심 → 엉덩이 중심 벡터가 아래를 향하도록 하는 90도 단위 회전
+        clockwise = estimate_upright_rotation(landmark_array, image_size)
+        rotation_angle = {0: 0.0, 90: 90.0, 180: 180.0, 270: -90.0}[clockwise]
+        needs_rotation = clockwise != 0
         
-        def get_landmark(idx: int) -> Tuple[float, float, float]:
-            landmark = landmarks[idx]
-            return landmark["x"], landmark["y"], landmark["z"]
-        
-        # 어깨 중심
-        left_shoulder = get_landmark(11)
-        right_shoulder = get_landmark(12)
-        shoulder_center_x = (left_shoulder[0] + right_shoulder[0]) / 2
-        shoulder_center_y = (left_shoulder[1] + right_shoulder[1]) / 2
-        
-        # 엉덩이 중심
-        left_hip = get_landmark(23)
-        right_hip = get_landmark(24)
-        hip_center_x = (left_hip[0] + right_hip[0]) / 2
-        hip_center_y = (left_hip[1] + right_hip[1]) / 2
-        
-        # 어깨와 엉덩이 사이의 x, y 차이
-        dx = abs(hip_center_x - shoulder_center_x)
-        dy = abs(hip_center_y - shoulder_center_y)
-        
-        # 정면 사진: 세로 방향 (y 차이가 x 차이보다 훨씬 큼)
-        # 가로로 누운 사진: 가로 방향 (x 차이가 y 차이보다 큼)
-        is_vertical = dy > dx
-        
-        # 회전 각도 계산 (어깨 중심에서 엉덩이 중심으로의 벡터)
-        angle_rad = np.arctan2(hip_center_y - shoulder_center_y, hip_center_x - shoulder_center_x)
-        angle_deg = np.degrees(angle_rad)
-        
-        # 정면 사진이어야 하는데 가로로 누워있는 경우 감지
-        # 정면: 어깨가 위, 엉덩이가 아래 (y 차이가 크고, 어깨 y < 엉덩이 y)
-        # 가로: 어깨와 엉덩이가 좌우로 (x 차이가 크거나, y 차이가 작음)
-        
-        # 정면 사진 기준: 어깨 y < 엉덩이 y (어깨가 위에 있음)
-        shoulder_above_hip = shoulder_center_y < hip_center_y
-        
-        # 가로로 누운지 판단: x 차이가 y 차이보다 크거나, 어깨가 엉덩이보다 아래에 있으면
-        is_horizontal = dx > dy or not shoulder_above_hip
-        
-        # 회전이 필요한지 판단
-        needs_rotation = is_horizontal
-        
-        # 회전 각도 결정 (90도 또는 -90도)
-        rotation_angle = 0.0
-        if needs_rotation:
-            # 어깨가 엉덩이보다 오른쪽에 있으면 -90도, 왼쪽에 있으면 90도
-            if shoulder_center_x > hip_center_x:
-                rotation_angle = -90.0
-            else:
-                rotation_angle = 90.0
-        
-        print(f"[방향 감지] 세로: {is_vertical}, 가로: {is_horizontal}, 회전 필요: {needs_rotation}, 각도: {rotation_angle:.1f}도")
-        print(f"  어깨 중심: ({shoulder_center_x:.3f}, {shoulder_center_y:.3f})")
-        print(f"  엉덩이 중심: ({hip_center_x:.3f}, {hip_center_y:.3f})")
-        print(f"  x 차이: {dx:.3f}, y 차이: {dy:.3f}")
+        print(f"[방향 감지] 회전 필요: {needs_rotation}, 각도: {rotation_angle:.1f}도")
         
         return {
-            "is_vertical": is_vertical,
-            "is_horizontal": is_horizontal,
+            "is_vertical": clockwise in (0, 180),
+            "is_horizontal": clockwise in (90, 270),
             "rotation_angle": rotation_angle,
             "needs_rotation": needs_rotation,
-            "dx": dx,
-            "dy": dy
+            "core_visibility": core_visibility(landmark_array)
         }
     
     def _correct_image_orientation(self, image: Image.Image, rotation_angle: float) -> Image.Image:
@@ -124,11 +87,13 @@ class BodyAnalysisService:
     
     def extract_landmarks(self, image: Image.Image, auto_correct_orientation: bool = False) -> Optional[List[Dict]]:
         """
-        이미지에서 포즈 랜드마크 추출 (방향 자동 보정 포함)
+        이미지에서 포즈 랜드마크 추출 (API 응답용 딕셔너리 리스트)
+        
+        체형 측정에는 변환 없는 extract_landmark_array를 사용합니다.
         
         Args:
             image: PIL Image 객체
-            auto_correct_orientation: 자동 방향 보정 여부 (기본값: True)
+            auto_correct_orientation: 자동 방향 보정 여부 (기본값: False)
             
         Returns:
             랜드마크 좌표 리스트 (33개 포인트) 또는 None
@@ -137,135 +102,105 @@ class BodyAnalysisService:
             print("서비스가 초기화되지 않았습니다.")
             return None
         
-        # 1차 랜드마크 추출 (방향 확인용)
-        landmarks = self.pose_landmark_service.extract_landmarks(image)
+        if not auto_correct_orientation:
+            # 휴대폰 사진의 EXIF 방향 적용 (픽셀 데이터가 회전 전 상태로 저장되는 경우)
+            return self.pose_landmark_service.extract_landmarks(ImageOps.exif_transpose(image))
+        
+        landmark_array = self.extract_landmark_array(image, auto_correct_orientation=True)
+        return array_to_landmarks(landmark_array) if landmark_array is not None else None
+    
+    def extract_landmark_array(self, image: Image.Image, auto_correct_orientation: bool = False) -> Optional[np.ndarray]:
+        """
+        이미지에서 포즈 랜드마크를 (33, 4) float32 배열로 추출 (방향 자동 보정 포함)
+        
+        EXIF 회전 정보는 첫 추론 전에 항상 적용합니다. 그 외 회전(가로/거꾸로 누운 사진)은
+        반환된 랜드마크 좌표를 회전해 보정하고, visibility가 낮아 결과를 신뢰할 수 없을 때만
+        이미지를 회전해 다시 추론합니다.
+        
+        Args:
+            image: PIL Image 객체
+            auto_correct_orientation: 자동 방향 보정 여부 (기본값: False)
+            
+        Returns:
+            (x, y, z, visibility) 배열 또는 None (33개 미만 감지 시)
+        """
+        if not self.is_initialized:
+            print("서비스가 초기화되지 않았습니다.")
+            return None
+        
+        # 휴대폰 사진의 EXIF 방향 적용 (픽셀 데이터가 회전 전 상태로 저장되는 경우)
+        image = ImageOps.exif_transpose(image)
         
-        if landmarks is None or len(landmarks) < 33:
-            return landmarks
+        # 1차 랜드마크 추출
+        landmark_array = self.pose_landmark_service.extract_landmark_array(image)
+        if landmark_array is None or not auto_correct_orientation:
+            return landmark_array
         
         # 방향 감지 및 자동 보정
-        if auto_correct_orientation:
-            orientation = self._detect_orientation(landmarks)
-            
-            if orientation["needs_rotation"]:
-                print(f"[방향 보정] 가로로 누운 이미지 감지, {orientation['rotation_angle']:.1f}도 회전 적용")
-                # 이미지 회전
-                corrected_image = self._correct_image_orientation(image, orientation["rotation_angle"])
-                # 회전된 이미지로 다시 랜드마크 추출
-                landmarks = self.pose_landmark_service.extract_landmarks(corrected_image)
+        orientation = self._detect_orientation(landmark_array, image.size)
+        if orientation["needs_rotation"]:
+            rotation_angle = orientation["rotation_angle"]
+            if orientation["core_visibility"] >= BODY_ORIENTATION_MIN_VISIBILITY:
+                # 랜드마크 좌표 공간에서 회전 (포즈 재추론 없음)
+                landmark_array = rotate_landmarks(landmark_array, int(rotation_angle))
+                print(f"[방향 보정] 랜드마크 좌표 {rotation_angle:.1f}도 회전 적용")
+            else:
+                print(
+                    f"[방향 보정] 핵심 랜드마크 visibility 낮음 "
+                    f"({orientation['core_visibility']:.2f} < {BODY_ORIENTATION_MIN_VISIBILITY}), "
+                    f"이미지 {rotation_angle:.1f}도 회전 후 재추출"
+                )
+                corrected_image = self._correct_image_orientation(image, rotation_angle)
+                landmark_array = self.pose_landmark_service.extract_landmark_array(corrected_image)
                 print(f"[방향 보정] 회전 후 랜드마크 재추출 완료")
         
-        return landmarks
+        return landmark_array
     
-    def calculate_measurements(self, landmarks: List[Dict]) -> Dict:
+    def calculate_measurements(self, landmarks) -> Dict:
         """
         랜드마크로부터 체형 측정값 계산
         
         Args:
-            landmarks: 랜드마크 좌표 리스트
+            landmarks: 랜드마크 좌표 리스트 또는 (33, 4) 배열
             
         Returns:
             측정값 딕셔너리
         """
-        if not landmarks or len(landmarks) < 33:
+        landmark_array = landmarks_to_array(landmarks)
+        if landmark_array is None:
             return {}
         
-        # 랜드마크 인덱스 정의
-        # 어깨: 11 (왼쪽), 12 (오른쪽)
-        # 엉덩이: 23 (왼쪽), 24 (오른쪽)
-        # 팔꿈치: 13 (왼쪽), 14 (오른쪽)
-        # 손목: 15 (왼쪽), 16 (오른쪽)
-        # 무릎: 25 (왼쪽), 26 (오른쪽)
-        # 발목: 27 (왼쪽), 28 (오른쪽)
-        # 머리: 0 (코)
-        # 발: 31 (왼쪽), 32 (오른쪽)
-        
-        def get_landmark(idx: int) -> Tuple[float, float, float]:
-            landmark = landmarks[idx]
-            return landmark["x"], landmark["y"], landmark["z"]
-        
-        def distance(p1: Tuple[float, float, float], p2: Tuple[float, float, float]) -> float:
-            return np.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2 + (p1[2] - p2[2])**2)
-        
-        # 어깨 폭
-        left_shoulder = get_landmark(11)
-        right_shoulder = get_landmark(12)
-        shoulder_width = distance(left_shoulder, right_shoulder)
-        
-        # 엉덩이 폭
-        left_hip = get_landmark(23)
-        right_hip = get_landmark(24)
-        hip_width = distance(left_hip, right_hip)
-        
-        # 어깨/엉덩이 비율
-        shoulder_hip_ratio = shoulder_width / hip_width if hip_width > 0 else 0
-        
-        # 팔 길이 (어깨 -> 팔꿈치 -> 손목)
-        left_elbow = get_landmark(13)
-        left_wrist = get_landmark(15)
-        left_arm_length = distance(left_shoulder, left_elbow) + distance(left_elbow, left_wrist)
-        
-        right_elbow = get_landmark(14)
-        right_wrist = get_landmark(16)
-        right_arm_length = distance(right_shoulder, right_elbow) + distance(right_elbow, right_wrist)
-        arm_length = (left_arm_length + right_arm_length) / 2
-        
-        # 다리 길이 (엉덩이 -> 무릎 -> 발목)
-        left_knee = get_landmark(25)
-        left_ankle = get_landmark(27)
-        left_leg_length = distance(left_hip, left_knee) + distance(left_knee, left_ankle)
-        
-        right_knee = get_landmark(26)
-        right_ankle = get_landmark(28)
-        right_leg_length = distance(right_hip, right_knee) + distance(right_knee, right_ankle)
-        leg_length = (left_leg_length + right_leg_length) / 2
-        
-        # 키 추정 (머리 -> 발)
-        nose = get_landmark(0)
-        left_foot = get_landmark(31)
-        right_foot = get_landmark(32)
-        foot_center = ((left_foot[0] + right_foot[0]) / 2, 
-                      (left_foot[1] + right_foot[1]) / 2, 
-                      (left_foot[2] + right_foot[2]) / 2)
-        estimated_height = distance(nose, foot_center)
-        
-        # 허리 폭 (엉덩이와 어깨의 중간점으로 추정)
-        waist_width = (shoulder_width + hip_width) / 2
-        
-        # 상체 길이 (어깨 중심 → 엉덩이 중심)
-        shoulder_center = ((left_shoulder[0] + right_shoulder[0]) / 2,
-                          (left_shoulder[1] + right_shoulder[1]) / 2,
-                          (left_shoulder[2] + right_shoulder[2]) / 2)
-        hip_center = ((left_hip[0] + right_hip[0]) / 2,
-                     (left_hip[1] + right_hip[1]) / 2,
-                     (left_hip[2] + right_hip[2]) / 2)
-        torso_length = distance(shoulder_center, hip_center)
-        
-        # 하체 길이 (이미 계산된 leg_length 사용)
-        lower_body_length = leg_length
+        return measure(landmark_array)
+    
+    def calculate_measurements_batch(self, landmark_batch: np.ndarray) -> List[Dict]:
+        """
+        여러 사람의 체형 측정값을 한 번에 계산
         
-        # 비율 계산
-        waist_shoulder_ratio = waist_width / shoulder_width if shoulder_width > 0 else 1.0
-        waist_hip_ratio = waist_width / hip_width if hip_width > 0 else 1.0
-        torso_leg_ratio = torso_length / leg_length if leg_length > 0 else 1.0
-        arm_leg_ratio = arm_length / leg_length if leg_length > 0 else 1.0
+        Args:
+            landmark_batch: (N, 33, 4) 랜드마크 배열
+            
+        Returns:
+            측정값 딕셔너리 리스트 (N개)
+        """
+        return measurements_to_dicts(compute_measurements(landmark_batch))
+    
+    def classify_body_types_batch(self, measurements_list: List[Dict]) -> List[Dict]:
+        """
+        여러 측정값의 체형 타입을 한 번에 분류 (classify_body_type과 동일한 기준)
         
-        return {
-            "shoulder_width": float(shoulder_width),
-            "hip_width": float(hip_width),
-            "waist_width": float(waist_width),
-            "shoulder_hip_ratio": float(shoulder_hip_ratio),
-            "waist_shoulder_ratio": float(waist_shoulder_ratio),
-            "waist_hip_ratio": float(waist_hip_ratio),
-            "arm_length": float(arm_length),
-            "leg_length": float(leg_length),
-            "torso_length": float(torso_length),
-            "lower_body_length": float(lower_body_length),
-            "torso_leg_ratio": float(torso_leg_ratio),
-            "arm_leg_ratio": float(arm_leg_ratio),
-            "estimated_height": float(estimated_height),
-            "body_length": float(estimated_height)
+        Args:
+            measurements_list: 측정값 딕셔너리 리스트
+            
+        Returns:
+            체형 타입 정보 리스트
+        """
+        if not measurements_list:
+            return []
+        columns = {
+            key: np.array([m.get(key, 1.0) for m in measurements_list])
+            for key in ("shoulder_hip_ratio", "waist_shoulder_ratio", "waist_hip_ratio")
         }
+        return classify_body_types(columns)
     
     def classify_body_type(self, measurements: Dict) -> Dict:
         """
@@ -315,40 +250,15 @@ class BodyAnalysisService:
         print(f"    H라인 (1.40-1.65, 허리>=0.82): {1.40 <= shoulder_hip_ratio <= 1.65 and waist_shoulder_ratio >= 0.82}")
         print(f"    O라인 (> 1.65): {shoulder_hip_ratio > 1.65}")
         
-        # 1. X라인 (모래시계형) - 허리가 매우 얇음
-        # 허리/어깨 비율이 낮고 (< 0.82), 허리/엉덩이 비율도 낮은 경우
-        if (waist_shoulder_ratio < 0.82 and waist_hip_ratio < 1.30):
-            body_type = "X라인"
-            confidence = 0.90
-            description = "X라인(모래시계형) 체형에 가깝습니다. 어깨와 엉덩이가 비슷하고 허리가 얇은 특징을 보입니다."
-        
-        # 2. A라인 (역삼각형) - 어깨 < 엉덩이 (상대적으로)
-        # 실제 측정값: 1.4 미만인 경우 (엉덩이가 상대적으로 넓음)
-        elif shoulder_hip_ratio < 1.40:
-            body_type = "A라인"
-            confidence = 0.85
-            description = "A라인 체형에 가깝습니다. 어깨보다 엉덩이가 넓은 특징을 보입니다."
-        
-        # 3. H라인 (직선형) - 어깨 ≈ 엉덩이, 허리도 비슷
-        # 실제 측정값: 1.4-1.65 범위에서 허리가 그렇게 얇지 않은 경우
-        elif (1.40 <= shoulder_hip_ratio <= 1.65 and
-              waist_shoulder_ratio >= 0.82):  # 허리가 그렇게 얇지 않음
-            body_type = "H라인"
-            confidence = 0.85
-            description = "H라인 체형에 가깝습니다. 어깨와 엉덩이가 비슷한 직선형 특징을 보입니다."
-        
-        # 4. O라인 (원형) - 어깨 > 엉덩이 또는 둥근 체형
-        # 실제 측정값: 1.65 이상인 경우 (어깨가 상대적으로 넓음)
-        elif shoulder_hip_ratio > 1.65:
-            body_type = "O라인"
-            confidence = 0.80
-            description = "O라인 체형에 가깝습니다. 어깨가 넓거나 균형잡힌 둥근 특징을 보입니다."
-        
-        # 5. 기본 (기타) - 위 조건에 해당하지 않는 경우
-        else:
-            body_type = "균형형"
-            confidence = 0.75
-            description = "균형잡힌 체형에 가깝습니다."
+        # 조건 순서: X라인 → A라인 → H라인 → O라인 → 균형형 (core/body_measurements.py)
+        type_index = int(classify_body_type_indices({
+            "shoulder_hip_ratio": shoulder_hip_ratio,
+            "waist_shoulder_ratio": waist_shoulder_ratio,
+            "waist_hip_ratio": waist_hip_ratio
+        }))
+        body_type = BODY_TYPES[type_index]["type"]
+        confidence = BODY_TYPES[type_index]["confidence"]
+        description = BODY_TYPES[type_index]["description"]
         
         print(f"  → 분류 결과: {body_type} (신뢰도: {confidence:.2f})")
         
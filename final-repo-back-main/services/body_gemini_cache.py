@@ -0,0 +1,140 @@
+"""
+Gemini 체형 분석 문구 버킷 캐시
+
+프롬프트 입력(체형 타입, 측정 비율, 키, BMI, 체형 특징)을 설정된 구간으로 양자화해 버킷 키를 만들고,
+버킷마다 생성된 분석 문구를 최대 BODY_GEMINI_CACHE_VARIANTS개까지 보관해 재사용합니다.
+버킷이 채워지기 전에는 새로 생성하고, 채워진 뒤에는 변형 중 하나를 무작위로 반환합니다.
+"""
+import math
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from core.ttl_cache import get_ttl_cache
+from config.body_analysis import (
+    BODY_GEMINI_CACHE_ENABLED,
+    BODY_GEMINI_CACHE_VARIANTS,
+    BODY_GEMINI_CACHE_MAX_BUCKETS,
+    BODY_GEMINI_CACHE_TTL_SEC,
+    BODY_GEMINI_RATIO_STEP,
+    BODY_GEMINI_HEIGHT_BAND_CM,
+    BODY_GEMINI_BMI_BAND
+)
+
+GEMINI_TEXT_CACHE_NAME = "body_gemini_text"
+
+# 프롬프트에 들어가는 측정 비율
+PROMPT_RATIO_KEYS = ("shoulder_hip_ratio", "waist_shoulder_ratio", "waist_hip_ratio")
+
+_buckets = get_ttl_cache(GEMINI_TEXT_CACHE_NAME, BODY_GEMINI_CACHE_MAX_BUCKETS, BODY_GEMINI_CACHE_TTL_SEC)
+_lock = threading.Lock()
+_metrics = {
+    "lookups": 0,
+    "hits": 0,       # 캐시 문구 반환 (절약한 Gemini 호출)
+    "misses": 0,     # 버킷이 없거나 변형이 덜 채워져 새로 생성
+    "stored": 0      # 버킷에 추가된 문구 수
+}
+
+
+def is_gemini_cache_enabled() -> bool:
+    return BODY_GEMINI_CACHE_ENABLED
+
+
+def _band_center(value: float, band: float) -> float:
+    """값이 속한 구간의 중앙값"""
+    return round(math.floor(value / band) * band + band / 2, 2)
+
+
+def quantize_prompt_inputs(measurements: Dict, height: Optional[float], bmi: Optional[float]) -> Dict:
+    """
+    프롬프트 입력 양자화
+
+    Returns:
+        {"measurements": 양자화된 비율, "height": 키 구간 중앙값, "bmi": BMI 구간 중앙값}
+    """
+    ratios = {
+        key: round(round(measurements.get(key, 1.0) / BODY_GEMINI_RATIO_STEP) * BODY_GEMINI_RATIO_STEP, 3)
+        for key in PROMPT_RATIO_KEYS
+    }
+    return {
+        "measurements": ratios,
+        "height": _band_center(height, BODY_GEMINI_HEIGHT_BAND_CM) if height else None,
+        "bmi": _band_center(bmi, BODY_GEMINI_BMI_BAND) if bmi else None
+    }
+
+
+def build_bucket_key(body_type: str, quantized: Dict, body_features: Optional[List[str]]) -> str:
+    """양자화된 입력으로 버킷 키 생성 (관리자 조회 시 읽을 수 있는 문자열)"""
+    ratios = quantized["measurements"]
+    parts = [body_type]
+    parts += [f"{key}={ratios[key]:.3f}" for key in PROMPT_RATIO_KEYS]
+    parts.append(f"height={quantized['height']}")
+    parts.append(f"bmi={quantized['bmi']}")
+    parts.append("features=" + ",".join(sorted(body_features or [])))
+    return "|".join(parts)
+
+
+def get_cached_analysis_text(bucket_key: str) -> Optional[str]:
+    """
+    버킷에서 분석 문구 조회
+
+    변형이 BODY_GEMINI_CACHE_VARIANTS개 모두 채워진 경우에만 무작위로 하나를 반환하고,
+    그 전에는 None (새로 생성해 store_analysis_text로 추가)
+    """
+    variants = _buckets.get(bucket_key)
+    with _lock:
+        _metrics["lookups"] += 1
+        if variants and len(variants) >= BODY_GEMINI_CACHE_VARIANTS:
+            _metrics["hits"] += 1
+            return random.choice(variants)
+        _metrics["misses"] += 1
+        return None
+
+
+def store_analysis_text(bucket_key: str, text: str):
+    """생성된 분석 문구를 버킷에 추가 (변형 수 상한까지)"""
+    if not text:
+        return
+    with _lock:
+        variants = list(_buckets.get(bucket_key) or ())
+        if len(variants) >= BODY_GEMINI_CACHE_VARIANTS or text in variants:
+            return
+        variants.append(text)
+        # 튜플로 저장해 조회 중인 요청과 공유해도 안전하게 유지
+        _buckets.set(bucket_key, tuple(variants))
+        _metrics["stored"] += 1
+
+
+def list_buckets() -> List[Dict]:
+    """관리자 조회용 버킷 목록"""
+    now = time.time()
+    return [
+        {
+            "bucket_key": key,
+            "variant_count": len(variants),
+            "complete": len(variants) >= BODY_GEMINI_CACHE_VARIANTS,
+            "age_sec": round(now - stored_at, 1),
+            "variants": list(variants)
+        }
+        for key, stored_at, variants in _buckets.items()
+    ]
+
+
+def purge_buckets(bucket_key: Optional[str] = None) -> int:
+    """버킷 삭제 (bucket_key가 없으면 전체) 후 삭제된 버킷 수 반환"""
+    if bucket_key is None:
+        return _buckets.clear()
+    return int(_buckets.delete(bucket_key))
+
+
+def get_gemini_cache_metrics() -> Dict:
+    """적중률 / 절약한 Gemini 호출 수"""
+    with _lock:
+        metrics = dict(_metrics)
+    metrics["enabled"] = BODY_GEMINI_CACHE_ENABLED
+    metrics["saved_calls"] = metrics["hits"]
+    metrics["hit_rate"] = round(metrics["hits"] / metrics["lookups"], 4) if metrics["lookups"] else None
+    metrics["bucket_count"] = len(_buckets)
+    metrics["variants_per_bucket"] = BODY_GEMINI_CACHE_VARIANTS
+    return metrics
@@ -1,5 +1,6 @@
 """체형 분석 서비스"""
 import os
+import asyncio
 from typing import Dict, List, Optional
 from PIL import Image
 from google import genai
@@ -8,6 +9,13 @@ from services.body_analysis_database import (
     get_multiple_body_definitions,
     format_body_type_info_for_prompt
 )
+from services.body_gemini_cache import (
+    is_gemini_cache_enabled,
+    quantize_prompt_inputs,
+    build_bucket_key,
+    get_cached_analysis_text,
+    store_analysis_text
+)
 
 
 def determine_body_features(body_type: Dict, bmi: float, height: float, measurements: Dict) -> List[str]:
@@ -73,9 +81,25 @@ async def analyze_body_with_gemini(
 ):
     """
     Gemini API로 체형 상세 분석
-    DB에서 체형별 정의를 조회하여 프롬프트에 포함
+    체형별 정의(메모리 캐시)를 조회하여 프롬프트에 포함
+    
+    버킷 캐시가 켜져 있으면 비율/키/BMI를 구간값으로 바꿔 프롬프트를 만들고,
+    같은 버킷에서 생성된 문구가 충분하면 Gemini 호출 없이 재사용합니다.
     """
     try:
+        bucket_key = None
+        if is_gemini_cache_enabled():
+            quantized = quantize_prompt_inputs(measurements, height, bmi)
+            measurements = quantized["measurements"]
+            height = quantized["height"]
+            bmi = quantized["bmi"]
+            bucket_key = build_bucket_key(body_type.get('type', 'unknown'), quantized, body_features)
+            cached_text = get_cached_analysis_text(bucket_key)
+            if cached_text is not None:
+                return {
+                    "detailed_analysis": cached_text
+                }
+        
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             print("GEMINI_API_KEY가 설정되지 않았습니다.")
@@ -83,7 +107,7 @@ async def analyze_body_with_gemini(
         
         client = genai.Client(api_key=api_key)
         
-        # DB에서 체형별 정의 조회 (체형 특징 기반)
+        # 체형별 정의 조회 (체형 특징 기반, 메모리 캐시)
         db_definitions = []
         if body_features:
             print(f"[DEBUG] 체형 특징: {body_features}")
@@ -265,14 +289,17 @@ async def analyze_body_with_gemini(
 - 별도의 리스트나 항목으로 나열하지 말고, 자연스러운 문단 형식으로 설명해주세요.
 """
         
-        # Gemini API 호출
-        response = client.models.generate_content(
+        # Gemini API 호출 (동기 호출을 별도 스레드에서 실행하여 이벤트 루프를 막지 않음)
+        response = await asyncio.to_thread(
+            client.models.generate_content,
             model="gemini-2.5-flash-image",
             contents=[image, prompt]
         )
         
         # 응답 파싱
         analysis_text = response.text
+        if bucket_key is not None:
+            store_analysis_text(bucket_key, analysis_text)
         
         # 상세 분석만 반환
         return {
@@ -0,0 +1,233 @@
+"""
+카탈로그 이미지 계층 캐시 서비스
+
+드레스 카탈로그 이미지(dresses/ 키)를 메모리 LRU → 디스크 → S3 순서로 읽습니다 (read-through).
+- IMAGE_CACHE_REVALIDATE_SEC이 지난 항목은 S3에 If-None-Match(ETag)로 재검증 (304면 본문 재다운로드 없음)
+- 재검증 중 S3 오류가 나면 캐시된 본문을 그대로 제공 (stale)
+- 드레스 업로드/삭제 시 invalidate_catalog_image로 즉시 무효화 (파생본 "<키>@..." 포함)
+"""
+import time
+import asyncio
+import threading
+from typing import Dict, Optional
+
+from core.object_cache import (
+    CachedObject,
+    MemoryObjectCache,
+    DiskObjectCache,
+    TieredObjectCache,
+    TIER_MEMORY,
+    TIER_DISK
+)
+from core.s3_client import S3_BUCKET_MAIN, open_s3_object, run_s3_io
+from config.image_cache import (
+    IMAGE_OBJECT_CACHE_ENABLED,
+    IMAGE_MEMORY_CACHE_MB,
+    IMAGE_MEMORY_CACHE_MAX_ITEM_MB,
+    IMAGE_DISK_CACHE_ENABLED,
+    IMAGE_DISK_CACHE_DIR,
+    IMAGE_DISK_CACHE_MB,
+    IMAGE_DISK_CACHE_RESCAN_SEC,
+    IMAGE_CACHE_REVALIDATE_SEC
+)
+
+_MB = 1024 * 1024
+
+_cache: Optional[TieredObjectCache] = None
+_cache_lock = threading.Lock()
+
+# 같은 키의 동시 miss/재검증은 S3 요청 하나로 합침 (key -> Task)
+_inflight: Dict[str, asyncio.Task] = {}
+
+# 계층별 조회 메트릭 (관리자 조회용)
+_metrics_lock = threading.Lock()
+_metrics = {
+    "requests": 0,
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "origin_fetches": 0,             # S3 본문 다운로드 (miss 또는 재검증 결과 변경)
+    "not_found": 0,
+    "revalidations": 0,
+    "revalidated_not_modified": 0,
+    "revalidated_changed": 0,
+    "stale_served": 0,               # 재검증 실패로 캐시 본문 제공
+    "coalesced": 0,                  # 진행 중인 S3 요청에 합류한 요청 수
+    "invalidations": 0,
+    "origin_bytes": 0
+}
+
+
+def _record(**counts):
+    with _metrics_lock:
+        for name, value in counts.items():
+            _metrics[name] += value
+
+
+def get_catalog_image_cache() -> TieredObjectCache:
+    """카탈로그 이미지 계층 캐시 (싱글톤)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                memory = MemoryObjectCache(IMAGE_MEMORY_CACHE_MB * _MB, IMAGE_MEMORY_CACHE_MAX_ITEM_MB * _MB)
+                disk = None
+                if IMAGE_DISK_CACHE_ENABLED:
+                    try:
+                        disk = DiskObjectCache(IMAGE_DISK_CACHE_DIR, IMAGE_DISK_CACHE_MB * _MB, IMAGE_DISK_CACHE_RESCAN_SEC)
+                    except OSError as e:
+                        print(f"[ImageCache] 디스크 캐시 초기화 실패 (메모리 캐시만 사용): {e}")
+                _cache = TieredObjectCache("catalog_images", memory, disk)
+    return _cache
+
+
+def _is_fresh(obj: CachedObject) -> bool:
+    return time.time() - obj.validated_at < IMAGE_CACHE_REVALIDATE_SEC
+
+
+def _fetch_from_s3(s3_key: str, etag: Optional[str] = None) -> Optional[Dict]:
+    """
+    S3 조건부 GET
+
+    Returns:
+        {"status": 200 | 304 | 404, "object": CachedObject 또는 None} 또는 None (S3 설정 누락)
+    """
+    result = open_s3_object(S3_BUCKET_MAIN, s3_key, if_none_match=etag)
+    if result is None:
+        return None
+    if result["status"] != 200:
+        return {"status": result["status"], "object": None}
+
+    body = result["body"]
+    try:
+        data = body.read()
+    finally:
+        body.close()
+    headers = result["headers"]
+    _record(origin_fetches=1, origin_bytes=len(data))
+    return {
+        "status": 200,
+        "object": CachedObject(data, headers.get("ETag"), headers.get("Last-Modified"), headers["Content-Type"])
+    }
+
+
+def _load(s3_key: str, cached: Optional[CachedObject]) -> Optional[CachedObject]:
+    """
+    메모리 조회 이후 단계 (디스크 → S3 재검증/다운로드). 블로킹 I/O이므로 스레드에서 실행
+
+    Args:
+        s3_key: 객체 키 (예: "dresses/Adress1.JPG")
+        cached: 메모리에서 찾은 (재검증이 필요한) 항목 또는 None
+    """
+    cache = get_catalog_image_cache()
+    if cached is None and cache.disk is not None:
+        cached = cache.disk.get(s3_key)
+        if cached is not None:
+            cache.memory.set(s3_key, cached)
+            if _is_fresh(cached):
+                _record(disk_hits=1)
+                return cached
+
+    if cached is not None:
+        _record(revalidations=1)
+        try:
+            result = _fetch_from_s3(s3_key, cached.etag)
+        except Exception as e:
+            print(f"[ImageCache] 재검증 실패, 캐시 본문 제공 ({s3_key}): {e}")
+            _record(stale_served=1)
+            return cached
+
+        if result is None or result["status"] == 304:
+            cache.mark_validated(s3_key, cached)
+            _record(revalidated_not_modified=1)
+            return cached
+        if result["status"] == 200:
+            cache.set(s3_key, result["object"])
+            _record(revalidated_changed=1)
+            return result["object"]
+        # S3에서 삭제된 객체
+        cache.delete(s3_key)
+        _record(not_found=1)
+        return None
+
+    result = _fetch_from_s3(s3_key)
+    if result is None:
+        return None
+    if result["status"] != 200:
+        _record(not_found=1)
+        return None
+    cache.set(s3_key, result["object"])
+    return result["object"]
+
+
+def get_catalog_image(s3_key: str) -> Optional[CachedObject]:
+    """카탈로그 이미지 조회 (동기, 캐시 → S3). 객체가 없거나 S3 설정이 없으면 None"""
+    _record(requests=1)
+    cached = get_catalog_image_cache().memory.get(s3_key)
+    if cached is not None and _is_fresh(cached):
+        _record(memory_hits=1)
+        return cached
+    return _load(s3_key, cached)
+
+
+async def get_catalog_image_async(s3_key: str) -> Optional[CachedObject]:
+    """
+    카탈로그 이미지 조회 (비동기)
+
+    신선한 메모리 hit은 이벤트 루프에서 바로 반환하고, 디스크/S3 단계는 S3 전용 스레드 풀에서 실행합니다.
+    같은 키의 동시 요청은 진행 중인 작업 하나를 함께 기다립니다.
+    """
+    _record(requests=1)
+    cached = get_catalog_image_cache().memory.get(s3_key)
+    if cached is not None and _is_fresh(cached):
+        _record(memory_hits=1)
+        return cached
+
+    task = _inflight.get(s3_key)
+    if task is not None:
+        _record(coalesced=1)
+    else:
+        task = asyncio.ensure_future(run_s3_io(_load, s3_key, cached))
+        _inflight[s3_key] = task
+        task.add_done_callback(lambda _: _inflight.pop(s3_key, None))
+    # 요청 하나가 취소되어도 다른 대기자를 위해 작업은 계속 진행
+    return await asyncio.shield(task)
+
+
+def invalidate_catalog_image(file_name: str) -> bool:
+    """드레스 이미지 캐시 무효화 (업로드로 덮어쓰기 / 삭제 시 호출, 파생본 포함)"""
+    if not IMAGE_OBJECT_CACHE_ENABLED:
+        return False
+    cache = get_catalog_image_cache()
+    s3_key = f"dresses/{file_name}"
+    deleted = cache.delete(s3_key)
+    derivatives = cache.delete_prefix(f"{s3_key}@")
+    _record(invalidations=1)
+    print(f"[ImageCache] 캐시 무효화: {s3_key} ({'삭제됨' if deleted else '캐시에 없음'}, 파생본 {derivatives}개)")
+    return deleted
+
+
+def clear_catalog_image_cache() -> int:
+    """메모리/디스크 캐시 전체 삭제 후 삭제된 항목 수 반환"""
+    return get_catalog_image_cache().clear()
+
+
+def get_catalog_image_cache_metrics() -> Dict:
+    """계층별 적중률, 재검증 결과, S3 다운로드량, 계층별 용량 (카운터는 워커별)"""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    requests = metrics["requests"]
+    # 캐시 본문으로 처리한 요청 (진행 중인 S3 요청에 합류한 요청은 캐시 적중이 아니므로 coalesced_rate로 따로 집계)
+    hits = (
+        metrics["memory_hits"] + metrics["disk_hits"] + metrics["revalidated_not_modified"]
+        + metrics["stale_served"]
+    )
+    metrics["enabled"] = IMAGE_OBJECT_CACHE_ENABLED
+    metrics["hit_rate"] = round(hits / requests, 4) if requests else None
+    metrics["coalesced_rate"] = round(metrics["coalesced"] / requests, 4) if requests else None
+    metrics["memory_hit_rate"] = round(metrics["memory_hits"] / requests, 4) if requests else None
+    metrics["disk_hit_rate"] = round(metrics["disk_hits"] / requests, 4) if requests else None
+    metrics["revalidate_sec"] = IMAGE_CACHE_REVALIDATE_SEC
+    stats = get_catalog_image_cache().stats()
+    metrics[TIER_MEMORY] = stats[TIER_MEMORY]
+    metrics[TIER_DISK] = stats[TIER_DISK]
+    return metrics
@@ -9,7 +9,8 @@ from PIL import Image
 from google import genai
 
 from core.xai_client import generate_prompt_from_images
-from core.s3_client import upload_log_to_s3
+from core.s3_client import upload_log_to_s3_async
+from core.image_codec import save_png
 from services.image_service import preprocess_dress_image
 from services.log_service import save_test_log
 # from services.garment_nukki_service import remove_garment_background  # 주석 처리: torch/transformers 미사용
@@ -102,20 +103,20 @@ async def generate_unified_tryon_custom_v3(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         garment_buffered = io.BytesIO()
-        garment_nukki_rgb.save(garment_buffered, format="PNG")
-        garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+        save_png(garment_nukki_rgb, garment_buffered)
+        garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
         
         garment_nukki_buffered = io.BytesIO()
-        garment_nukki.save(garment_nukki_buffered, format="PNG")
-        garment_nukki_s3_url = upload_log_to_s3(garment_nukki_buffered.getvalue(), model_id, "garment_nukki") or ""
+        save_png(garment_nukki, garment_nukki_buffered)
+        garment_nukki_s3_url = await upload_log_to_s3_async(garment_nukki_buffered.getvalue(), model_id, "garment_nukki") or ""
         
         background_buffered = io.BytesIO()
-        background_img_processed.save(background_buffered, format="PNG")
-        background_s3_url = upload_log_to_s3(background_buffered.getvalue(), model_id, "background") or ""
+        save_png(background_img_processed, background_buffered)
+        background_s3_url = await upload_log_to_s3_async(background_buffered.getvalue(), model_id, "background") or ""
         
         # ============================================================
         # Stage 1: X.AI 프롬프트 생성 (누끼 처리된 의상 이미지 사용)
@@ -338,8 +339,8 @@ async def generate_unified_tryon_custom_v3(
         
         # Stage 2 결과 S3 업로드
         stage2_buffered = io.BytesIO()
-        dressed_person_img.save(stage2_buffered, format="PNG")
-        stage2_result_s3_url = upload_log_to_s3(stage2_buffered.getvalue(), model_id, "stage2_result") or ""
+        save_png(dressed_person_img, stage2_buffered)
+        stage2_result_s3_url = await upload_log_to_s3_async(stage2_buffered.getvalue(), model_id, "stage2_result") or ""
         
         # ============================================================
         # Stage 3: Gemini로 배경 합성 + 조명 보정
@@ -502,8 +503,8 @@ async def generate_unified_tryon_custom_v3(
         result_image_base64 = base64.b64encode(stage3_image_parts[0]).decode()
         
         result_buffered = io.BytesIO()
-        final_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+        save_png(final_img, result_buffered)
+        result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
         
         run_time = time.time() - start_time
         
@@ -48,6 +48,7 @@ async def generate_unified_tryon_custom_v4(
             "result_image": str (base64),
             "message": str,
             "llm": str,
+            "garment_parsing_path": Optional[str],  # 누끼 경로 ("uniform_background" / "segformer")
             "error": Optional[str]
         }
     """
@@ -58,6 +59,7 @@ async def generate_unified_tryon_custom_v4(
     background_s3_url = ""
     result_s3_url = ""
     used_prompt = ""
+    garment_parsing_path = None
     
     try:
         # ============================================================
@@ -69,6 +71,7 @@ async def generate_unified_tryon_custom_v4(
         
         print("\n[Stage 0] 의상 이미지 누끼 처리 시작 (HuggingFace API)...")
         parsing_result = await parse_garment_image_v4(garment_img)
+        garment_parsing_path = parsing_result.get("path")
         
         if not parsing_result.get("success"):
             error_msg = parsing_result.get("message", "의상 이미지 누끼 처리에 실패했습니다.")
@@ -82,7 +85,7 @@ async def generate_unified_tryon_custom_v4(
                 print("[Stage 0] 누끼 처리 결과에서 garment_only 이미지를 찾을 수 없습니다.")
                 garment_nukki_rgb = garment_img.convert('RGB')
             else:
-                print("[Stage 0] 의상 이미지 누끼 처리 완료")
+                print(f"[Stage 0] 의상 이미지 누끼 처리 완료 (경로: {garment_parsing_path})")
                 print(f"[Stage 0] 누끼 처리된 이미지 크기: {garment_nukki_rgb.size[0]}x{garment_nukki_rgb.size[1]}, 모드: {garment_nukki_rgb.mode}")
         
         # ============================================================
@@ -360,6 +363,7 @@ async def generate_unified_tryon_custom_v4(
             "result_image": f"data:image/png;base64,{result_image_base64}",
             "message": "CustomV4 파이프라인이 성공적으로 완료되었습니다.",
             "llm": f"{XAI_PROMPT_MODEL}+{GEMINI_3_FLASH_MODEL}",
+            "garment_parsing_path": garment_parsing_path,
             "error": None
         }
         
@@ -1,12 +1,11 @@
 """드레스 판별 서비스"""
 import os
 import json
-import base64
-import io
 from typing import Dict, Optional
 from PIL import Image
 from openai import OpenAI
 
+from core.image_codec import preview_data_url
 from config.settings import GPT4O_MODEL_NAME
 
 
@@ -21,12 +20,9 @@ class DressCheckService:
         
         self.client = OpenAI(api_key=self.openai_api_key)
     
-    def _image_to_base64(self, image: Image.Image) -> str:
-        """PIL Image를 base64 문자열로 변환"""
-        buffered = io.BytesIO()
-        image.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode()
-        return img_str
+    def _image_to_data_url(self, image: Image.Image) -> str:
+        """PIL Image를 미리보기 data URL로 변환 (IMAGE_PREVIEW_MAX_SIDE로 축소, JPEG / WebP)"""
+        return preview_data_url(image)
     
     def _build_prompt(self, mode: str) -> str:
         """프롬프트 생성"""
@@ -94,8 +90,8 @@ category는 드레스인 경우 스타일(예: "벨라인", "A라인", "머메
             }
         """
         try:
-            # 이미지를 base64로 변환
-            img_base64 = self._image_to_base64(image)
+            # 이미지를 data URL로 변환
+            img_data_url = self._image_to_data_url(image)
             
             # 프롬프트 생성
             prompt = self._build_prompt(mode)
@@ -120,7 +116,7 @@ category는 드레스인 경우 스타일(예: "벨라인", "A라인", "머메
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/png;base64,{img_base64}"
+                                    "url": img_data_url
                                 }
                             }
                         ]
@@ -1,3 +1,262 @@
 """드레스 관련 비즈니스 로직"""
-# 현재는 비어있지만 향후 드레스 관련 비즈니스 로직 추가 가능
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Set
 
+from services.database import get_db_connection
+from services.catalog_image_cache import invalidate_catalog_image
+from services.image_delivery_service import invalidate_presigned_url
+from core.s3_client import S3_BUCKET_MAIN, delete_objects_async, list_s3_objects_async
+from config.s3 import DRESS_ORPHAN_MIN_AGE_MIN
+
+# 드레스 이미지 S3 키 접두사 (upload_to_s3 기본 폴더)
+DRESS_S3_PREFIX = "dresses/"
+
+# 드레스별 이미지 처리 결과
+IMAGE_DELETED = "deleted"      # S3 객체 삭제
+IMAGE_FAILED = "failed"        # S3 삭제 실패 (고아 객체로 남음, 정리 작업 대상)
+IMAGE_SHARED = "shared"        # 다른 드레스가 같은 파일을 사용 중이라 유지
+IMAGE_SKIPPED = "skipped"      # S3 URL이 아님
+
+
+def _placeholders(values: List) -> str:
+    return ", ".join(["%s"] * len(values))
+
+
+def _invalidate_dress_images(file_names: Iterable[str]):
+    """드레스 이미지 캐시 / 파생본 / presigned URL 무효화"""
+    for file_name in file_names:
+        invalidate_catalog_image(file_name)
+        invalidate_presigned_url(S3_BUCKET_MAIN, f"{DRESS_S3_PREFIX}{file_name}")
+
+
+def _referenced_file_names(cursor, file_names: List[str]) -> Set[str]:
+    """주어진 파일명 중 dresses 테이블에서 아직 사용 중인 파일명"""
+    if not file_names:
+        return set()
+    cursor.execute(
+        f"SELECT DISTINCT file_name FROM dresses WHERE file_name IN ({_placeholders(file_names)})",
+        file_names
+    )
+    return {row["file_name"] for row in cursor.fetchall()}
+
+
+async def bulk_delete_dresses(dress_ids: List[int]) -> Dict:
+    """
+    드레스 일괄 삭제
+
+    1. DB 레코드를 한 트랜잭션으로 삭제 (실패 시 롤백, S3는 건드리지 않음)
+    2. 삭제된 드레스의 S3 이미지를 delete_objects로 일괄 삭제 (다른 드레스가 쓰는 파일은 유지)
+    3. 이미지 캐시 / 파생본 / presigned URL 무효화
+
+    S3 삭제 실패는 드레스별 결과에 기록되고 객체는 고아로 남아 reconcile_orphan_dress_objects로 정리합니다.
+
+    Args:
+        dress_ids: 삭제할 드레스 ID 목록
+
+    Returns:
+        dict: {
+            "success": bool,
+            "requested": int,
+            "deleted": int,
+            "not_found": int,
+            "images_deleted": int,
+            "images_failed": int,
+            "results": [{"dress_id", "status", "file_name", "image_status", "error"}],
+            "message": str,
+            "error": Optional[str]
+        }
+    """
+    ids = list(dict.fromkeys(dress_ids))
+    if not ids:
+        return {
+            "success": False,
+            "error": "No dress ids",
+            "message": "삭제할 드레스 ID가 없습니다."
+        }
+
+    connection = get_db_connection()
+    if not connection:
+        return {
+            "success": False,
+            "error": "Database connection failed",
+            "message": "데이터베이스 연결에 실패했습니다."
+        }
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT idx, file_name, url FROM dresses WHERE idx IN ({_placeholders(ids)}) FOR UPDATE",
+                ids
+            )
+            rows = {row["idx"]: row for row in cursor.fetchall()}
+
+            if rows:
+                found_ids = list(rows)
+                cursor.execute(f"DELETE FROM dresses WHERE idx IN ({_placeholders(found_ids)})", found_ids)
+
+            # S3에 올라간 이미지 중 남은 레코드가 참조하지 않는 파일만 삭제 대상
+            s3_file_names = list({
+                row["file_name"] for row in rows.values()
+                if row["file_name"] and row["url"] and row["url"].startswith("https://")
+            })
+            shared = _referenced_file_names(cursor, s3_file_names)
+            connection.commit()
+    except Exception as e:
+        connection.rollback()
+        print(f"[DressDelete] 일괄 삭제 DB 오류 (롤백): {e}")
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"드레스 일괄 삭제 중 데이터베이스 오류가 발생해 롤백했습니다: {str(e)}"
+        }
+    finally:
+        connection.close()
+
+    delete_names = [file_name for file_name in s3_file_names if file_name not in shared]
+    s3_results = await delete_objects_async(f"{DRESS_S3_PREFIX}{file_name}" for file_name in delete_names)
+    _invalidate_dress_images(delete_names)
+
+    results = []
+    for dress_id in ids:
+        row = rows.get(dress_id)
+        if row is None:
+            results.append({"dress_id": dress_id, "status": "not_found", "file_name": None, "image_status": None, "error": None})
+            continue
+
+        file_name = row["file_name"]
+        error = None
+        if file_name in shared:
+            image_status = IMAGE_SHARED
+        elif file_name in delete_names:
+            error = s3_results.get(f"{DRESS_S3_PREFIX}{file_name}")
+            image_status = IMAGE_FAILED if error else IMAGE_DELETED
+        else:
+            image_status = IMAGE_SKIPPED
+        results.append({
+            "dress_id": dress_id,
+            "status": "deleted",
+            "file_name": file_name,
+            "image_status": image_status,
+            "error": error
+        })
+
+    images_failed = sum(1 for error in s3_results.values() if error is not None)
+    summary = {
+        "requested": len(ids),
+        "deleted": len(rows),
+        "not_found": len(ids) - len(rows),
+        "images_deleted": len(s3_results) - images_failed,
+        "images_failed": images_failed
+    }
+    print(f"[DressDelete] 일괄 삭제: {summary}")
+
+    message = f"드레스 {summary['deleted']}개를 삭제했습니다."
+    if images_failed:
+        message += f" 이미지 {images_failed}개는 S3 삭제에 실패해 고아 객체 정리 대상으로 남았습니다."
+    return {"success": True, **summary, "results": results, "message": message}
+
+
+async def reconcile_orphan_dress_objects(dry_run: bool = True, min_age_min: int = DRESS_ORPHAN_MIN_AGE_MIN) -> Dict:
+    """
+    고아 드레스 이미지 정리
+
+    S3 dresses/ 아래 객체 중 dresses 테이블이 참조하지 않는 객체를 찾아 (dry_run이 아니면) 일괄 삭제합니다.
+    업로드 후 DB 등록 전일 수 있는 min_age_min분 이내 객체는 제외하고, 삭제 직전에 DB를 다시 확인합니다.
+
+    Args:
+        dry_run: True면 목록만 반환
+        min_age_min: 이 시간(분) 이내에 수정된 객체는 제외
+
+    Returns:
+        dict: {
+            "success": bool,
+            "dry_run": bool,
+            "scanned": int,
+            "orphans": int,
+            "orphan_bytes": int,
+            "skipped_recent": int,
+            "deleted": int,
+            "failed": int,
+            "results": [{"key", "size", "last_modified", "status", "error"}],
+            "message": str
+        }
+    """
+    objects = await list_s3_objects_async(DRESS_S3_PREFIX)
+    if objects is None:
+        return {
+            "success": False,
+            "error": "S3 list failed",
+            "message": "S3 드레스 이미지 목록을 조회하지 못했습니다."
+        }
+
+    connection = get_db_connection()
+    if not connection:
+        return {
+            "success": False,
+            "error": "Database connection failed",
+            "message": "데이터베이스 연결에 실패했습니다."
+        }
+
+    cutoff = datetime.now(timezone.utc) - timedelta(minutes=min_age_min)
+    skipped_recent = 0
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT DISTINCT file_name FROM dresses WHERE file_name IS NOT NULL")
+            referenced = {row["file_name"] for row in cursor.fetchall()}
+
+            orphans = []
+            for item in objects:
+                file_name = item["key"][len(DRESS_S3_PREFIX):]
+                if not file_name or item["key"].endswith("/") or file_name in referenced:
+                    continue
+                if item["last_modified"] > cutoff:
+                    skipped_recent += 1
+                    continue
+                orphans.append(item)
+
+            # 조회 이후 등록된 드레스가 참조하는 객체는 제외
+            if orphans and not dry_run:
+                now_referenced = _referenced_file_names(cursor, [item["key"][len(DRESS_S3_PREFIX):] for item in orphans])
+                orphans = [item for item in orphans if item["key"][len(DRESS_S3_PREFIX):] not in now_referenced]
+    finally:
+        connection.close()
+
+    s3_results = {}
+    if orphans and not dry_run:
+        s3_results = await delete_objects_async(item["key"] for item in orphans)
+        _invalidate_dress_images(item["key"][len(DRESS_S3_PREFIX):] for item in orphans)
+
+    results = []
+    for item in orphans:
+        if dry_run:
+            status, error = "orphan", None
+        else:
+            error = s3_results.get(item["key"])
+            status = "failed" if error else "deleted"
+        results.append({
+            "key": item["key"],
+            "size": item["size"],
+            "last_modified": item["last_modified"].isoformat(),
+            "status": status,
+            "error": error
+        })
+
+    failed = sum(1 for error in s3_results.values() if error is not None)
+    summary = {
+        "dry_run": dry_run,
+        "scanned": len(objects),
+        "orphans": len(orphans),
+        "orphan_bytes": sum(item["size"] for item in orphans),
+        "skipped_recent": skipped_recent,
+        "deleted": len(s3_results) - failed,
+        "failed": failed
+    }
+    print(f"[DressOrphans] 고아 객체 정리: {summary}")
+
+    if dry_run:
+        message = f"고아 이미지 {len(orphans)}개를 찾았습니다. (dry run, 삭제하지 않음)"
+    else:
+        message = f"고아 이미지 {summary['deleted']}개를 삭제했습니다."
+        if failed:
+            message += f" {failed}개는 삭제에 실패했습니다."
+    return {"success": True, **summary, "results": results, "message": message}
@@ -1,31 +1,56 @@
 """
 얼굴 분석 서비스
-HuggingFace Inference Endpoint를 사용하여 InsightFace 얼굴 분석
+HuggingFace Inference Endpoint(InsightFace) 또는 로컬 ONNX 백엔드(SCRFD + ArcFace)로 얼굴 분석
 """
 import os
 import base64
+import hashlib
 import io
 import requests
 import numpy as np
 from PIL import Image
 from typing import Optional, Dict, List
 from config.settings import INSIGHTFACE_ENDPOINT_URL, INSIGHTFACE_API_KEY
+from config.face_backend import (
+    FACE_BACKEND,
+    FACE_FALLBACK_TO_REMOTE,
+    FACE_LOCAL_WHEN_REMOTE_WARMING,
+    FACE_EMBEDDING_CACHE_SIZE,
+    FACE_EMBEDDING_CACHE_TTL_SEC
+)
+from core.upstream_warmer import record_upstream_result, is_upstream_warming, UPSTREAM_INSIGHTFACE
+from core.ttl_cache import get_ttl_cache
+from services.face_backends import get_local_face_backend
+
+# 얼굴 감지 + 임베딩 결과 캐시 (이미지 해시 -> 얼굴 리스트)
+_face_cache = get_ttl_cache("face_embeddings", FACE_EMBEDDING_CACHE_SIZE, FACE_EMBEDDING_CACHE_TTL_SEC)
+
+
+def compute_array_hash(image: np.ndarray) -> str:
+    """이미지 배열 해시 (크기 포함)"""
+    digest = hashlib.blake2b(np.ascontiguousarray(image).tobytes(), digest_size=16)
+    digest.update(str(image.shape).encode())
+    return digest.hexdigest()
 
 
 class FaceAnalysisService:
-    """얼굴 분석 서비스 (HuggingFace Inference Endpoint 기반)"""
+    """얼굴 분석 서비스 (HuggingFace Inference Endpoint / 로컬 ONNX 백엔드)"""
     
-    def __init__(self, endpoint_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(self, endpoint_url: Optional[str] = None, api_key: Optional[str] = None, backend: Optional[str] = None):
         """
         초기화
         
         Args:
             endpoint_url: HuggingFace Inference Endpoint URL (None이면 설정에서 가져옴)
             api_key: HuggingFace API 키 (None이면 설정에서 가져옴)
+            backend: 얼굴 분석 백엔드 ("remote" / "local", None이면 FACE_BACKEND 설정)
         """
         self.endpoint_url = endpoint_url or INSIGHTFACE_ENDPOINT_URL
         self.api_key = api_key or INSIGHTFACE_API_KEY
-        self.is_initialized = bool(self.endpoint_url and self.api_key)
+        self.backend = (backend or FACE_BACKEND).lower()
+        self.remote_available = bool(self.endpoint_url and self.api_key)
+        # 로컬 백엔드는 모델을 첫 사용 시 로드하므로 항상 초기화된 것으로 취급
+        self.is_initialized = self.backend == "local" or self.remote_available
         
         if not self.is_initialized:
             print("⚠️  InsightFace Inference Endpoint가 설정되지 않았습니다.")
@@ -78,89 +103,28 @@ class FaceAnalysisService:
             image: BGR 형식의 numpy 배열 이미지
             
         Returns:
-            얼굴 분석 결과 딕셔너리 또는 None
+            얼굴 분석 결과 딕셔너리 또는 None (여러 얼굴이면 가장 큰 얼굴)
         """
-        if not self.is_initialized:
-            print("서비스가 초기화되지 않았습니다.")
+        faces = self.detect_faces(image)
+        if not faces:
             return None
         
-        try:
-            # 이미지를 Base64로 인코딩
-            img_base64 = self._numpy_to_base64(image)
-            
-            # HuggingFace Inference Endpoint 요청 형식
-            payload = {
-                "inputs": {
-                    "image": f"data:image/jpeg;base64,{img_base64}"
-                }
-            }
-            
-            # API 호출
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            response = requests.post(
-                self.endpoint_url,
-                json=payload,
-                headers=headers,
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                print(f"얼굴 분석 API 호출 실패: {response.status_code}")
-                print(f"응답: {response.text}")
-                return None
-            
-            # 응답 파싱
-            result = response.json()
-            
-            # Inference Endpoint 응답 형식에 따라 파싱
-            # 일반적으로 {"faces": [...]} 또는 직접 배열 형식
-            if isinstance(result, dict):
-                if "faces" in result:
-                    faces = result["faces"]
-                elif "data" in result:
-                    faces = result["data"]
-                else:
-                    # 직접 얼굴 정보인 경우
-                    faces = [result]
-            elif isinstance(result, list):
-                faces = result
-            else:
-                print(f"예상하지 못한 응답 형식: {result}")
-                return None
-            
-            # 첫 번째 얼굴 반환 (가장 큰 얼굴)
-            if len(faces) > 0:
-                # 여러 얼굴이 있는 경우 가장 큰 얼굴 선택
-                if len(faces) > 1:
-                    largest_face = max(faces, key=lambda f: (
-                        f.get("bbox", [0, 0, 0, 0])[2] - f.get("bbox", [0, 0, 0, 0])[0]
-                    ) * (
-                        f.get("bbox", [0, 0, 0, 0])[3] - f.get("bbox", [0, 0, 0, 0])[1]
-                    ))
-                else:
-                    largest_face = faces[0]
-                
-                return largest_face
-            
-            return None
-            
-        except requests.exceptions.RequestException as e:
-            print(f"얼굴 분석 API 요청 오류: {e}")
-            return None
-        except Exception as e:
-            print(f"얼굴 분석 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        def face_area(face: Dict) -> float:
+            bbox = face.get("bbox", [0, 0, 0, 0])
+            return (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        
+        return max(faces, key=face_area)
     
     def detect_faces(self, image: np.ndarray) -> List[Dict]:
         """
         이미지에서 모든 얼굴 감지 및 분석
         
+        FACE_BACKEND 설정에 따라 로컬 백엔드(SCRFD + ArcFace)를 우선 사용하고,
+        로컬 백엔드를 사용할 수 없거나 오류가 나면 원격 엔드포인트로 폴백합니다.
+        원격 엔드포인트가 콜드 스타트 중(upstream warmer "warming")이면 FACE_BACKEND=remote도
+        로컬 백엔드를 먼저 사용하고(FACE_LOCAL_WHEN_REMOTE_WARMING), 로컬 실패 후 폴백은 건너뜁니다.
+        같은 이미지(해시 기준)의 감지/임베딩 결과는 캐시에서 재사용합니다.
+        
         Args:
             image: BGR 형식의 numpy 배열 이미지
             
@@ -171,6 +135,41 @@ class FaceAnalysisService:
             print("서비스가 초기화되지 않았습니다.")
             return []
         
+        image_hash = compute_array_hash(image)
+        cached = _face_cache.get(image_hash)
+        if cached is not None:
+            return cached
+        
+        faces = None
+        remote_warming = self.remote_available and is_upstream_warming(UPSTREAM_INSIGHTFACE)
+        if self.backend == "local" or (remote_warming and FACE_LOCAL_WHEN_REMOTE_WARMING):
+            try:
+                local_backend = get_local_face_backend()
+                if local_backend is not None:
+                    faces = local_backend.detect_faces(image)
+                else:
+                    print("[FaceAnalysisService] 로컬 얼굴 백엔드가 등록되지 않았습니다.")
+            except Exception as e:
+                print(f"[FaceAnalysisService] 로컬 얼굴 백엔드 오류: {e}")
+            
+            if faces is None and self.backend == "local":
+                if not (FACE_FALLBACK_TO_REMOTE and self.remote_available):
+                    return []
+                if remote_warming:
+                    print("[FaceAnalysisService] 원격 엔드포인트가 콜드 스타트 중이라 폴백을 건너뜀")
+                    return []
+                print("[FaceAnalysisService] 원격 엔드포인트로 폴백")
+        
+        if faces is None:
+            faces = self._detect_faces_remote(image)
+        
+        # 오류로 빈 결과가 나온 경우를 캐시하지 않도록 얼굴이 있을 때만 저장
+        if faces:
+            _face_cache.set(image_hash, faces)
+        return faces
+    
+    def _detect_faces_remote(self, image: np.ndarray) -> List[Dict]:
+        """원격 HF Inference Endpoint(InsightFace)로 모든 얼굴 감지"""
         try:
             # 이미지를 Base64로 인코딩
             img_base64 = self._numpy_to_base64(image)
@@ -194,6 +193,7 @@ class FaceAnalysisService:
                 headers=headers,
                 timeout=30
             )
+            record_upstream_result(UPSTREAM_INSIGHTFACE, response.status_code)
             
             if response.status_code != 200:
                 print(f"얼굴 분석 API 호출 실패: {response.status_code}")
@@ -220,6 +220,8 @@ class FaceAnalysisService:
             
         except requests.exceptions.RequestException as e:
             print(f"얼굴 분석 API 요청 오류: {e}")
+            if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+                record_upstream_result(UPSTREAM_INSIGHTFACE, None)
             return []
         except Exception as e:
             print(f"얼굴 분석 오류: {e}")
@@ -0,0 +1,364 @@
+"""
+로컬 얼굴 분석 / 페이스스왑 백엔드 (ONNX Runtime CPU)
+
+- SCRFD: 얼굴 감지 (bbox + 5점 랜드마크)
+- ArcFace: 얼굴 임베딩 (512차원, L2 정규화)
+- INSwapper: 타겟 얼굴을 소스 임베딩으로 교체
+
+원격 InsightFace 엔드포인트와 같은 얼굴 딕셔너리 형식({"bbox", "kps", "det_score", "normed_embedding"})을 반환합니다.
+입력 이미지는 모두 BGR numpy 배열입니다.
+"""
+import os
+from typing import Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from config.face_backend import (
+    FACE_DETECTOR_MODEL_PATH,
+    FACE_RECOGNIZER_MODEL_PATH,
+    FACE_SWAPPER_MODEL_PATH,
+    FACE_SWAPPER_EMAP_PATH,
+    FACE_DETECTION_SIZE,
+    FACE_DETECTION_THRESHOLD,
+    FACE_NMS_THRESHOLD
+)
+
+# 모델 레지스트리 등록 이름
+LOCAL_FACE_MODEL_NAME = "face_local"
+
+# ArcFace 정렬 기준 5점 좌표 (112x112)
+ARCFACE_DST = np.array([
+    [38.2946, 51.6963],
+    [73.5318, 51.5014],
+    [56.0252, 71.7366],
+    [41.5493, 92.3655],
+    [70.7299, 92.2041]
+], dtype=np.float32)
+
+
+def estimate_similarity_transform(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    src -> dst 유사 변환(회전 + 균일 스케일 + 이동) 추정 (Umeyama)
+
+    Returns:
+        2x3 아핀 행렬
+    """
+    src = np.asarray(src, dtype=np.float64)
+    dst = np.asarray(dst, dtype=np.float64)
+    src_mean, dst_mean = src.mean(axis=0), dst.mean(axis=0)
+    src_demean, dst_demean = src - src_mean, dst - dst_mean
+
+    covariance = dst_demean.T @ src_demean / len(src)
+    d = np.ones(2)
+    if np.linalg.det(covariance) < 0:
+        d[1] = -1
+    u, s, vt = np.linalg.svd(covariance)
+    rotation = u @ np.diag(d) @ vt
+    scale = (s * d).sum() / src_demean.var(axis=0).sum()
+
+    matrix = np.zeros((2, 3), dtype=np.float64)
+    matrix[:, :2] = scale * rotation
+    matrix[:, 2] = dst_mean - scale * rotation @ src_mean
+    return matrix
+
+
+def estimate_norm(kps: np.ndarray, image_size: int = 112) -> np.ndarray:
+    """5점 랜드마크를 ArcFace 정렬 좌표로 옮기는 변환 행렬 (112 / 128 배수 크기)"""
+    if image_size % 112 == 0:
+        ratio, diff_x = image_size / 112.0, 0.0
+    else:
+        ratio = image_size / 128.0
+        diff_x = 8.0 * ratio
+    dst = ARCFACE_DST * ratio
+    dst[:, 0] += diff_x
+    return estimate_similarity_transform(kps, dst)
+
+
+def norm_crop(image: np.ndarray, kps: np.ndarray, image_size: int = 112):
+    """정렬된 얼굴 crop과 변환 행렬 반환"""
+    matrix = estimate_norm(kps, image_size)
+    return cv2.warpAffine(image, matrix, (image_size, image_size), borderValue=0.0), matrix
+
+
+def _nms(detections: np.ndarray, threshold: float) -> List[int]:
+    """score 내림차순 NMS (detections: (N, 5) = x1, y1, x2, y2, score)"""
+    x1, y1, x2, y2, scores = detections.T
+    areas = (x2 - x1 + 1) * (y2 - y1 + 1)
+    order = scores.argsort()[::-1]
+
+    keep = []
+    while order.size > 0:
+        i = order[0]
+        keep.append(int(i))
+        xx1 = np.maximum(x1[i], x1[order[1:]])
+        yy1 = np.maximum(y1[i], y1[order[1:]])
+        xx2 = np.minimum(x2[i], x2[order[1:]])
+        yy2 = np.minimum(y2[i], y2[order[1:]])
+        inter = np.maximum(0.0, xx2 - xx1 + 1) * np.maximum(0.0, yy2 - yy1 + 1)
+        iou = inter / (areas[i] + areas[order[1:]] - inter)
+        order = order[np.where(iou <= threshold)[0] + 1]
+    return keep
+
+
+class ScrfdDetector:
+    """SCRFD 얼굴 감지 (InsightFace det_10g / det_500m 등, 랜드마크 출력 포함 모델)"""
+
+    def __init__(self, model_path: str = FACE_DETECTOR_MODEL_PATH, input_size: int = FACE_DETECTION_SIZE):
+        from core.shared_weights import create_shared_onnx_session
+        from core.micro_batcher import register_batcher, make_onnx_batch_fn
+
+        self.session = create_shared_onnx_session(model_path)
+        self.input_name = self.session.get_inputs()[0].name
+        self.output_names = [output.name for output in self.session.get_outputs()]
+        self.input_size = input_size
+        # 배치 차원 없이 내보낸 모델은 배처가 항목별로 실행
+        self.batched = len(self.session.get_outputs()[0].shape) == 3
+        self.batcher = register_batcher("face_detector", make_onnx_batch_fn(
+            self.session, self.input_name, self.output_names, batched_outputs=self.batched
+        ))
+
+        num_outputs = len(self.output_names)
+        # 출력 수에 따른 stride / anchor 구성 (SCRFD 공식 구현과 동일)
+        if num_outputs in (6, 9):
+            self.fmc, self.strides, self.num_anchors = 3, [8, 16, 32], 2
+        elif num_outputs in (10, 15):
+            self.fmc, self.strides, self.num_anchors = 5, [8, 16, 32, 64, 128], 1
+        else:
+            raise ValueError(f"지원하지 않는 SCRFD 출력 구성입니다: {num_outputs}개")
+        self.use_kps = num_outputs in (9, 15)
+        self._anchor_cache: Dict[tuple, np.ndarray] = {}
+
+    def _anchor_centers(self, height: int, width: int, stride: int) -> np.ndarray:
+        key = (height, width, stride)
+        centers = self._anchor_cache.get(key)
+        if centers is None:
+            centers = np.stack(np.mgrid[:height, :width][::-1], axis=-1).astype(np.float32)
+            centers = (centers * stride).reshape(-1, 2)
+            if self.num_anchors > 1:
+                centers = np.repeat(centers, self.num_anchors, axis=0)
+            self._anchor_cache[key] = centers
+        return centers
+
+    def detect(self, image: np.ndarray, threshold: float = FACE_DETECTION_THRESHOLD):
+        """
+        얼굴 감지
+
+        Returns:
+            (detections (N, 5), kps (N, 5, 2) 또는 None) - 원본 이미지 좌표
+        """
+        height, width = image.shape[:2]
+        scale = self.input_size / max(height, width)
+        resized = cv2.resize(image, (max(1, int(width * scale)), max(1, int(height * scale))))
+        canvas = np.zeros((self.input_size, self.input_size, 3), dtype=np.uint8)
+        canvas[:resized.shape[0], :resized.shape[1]] = resized
+
+        blob = cv2.dnn.blobFromImage(
+            canvas, 1.0 / 128, (self.input_size, self.input_size), (127.5, 127.5, 127.5), swapRB=True
+        )
+        # 배처 출력은 입력 1건 기준 (배치 차원 제거됨)
+        outputs = self.batcher.run([blob[0]])[0]
+
+        scores_list, boxes_list, kps_list = [], [], []
+        for idx, stride in enumerate(self.strides):
+            scores = outputs[idx]
+            box_preds = outputs[idx + self.fmc] * stride
+            kps_preds = outputs[idx + self.fmc * 2] * stride if self.use_kps else None
+
+            grid = self.input_size // stride
+            centers = self._anchor_centers(grid, grid, stride)
+            positive = np.where(scores.reshape(-1) >= threshold)[0]
+            if positive.size == 0:
+                continue
+
+            c = centers[positive]
+            d = box_preds.reshape(-1, 4)[positive]
+            boxes_list.append(np.stack([c[:, 0] - d[:, 0], c[:, 1] - d[:, 1], c[:, 0] + d[:, 2], c[:, 1] + d[:, 3]], axis=-1))
+            scores_list.append(scores.reshape(-1)[positive])
+            if kps_preds is not None:
+                k = kps_preds.reshape(-1, 10)[positive].reshape(-1, 5, 2)
+                kps_list.append(c[:, np.newaxis, :] + k)
+
+        if not scores_list:
+            return np.zeros((0, 5), dtype=np.float32), None
+
+        scores = np.concatenate(scores_list)
+        boxes = np.concatenate(boxes_list) / scale
+        detections = np.hstack([boxes, scores[:, np.newaxis]]).astype(np.float32)
+        keep = _nms(detections, FACE_NMS_THRESHOLD)
+        kps = (np.concatenate(kps_list) / scale)[keep] if kps_list else None
+        return detections[keep], kps
+
+
+class ArcFaceRecognizer:
+    """ArcFace 얼굴 임베딩 (w600k_r50 등, 112x112 입력)"""
+
+    def __init__(self, model_path: str = FACE_RECOGNIZER_MODEL_PATH):
+        from core.shared_weights import create_shared_onnx_session
+        from core.micro_batcher import register_batcher, make_onnx_batch_fn
+
+        self.session = create_shared_onnx_session(model_path)
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.input_size = int(model_input.shape[2]) if isinstance(model_input.shape[2], int) else 112
+        self.batcher = register_batcher("face_recognizer", make_onnx_batch_fn(self.session, self.input_name))
+
+    def embed(self, image: np.ndarray, kps_list: List[np.ndarray]) -> np.ndarray:
+        """얼굴별 L2 정규화 임베딩 (N, D) - 다른 요청의 얼굴과 함께 배치 추론"""
+        crops = [norm_crop(image, kps, self.input_size)[0] for kps in kps_list]
+        blob = cv2.dnn.blobFromImages(
+            crops, 1.0 / 127.5, (self.input_size, self.input_size), (127.5, 127.5, 127.5), swapRB=True
+        )
+        embeddings = np.stack([outputs[0] for outputs in self.batcher.run(list(blob))])
+        return embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+
+class InSwapper:
+    """INSwapper 페이스스왑 (inswapper_128)"""
+
+    def __init__(self, model_path: str = FACE_SWAPPER_MODEL_PATH, emap_path: str = FACE_SWAPPER_EMAP_PATH):
+        from core.shared_weights import create_shared_onnx_session
+        from core.micro_batcher import register_batcher, make_onnx_batch_fn
+
+        self.session = create_shared_onnx_session(model_path)
+        self.input_names = [model_input.name for model_input in self.session.get_inputs()]
+        self.input_size = int(self.session.get_inputs()[0].shape[2])
+        self.emap = self._load_emap(model_path, emap_path)
+        # 항목: (타겟 얼굴 blob, 소스 latent) 튜플
+        self.batcher = register_batcher("face_swapper", make_onnx_batch_fn(self.session))
+
+    @staticmethod
+    def _load_emap(model_path: str, emap_path: str) -> np.ndarray:
+        """
+        임베딩 변환 행렬 로드 (.npy가 없으면 모델의 마지막 initializer에서 추출)
+
+        워커 간 공유 memmap으로 로드하며(core/shared_weights.py), 원본 파일 지문이 같으면
+        다른 워커가 기록한 공유 파일을 그대로 매핑합니다.
+        """
+        from core.shared_weights import share_array, share_npy_file, file_fingerprint
+
+        if emap_path and os.path.exists(emap_path):
+            return share_npy_file("face_swapper/emap", emap_path)
+
+        def extract() -> np.ndarray:
+            import onnx
+            from onnx import numpy_helper
+
+            emap = numpy_helper.to_array(onnx.load(model_path).graph.initializer[-1])
+            if emap_path:
+                # 다음 로드부터는 onnx 패키지 없이 사용
+                np.save(emap_path, emap)
+            return emap
+
+        return share_array("face_swapper/emap", file_fingerprint(model_path), extract)
+
+    def swap(self, target_image: np.ndarray, target_face: Dict, source_face: Dict) -> np.ndarray:
+        """
+        타겟 이미지의 얼굴을 소스 얼굴로 교체
+
+        Args:
+            target_image: BGR 이미지
+            target_face: 타겟 얼굴 ("kps" 또는 "landmarks" 5점 필요)
+            source_face: 소스 얼굴 ("normed_embedding" 또는 "embedding" 필요)
+
+        Returns:
+            교체된 BGR 이미지
+        """
+        kps = np.asarray(target_face.get("kps", target_face.get("landmarks")), dtype=np.float32)
+        embedding = source_face.get("normed_embedding", source_face.get("embedding"))
+        if kps.shape != (5, 2) or embedding is None:
+            raise ValueError("페이스스왑에는 타겟 5점 랜드마크와 소스 임베딩이 필요합니다.")
+
+        aligned, matrix = norm_crop(target_image, kps, self.input_size)
+        blob = cv2.dnn.blobFromImage(aligned, 1.0 / 255.0, (self.input_size, self.input_size), (0.0, 0.0, 0.0), swapRB=True)
+
+        latent = np.asarray(embedding, dtype=np.float32).reshape(1, -1)
+        latent = latent / np.linalg.norm(latent)
+        latent = latent @ self.emap
+        latent = (latent / np.linalg.norm(latent)).astype(np.float32)
+
+        prediction = self.batcher.run([(blob[0], latent[0])])[0][0]
+        fake = np.clip(255 * prediction.transpose(1, 2, 0), 0, 255).astype(np.uint8)[:, :, ::-1]
+        return self._paste_back(target_image, fake, matrix)
+
+    def _paste_back(self, target_image: np.ndarray, fake: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """교체된 얼굴 crop을 원본 좌표로 되돌려 부드러운 마스크로 합성"""
+        height, width = target_image.shape[:2]
+        inverse = cv2.invertAffineTransform(matrix)
+        fake_full = cv2.warpAffine(fake, inverse, (width, height), borderValue=0.0)
+        mask = cv2.warpAffine(
+            np.full((self.input_size, self.input_size), 255, dtype=np.float32), inverse, (width, height), borderValue=0.0
+        )
+        mask[mask > 20] = 255
+
+        rows, cols = np.where(mask == 255)
+        if rows.size == 0:
+            return target_image
+        mask_size = int(np.sqrt((rows.max() - rows.min()) * (cols.max() - cols.min())))
+        erode = max(mask_size // 10, 10)
+        mask = cv2.erode(mask, np.ones((erode, erode), np.uint8), iterations=1)
+        blur = max(mask_size // 20, 5) * 2 + 1
+        mask = (cv2.GaussianBlur(mask, (blur, blur), 0) / 255.0)[:, :, np.newaxis]
+
+        merged = mask * fake_full.astype(np.float32) + (1 - mask) * target_image.astype(np.float32)
+        return merged.astype(np.uint8)
+
+
+class LocalFaceBackend:
+    """SCRFD + ArcFace (+ INSwapper) 로컬 얼굴 백엔드"""
+
+    name = "local"
+
+    def __init__(self):
+        self.detector = ScrfdDetector()
+        self.recognizer = ArcFaceRecognizer()
+        self.swapper: Optional[InSwapper] = None
+        if FACE_SWAPPER_MODEL_PATH and os.path.exists(FACE_SWAPPER_MODEL_PATH):
+            self.swapper = InSwapper()
+        # 요청 폭주 시 CPU 과점유 방지: 모델별 마이크로 배처가 추론을 한 번에 한 배치씩 실행
+        print(
+            f"[FaceBackend] 로컬 얼굴 백엔드 로드 완료 "
+            f"(SCRFD {self.detector.input_size}px, ArcFace, INSwapper {'사용' if self.swapper else '없음'})"
+        )
+
+    def detect_faces(self, image: np.ndarray) -> List[Dict]:
+        """얼굴 감지 + 임베딩 (원격 엔드포인트와 같은 딕셔너리 형식)"""
+        detections, kps = self.detector.detect(image)
+        if len(detections) == 0 or kps is None:
+            return []
+        embeddings = self.recognizer.embed(image, list(kps))
+
+        return [
+            {
+                "bbox": [float(v) for v in detection[:4]],
+                "det_score": float(detection[4]),
+                "kps": face_kps.tolist(),
+                "normed_embedding": embedding
+            }
+            for detection, face_kps, embedding in zip(detections, kps, embeddings)
+        ]
+
+    def swap(self, target_image: np.ndarray, target_face: Dict, source_face: Dict) -> np.ndarray:
+        if self.swapper is None:
+            raise RuntimeError(f"INSwapper 모델이 없습니다: {FACE_SWAPPER_MODEL_PATH}")
+        return self.swapper.swap(target_image, target_face, source_face)
+
+
+def load_local_face_backend() -> LocalFaceBackend:
+    """모델 레지스트리 로더"""
+    return LocalFaceBackend()
+
+
+def get_local_face_backend() -> Optional[LocalFaceBackend]:
+    """
+    모델 레지스트리에서 로컬 얼굴 백엔드 반환 (첫 사용 시 로드)
+
+    Returns:
+        백엔드 인스턴스 또는 None (등록되지 않음)
+    """
+    from core.model_registry import get_model_registry
+
+    registry = get_model_registry()
+    if not registry.is_registered(LOCAL_FACE_MODEL_NAME):
+        return None
+    return registry.get(LOCAL_FACE_MODEL_NAME)
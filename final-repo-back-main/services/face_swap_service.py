@@ -8,6 +8,7 @@ HuggingFace Inference Endpoint를 사용한 얼굴 분석 및 페이스스왑
 3. 자연스러운 페이스스왑 결과 생성
 """
 import os
+import threading
 import cv2
 import numpy as np
 from PIL import Image
@@ -15,6 +16,8 @@ from typing import Optional, List, Dict
 from pathlib import Path
 from services.face_analysis_service import FaceAnalysisService
 from services.pose_landmark_service import PoseLandmarkService
+from services.face_swap_templates import get_face_template_registry, normalize_face
+from services.face_backends import get_local_face_backend
 
 
 class FaceSwapService:
@@ -30,7 +33,6 @@ class FaceSwapService:
         """
         self.face_analysis_service = FaceAnalysisService(endpoint_url=endpoint_url, api_key=api_key)
         self.pose_landmark_service = PoseLandmarkService()
-        self.swapper = None
         self.is_initialized = self.face_analysis_service.is_initialized
         
         # INSwapper는 로컬 모델이 필요하므로 경고 메시지 출력
@@ -39,6 +41,27 @@ class FaceSwapService:
         else:
             print("✅ 얼굴 분석 서비스 초기화 완료 (페이스스왑 기능은 INSwapper 모델이 필요합니다)")
     
+    @property
+    def swapper(self):
+        """
+        로컬 INSwapper 백엔드 (FACE_BACKEND=local이고 INSwapper 모델이 있을 때, 없으면 None)
+
+        싱글톤 서비스가 백엔드를 붙잡아 두지 않도록 매번 모델 레지스트리에서 가져옵니다
+        (해제된 경우 첫 사용 시 다시 로드).
+        """
+        return self._load_swapper()
+    
+    def _load_swapper(self):
+        """로컬 INSwapper 백엔드 반환 (없으면 None)"""
+        if self.face_analysis_service.backend != "local":
+            return None
+        try:
+            backend = get_local_face_backend()
+        except Exception as e:
+            print(f"로컬 얼굴 백엔드 로드 오류: {e}")
+            return None
+        return backend if backend is not None and backend.swapper is not None else None
+    
     def is_available(self) -> bool:
         """서비스 사용 가능 여부 확인"""
         # 얼굴 감지는 API로 가능하지만, 페이스스왑은 INSwapper 모델이 필요
@@ -65,12 +88,27 @@ class FaceSwapService:
             print(f"얼굴 감지 오류: {e}")
             return None
     
+    def detect_all_faces(self, image: Image.Image) -> List[Dict]:
+        """
+        이미지의 모든 얼굴 감지 (FaceAnalysisService의 이미지 내용 해시 캐시 사용)
+        
+        Args:
+            image: PIL Image
+            
+        Returns:
+            얼굴 정보 리스트 (bbox, landmarks, embedding 정리됨)
+        """
+        image_np = np.array(image.convert('RGB'))[:, :, ::-1]  # RGB -> BGR
+        return [normalize_face(face) for face in self.face_analysis_service.detect_faces(image_np)]
+    
     def swap_face(
         self,
         source_image: Image.Image,
         target_image: Image.Image,
         source_face_index: int = 0,
-        target_face_index: int = 0
+        target_face_index: int = 0,
+        target_faces: Optional[List[Dict]] = None,
+        source_faces: Optional[List[Dict]] = None
     ) -> Optional[Image.Image]:
         """
         템플릿 이미지에 사용자 얼굴을 교체
@@ -83,6 +121,8 @@ class FaceSwapService:
             target_image: 템플릿 이미지 (PIL Image)
             source_face_index: 소스 이미지에서 사용할 얼굴 인덱스 (기본값: 0)
             target_face_index: 타겟 이미지에서 교체할 얼굴 인덱스 (기본값: 0)
+            target_faces: 미리 감지한 타겟 얼굴 (템플릿 레지스트리, 없으면 감지)
+            source_faces: 미리 감지한 소스 얼굴 (detect_image_type 결과의 "faces", 없으면 감지)
             
         Returns:
             페이스스왑된 이미지 (PIL Image) 또는 None (실패 시)
@@ -92,18 +132,16 @@ class FaceSwapService:
             return None
         
         # INSwapper 모델이 없으면 페이스스왑 불가
-        if self.swapper is None:
+        swapper = self.swapper
+        if swapper is None:
             print("⚠️  페이스스왑 기능은 INSwapper 모델이 필요합니다.")
             print("   현재는 얼굴 감지만 API로 수행됩니다.")
             return None
         
         try:
-            # PIL Image를 BGR numpy 배열로 변환
-            source_np = np.array(source_image.convert('RGB'))[:, :, ::-1]  # RGB -> BGR
-            target_np = np.array(target_image.convert('RGB'))[:, :, ::-1]  # RGB -> BGR
-            
-            # 소스 이미지에서 얼굴 감지 (API 사용)
-            source_faces = self.face_analysis_service.detect_faces(source_np)
+            # 소스 이미지 얼굴 (detect_image_type에서 감지한 결과가 있으면 재사용)
+            if source_faces is None:
+                source_faces = self.detect_all_faces(source_image)
             if len(source_faces) == 0:
                 print("⚠️  소스 이미지에서 얼굴을 찾을 수 없습니다.")
                 return None
@@ -113,8 +151,9 @@ class FaceSwapService:
             
             source_face_data = source_faces[source_face_index]
             
-            # 타겟 이미지에서 얼굴 감지 (API 사용)
-            target_faces = self.face_analysis_service.detect_faces(target_np)
+            # 타겟 이미지 얼굴 (템플릿은 레지스트리에서 미리 감지한 값 사용)
+            if target_faces is None:
+                target_faces = self.detect_all_faces(target_image)
             if len(target_faces) == 0:
                 print("⚠️  타겟 이미지에서 얼굴을 찾을 수 없습니다.")
                 return None
@@ -124,11 +163,10 @@ class FaceSwapService:
             
             target_face_data = target_faces[target_face_index]
             
-            # INSwapper로 페이스스왑 (로컬 모델 필요)
-            # API에서 받은 얼굴 데이터를 INSwapper 형식으로 변환 필요
-            # 현재는 INSwapper 모델이 없으므로 원본 이미지 반환
-            print("⚠️  페이스스왑 기능은 INSwapper 모델이 필요합니다.")
-            return target_image
+            # INSwapper로 페이스스왑 (타겟 5점 랜드마크 + 소스 임베딩 사용)
+            target_np = np.array(target_image.convert('RGB'))[:, :, ::-1]  # RGB -> BGR
+            result_np = swapper.swap(target_np, target_face_data, source_face_data)
+            return Image.fromarray(result_np[:, :, ::-1].copy())  # BGR -> RGB
             
         except Exception as e:
             print(f"페이스스왑 오류: {e}")
@@ -149,6 +187,7 @@ class FaceSwapService:
             - type: "full_body" or "upper_body" or "face_only"
             - confidence: 신뢰도 (0.0 ~ 1.0)
             - details: 상세 정보
+            - faces: 감지한 얼굴 리스트 (swap_face의 source_faces로 전달)
         """
         try:
             # 이미지 크기 및 비율 확인
@@ -156,8 +195,7 @@ class FaceSwapService:
             aspect_ratio = height / width if width > 0 else 1.0
             
             # 얼굴 크기 비율 계산
-            source_np = np.array(image.convert('RGB'))[:, :, ::-1]  # RGB -> BGR
-            faces = self.face_analysis_service.detect_faces(source_np)
+            faces = self.detect_all_faces(image)
             
             face_ratio = 0.0
             if len(faces) > 0:
@@ -221,7 +259,8 @@ class FaceSwapService:
                     "face_ratio": face_ratio,
                     "has_lower_body": has_lower_body,
                     "image_size": (width, height)
-                }
+                },
+                "faces": faces
             }
             
         except Exception as e:
@@ -243,7 +282,8 @@ class FaceSwapService:
             템플릿 이미지 파일 경로 리스트
         """
         if template_dir is None:
-            template_dir = Path(__file__).parent.parent / 'templates' / 'face_swap_templates'
+            # 기본 경로는 서버 시작 시 로드된 템플릿 레지스트리 사용
+            return [template.path for template in get_face_template_registry().list()]
         
         template_dir = Path(template_dir)
         if not template_dir.exists():
@@ -260,3 +300,16 @@ class FaceSwapService:
         
         return sorted(template_files)
 
+
+_service: Optional[FaceSwapService] = None
+_service_lock = threading.Lock()
+
+
+def get_face_swap_service() -> FaceSwapService:
+    """페이스스왑 서비스 싱글톤 (요청마다 생성하지 않음)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = FaceSwapService()
+    return _service
@@ -0,0 +1,204 @@
+"""
+페이스스왑 템플릿 레지스트리
+
+서버 시작 시 템플릿 이미지를 한 번 디코딩하고 템플릿 얼굴(bbox, 랜드마크, 임베딩)을 미리 감지해 보관합니다.
+요청 경로에서는 템플릿 이미지를 디스크에서 다시 읽지 않으며, 사전 감지가 꺼져 있거나 실패한 템플릿만
+ensure_detected로 요청 시 한 번 감지해 캐시합니다 (사전 감지는 첫 요청 지연을 줄이는 최적화).
+"""
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+from PIL import Image, ImageOps
+
+from config.face_swap import (
+    FACE_TEMPLATE_DIR,
+    FACE_TEMPLATE_PRELOAD,
+    FACE_TEMPLATE_DETECT_RETRY_SEC,
+    FACE_TEMPLATE_DETECT_MAX_ATTEMPTS
+)
+
+TEMPLATE_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp'}
+
+
+def normalize_face(face: Dict) -> Dict:
+    """
+    얼굴 분석 API 응답의 얼굴 한 개를 공통 형식으로 정리
+
+    원본 키는 유지하고 bbox(리스트), landmarks / embedding(float32 배열 또는 None)을 채웁니다.
+    """
+    landmarks = face.get("kps", face.get("landmarks", face.get("landmark_2d_106")))
+    embedding = face.get("normed_embedding", face.get("embedding"))
+    return {
+        **face,
+        "bbox": [float(v) for v in face.get("bbox", [0, 0, 0, 0])[:4]],
+        "landmarks": np.asarray(landmarks, dtype=np.float32) if landmarks is not None else None,
+        "embedding": np.asarray(embedding, dtype=np.float32) if embedding is not None else None
+    }
+
+
+class FaceTemplate:
+    """디코딩된 템플릿 이미지와 미리 감지한 얼굴 정보"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.name = path.name
+        self.image = ImageOps.exif_transpose(Image.open(path)).convert("RGB")
+        self.image_bgr = np.ascontiguousarray(np.asarray(self.image)[:, :, ::-1])  # RGB -> BGR
+        self.faces: Optional[List[Dict]] = None  # None: 아직 감지하지 못함
+        self.detect_attempts = 0
+        self.detect_lock = threading.Lock()  # 같은 템플릿의 동시 감지 방지
+        self.detected_at: Optional[float] = None
+
+    @property
+    def is_detected(self) -> bool:
+        return self.faces is not None
+
+    def info(self) -> Dict:
+        """템플릿 목록 / 관리자 조회용 정보"""
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "size": list(self.image.size),
+            "face_detected": self.is_detected,
+            "face_count": len(self.faces) if self.faces is not None else None,
+            "detect_attempts": self.detect_attempts
+        }
+
+
+class FaceTemplateRegistry:
+    """템플릿 이름 -> FaceTemplate"""
+
+    def __init__(self, template_dir: Path = FACE_TEMPLATE_DIR):
+        self.template_dir = Path(template_dir)
+        self._templates: Dict[str, FaceTemplate] = {}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self):
+        """템플릿 이미지 디코딩 (얼굴 감지는 detect_pending에서 수행)"""
+        if not self.template_dir.exists():
+            self.template_dir.mkdir(parents=True, exist_ok=True)
+            print(f"⚠️  템플릿 디렉토리가 없어 생성했습니다: {self.template_dir}")
+
+        templates = {}
+        for path in sorted(self.template_dir.iterdir()):
+            if not path.is_file() or path.suffix.lower() not in TEMPLATE_IMAGE_EXTENSIONS:
+                continue
+            try:
+                templates[path.name] = FaceTemplate(path)
+            except Exception as e:
+                print(f"[FaceTemplates] 템플릿 이미지 로드 실패 ({path.name}): {e}")
+
+        with self._lock:
+            self._templates = templates
+            self.loaded = True
+        print(f"[FaceTemplates] 템플릿 {len(templates)}개 로드")
+
+    def detect_pending(self, face_analysis_service) -> int:
+        """
+        얼굴 정보가 없는 템플릿의 얼굴 감지
+
+        Returns:
+            아직 감지하지 못한 템플릿 수
+        """
+        return sum(1 for template in self.list() if not self.ensure_detected(template, face_analysis_service))
+
+    def ensure_detected(self, template: FaceTemplate, face_analysis_service) -> bool:
+        """
+        템플릿 얼굴이 아직 없으면 감지 후 캐시 (요청 경로 지연 감지, 템플릿별 잠금으로 동시 요청은 한 번만 호출)
+
+        Returns:
+            얼굴 정보 보유 여부
+        """
+        if template.is_detected:
+            return True
+        with template.detect_lock:
+            if template.is_detected:
+                return True
+            template.detect_attempts += 1
+            try:
+                faces = face_analysis_service.detect_faces(template.image_bgr)
+            except Exception as e:
+                print(f"[FaceTemplates] {template.name}: 얼굴 감지 오류: {e}")
+                return False
+            if not faces:
+                return False
+            template.faces = [normalize_face(face) for face in faces]
+            template.detected_at = time.time()
+            print(f"[FaceTemplates] {template.name}: 얼굴 {len(template.faces)}개 감지")
+            return True
+
+    def get(self, name: Optional[str] = None) -> Optional[FaceTemplate]:
+        """이름으로 템플릿 조회 (이름이 없거나 찾지 못하면 첫 번째 템플릿)"""
+        with self._lock:
+            if not self._templates:
+                return None
+            if name and name in self._templates:
+                return self._templates[name]
+            return next(iter(self._templates.values()))
+
+    def list(self) -> List[FaceTemplate]:
+        with self._lock:
+            return list(self._templates.values())
+
+
+_registry: Optional[FaceTemplateRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_face_template_registry() -> FaceTemplateRegistry:
+    """템플릿 레지스트리 싱글톤 (처음 호출 시 이미지 로드)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = FaceTemplateRegistry()
+                registry.load()
+                _registry = registry
+    return _registry
+
+
+def _load_and_detect_templates(registry: FaceTemplateRegistry):
+    """템플릿 얼굴 감지 (엔드포인트 콜드 스타트에 대비해 재시도)"""
+    from services.face_analysis_service import FaceAnalysisService
+
+    face_analysis_service = FaceAnalysisService()
+    if not face_analysis_service.is_initialized:
+        return
+
+    for attempt in range(1, FACE_TEMPLATE_DETECT_MAX_ATTEMPTS + 1):
+        pending = registry.detect_pending(face_analysis_service)
+        if pending == 0:
+            return
+        if attempt < FACE_TEMPLATE_DETECT_MAX_ATTEMPTS:
+            print(f"[FaceTemplates] 얼굴 감지 실패 템플릿 {pending}개 - {FACE_TEMPLATE_DETECT_RETRY_SEC}초 후 재시도")
+            time.sleep(FACE_TEMPLATE_DETECT_RETRY_SEC)
+    print(f"[FaceTemplates] 템플릿 얼굴 사전 감지 중단 ({pending}개) - 요청 시 다시 감지합니다")
+
+
+async def reload_face_templates() -> FaceTemplateRegistry:
+    """템플릿 디렉토리를 다시 읽고 얼굴 감지 (관리자 API)"""
+    registry = get_face_template_registry()
+    await asyncio.to_thread(registry.load)
+    await asyncio.to_thread(_load_and_detect_templates, registry)
+    return registry
+
+
+def start_face_template_loading():
+    """템플릿 레지스트리 백그라운드 로드 시작 (앱 startup에서 호출)"""
+    if not FACE_TEMPLATE_PRELOAD:
+        print("[FaceTemplates] 사전 로드 비활성화됨 (FACE_TEMPLATE_PRELOAD=false)")
+        return
+
+    async def _load():
+        try:
+            registry = await asyncio.to_thread(get_face_template_registry)
+            await asyncio.to_thread(_load_and_detect_templates, registry)
+        except Exception as e:
+            print(f"[FaceTemplates] 템플릿 사전 로드 오류: {e}")
+
+    asyncio.get_running_loop().create_task(_load())
@@ -0,0 +1,202 @@
+"""
+Fitting 인물 전처리 / 합성 마스크 연산
+
+face_patch / base_img / inpaint_mask 생성과 face_patch 블렌딩처럼 numpy / OpenCV만 쓰는 CPU 작업.
+프로세스 풀 워커(core/cpu_pool.py)에서 import되므로 모델 / 외부 API 클라이언트를 import하지 않습니다.
+"""
+import io
+import base64
+import numpy as np
+import cv2
+from typing import Dict, Tuple
+from PIL import Image
+
+from core.image_codec import save_png
+from config.hf_segformer import FACE_MASK_IDS, NEUTRAL_COLOR
+
+
+def extract_face_patch(person_img: Image.Image, parsing_mask: np.ndarray) -> Image.Image:
+    """
+    face_mask + hair_mask로 face_patch 추출
+    
+    Args:
+        person_img: 인물 이미지 (PIL Image)
+        parsing_mask: 파싱 마스크 (numpy array)
+    
+    Returns:
+        Image.Image: face_patch 이미지 (RGBA)
+    """
+    # face_mask 생성 (face, skin, hair)
+    face_mask_array = np.isin(parsing_mask, FACE_MASK_IDS).astype(np.uint8) * 255
+    
+    # 원본 이미지를 RGBA로 변환
+    person_rgba = person_img.convert("RGBA")
+    person_array = np.array(person_rgba)
+    
+    # face_mask 영역만 추출
+    face_patch_array = person_array.copy()
+    face_patch_array[:, :, 3] = face_mask_array  # Alpha 채널에 face_mask 적용
+    
+    # face_patch 생성
+    face_patch = Image.fromarray(face_patch_array, mode='RGBA')
+    
+    return face_patch
+
+
+def generate_base_image(person_img: Image.Image, parsing_mask: np.ndarray) -> Image.Image:
+    """
+    cloth_mask 영역을 neutral_color(128,128,128)로 덮어서 base_img 생성
+    
+    Args:
+        person_img: 인물 이미지 (PIL Image)
+        parsing_mask: 파싱 마스크 (numpy array)
+    
+    Returns:
+        Image.Image: base_img 이미지 (RGB)
+    """
+    # cloth_mask 생성
+    cloth_mask_ids = [4, 5, 6, 7, 8, 16, 17]
+    cloth_mask_array = np.isin(parsing_mask, cloth_mask_ids).astype(np.uint8)
+    
+    # 원본 이미지 배열로 변환
+    person_array = np.array(person_img.convert("RGB"))
+    
+    # cloth_mask 영역을 neutral_color로 덮기
+    base_img_array = person_array.copy()
+    cloth_mask_3d = cloth_mask_array[:, :, np.newaxis]  # (H, W, 1)
+    base_img_array = np.where(
+        cloth_mask_3d > 0,
+        np.array(NEUTRAL_COLOR, dtype=np.uint8),
+        base_img_array
+    )
+    
+    # base_img 생성
+    base_img = Image.fromarray(base_img_array, mode='RGB')
+    
+    return base_img
+
+
+def generate_inpaint_mask(parsing_mask: np.ndarray) -> Image.Image:
+    """
+    inpaint_mask = body_mask - face_mask
+    
+    Args:
+        parsing_mask: 파싱 마스크 (numpy array)
+    
+    Returns:
+        Image.Image: inpaint_mask 이미지 (L mode, 0 또는 255)
+    """
+    # body_mask 생성
+    body_mask_ids = [12, 13, 14, 15]
+    body_mask_array = np.isin(parsing_mask, body_mask_ids).astype(np.uint8) * 255
+    
+    # face_mask 생성
+    face_mask_array = np.isin(parsing_mask, FACE_MASK_IDS).astype(np.uint8) * 255
+    
+    # inpaint_mask = body_mask - face_mask
+    inpaint_mask_array = np.clip(body_mask_array.astype(np.int16) - face_mask_array.astype(np.int16), 0, 255).astype(np.uint8)
+    
+    # PIL Image로 변환
+    inpaint_mask = Image.fromarray(inpaint_mask_array, mode='L')
+    
+    return inpaint_mask
+
+
+def build_person_masks(
+    person_img: Image.Image,
+    parsing_mask: np.ndarray
+) -> Tuple[Image.Image, Image.Image, Image.Image]:
+    """
+    파싱 마스크로 face_patch, base_img, inpaint_mask를 한 번에 생성 (프로세스 풀 작업 1건)
+    
+    Args:
+        person_img: 인물 이미지 (PIL Image)
+        parsing_mask: 파싱 마스크 (numpy array)
+    
+    Returns:
+        tuple: (face_patch (RGBA), base_img (RGB), inpaint_mask (L))
+    """
+    return (
+        extract_face_patch(person_img, parsing_mask),
+        generate_base_image(person_img, parsing_mask),
+        generate_inpaint_mask(parsing_mask)
+    )
+
+
+def build_preprocessed_person_payload(
+    face_patch: Image.Image,
+    base_img: Image.Image,
+    inpaint_mask: Image.Image
+) -> Dict:
+    """
+    face_patch, base_img, inpaint_mask를 base64(PNG)로 변환하여 payload 생성
+    
+    Args:
+        face_patch: face_patch 이미지 (PIL Image)
+        base_img: base_img 이미지 (PIL Image)
+        inpaint_mask: inpaint_mask 이미지 (PIL Image)
+    
+    Returns:
+        dict: {
+            "face_patch": str (base64),
+            "base_img": str (base64),
+            "inpaint_mask": str (base64)
+        }
+    """
+    def image_to_base64(img: Image.Image) -> str:
+        buffer = io.BytesIO()
+        save_png(img, buffer)
+        img_bytes = buffer.getvalue()
+        return base64.b64encode(img_bytes).decode("utf-8")
+    
+    return {
+        "face_patch": image_to_base64(face_patch),
+        "base_img": image_to_base64(base_img),
+        "inpaint_mask": image_to_base64(inpaint_mask)
+    }
+
+
+def blend_face_patch(
+    generated_img: Image.Image,
+    face_patch: Image.Image,
+    face_mask: np.ndarray
+) -> Image.Image:
+    """
+    Gemini 생성 이미지에 face_patch를 합성하고 경계 블렌딩 수행
+    
+    Args:
+        generated_img: Gemini가 생성한 이미지 (PIL Image)
+        face_patch: face_patch 이미지 (PIL Image, RGBA)
+        face_mask: face_mask (numpy array, 0 또는 255)
+    
+    Returns:
+        Image.Image: 최종 합성 이미지 (RGB)
+    """
+    # 이미지 크기 맞추기
+    if generated_img.size != face_patch.size:
+        face_patch = face_patch.resize(generated_img.size, Image.Resampling.LANCZOS)
+    
+    if generated_img.size[0] != face_mask.shape[1] or generated_img.size[1] != face_mask.shape[0]:
+        face_mask_resized = cv2.resize(face_mask, generated_img.size, interpolation=cv2.INTER_NEAREST)
+    else:
+        face_mask_resized = face_mask
+    
+    # generated_img를 RGBA로 변환
+    generated_rgba = generated_img.convert("RGBA")
+    generated_array = np.array(generated_rgba)
+    face_patch_array = np.array(face_patch)
+    
+    # 경계 블렌딩을 위한 가우시안 블러 적용
+    face_mask_blurred = cv2.GaussianBlur(face_mask_resized.astype(np.float32), (21, 21), 0) / 255.0
+    face_mask_blurred_3d = face_mask_blurred[:, :, np.newaxis]
+    
+    # 블렌딩: face_patch와 generated_img를 블렌딩
+    blended_array = (
+        face_patch_array[:, :, :3] * face_mask_blurred_3d +
+        generated_array[:, :, :3] * (1 - face_mask_blurred_3d)
+    ).astype(np.uint8)
+    
+    # 최종 이미지 생성
+    final_img = Image.fromarray(blended_array, mode='RGB')
+    
+    return final_img
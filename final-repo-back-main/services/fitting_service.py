@@ -4,8 +4,6 @@ import io
 import base64
 import time
 import traceback
-import numpy as np
-import cv2
 from typing import Dict, Optional
 from PIL import Image
 from google import genai
@@ -13,11 +11,13 @@ from google import genai
 from core.segformer_person_parser import parse_person_image
 from core.segformer_garment_parser import parse_garment_image
 from core.xai_client import generate_prompt_from_images
-from core.s3_client import upload_log_to_s3
+from core.s3_client import upload_log_to_s3_async
+from core.image_codec import decode_image, save_png, encode_png
+from core.cpu_pool import run_cpu_task
 from services.image_service import preprocess_dress_image
+from services.fitting_masks import build_person_masks, blend_face_patch
 from services.log_service import save_test_log
 from config.settings import GEMINI_FLASH_MODEL, XAI_PROMPT_MODEL
-from config.hf_segformer import FACE_MASK_IDS, NEUTRAL_COLOR
 
 
 def parse_person_with_b2(person_img: Image.Image) -> Dict:
@@ -41,175 +41,6 @@ def parse_person_with_b2(person_img: Image.Image) -> Dict:
     return parse_person_image(person_img)
 
 
-def extract_face_patch(person_img: Image.Image, parsing_mask: np.ndarray) -> Image.Image:
-    """
-    face_mask + hair_mask로 face_patch 추출
-    
-    Args:
-        person_img: 인물 이미지 (PIL Image)
-        parsing_mask: 파싱 마스크 (numpy array)
-    
-    Returns:
-        Image.Image: face_patch 이미지 (RGBA)
-    """
-    # face_mask 생성 (face, skin, hair)
-    face_mask_array = np.isin(parsing_mask, FACE_MASK_IDS).astype(np.uint8) * 255
-    
-    # 원본 이미지를 RGBA로 변환
-    person_rgba = person_img.convert("RGBA")
-    person_array = np.array(person_rgba)
-    
-    # face_mask 영역만 추출
-    face_patch_array = person_array.copy()
-    face_patch_array[:, :, 3] = face_mask_array  # Alpha 채널에 face_mask 적용
-    
-    # face_patch 생성
-    face_patch = Image.fromarray(face_patch_array, mode='RGBA')
-    
-    return face_patch
-
-
-def generate_base_image(person_img: Image.Image, parsing_mask: np.ndarray) -> Image.Image:
-    """
-    cloth_mask 영역을 neutral_color(128,128,128)로 덮어서 base_img 생성
-    
-    Args:
-        person_img: 인물 이미지 (PIL Image)
-        parsing_mask: 파싱 마스크 (numpy array)
-    
-    Returns:
-        Image.Image: base_img 이미지 (RGB)
-    """
-    # cloth_mask 생성
-    cloth_mask_ids = [4, 5, 6, 7, 8, 16, 17]
-    cloth_mask_array = np.isin(parsing_mask, cloth_mask_ids).astype(np.uint8)
-    
-    # 원본 이미지 배열로 변환
-    person_array = np.array(person_img.convert("RGB"))
-    
-    # cloth_mask 영역을 neutral_color로 덮기
-    base_img_array = person_array.copy()
-    cloth_mask_3d = cloth_mask_array[:, :, np.newaxis]  # (H, W, 1)
-    base_img_array = np.where(
-        cloth_mask_3d > 0,
-        np.array(NEUTRAL_COLOR, dtype=np.uint8),
-        base_img_array
-    )
-    
-    # base_img 생성
-    base_img = Image.fromarray(base_img_array, mode='RGB')
-    
-    return base_img
-
-
-def generate_inpaint_mask(parsing_mask: np.ndarray) -> Image.Image:
-    """
-    inpaint_mask = body_mask - face_mask
-    
-    Args:
-        parsing_mask: 파싱 마스크 (numpy array)
-    
-    Returns:
-        Image.Image: inpaint_mask 이미지 (L mode, 0 또는 255)
-    """
-    # body_mask 생성
-    body_mask_ids = [12, 13, 14, 15]
-    body_mask_array = np.isin(parsing_mask, body_mask_ids).astype(np.uint8) * 255
-    
-    # face_mask 생성
-    face_mask_array = np.isin(parsing_mask, FACE_MASK_IDS).astype(np.uint8) * 255
-    
-    # inpaint_mask = body_mask - face_mask
-    inpaint_mask_array = np.clip(body_mask_array.astype(np.int16) - face_mask_array.astype(np.int16), 0, 255).astype(np.uint8)
-    
-    # PIL Image로 변환
-    inpaint_mask = Image.fromarray(inpaint_mask_array, mode='L')
-    
-    return inpaint_mask
-
-
-def build_preprocessed_person_payload(
-    face_patch: Image.Image,
-    base_img: Image.Image,
-    inpaint_mask: Image.Image
-) -> Dict:
-    """
-    face_patch, base_img, inpaint_mask를 base64(PNG)로 변환하여 payload 생성
-    
-    Args:
-        face_patch: face_patch 이미지 (PIL Image)
-        base_img: base_img 이미지 (PIL Image)
-        inpaint_mask: inpaint_mask 이미지 (PIL Image)
-    
-    Returns:
-        dict: {
-            "face_patch": str (base64),
-            "base_img": str (base64),
-            "inpaint_mask": str (base64)
-        }
-    """
-    def image_to_base64(img: Image.Image) -> str:
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        img_bytes = buffer.getvalue()
-        return base64.b64encode(img_bytes).decode("utf-8")
-    
-    return {
-        "face_patch": image_to_base64(face_patch),
-        "base_img": image_to_base64(base_img),
-        "inpaint_mask": image_to_base64(inpaint_mask)
-    }
-
-
-def blend_face_patch(
-    generated_img: Image.Image,
-    face_patch: Image.Image,
-    face_mask: np.ndarray
-) -> Image.Image:
-    """
-    Gemini 생성 이미지에 face_patch를 합성하고 경계 블렌딩 수행
-    
-    Args:
-        generated_img: Gemini가 생성한 이미지 (PIL Image)
-        face_patch: face_patch 이미지 (PIL Image, RGBA)
-        face_mask: face_mask (numpy array, 0 또는 255)
-    
-    Returns:
-        Image.Image: 최종 합성 이미지 (RGB)
-    """
-    # 이미지 크기 맞추기
-    if generated_img.size != face_patch.size:
-        face_patch = face_patch.resize(generated_img.size, Image.Resampling.LANCZOS)
-    
-    if generated_img.size[0] != face_mask.shape[1] or generated_img.size[1] != face_mask.shape[0]:
-        face_mask_resized = cv2.resize(face_mask, generated_img.size, interpolation=cv2.INTER_NEAREST)
-    else:
-        face_mask_resized = face_mask
-    
-    # generated_img를 RGBA로 변환
-    generated_rgba = generated_img.convert("RGBA")
-    generated_array = np.array(generated_rgba)
-    face_patch_array = np.array(face_patch)
-    
-    # face_mask를 3D로 확장
-    face_mask_3d = face_mask_resized[:, :, np.newaxis] / 255.0
-    
-    # 경계 블렌딩을 위한 가우시안 블러 적용
-    face_mask_blurred = cv2.GaussianBlur(face_mask_resized.astype(np.float32), (21, 21), 0) / 255.0
-    face_mask_blurred_3d = face_mask_blurred[:, :, np.newaxis]
-    
-    # 블렌딩: face_patch와 generated_img를 블렌딩
-    blended_array = (
-        face_patch_array[:, :, :3] * face_mask_blurred_3d +
-        generated_array[:, :, :3] * (1 - face_mask_blurred_3d)
-    ).astype(np.uint8)
-    
-    # 최종 이미지 생성
-    final_img = Image.fromarray(blended_array, mode='RGB')
-    
-    return final_img
-
-
 async def compose_v2_5(
     person_img: Image.Image,
     garment_img: Image.Image,
@@ -250,7 +81,7 @@ async def compose_v2_5(
     try:
         # 1. 의상 이미지 전처리 및 SegFormer B2 Garment Parsing
         print("의상 이미지 전처리 시작...")
-        garment_img_processed = preprocess_dress_image(garment_img, target_size=1024)
+        garment_img_processed = await run_cpu_task(preprocess_dress_image, garment_img, 1024)
         print("의상 이미지 전처리 완료")
         
         print("\n" + "="*80)
@@ -264,12 +95,12 @@ async def compose_v2_5(
             run_time = time.time() - start_time
             
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             garment_buffered = io.BytesIO()
-            garment_img_processed.save(garment_buffered, format="PNG")
-            garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+            save_png(garment_img_processed, garment_buffered)
+            garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -296,12 +127,12 @@ async def compose_v2_5(
             run_time = time.time() - start_time
             
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             garment_buffered = io.BytesIO()
-            garment_img_processed.save(garment_buffered, format="PNG")
-            garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+            save_png(garment_img_processed, garment_buffered)
+            garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -342,8 +173,8 @@ async def compose_v2_5(
                 run_time = time.time() - start_time
                 
                 person_buffered = io.BytesIO()
-                person_img.save(person_buffered, format="PNG")
-                person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+                save_png(person_img, person_buffered)
+                person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
                 
                 save_test_log(
                     person_url=person_s3_url or "",
@@ -367,20 +198,12 @@ async def compose_v2_5(
             parsing_mask = person_parsing_result.get("parsing_mask")
             face_mask_array = person_parsing_result.get("face_mask")
             
-            # Step 2: face_patch 추출
-            print("[Step 2] face_patch 추출...")
-            face_patch = extract_face_patch(person_img, parsing_mask)
-            print("[Step 2] face_patch 추출 완료")
-            
-            # Step 3: base_img 생성
-            print("[Step 3] base_img 생성...")
-            base_img = generate_base_image(person_img, parsing_mask)
-            print("[Step 3] base_img 생성 완료")
-            
-            # Step 4: inpaint_mask 생성
-            print("[Step 4] inpaint_mask 생성...")
-            inpaint_mask_img = generate_inpaint_mask(parsing_mask)
-            print("[Step 4] inpaint_mask 생성 완료")
+            # Step 2~4: face_patch 추출, base_img 생성, inpaint_mask 생성 (프로세스 풀)
+            print("[Step 2~4] face_patch / base_img / inpaint_mask 생성...")
+            face_patch, base_img, inpaint_mask_img = await run_cpu_task(
+                build_person_masks, person_img, parsing_mask
+            )
+            print("[Step 2~4] face_patch / base_img / inpaint_mask 생성 완료")
             
             print("[Step 5] 인물 전처리 완료")
         
@@ -404,20 +227,20 @@ async def compose_v2_5(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         garment_buffered = io.BytesIO()
-        garment_img_processed.save(garment_buffered, format="PNG")
-        garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+        save_png(garment_img_processed, garment_buffered)
+        garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
         
         garment_only_buffered = io.BytesIO()
-        garment_only_img.save(garment_only_buffered, format="PNG")
-        garment_only_s3_url = upload_log_to_s3(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
+        save_png(garment_only_img, garment_only_buffered)
+        garment_only_s3_url = await upload_log_to_s3_async(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
         
         background_buffered = io.BytesIO()
-        background_img_processed.save(background_buffered, format="PNG")
-        background_s3_url = upload_log_to_s3(background_buffered.getvalue(), model_id, "background") or ""
+        save_png(background_img_processed, background_buffered)
+        background_s3_url = await upload_log_to_s3_async(background_buffered.getvalue(), model_id, "background") or ""
         
         # 3. X.AI 프롬프트 생성
         print("\n" + "="*80)
@@ -638,14 +461,14 @@ BACKGROUND RULES:
             }
         
         # 5. Gemini 생성 이미지에 face_patch 합성 및 경계 블렌딩
-        generated_img = Image.open(io.BytesIO(image_parts[0]))
+        generated_img = decode_image(image_parts[0], mode=None)
         
         if use_person_preprocess and face_patch is not None and face_mask_array is not None:
             print("\n" + "="*80)
             print("face_patch 합성 및 경계 블렌딩 시작")
             print("="*80)
             
-            final_img = blend_face_patch(generated_img, face_patch, face_mask_array)
+            final_img = await run_cpu_task(blend_face_patch, generated_img, face_patch, face_mask_array)
             print("face_patch 합성 및 경계 블렌딩 완료")
         else:
             final_img = generated_img
@@ -653,14 +476,10 @@ BACKGROUND RULES:
         # 6. 결과 이미지 처리 및 S3 업로드
         result_image_base64 = base64.b64encode(image_parts[0]).decode()
         
-        result_buffered = io.BytesIO()
-        final_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
-        
-        # 최종 이미지를 base64로 인코딩
-        final_buffered = io.BytesIO()
-        final_img.save(final_buffered, format="PNG")
-        final_image_base64 = base64.b64encode(final_buffered.getvalue()).decode()
+        # 최종 이미지는 한 번만 PNG 인코딩해 S3 업로드와 응답 base64에 함께 사용
+        final_png = await run_cpu_task(encode_png, final_img)
+        result_s3_url = await upload_log_to_s3_async(final_png, model_id, "result") or ""
+        final_image_base64 = base64.b64encode(final_png).decode()
         
         run_time = time.time() - start_time
         
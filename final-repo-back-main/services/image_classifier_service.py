@@ -1,98 +1,347 @@
 """
 이미지 분류 서비스
-MediaPipe 의존성 제거됨 - 현재 비활성화 상태
+로컬 CPU ImageNet 분류 모델(ONNX, MobileNetV3 등)로 업로드 이미지가 인물 사진인지 빠르게 검증
 
-참고: 이미지 분류 기능이 필요한 경우 HuggingFace Inference API를 사용하도록 변경 가능
+- 동물 사진: ImageNet 동물 클래스(0~397번) 확률 합이 임계값 이상이면 차단
+- 사물 사진: 사람/의상과 무관한 사물 클래스가 높은 확신도로 top-1이면 차단
+모델 파일이 없으면 비활성화되며, 검증은 통과(fail-open) 처리합니다.
 """
+import os
+import threading
+import time
 from PIL import Image
 from typing import Optional, List, Dict
 
+import numpy as np
+
+from config.image_classifier import (
+    IMAGE_CLASSIFIER_ENABLED,
+    IMAGE_CLASSIFIER_MODEL_PATH,
+    IMAGE_CLASSIFIER_LABELS_PATH,
+    IMAGE_CLASSIFIER_ANIMAL_THRESHOLD,
+    IMAGE_CLASSIFIER_OBJECT_THRESHOLD,
+    IMAGE_CLASSIFIER_TOP_K
+)
+
+# ImageNet-1k 클래스 0~397번은 동물 (어류, 조류, 파충류, 포유류, 곤충 등)
+IMAGENET_ANIMAL_CLASS_END = 398
+IMAGENET_NUM_CLASSES = 1000
+
+# 인물 사진의 top-1으로 자주 나오는 사람/의상/액세서리 클래스 인덱스 (사물 차단에서 제외)
+# 라벨 이름 부분 문자열 매칭은 "boa" → boathouse, "hat" → hatchet, "cap" → bottlecap 등 무관한 사물까지 제외해 인덱스로 고정
+PERSON_CONTEXT_CLASS_INDICES = frozenset({
+    399,  # abaya
+    400,  # academic gown
+    411,  # apron
+    433,  # bathing cap
+    439,  # bearskin
+    443,  # bib
+    445,  # bikini
+    451,  # bolo tie
+    452,  # bonnet
+    457,  # bow tie
+    459,  # brassiere
+    465,  # bulletproof vest
+    474,  # cardigan
+    501,  # cloak
+    502,  # clog
+    514,  # cowboy boot
+    515,  # cowboy hat
+    529,  # diaper
+    552,  # feather boa
+    568,  # fur coat
+    578,  # gown
+    601,  # hoopskirt
+    608,  # jean
+    610,  # jersey
+    614,  # kimono
+    617,  # lab coat
+    629,  # lipstick
+    630,  # Loafer
+    638,  # maillot
+    639,  # maillot, tank suit
+    643,  # mask
+    652,  # military uniform
+    655,  # miniskirt
+    658,  # mitten
+    667,  # mortarboard
+    679,  # necklace
+    689,  # overskirt
+    697,  # pajama
+    735,  # poncho
+    770,  # running shoe
+    774,  # sandal
+    775,  # sarong
+    793,  # shower cap
+    796,  # ski mask
+    806,  # sock
+    808,  # sombrero
+    824,  # stole
+    834,  # suit
+    836,  # sunglass
+    837,  # sunglasses
+    841,  # sweatshirt
+    842,  # swimming trunks
+    869,  # trench coat
+    887,  # vestment
+    903,  # wig
+    906,  # Windsor tie
+    981,  # ballplayer
+    982,  # groom
+    983,  # scuba diver
+})
+
+# 라벨 파일 순서 확인용 기준 클래스 (동물 구간 경계 포함, 라벨 이름에 포함되어야 하는 단어)
+IMAGENET_LABEL_ANCHORS = {
+    0: "tench",
+    397: "puffer",
+    398: "abacus",
+    578: "gown",
+    834: "suit",
+    982: "groom",
+    999: "toilet tissue"
+}
+
+# ImageNet 정규화 값
+_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32)
+_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32)
+
+# 검증 에러 코드
+ERROR_ANIMAL_DETECTED = "ANIMAL_DETECTED"
+ERROR_NOT_A_PERSON = "NOT_A_PERSON"
+
+_ERROR_MESSAGES = {
+    ERROR_ANIMAL_DETECTED: "인물사진을 업로드해주세요.",
+    ERROR_NOT_A_PERSON: "사람이 나온 사진을 업로드해주세요."
+}
+
+
+def check_imagenet_labels(labels: List[str]):
+    """
+    라벨 파일이 ImageNet-1k 표준 순서인지 확인
+
+    동물 구간(0~397번)과 인물 클래스 인덱스는 표준 순서를 전제로 하므로,
+    다른 순서의 라벨 파일이면 ValueError (분류기 비활성화).
+    """
+    if len(labels) != IMAGENET_NUM_CLASSES:
+        raise ValueError(f"ImageNet 클래스 수가 {IMAGENET_NUM_CLASSES}개가 아닙니다: {len(labels)}개")
+    mismatched = [
+        f"{index}: {labels[index]!r} (기대: {name!r})"
+        for index, name in IMAGENET_LABEL_ANCHORS.items()
+        if name not in labels[index].lower()
+    ]
+    if mismatched:
+        raise ValueError(f"ImageNet 라벨 순서가 표준과 다릅니다 (동물 클래스 0~{IMAGENET_ANIMAL_CLASS_END - 1}번 전제): {', '.join(mismatched)}")
+
 
 class ImageClassifierService:
-    """이미지 분류 서비스 (현재 비활성화)"""
-    
-    def __init__(self, model_path: Optional[str] = None):
+    """이미지 분류 서비스 (로컬 ONNX ImageNet 분류 모델)"""
+
+    def __init__(self, model_path: Optional[str] = None, labels_path: Optional[str] = None):
         """
         초기화
-        
+
         Args:
-            model_path: 모델 파일 경로 (사용하지 않음)
+            model_path: ONNX 모델 파일 경로 (None이면 IMAGE_CLASSIFIER_MODEL_PATH)
+            labels_path: 클래스 이름 파일 경로 (None이면 IMAGE_CLASSIFIER_LABELS_PATH)
         """
-        self.model_path = model_path
+        self.model_path = model_path or IMAGE_CLASSIFIER_MODEL_PATH
+        self.labels_path = labels_path or IMAGE_CLASSIFIER_LABELS_PATH
+        self.session = None
+        self.labels: List[str] = []
         self.is_initialized = False
-        print("⚠️  ImageClassifierService는 MediaPipe 의존성 제거로 인해 비활성화되었습니다.")
-        print("   이미지 분류가 필요한 경우 HuggingFace Inference API를 사용하도록 변경하세요.")
-    
+
+        if not IMAGE_CLASSIFIER_ENABLED:
+            print("⚠️  ImageClassifierService 비활성화됨 (IMAGE_CLASSIFIER_ENABLED=false)")
+            return
+        if not os.path.exists(self.model_path) or not os.path.exists(self.labels_path):
+            print(f"⚠️  이미지 분류 모델 또는 클래스 파일이 없습니다: {self.model_path}, {self.labels_path}")
+            return
+
+        try:
+            from core.shared_weights import create_shared_onnx_session
+            from core.micro_batcher import register_batcher, make_onnx_batch_fn
+
+            self.session = create_shared_onnx_session(self.model_path)
+            model_input = self.session.get_inputs()[0]
+            self.input_name = model_input.name
+            self.channels_first = model_input.shape[1] == 3
+            self.input_size = int(model_input.shape[2] if self.channels_first else model_input.shape[1])
+            # 동시 업로드 검증을 한 번의 배치 추론으로 묶음
+            self.batcher = register_batcher("image_classifier", make_onnx_batch_fn(self.session, self.input_name))
+
+            with open(self.labels_path, encoding="utf-8") as f:
+                self.labels = [line.strip() for line in f if line.strip()]
+            check_imagenet_labels(self.labels)
+
+            self._person_context = np.zeros(IMAGENET_NUM_CLASSES, dtype=bool)
+            self._person_context[sorted(PERSON_CONTEXT_CLASS_INDICES)] = True
+            self.is_initialized = True
+            print(f"✅ 이미지 분류 모델 로드 완료: {self.model_path} (클래스 {len(self.labels)}개)")
+        except Exception as e:
+            print(f"⚠️  이미지 분류 모델 로드 실패: {e}")
+
+    def _preprocess(self, image: Image.Image) -> np.ndarray:
+        """짧은 변 리사이즈 + 중앙 crop + ImageNet 정규화 (배치 차원 없음)"""
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        resize_to = int(self.input_size * 256 / 224)
+        ratio = resize_to / min(image.size)
+        image = image.resize(
+            (max(resize_to, round(image.width * ratio)), max(resize_to, round(image.height * ratio))),
+            Image.Resampling.BILINEAR
+        )
+        left = (image.width - self.input_size) // 2
+        top = (image.height - self.input_size) // 2
+        image = image.crop((left, top, left + self.input_size, top + self.input_size))
+
+        tensor = (np.asarray(image, dtype=np.float32) / 255.0 - _MEAN) / _STD
+        if self.channels_first:
+            tensor = tensor.transpose(2, 0, 1)
+        return np.ascontiguousarray(tensor)
+
+    def predict_probabilities(self, image: Image.Image) -> Optional[np.ndarray]:
+        """클래스별 확률 (1000,) 또는 None (비활성화)"""
+        if not self.is_initialized:
+            return None
+        output = np.asarray(self.batcher.run([self._preprocess(image)])[0][0], dtype=np.float32).reshape(-1)
+        # 로짓을 출력하는 모델이면 softmax 적용
+        if output.min() < 0 or abs(float(output.sum()) - 1.0) > 1e-3:
+            output = np.exp(output - output.max())
+            output /= output.sum()
+        return output
+
     def classify_image(self, image: Image.Image) -> Optional[List[Dict]]:
         """
-        이미지를 분류 (현재 비활성화)
-        
+        이미지를 분류
+
         Args:
             image: PIL Image 객체
-            
+
         Returns:
-            None (서비스 비활성화)
+            상위 클래스 리스트 [{"index", "category_name", "score"}] 또는 None (비활성화)
         """
-        print("⚠️  이미지 분류 서비스가 비활성화되었습니다.")
-        return None
-    
+        probabilities = self.predict_probabilities(image)
+        if probabilities is None:
+            return None
+        return self._top_categories(probabilities)
+
+    def _top_categories(self, probabilities: np.ndarray) -> List[Dict]:
+        top = np.argsort(probabilities)[::-1][:IMAGE_CLASSIFIER_TOP_K]
+        return [
+            {"index": int(i), "category_name": self.labels[i], "score": float(probabilities[i])}
+            for i in top
+        ]
+
+    def check_person_image(self, image: Image.Image) -> Dict:
+        """
+        업로드 이미지가 인물 사진인지 검증
+
+        Returns:
+            {"valid", "error_code", "animal_score", "top_categories"}
+        """
+        probabilities = self.predict_probabilities(image)
+        if probabilities is None:
+            return {"valid": True, "error_code": None, "animal_score": None, "top_categories": []}
+
+        animal_score = float(probabilities[:IMAGENET_ANIMAL_CLASS_END].sum())
+        top_index = int(probabilities.argmax())
+        error_code = None
+        if animal_score >= IMAGE_CLASSIFIER_ANIMAL_THRESHOLD:
+            error_code = ERROR_ANIMAL_DETECTED
+        elif (
+            top_index >= IMAGENET_ANIMAL_CLASS_END
+            and not self._person_context[top_index]
+            and probabilities[top_index] >= IMAGE_CLASSIFIER_OBJECT_THRESHOLD
+        ):
+            error_code = ERROR_NOT_A_PERSON
+
+        return {
+            "valid": error_code is None,
+            "error_code": error_code,
+            "animal_score": round(animal_score, 4),
+            "top_categories": self._top_categories(probabilities)[:3]
+        }
+
     def is_person(self, image: Image.Image, threshold: float = 0.3) -> bool:
         """
         이미지에 사람이 있는지 판단
-        
+
         Args:
             image: PIL Image 객체
-            threshold: 사람 관련 클래스의 최소 신뢰도 (기본값: 0.3)
-            
+            threshold: 사용하지 않음 (IMAGE_CLASSIFIER_* 임계값 설정 사용, 호환용)
+
         Returns:
-            사람이 있으면 True, 없으면 False
+            인물 사진으로 판단되면 True (분류기 비활성화 시에도 True)
         """
-        categories = self.classify_image(image)
-        if not categories:
-            print("❌ 이미지 분류 결과 없음")
-            return False
-        
-        # 사람 관련 키워드 (정확한 매칭만 허용)
-        person_keywords = [
-            "person", "man", "woman", "girl", "boy", "child", "baby",
-            "people", "human", "bride", "groom", "bridegroom",
-            "lady", "gentleman", "adult", "teenager", "infant"
-        ]
-        
-        # 동물 관련 키워드 (제외)
-        animal_keywords = [
-            "animal", "dog", "cat", "bear", "monkey", "ape", "gorilla",
-            "orangutan", "chimpanzee", "elephant", "lion", "tiger",
-            "bird", "fish", "horse", "cow", "pig", "sheep", "goat",
-            "rabbit", "mouse", "rat", "hamster", "squirrel", "deer",
-            "wolf", "fox", "panda", "koala", "kangaroo", "zebra",
-            "giraffe", "camel", "donkey", "mule", "llama", "alpaca"
-        ]
-        
-        # 상위 결과 확인
-        print(f"이미지 분류 결과 (상위 5개):")
-        for i, category in enumerate(categories[:5]):
-            print(f"  {i+1}. {category['category_name']}: {category['score']:.2f}")
-        
-        # 상위 결과 중 사람 관련 클래스가 있는지 확인
-        for category in categories:
-            category_name_lower = category["category_name"].lower()
-            score = category["score"]
-            
-            # 동물 관련 키워드가 포함되어 있으면 즉시 차단
-            if any(keyword in category_name_lower for keyword in animal_keywords):
-                print(f"❌ 동물 감지: {category['category_name']} (신뢰도: {score:.2f}) - 차단")
-                return False
-            
-            # 사람 관련 키워드가 포함되어 있고 신뢰도가 임계값 이상이면 사람으로 판단
-            if any(keyword in category_name_lower for keyword in person_keywords):
-                if score >= threshold:
-                    print(f"✅ 사람 감지: {category['category_name']} (신뢰도: {score:.2f})")
-                    return True
-        
-        # 사람 관련 클래스가 없으면 차단
-        top_category = categories[0]['category_name'] if categories else 'None'
-        top_score = categories[0]['score'] if categories else 0
-        print(f"❌ 사람 감지 실패 - 상위 분류: {top_category} (신뢰도: {top_score:.2f})")
-        return False
+        return self.check_person_image(image)["valid"]
+
+
+# 검증 메트릭 (관리자 조회용)
+_metrics_lock = threading.Lock()
+_metrics = {
+    "checked": 0,
+    "passed": 0,
+    "skipped": 0,          # 분류기 비활성화 / 오류로 검증 생략
+    "rejected": {},        # 에러 코드별 차단 횟수
+    "by_endpoint": {},     # 엔드포인트별 차단 횟수
+    "total_time_ms": 0.0
+}
+
+
+def validate_person_upload(image: Image.Image, endpoint: str) -> Optional[Dict]:
+    """
+    업로드 이미지 인물 검증 (Gemini 등 업스트림 호출 전에 실행)
+
+    Args:
+        image: PIL Image
+        endpoint: 메트릭 집계용 엔드포인트 이름
+
+    Returns:
+        차단 시 {"error_code", "message", "animal_score", "top_categories"}, 통과 시 None
+    """
+    from core.model_loader import get_image_classifier_service
+
+    start = time.perf_counter()
+    result = None
+    try:
+        service = get_image_classifier_service()
+        if service is not None and service.is_initialized:
+            result = service.check_person_image(image)
+    except Exception as e:
+        print(f"[ImageClassifier] 인물 검증 오류 (통과 처리): {e}")
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    with _metrics_lock:
+        if result is None:
+            _metrics["skipped"] += 1
+            return None
+        _metrics["checked"] += 1
+        _metrics["total_time_ms"] += elapsed_ms
+        if result["valid"]:
+            _metrics["passed"] += 1
+            return None
+        code = result["error_code"]
+        _metrics["rejected"][code] = _metrics["rejected"].get(code, 0) + 1
+        _metrics["by_endpoint"][endpoint] = _metrics["by_endpoint"].get(endpoint, 0) + 1
+
+    print(f"[ImageClassifier] {endpoint} 업로드 차단: {code} (동물 확률 {result['animal_score']:.2f}, {elapsed_ms:.1f}ms)")
+    return {
+        "error_code": code,
+        "message": _ERROR_MESSAGES[code],
+        "animal_score": result["animal_score"],
+        "top_categories": result["top_categories"]
+    }
+
 
+def get_person_validation_metrics() -> Dict:
+    """인물 검증 메트릭 (검증/통과/생략 수, 에러 코드별·엔드포인트별 차단 수, 평균 소요 시간)"""
+    with _metrics_lock:
+        metrics = {
+            **_metrics,
+            "rejected": dict(_metrics["rejected"]),
+            "by_endpoint": dict(_metrics["by_endpoint"])
+        }
+    metrics["rejected_total"] = sum(metrics["rejected"].values())
+    metrics["avg_time_ms"] = round(metrics.pop("total_time_ms") / metrics["checked"], 2) if metrics["checked"] else None
+    return metrics
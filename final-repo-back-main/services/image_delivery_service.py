@@ -0,0 +1,96 @@
+"""
+이미지 전달 서비스 (presigned URL)
+
+IMAGE_DELIVERY_MODE가 redirect / presigned이면 이미지 바이트를 워커가 중계하지 않고
+브라우저가 presigned URL로 S3에서 직접 받도록 합니다.
+생성한 URL은 만료 IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC초 전까지 캐시해 재사용합니다 (같은 URL → 브라우저 캐시 적중).
+"""
+import time
+from typing import Dict, Iterable, Optional
+
+from core.ttl_cache import get_ttl_cache
+from core.s3_client import parse_s3_url, generate_presigned_get_url
+from config.image_delivery import (
+    IMAGE_DELIVERY_MODE,
+    IMAGE_PRESIGNED_URL_EXPIRES_SEC,
+    IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC,
+    IMAGE_PRESIGNED_URL_CACHE_SIZE
+)
+
+DELIVERY_PROXY = "proxy"
+DELIVERY_REDIRECT = "redirect"
+DELIVERY_PRESIGNED = "presigned"
+
+# (버킷 종류, 키) -> (URL, 만료 시각). 캐시 TTL = 유효 시간 - 갱신 여유
+_url_cache = get_ttl_cache(
+    "presigned_urls",
+    IMAGE_PRESIGNED_URL_CACHE_SIZE,
+    max(IMAGE_PRESIGNED_URL_EXPIRES_SEC - IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC, 0)
+)
+
+
+def is_redirect_delivery() -> bool:
+    """이미지 엔드포인트가 presigned URL로 리다이렉트하는지"""
+    return IMAGE_DELIVERY_MODE in (DELIVERY_REDIRECT, DELIVERY_PRESIGNED)
+
+
+def is_presigned_listing() -> bool:
+    """목록 API가 presigned URL을 함께 반환하는지"""
+    return IMAGE_DELIVERY_MODE == DELIVERY_PRESIGNED
+
+
+def get_presigned_url(bucket_kind: str, s3_key: str) -> Optional[Dict]:
+    """
+    캐시된(또는 새로 서명한) presigned GET URL
+
+    Returns:
+        {"url", "expires_at", "max_age"} 또는 None (S3 설정 누락).
+        max_age는 리다이렉트 응답을 브라우저가 재사용해도 되는 시간 (만료 - 갱신 여유까지)
+    """
+    cache_key = (bucket_kind, s3_key)
+    cached = _url_cache.get(cache_key)
+    if cached is None:
+        url = generate_presigned_get_url(
+            bucket_kind,
+            s3_key,
+            IMAGE_PRESIGNED_URL_EXPIRES_SEC,
+            response_cache_control=f"private, max-age={IMAGE_PRESIGNED_URL_EXPIRES_SEC}"
+        )
+        if url is None:
+            return None
+        cached = (url, time.time() + IMAGE_PRESIGNED_URL_EXPIRES_SEC)
+        _url_cache.set(cache_key, cached)
+
+    url, expires_at = cached
+    return {
+        "url": url,
+        "expires_at": expires_at,
+        "max_age": max(int(expires_at - IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC - time.time()), 0)
+    }
+
+
+def presign_stored_url(url: Optional[str]) -> Optional[str]:
+    """DB에 저장된 S3 URL의 presigned URL (설정된 버킷의 URL이 아니면 None)"""
+    location = parse_s3_url(url)
+    if location is None:
+        return None
+    presigned = get_presigned_url(*location)
+    return presigned["url"] if presigned else None
+
+
+def add_presigned_urls(row: Dict, fields: Iterable[str]) -> Dict:
+    """
+    목록 항목에 presigned URL 필드 추가 (presigned 모드에서만)
+
+    "url" → "presigned_url", "result_url" → "result_presigned_url"처럼 원래 필드는 그대로 두고 옆에 추가합니다.
+    """
+    if not is_presigned_listing():
+        return row
+    for field in fields:
+        row[field.replace("url", "presigned_url")] = presign_stored_url(row.get(field))
+    return row
+
+
+def invalidate_presigned_url(bucket_kind: str, s3_key: str):
+    """객체 삭제 시 캐시된 URL 제거"""
+    _url_cache.delete((bucket_kind, s3_key))
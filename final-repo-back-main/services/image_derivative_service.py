@@ -0,0 +1,256 @@
+"""
+카탈로그 이미지 파생본 서비스
+
+드레스 원본을 허용된 가로 크기 / 포맷(WebP, AVIF, JPEG) / 품질로 줄인 파생본을 만들어
+카탈로그 이미지 계층 캐시에 (원본 키, 파라미터) 단위로 저장합니다.
+- 캐시 키: "dresses/<파일명>@w<가로>.q<품질>.<포맷>" (원본 무효화 시 접두어로 함께 삭제)
+- ETag: 원본 ETag + 파라미터에서 계산. 원본이 바뀌면 ETag가 달라져 다시 생성
+"""
+import io
+import time
+import asyncio
+import hashlib
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from PIL import Image, ImageOps, features
+
+try:
+    import pillow_avif  # noqa: F401  (Pillow 11.2 미만에서 AVIF 인코더 등록)
+except ImportError:
+    pass
+
+from core.object_cache import CachedObject
+from core.image_codec import open_image
+from services.catalog_image_cache import get_catalog_image_cache, get_catalog_image_async
+from config.image_cache import IMAGE_CACHE_REVALIDATE_SEC
+from config.image_derivatives import (
+    IMAGE_DERIVATIVE_WIDTHS,
+    IMAGE_DERIVATIVE_QUALITIES,
+    IMAGE_DERIVATIVE_DEFAULT_QUALITY,
+    IMAGE_DERIVATIVE_THUMBNAIL_WIDTH,
+    IMAGE_DERIVATIVE_EAGER
+)
+
+FORMAT_AUTO = "auto"
+FORMAT_WEBP = "webp"
+FORMAT_AVIF = "avif"
+FORMAT_JPEG = "jpeg"
+
+# 포맷 -> (Pillow 포맷 이름, MIME 타입, 저장 옵션)
+_FORMATS = {
+    FORMAT_WEBP: ("WEBP", "image/webp", {"method": 4}),
+    FORMAT_AVIF: ("AVIF", "image/avif", {"speed": 6}),
+    FORMAT_JPEG: ("JPEG", "image/jpeg", {"optimize": True, "progressive": True})
+}
+
+# 같은 파생본의 동시 생성은 하나로 합침 (key -> Task)
+_inflight: Dict[str, asyncio.Task] = {}
+
+_metrics_lock = threading.Lock()
+_metrics = {
+    "requests": 0,
+    "cache_hits": 0,
+    "generated": 0,
+    "coalesced": 0,          # 진행 중인 생성 작업에 합류한 요청 수
+    "source_not_found": 0,
+    "generation_errors": 0,
+    "total_generation_ms": 0.0,
+    "source_bytes": 0,       # 생성에 사용한 원본 크기 합
+    "output_bytes": 0        # 생성된 파생본 크기 합
+}
+
+
+def _record(**counts):
+    with _metrics_lock:
+        for name, value in counts.items():
+            _metrics[name] += value
+
+
+def get_supported_formats() -> List[str]:
+    """현재 Pillow 빌드에서 인코딩 가능한 포맷 (AVIF는 Pillow 11.2+ 또는 pillow-avif-plugin 필요)"""
+    formats = [FORMAT_WEBP, FORMAT_JPEG]
+    if features.check("avif") or "AVIF" in Image.SAVE:
+        formats.insert(0, FORMAT_AVIF)
+    return formats
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Accept 헤더로 포맷 선택 (AVIF → WebP → JPEG)"""
+    accept = (accept or "").lower()
+    for fmt in get_supported_formats():
+        if fmt != FORMAT_JPEG and _FORMATS[fmt][1] in accept:
+            return fmt
+    return FORMAT_JPEG
+
+
+def validate_derivative_params(width: int, fmt: str, quality: int) -> Optional[str]:
+    """파라미터 허용 목록 검사. 문제가 있으면 오류 메시지, 없으면 None"""
+    if width not in IMAGE_DERIVATIVE_WIDTHS:
+        return f"허용되지 않은 가로 크기입니다: {width} (허용: {IMAGE_DERIVATIVE_WIDTHS})"
+    if fmt != FORMAT_AUTO and fmt not in get_supported_formats():
+        return f"지원하지 않는 포맷입니다: {fmt} (허용: {[FORMAT_AUTO] + get_supported_formats()})"
+    if quality not in IMAGE_DERIVATIVE_QUALITIES:
+        return f"허용되지 않은 품질 값입니다: {quality} (허용: {IMAGE_DERIVATIVE_QUALITIES})"
+    return None
+
+
+def derivative_key(file_name: str, width: int, fmt: str, quality: int) -> str:
+    return f"dresses/{file_name}@w{width}.q{quality}.{fmt}"
+
+
+def derivative_url(file_name: str, width: int = IMAGE_DERIVATIVE_THUMBNAIL_WIDTH, fmt: str = FORMAT_AUTO) -> str:
+    """파생본 엔드포인트 상대 URL (기본 품질)"""
+    url = f"/api/thumbnails/{quote(file_name)}?w={width}"
+    return url if fmt == FORMAT_AUTO else f"{url}&format={fmt}"
+
+
+def catalog_image_urls(file_name: str) -> Dict:
+    """카탈로그 목록용 파생본 URL (목록 썸네일 + 허용 크기별 URL)"""
+    return {
+        "thumbnail_url": derivative_url(file_name),
+        "derivative_urls": {str(width): derivative_url(file_name, width) for width in IMAGE_DERIVATIVE_WIDTHS}
+    }
+
+
+def render_derivative(data: bytes, width: int, fmt: str, quality: int) -> bytes:
+    """
+    원본 이미지 바이트로 파생본 생성
+
+    가로가 width보다 크면 비율을 유지해 줄이고(확대는 하지 않음), EXIF 회전을 반영합니다.
+    JPEG는 투명 영역을 흰 배경으로 채웁니다.
+    """
+    pil_format, _, save_options = _FORMATS[fmt]
+    with open_image(data) as source:
+        # JPEG 원본은 DCT 단계에서 미리 축소해 디코딩 비용 절감 (회전 전이므로 양변 모두 width 이상 유지)
+        source.draft("RGB", (width, width))
+        image = ImageOps.exif_transpose(source)
+
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+
+        has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+        if fmt == FORMAT_JPEG or not has_alpha:
+            if has_alpha:
+                image = image.convert("RGBA")
+                background = Image.new("RGB", image.size, (255, 255, 255))
+                background.paste(image, mask=image.getchannel("A"))
+                image = background
+            elif image.mode != "RGB":
+                image = image.convert("RGB")
+        elif image.mode != "RGBA":
+            image = image.convert("RGBA")
+
+        output = io.BytesIO()
+        image.save(output, format=pil_format, quality=quality, **save_options)
+        return output.getvalue()
+
+
+def _derivative_etag(source: CachedObject, key: str) -> str:
+    digest = hashlib.sha256(f"{source.etag}|{source.size}|{key}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _load_or_render(key: str, source: CachedObject, etag: str, width: int, fmt: str, quality: int) -> CachedObject:
+    """디스크 캐시 확인 후 없거나 원본이 바뀌었으면 생성 (블로킹, 스레드에서 실행)"""
+    cache = get_catalog_image_cache()
+    if cache.disk is not None:
+        cached = cache.disk.get(key)
+        if cached is not None and cached.etag == etag:
+            cache.memory.set(key, cached)
+            cache.mark_validated(key, cached)
+            _record(cache_hits=1)
+            return cached
+
+    start = time.perf_counter()
+    data = render_derivative(source.data, width, fmt, quality)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    obj = CachedObject(data, etag, source.last_modified, _FORMATS[fmt][1])
+    cache.set(key, obj)
+    _record(generated=1, total_generation_ms=elapsed_ms, source_bytes=source.size, output_bytes=len(data))
+    print(f"[ImageDerivative] 생성: {key} ({source.size // 1024}KB -> {len(data) // 1024}KB, {elapsed_ms:.0f}ms)")
+    return obj
+
+
+async def get_derivative_async(
+    file_name: str,
+    width: int,
+    fmt: str,
+    quality: int = IMAGE_DERIVATIVE_DEFAULT_QUALITY
+) -> Optional[CachedObject]:
+    """
+    파생본 조회 (캐시 → 생성)
+
+    Args:
+        file_name: 드레스 이미지 파일명
+        width: 허용 가로 크기 (validate_derivative_params로 미리 검사)
+        fmt: webp / avif / jpeg (auto는 호출 측에서 negotiate_format으로 결정)
+        quality: 허용 품질 값
+
+    Returns:
+        파생본 또는 None (원본 없음)
+    """
+    _record(requests=1)
+    key = derivative_key(file_name, width, fmt, quality)
+    cache = get_catalog_image_cache()
+    cached = cache.memory.get(key)
+    if cached is not None and time.time() - cached.validated_at < IMAGE_CACHE_REVALIDATE_SEC:
+        _record(cache_hits=1)
+        return cached
+
+    # 재검증 주기가 지났거나 캐시에 없으면 원본(계층 캐시, 필요 시 S3 재검증)의 ETag와 대조
+    source = await get_catalog_image_async(f"dresses/{file_name}")
+    if source is None:
+        _record(source_not_found=1)
+        return None
+    etag = _derivative_etag(source, key)
+    if cached is not None and cached.etag == etag:
+        cache.mark_validated(key, cached)
+        _record(cache_hits=1)
+        return cached
+
+    task = _inflight.get(key)
+    if task is not None:
+        _record(coalesced=1)
+    else:
+        task = asyncio.ensure_future(asyncio.to_thread(_load_or_render, key, source, etag, width, fmt, quality))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    try:
+        return await asyncio.shield(task)
+    except Exception:
+        _record(generation_errors=1)
+        raise
+
+
+async def warm_derivatives_async(file_name: str):
+    """IMAGE_DERIVATIVE_EAGER에 지정된 파생본 미리 생성 (드레스 업로드 직후 백그라운드 작업)"""
+    for spec in IMAGE_DERIVATIVE_EAGER:
+        width, _, fmt = spec.partition(":")
+        fmt = fmt or FORMAT_WEBP
+        if fmt not in get_supported_formats():
+            continue
+        try:
+            if await get_derivative_async(file_name, int(width), fmt) is None:
+                print(f"[ImageDerivative] 원본이 없어 미리 생성 중단: {file_name}")
+                return
+        except Exception as e:
+            print(f"[ImageDerivative] 미리 생성 실패 ({file_name}, {spec}): {e}")
+
+
+def get_derivative_metrics() -> Dict:
+    """파생본 요청 / 캐시 적중 / 생성 수, 평균 생성 시간, 원본 대비 크기 비율"""
+    with _metrics_lock:
+        metrics = dict(_metrics)
+    requests = metrics["requests"]
+    metrics["hit_rate"] = round(metrics["cache_hits"] / requests, 4) if requests else None
+    total_generation_ms = metrics.pop("total_generation_ms")
+    metrics["avg_generation_ms"] = round(total_generation_ms / metrics["generated"], 2) if metrics["generated"] else None
+    metrics["size_ratio"] = (
+        round(metrics["output_bytes"] / metrics["source_bytes"], 4) if metrics["source_bytes"] else None
+    )
+    metrics["widths"] = IMAGE_DERIVATIVE_WIDTHS
+    metrics["formats"] = get_supported_formats()
+    return metrics
@@ -292,6 +292,86 @@ def apply_sticker(
     return result
 
 
+def apply_filter_with_frame(
+    image: Image.Image,
+    filter_preset: str = "none",
+    frame_preset: str = "none",
+    frame_options: Optional[Dict] = None
+) -> Image.Image:
+    """
+    필터와 프레임(프리셋 또는 커스텀)을 한 번에 적용 (프로세스 풀 작업 1건)
+    
+    Args:
+        image: 원본 이미지 (PIL Image)
+        filter_preset: 필터 프리셋 이름
+        frame_preset: 프레임 프리셋 이름 ("none"이면 frame_options 사용)
+        frame_options: 커스텀 프레임 옵션 딕셔너리
+    
+    Returns:
+        처리된 이미지
+    """
+    result = apply_filter_preset(image, filter_preset)
+    
+    if frame_preset != "none":
+        result = apply_frame_preset(result, frame_preset)
+    elif frame_options:
+        result = apply_frame(
+            result,
+            frame_options.get("frame_type", "none"),
+            frame_options.get("frame_color", "#000000"),
+            frame_options.get("frame_width", 10),
+            frame_options.get("frame_image")
+        )
+    
+    return result
+
+
+def harmonize_colors(image: Image.Image, reference: Optional[Image.Image] = None) -> Image.Image:
+    """
+    Color Harmonization - 조명 및 색상 보정
+    
+    Args:
+        image: 원본 이미지 (PIL Image, RGB)
+        reference: 참조 이미지 (있으면 LAB a/b 채널 색상 전이, 없으면 CLAHE 자동 보정)
+    
+    Returns:
+        보정된 이미지 (RGB)
+    """
+    import cv2
+    import numpy as np
+    
+    # OpenCV 형식으로 변환
+    img_bgr = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+    
+    if reference is not None:
+        ref_bgr = cv2.cvtColor(np.array(reference), cv2.COLOR_RGB2BGR)
+        
+        # LAB 색공간으로 변환
+        img_lab = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2LAB)
+        ref_lab = cv2.cvtColor(ref_bgr, cv2.COLOR_BGR2LAB)
+        
+        # 색상 전이 (LAB 색공간에서)
+        img_lab[:, :, 1] = ref_lab[:, :, 1]  # a 채널
+        img_lab[:, :, 2] = ref_lab[:, :, 2]  # b 채널
+        
+        # BGR로 변환
+        result_bgr = cv2.cvtColor(img_lab, cv2.COLOR_LAB2BGR)
+    else:
+        # 자동 색상 보정 (CLAHE 사용)
+        lab = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2LAB)
+        l, a, b = cv2.split(lab)
+        
+        # CLAHE 적용 (대비 향상)
+        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        l = clahe.apply(l)
+        
+        # LAB 합성
+        lab = cv2.merge([l, a, b])
+        result_bgr = cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+    
+    return Image.fromarray(cv2.cvtColor(result_bgr, cv2.COLOR_BGR2RGB))
+
+
 def process_image_with_filters_and_stickers(
     image: Image.Image,
     filter_preset: str = "none",
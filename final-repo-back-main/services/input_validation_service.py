@@ -0,0 +1,306 @@
+"""
+업로드 이미지 입력 검증 서비스
+
+X.AI / Gemini 등 유료 업스트림 호출 전에 축소 디코딩한 이미지로 수 ms 안에 불량 입력을 걸러냅니다.
+
+검사 항목 (규칙 세트는 config.input_validation.VALIDATION_RULE_SETS):
+- 디코딩 / 잘린 파일
+- 해상도(짧은 변), 픽셀 수 상한(디코딩 전 헤더 기준), 극단적인 가로세로 비율
+- 균일도(빈 화면), 노출(평균 밝기, 포화 픽셀 비율), 흐림(Laplacian 분산), 흑백
+- (require_person) 로컬 분류기 인물 검증
+"""
+import time
+import asyncio
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from core.image_codec import open_image, ImageDecodeError, ImageTooLargeError
+from config.input_validation import (
+    INPUT_VALIDATION_ENABLED,
+    INPUT_VALIDATION_ANALYSIS_SIZE,
+    DEFAULT_VALIDATION_RULES,
+    VALIDATION_RULE_SETS
+)
+
+# 검증 에러 코드
+ERROR_DECODE_FAILED = "DECODE_FAILED"
+ERROR_TRUNCATED = "TRUNCATED"
+ERROR_TOO_LARGE = "TOO_LARGE"
+ERROR_TOO_SMALL = "TOO_SMALL"
+ERROR_EXTREME_ASPECT_RATIO = "EXTREME_ASPECT_RATIO"
+ERROR_UNIFORM = "UNIFORM"
+ERROR_UNDEREXPOSED = "UNDEREXPOSED"
+ERROR_OVEREXPOSED = "OVEREXPOSED"
+ERROR_BLURRY = "BLURRY"
+ERROR_GRAYSCALE = "GRAYSCALE"
+
+_ERROR_MESSAGES = {
+    ERROR_DECODE_FAILED: "이미지 파일을 읽을 수 없습니다. JPG 또는 PNG 이미지를 업로드해주세요.",
+    ERROR_TRUNCATED: "이미지 파일이 손상되었거나 업로드가 완료되지 않았습니다. 다시 업로드해주세요.",
+    ERROR_TOO_LARGE: "이미지 해상도가 너무 큽니다. 더 작은 이미지를 업로드해주세요.",
+    ERROR_TOO_SMALL: "이미지 해상도가 너무 낮습니다. 더 큰 이미지를 업로드해주세요.",
+    ERROR_EXTREME_ASPECT_RATIO: "이미지 가로세로 비율이 너무 극단적입니다.",
+    ERROR_UNIFORM: "빈 이미지이거나 내용이 거의 없는 이미지입니다.",
+    ERROR_UNDEREXPOSED: "이미지가 너무 어둡습니다. 밝은 곳에서 찍은 사진을 업로드해주세요.",
+    ERROR_OVEREXPOSED: "이미지가 너무 밝습니다. 노출이 적당한 사진을 업로드해주세요.",
+    ERROR_BLURRY: "이미지가 너무 흐립니다. 초점이 맞은 사진을 업로드해주세요.",
+    ERROR_GRAYSCALE: "흑백 이미지는 사용할 수 없습니다. 컬러 사진을 업로드해주세요."
+}
+
+# 인물 분류기 입력으로 쓸 축소 디코딩 최소 크기
+_PERSON_CHECK_SIZE = 512
+
+# 검증 메트릭 (관리자 조회용)
+_metrics_lock = threading.Lock()
+_metrics = {
+    "checked": 0,
+    "passed": 0,
+    "rejected": {},        # 에러 코드별 차단 횟수
+    "by_endpoint": {},     # 엔드포인트별 {"checked", "rejected"}
+    "errors": 0,           # 검증기 내부 오류 (통과 처리)
+    "total_time_ms": 0.0
+}
+
+
+def get_rules(rule_set: str) -> Dict:
+    """규칙 세트 이름으로 기본 규칙을 덮어쓴 규칙 반환"""
+    if rule_set not in VALIDATION_RULE_SETS:
+        raise ValueError(f"알 수 없는 입력 검증 규칙 세트: {rule_set}")
+    return {**DEFAULT_VALIDATION_RULES, **VALIDATION_RULE_SETS[rule_set]}
+
+
+def _reason(code: str, value=None, limit=None) -> Dict:
+    return {"code": code, "message": _ERROR_MESSAGES[code], "value": value, "limit": limit}
+
+
+def _decode_downscaled(data: bytes, rules: Dict) -> Tuple[Optional[Image.Image], Optional[Dict], Dict]:
+    """
+    헤더 검사 후 축소 디코딩
+
+    Returns:
+        (축소 RGB 이미지 또는 None, 차단 사유 또는 None, {"width", "height", "format"})
+    """
+    try:
+        # 픽셀 수 상한은 규칙 세트 값으로 아래에서 검사 (Pillow 전역 한도의 2배 초과는 open_image가 거부)
+        image = open_image(data, max_pixels=0)
+    except ImageTooLargeError:
+        return None, _reason(ERROR_TOO_LARGE, None, rules["max_pixels"]), {}
+    except ImageDecodeError:
+        return None, _reason(ERROR_DECODE_FAILED), {}
+
+    width, height = image.size
+    info = {"width": width, "height": height, "format": image.format}
+
+    # 디코딩 전에 헤더 크기로 차단 (압축 폭탄 방지)
+    if width * height > rules["max_pixels"]:
+        return None, _reason(ERROR_TOO_LARGE, width * height, rules["max_pixels"]), info
+
+    # JPEG는 DCT 축소 디코딩 (필요한 크기 이상으로만 줄어듦)
+    target = max(INPUT_VALIDATION_ANALYSIS_SIZE, _PERSON_CHECK_SIZE if rules["require_person"] else 0)
+    image.draft("RGB", (target, target))
+    try:
+        image.load()
+    except OSError as e:
+        code = ERROR_TRUNCATED if "truncated" in str(e).lower() else ERROR_DECODE_FAILED
+        return None, _reason(code), info
+    except Exception:
+        return None, _reason(ERROR_DECODE_FAILED), info
+
+    info["grayscale_mode"] = image.mode in ("1", "L", "LA", "I", "I;16", "F")
+    if image.mode != "RGB":
+        # 투명 영역은 흰 배경으로 간주 (의상 누끼 PNG)
+        if image.mode in ("RGBA", "LA", "P"):
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, (255, 255, 255))
+            image.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            image = image.convert("RGB")
+    return image, None, info
+
+
+def _max_tile_std(gray: np.ndarray, tile: int = 32) -> float:
+    """타일별 밝기 표준편차 중 최대값 (넓은 단색 배경이 전체 표준편차를 낮추는 이미지용)"""
+    if min(gray.shape) < tile:
+        return float(gray.std())
+    rows, cols = gray.shape[0] // tile, gray.shape[1] // tile
+    tiles = gray[:rows * tile, :cols * tile].reshape(rows, tile, cols, tile).astype(np.float32)
+    return float(tiles.std(axis=(1, 3)).max())
+
+
+def _quality_reasons(image: Image.Image, rules: Dict, info: Dict) -> Tuple[List[Dict], Dict]:
+    """축소 이미지의 균일도 / 노출 / 흐림 / 흑백 검사"""
+    scale = INPUT_VALIDATION_ANALYSIS_SIZE / max(image.size)
+    if scale < 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        image = image.resize(size, Image.Resampling.BILINEAR)
+    rgb = np.asarray(image, dtype=np.uint8)
+    gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+
+    brightness = float(gray.mean())
+    std = float(gray.std()) if rules["min_std_scope"] != "tile" else _max_tile_std(gray)
+    clipped = float(np.count_nonzero((gray <= 5) | (gray >= 250)) / gray.size)
+    blur = float(cv2.Laplacian(gray, cv2.CV_64F).var())
+    # 채널 간 평균 차이가 작으면 흑백 (세피아 등 약한 색조 포함)
+    channels = rgb.astype(np.int16)
+    chroma = float(np.abs(channels[:, :, 0] - channels[:, :, 1]).mean() + np.abs(channels[:, :, 1] - channels[:, :, 2]).mean())
+
+    stats = {
+        "brightness": round(brightness, 1),
+        "contrast": round(std, 1),
+        "clipped_ratio": round(clipped, 3),
+        "blur_variance": round(blur, 1),
+        "chroma": round(chroma, 2)
+    }
+
+    reasons = []
+    if std < rules["min_std"]:
+        # 단색 이미지는 노출/흐림도 함께 걸리므로 균일도 사유만 반환
+        return [_reason(ERROR_UNIFORM, stats["contrast"], rules["min_std"])], stats
+    if brightness < rules["min_brightness"]:
+        reasons.append(_reason(ERROR_UNDEREXPOSED, stats["brightness"], rules["min_brightness"]))
+    elif brightness > rules["max_brightness"]:
+        reasons.append(_reason(ERROR_OVEREXPOSED, stats["brightness"], rules["max_brightness"]))
+    elif clipped > rules["max_clipped_ratio"]:
+        code = ERROR_UNDEREXPOSED if brightness < 128 else ERROR_OVEREXPOSED
+        reasons.append(_reason(code, stats["clipped_ratio"], rules["max_clipped_ratio"]))
+    if rules["min_blur_variance"] and blur < rules["min_blur_variance"]:
+        reasons.append(_reason(ERROR_BLURRY, stats["blur_variance"], rules["min_blur_variance"]))
+    if not rules["allow_grayscale"] and (info.get("grayscale_mode") or chroma < 2.0):
+        reasons.append(_reason(ERROR_GRAYSCALE, stats["chroma"], 2.0))
+    return reasons, stats
+
+
+def validate_image_bytes(data: bytes, rule_set: str, endpoint: str = "unknown") -> Dict:
+    """
+    업로드 이미지 바이트 검증
+
+    Args:
+        data: 업로드 원본 바이트
+        rule_set: 규칙 세트 이름 ("person", "garment", "background", "body", "face")
+        endpoint: 인물 검증 메트릭 집계용 엔드포인트 이름
+
+    Returns:
+        {"valid", "error_code", "message", "reasons", "image": {"width", "height", "format", ...}, "time_ms"}
+    """
+    start = time.perf_counter()
+    rules = get_rules(rule_set)
+    reasons: List[Dict] = []
+    image_info: Dict = {}
+
+    image, decode_reason, image_info = _decode_downscaled(data, rules)
+    if decode_reason:
+        reasons.append(decode_reason)
+    else:
+        width, height = image_info["width"], image_info["height"]
+        if min(width, height) < rules["min_side"]:
+            reasons.append(_reason(ERROR_TOO_SMALL, min(width, height), rules["min_side"]))
+        aspect = max(width, height) / max(1, min(width, height))
+        if aspect > rules["max_aspect_ratio"]:
+            reasons.append(_reason(ERROR_EXTREME_ASPECT_RATIO, round(aspect, 2), rules["max_aspect_ratio"]))
+
+        quality_reasons, stats = _quality_reasons(image, rules, image_info)
+        reasons += quality_reasons
+        image_info.update(stats)
+
+        # 인물 검증은 다른 검사를 모두 통과한 경우에만 (분류기 추론이 가장 비쌈)
+        if not reasons and rules["require_person"]:
+            from services.image_classifier_service import validate_person_upload
+
+            rejection = validate_person_upload(image, endpoint)
+            if rejection:
+                reasons.append({
+                    "code": rejection["error_code"],
+                    "message": rejection["message"],
+                    "value": rejection["animal_score"],
+                    "limit": None
+                })
+                image_info["top_categories"] = rejection["top_categories"]
+
+    image_info.pop("grayscale_mode", None)
+    return {
+        "valid": not reasons,
+        "error_code": reasons[0]["code"] if reasons else None,
+        "message": reasons[0]["message"] if reasons else None,
+        "reasons": reasons,
+        "image": image_info,
+        "time_ms": round((time.perf_counter() - start) * 1000, 2)
+    }
+
+
+def _record(endpoint: str, result: Optional[Dict], elapsed_ms: float):
+    with _metrics_lock:
+        endpoint_metrics = _metrics["by_endpoint"].setdefault(endpoint, {"checked": 0, "rejected": 0})
+        endpoint_metrics["checked"] += 1
+        _metrics["checked"] += 1
+        _metrics["total_time_ms"] += elapsed_ms
+        if result is None:
+            _metrics["errors"] += 1
+            _metrics["passed"] += 1
+        elif result["valid"]:
+            _metrics["passed"] += 1
+        else:
+            endpoint_metrics["rejected"] += 1
+            for reason in result["reasons"]:
+                _metrics["rejected"][reason["code"]] = _metrics["rejected"].get(reason["code"], 0) + 1
+
+
+def validate_upload_images(uploads: Dict[str, Tuple[bytes, str]], endpoint: str) -> Optional[Dict]:
+    """
+    엔드포인트 업로드 이미지 일괄 검증 (첫 번째 실패 필드에서 중단)
+
+    Args:
+        uploads: {필드 이름: (업로드 바이트, 규칙 세트 이름)}
+        endpoint: 메트릭 집계용 엔드포인트 이름
+
+    Returns:
+        차단 시 {"error", "error_code", "message", "field", "reasons"}, 통과 시 None
+    """
+    if not INPUT_VALIDATION_ENABLED:
+        return None
+
+    for field, (data, rule_set) in uploads.items():
+        start = time.perf_counter()
+        try:
+            result = validate_image_bytes(data, rule_set, endpoint)
+        except Exception as e:
+            # 검증기 자체 오류는 요청을 막지 않음 (fail-open)
+            print(f"[InputValidation] {endpoint} {field} 검증 오류 (통과 처리): {e}")
+            result = None
+        _record(endpoint, result, (time.perf_counter() - start) * 1000)
+
+        if result is not None and not result["valid"]:
+            codes = ", ".join(reason["code"] for reason in result["reasons"])
+            print(f"[InputValidation] {endpoint} {field} 차단: {codes} ({result['time_ms']:.1f}ms)")
+            return {
+                "error": "Invalid input",
+                "error_code": result["error_code"],
+                "message": result["message"],
+                "field": field,
+                "reasons": result["reasons"]
+            }
+    return None
+
+
+async def validate_upload_images_async(uploads: Dict[str, Tuple[bytes, str]], endpoint: str) -> Optional[Dict]:
+    """validate_upload_images를 스레드에서 실행 (이벤트 루프 블로킹 방지)"""
+    if not INPUT_VALIDATION_ENABLED:
+        return None
+    return await asyncio.to_thread(validate_upload_images, uploads, endpoint)
+
+
+def get_input_validation_metrics() -> Dict:
+    """입력 검증 메트릭 (검증/통과 수, 에러 코드별·엔드포인트별 차단 수, 평균 소요 시간)"""
+    with _metrics_lock:
+        metrics = {
+            **_metrics,
+            "rejected": dict(_metrics["rejected"]),
+            "by_endpoint": {name: dict(value) for name, value in _metrics["by_endpoint"].items()}
+        }
+    metrics["enabled"] = INPUT_VALIDATION_ENABLED
+    metrics["rejected_total"] = metrics["checked"] - metrics["passed"]
+    metrics["avg_time_ms"] = round(metrics.pop("total_time_ms") / metrics["checked"], 2) if metrics["checked"] else None
+    return metrics
@@ -0,0 +1,172 @@
+"""
+로컬 포즈 추정 백엔드
+원격 HF Space(MediaPipe API)와 같은 33개 키포인트를 (33, 4) float32 배열(x, y, z, visibility)로 반환
+(core/body_measurements.py 형식, API 응답용 딕셔너리 변환은 PoseLandmarkService.extract_landmarks에서만 수행)
+"""
+import threading
+from typing import List, Optional
+
+import numpy as np
+from PIL import Image
+
+from config.pose_backend import (
+    MEDIAPIPE_POSE_MODEL_PATH,
+    MEDIAPIPE_POSE_NUM_POSES,
+    POSE_ONNX_MODEL_PATH,
+    POSE_MIN_DETECTION_CONFIDENCE,
+    POSE_LOCAL_MAX_SIDE
+)
+from core.body_measurements import LANDMARK_COUNT, LANDMARK_DTYPE
+
+POSE_LANDMARK_COUNT = LANDMARK_COUNT
+
+# 모델 레지스트리 등록 이름
+POSE_BACKEND_MODEL_NAMES = {
+    "mediapipe": "pose_mediapipe",
+    "onnx": "pose_onnx"
+}
+
+
+def _prepare_image(image: Image.Image) -> Image.Image:
+    """RGB 변환 및 최대 변 길이 제한"""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    if max(image.size) > POSE_LOCAL_MAX_SIDE:
+        ratio = POSE_LOCAL_MAX_SIDE / max(image.size)
+        image = image.resize(
+            (max(1, round(image.width * ratio)), max(1, round(image.height * ratio))),
+            Image.Resampling.BILINEAR
+        )
+    return image
+
+
+class MediaPipePoseBackend:
+    """MediaPipe Pose Landmarker (CPU, IMAGE 모드)"""
+
+    name = "mediapipe"
+
+    def __init__(self, model_path: str = MEDIAPIPE_POSE_MODEL_PATH, num_poses: int = MEDIAPIPE_POSE_NUM_POSES):
+        import mediapipe as mp
+        from mediapipe.tasks import python as mp_tasks
+        from mediapipe.tasks.python import vision
+
+        self._mp = mp
+        options = vision.PoseLandmarkerOptions(
+            base_options=mp_tasks.BaseOptions(
+                model_asset_path=model_path,
+                delegate=mp_tasks.BaseOptions.Delegate.CPU
+            ),
+            running_mode=vision.RunningMode.IMAGE,
+            num_poses=num_poses,
+            min_pose_detection_confidence=POSE_MIN_DETECTION_CONFIDENCE,
+            min_pose_presence_confidence=POSE_MIN_DETECTION_CONFIDENCE,
+            output_segmentation_masks=False
+        )
+        self.landmarker = vision.PoseLandmarker.create_from_options(options)
+        # PoseLandmarker는 스레드 안전하지 않으므로 추론 직렬화
+        self._lock = threading.Lock()
+        print(f"[PoseBackend] MediaPipe Pose Landmarker 로드 완료: {model_path}")
+
+    def detect(self, image: Image.Image) -> List[np.ndarray]:
+        """
+        포즈 랜드마크 감지
+
+        Returns:
+            사람별 (33, 4) 랜드마크 배열 리스트 (감지되지 않으면 빈 리스트)
+        """
+        image = _prepare_image(image)
+        mp_image = self._mp.Image(image_format=self._mp.ImageFormat.SRGB, data=np.asarray(image))
+        with self._lock:
+            result = self.landmarker.detect(mp_image)
+
+        return [
+            np.array(
+                [
+                    (landmark.x, landmark.y, landmark.z, landmark.visibility if landmark.visibility is not None else 1.0)
+                    for landmark in pose[:POSE_LANDMARK_COUNT]
+                ],
+                dtype=LANDMARK_DTYPE
+            )
+            for pose in result.pose_landmarks
+            if len(pose) >= POSE_LANDMARK_COUNT
+        ]
+
+
+class OnnxPoseBackend:
+    """
+    ONNX 포즈 랜드마크 모델 (BlazePose GHUM 랜드마크 모델 변환본, 1인)
+
+    - 입력: (1, H, W, 3) 또는 (1, 3, H, W) float32 [0, 1]
+    - 출력 0: (1, 195) = 39개 × (x, y, z, visibility, presence), 입력 픽셀 좌표 (앞 33개 사용)
+    - 출력 1: (1, 1) 포즈 존재 확률
+    이미지 전체를 정사각형으로 패딩해 입력하므로 전신 1인 사진을 가정합니다.
+    """
+
+    name = "onnx"
+
+    def __init__(self, model_path: str = POSE_ONNX_MODEL_PATH):
+        from core.shared_weights import create_shared_onnx_session
+        from core.micro_batcher import register_batcher, make_onnx_batch_fn
+
+        self.session = create_shared_onnx_session(model_path)
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        shape = model_input.shape
+        self.channels_first = shape[1] == 3
+        self.input_size = int(shape[2] if self.channels_first else shape[1])
+        # 동시 요청을 한 번의 배치 추론으로 묶음
+        self.batcher = register_batcher(POSE_BACKEND_MODEL_NAMES[self.name], make_onnx_batch_fn(self.session, self.input_name))
+        print(f"[PoseBackend] ONNX 포즈 모델 로드 완료: {model_path} (입력 {self.input_size}px)")
+
+    def detect(self, image: Image.Image) -> List[np.ndarray]:
+        """포즈 랜드마크 감지 (1인 (33, 4) 배열, 감지되지 않으면 빈 리스트)"""
+        image = _prepare_image(image)
+        width, height = image.size
+        side = max(width, height)
+        pad_x, pad_y = (side - width) // 2, (side - height) // 2
+
+        # 정사각형 패딩 후 모델 입력 크기로 리사이즈
+        canvas = Image.new("RGB", (side, side), (0, 0, 0))
+        canvas.paste(image, (pad_x, pad_y))
+        canvas = canvas.resize((self.input_size, self.input_size), Image.Resampling.BILINEAR)
+        tensor = np.asarray(canvas, dtype=np.float32) / 255.0
+        if self.channels_first:
+            tensor = tensor.transpose(2, 0, 1)
+
+        outputs = self.batcher.run([np.ascontiguousarray(tensor)])[0]
+        if len(outputs) > 1 and float(np.asarray(outputs[1]).reshape(-1)[0]) < POSE_MIN_DETECTION_CONFIDENCE:
+            return []
+
+        raw = np.asarray(outputs[0], dtype=np.float32).reshape(-1, 5)[:POSE_LANDMARK_COUNT]
+        scale = side / self.input_size
+        x = (raw[:, 0] * scale - pad_x) / width
+        y = (raw[:, 1] * scale - pad_y) / height
+        z = raw[:, 2] * scale / width
+        visibility = 1.0 / (1.0 + np.exp(-raw[:, 3]))
+
+        return [np.stack([x, y, z, visibility], axis=1).astype(LANDMARK_DTYPE, copy=False)]
+
+
+def load_pose_backend(backend: str):
+    """백엔드 이름으로 로컬 포즈 백엔드 생성 (모델 레지스트리 로더)"""
+    if backend == "mediapipe":
+        return MediaPipePoseBackend()
+    if backend == "onnx":
+        return OnnxPoseBackend()
+    raise ValueError(f"지원하지 않는 로컬 포즈 백엔드입니다: {backend}")
+
+
+def get_local_pose_backend(backend: str) -> Optional[object]:
+    """
+    모델 레지스트리에서 로컬 포즈 백엔드 반환 (첫 사용 시 로드)
+
+    Returns:
+        백엔드 인스턴스 또는 None (등록되지 않음)
+    """
+    from core.model_registry import get_model_registry
+
+    model_name = POSE_BACKEND_MODEL_NAMES.get(backend)
+    registry = get_model_registry()
+    if model_name is None or not registry.is_registered(model_name):
+        return None
+    return registry.get(model_name)
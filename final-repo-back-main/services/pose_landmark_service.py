@@ -1,33 +1,42 @@
 """
 포즈 랜드마크 서비스
-HuggingFace Spaces에 배포된 MediaPipe Pose API를 사용하여 포즈 랜드마크 추출
+HuggingFace Spaces에 배포된 MediaPipe Pose API 또는 로컬 백엔드(MediaPipe CPU / ONNX)로 포즈 랜드마크 추출
 """
 import os
 import io
 import requests
 from PIL import Image
-from typing import Optional, List, Dict
+import numpy as np
+from typing import Optional, List, Dict, Union
 from config.settings import MEDIAPIPE_SPACE_URL
+from config.pose_backend import POSE_BACKEND, POSE_FALLBACK_TO_REMOTE, POSE_LOCAL_WHEN_REMOTE_WARMING
+from core.upstream_warmer import record_upstream_result, is_upstream_warming, UPSTREAM_MEDIAPIPE_POSE
+from services.pose_backends import get_local_pose_backend
+from core.body_measurements import landmarks_to_array, array_to_landmarks, select_best_person
 
 
 class PoseLandmarkService:
-    """포즈 랜드마크 서비스 (HuggingFace Spaces API 기반)"""
+    """포즈 랜드마크 서비스 (HuggingFace Spaces API / 로컬 백엔드)"""
     
-    def __init__(self, space_url: Optional[str] = None):
+    def __init__(self, space_url: Optional[str] = None, backend: Optional[str] = None):
         """
         초기화
         
         Args:
             space_url: HuggingFace Spaces URL (None이면 설정에서 가져옴)
+            backend: 포즈 백엔드 ("remote" / "mediapipe" / "onnx", None이면 POSE_BACKEND 설정)
         """
         self.space_url = space_url or MEDIAPIPE_SPACE_URL
-        self.is_initialized = True  # API 서비스는 항상 초기화됨
-        print(f"[PoseLandmarkService] 초기화 완료 - Space URL: {self.space_url}")
+        self.backend = (backend or POSE_BACKEND).lower()
+        self.is_initialized = True  # API 서비스는 항상 초기화됨 (로컬 모델은 첫 사용 시 로드)
+        print(f"[PoseLandmarkService] 초기화 완료 - 백엔드: {self.backend}, Space URL: {self.space_url}")
     
     
     def extract_landmarks(self, image: Image.Image) -> Optional[List[Dict]]:
         """
-        이미지에서 포즈 랜드마크 추출
+        이미지에서 포즈 랜드마크 추출 (API 응답용 딕셔너리 리스트)
+        
+        체형 계산에는 변환 없는 extract_landmark_array를 사용합니다.
         
         Args:
             image: PIL Image 객체
@@ -35,10 +44,67 @@ class PoseLandmarkService:
         Returns:
             랜드마크 좌표 리스트 (33개 포인트) 또는 None
         """
+        landmarks = self._extract(image)
+        return array_to_landmarks(landmarks) if isinstance(landmarks, np.ndarray) else landmarks
+    
+    def extract_landmark_array(self, image: Image.Image) -> Optional[np.ndarray]:
+        """
+        이미지에서 포즈 랜드마크를 (33, 4) float32 배열로 추출
+        
+        로컬 백엔드 결과는 변환 없이 그대로, 원격 API 응답(JSON)은 한 번만 배열로 변환합니다.
+        
+        Returns:
+            (x, y, z, visibility) 배열 또는 None (33개 미만 감지 시)
+        """
+        return landmarks_to_array(self._extract(image))
+    
+    def _extract(self, image: Image.Image) -> Union[np.ndarray, List[Dict], None]:
+        """
+        백엔드 라우팅 (로컬 백엔드는 (33, 4) 배열, 원격 API는 딕셔너리 리스트 반환)
+        
+        POSE_BACKEND 설정에 따라 로컬 백엔드(MediaPipe CPU / ONNX)를 우선 사용하고,
+        로컬 백엔드를 사용할 수 없거나, 추론 중 오류가 나거나, 사람을 감지하지 못하면 원격 API로 폴백합니다.
+        원격 Space가 콜드 스타트 중(upstream warmer "warming")이면:
+        - POSE_BACKEND=remote: POSE_LOCAL_WHEN_REMOTE_WARMING 로컬 백엔드를 먼저 사용
+        - 로컬 백엔드 실패 후 폴백: 원격 호출을 건너뜀 (모델 로딩 대기로 타임아웃까지 막히지 않도록)
+        """
         if not self.is_initialized:
             print("[PoseLandmarkService] ⚠️ 서비스가 초기화되지 않았습니다.")
             return None
         
+        remote_warming = is_upstream_warming(UPSTREAM_MEDIAPIPE_POSE)
+        local_name = self.backend
+        if self.backend == "remote":
+            local_name = POSE_LOCAL_WHEN_REMOTE_WARMING if remote_warming else ""
+        
+        if local_name:
+            try:
+                local_backend = get_local_pose_backend(local_name)
+                if local_backend is not None:
+                    people = local_backend.detect(image)
+                    if people:
+                        return select_best_person(people)
+                    print(f"[PoseLandmarkService] 로컬 백엔드 '{local_name}'에서 사람을 감지하지 못했습니다.")
+                    if self.backend == "remote":
+                        # 원격이 콜드 스타트 중이라 로컬을 대신 쓴 경우 (원격 재시도는 모델 로딩 대기로 막힘)
+                        return None
+                else:
+                    print(f"[PoseLandmarkService] 로컬 백엔드 '{local_name}'가 등록되지 않았습니다.")
+            except Exception as e:
+                print(f"[PoseLandmarkService] 로컬 백엔드 '{local_name}' 오류: {e}")
+            
+            if self.backend != "remote":
+                if not POSE_FALLBACK_TO_REMOTE:
+                    return None
+                if remote_warming:
+                    print("[PoseLandmarkService] 원격 API가 콜드 스타트 중이라 폴백을 건너뜀")
+                    return None
+                print("[PoseLandmarkService] 원격 API로 폴백")
+        
+        return self._extract_landmarks_remote(image)
+    
+    def _extract_landmarks_remote(self, image: Image.Image) -> Optional[List[Dict]]:
+        """원격 HF Space MediaPipe API로 포즈 랜드마크 추출"""
         try:
             # 이미지가 너무 크면 리사이즈
             max_size = 1920
@@ -69,6 +135,7 @@ class PoseLandmarkService:
                 files=files,
                 timeout=30
             )
+            record_upstream_result(UPSTREAM_MEDIAPIPE_POSE, response.status_code)
             
             if response.status_code != 200:
                 return None
@@ -170,6 +237,10 @@ class PoseLandmarkService:
             
             return None
             
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            # HF Space 슬립/재시작 중
+            record_upstream_result(UPSTREAM_MEDIAPIPE_POSE, None)
+            return None
         except Exception as e:
             return None
     
@@ -9,13 +9,15 @@ from PIL import Image
 from google import genai
 
 from core.xai_client import generate_prompt_from_images
-from core.s3_client import upload_log_to_s3
+from core.s3_client import upload_log_to_s3_async
 # SegFormer B2 Garment Parsing (HuggingFace Inference API)
 from core.segformer_garment_parser import parse_garment_image
 from services.image_service import preprocess_dress_image
 from services.log_service import save_test_log
 from config.settings import GEMINI_FLASH_MODEL, GEMINI_3_FLASH_MODEL, XAI_PROMPT_MODEL
 from core.gemini_client import get_gemini_client_pool
+from core.image_codec import decode_image, save_png
+from core.cpu_pool import run_cpu_task
 
 
 async def generate_unified_tryon(
@@ -53,7 +55,7 @@ async def generate_unified_tryon(
     try:
         # 1. 이미지 전처리
         print("드레스 이미지 전처리 시작...")
-        dress_img_processed = preprocess_dress_image(dress_img, target_size=1024)
+        dress_img_processed = await run_cpu_task(preprocess_dress_image, dress_img, 1024)
         print("드레스 이미지 전처리 완료")
         
         # 원본 인물 이미지 크기 저장
@@ -72,16 +74,16 @@ async def generate_unified_tryon(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         dress_buffered = io.BytesIO()
-        dress_img_processed.save(dress_buffered, format="PNG")
-        dress_s3_url = upload_log_to_s3(dress_buffered.getvalue(), model_id, "dress") or ""
+        save_png(dress_img_processed, dress_buffered)
+        dress_s3_url = await upload_log_to_s3_async(dress_buffered.getvalue(), model_id, "dress") or ""
         
         background_buffered = io.BytesIO()
-        background_img_processed.save(background_buffered, format="PNG")
-        background_s3_url = upload_log_to_s3(background_buffered.getvalue(), model_id, "background") or ""
+        save_png(background_img_processed, background_buffered)
+        background_s3_url = await upload_log_to_s3_async(background_buffered.getvalue(), model_id, "background") or ""
         
         # 2. X.AI 프롬프트 생성
         print("\n" + "="*80)
@@ -304,10 +306,10 @@ BACKGROUND RULES:
         # 4. 결과 이미지 처리 및 S3 업로드
         result_image_base64 = base64.b64encode(image_parts[0]).decode()
         
-        result_img = Image.open(io.BytesIO(image_parts[0]))
+        result_img = decode_image(image_parts[0], mode=None)
         result_buffered = io.BytesIO()
-        result_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+        save_png(result_img, result_buffered)
+        result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
         
         run_time = time.time() - start_time
         
@@ -400,7 +402,7 @@ async def generate_unified_tryon_v2(
     try:
         # 1. 의상 이미지 전처리
         print("의상 이미지 전처리 시작...")
-        garment_img_processed = preprocess_dress_image(garment_img, target_size=1024)
+        garment_img_processed = await run_cpu_task(preprocess_dress_image, garment_img, 1024)
         print("의상 이미지 전처리 완료")
         
         # 2. SegFormer B2 Garment Parsing - garment_only 이미지 추출
@@ -416,12 +418,12 @@ async def generate_unified_tryon_v2(
             
             # S3에 입력 이미지 업로드 (실패 로그용)
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             garment_buffered = io.BytesIO()
-            garment_img_processed.save(garment_buffered, format="PNG")
-            garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+            save_png(garment_img_processed, garment_buffered)
+            garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -448,12 +450,12 @@ async def generate_unified_tryon_v2(
             run_time = time.time() - start_time
             
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             garment_buffered = io.BytesIO()
-            garment_img_processed.save(garment_buffered, format="PNG")
-            garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+            save_png(garment_img_processed, garment_buffered)
+            garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -492,20 +494,20 @@ async def generate_unified_tryon_v2(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         garment_buffered = io.BytesIO()
-        garment_img_processed.save(garment_buffered, format="PNG")
-        garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+        save_png(garment_img_processed, garment_buffered)
+        garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
         
         garment_only_buffered = io.BytesIO()
-        garment_only_img.save(garment_only_buffered, format="PNG")
-        garment_only_s3_url = upload_log_to_s3(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
+        save_png(garment_only_img, garment_only_buffered)
+        garment_only_s3_url = await upload_log_to_s3_async(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
         
         background_buffered = io.BytesIO()
-        background_img_processed.save(background_buffered, format="PNG")
-        background_s3_url = upload_log_to_s3(background_buffered.getvalue(), model_id, "background") or ""
+        save_png(background_img_processed, background_buffered)
+        background_s3_url = await upload_log_to_s3_async(background_buffered.getvalue(), model_id, "background") or ""
         
         # 3. X.AI 프롬프트 생성 (person_img, garment_only_img 사용)
         print("\n" + "="*80)
@@ -728,10 +730,10 @@ BACKGROUND RULES:
         # 5. 결과 이미지 처리 및 S3 업로드
         result_image_base64 = base64.b64encode(image_parts[0]).decode()
         
-        result_img = Image.open(io.BytesIO(image_parts[0]))
+        result_img = decode_image(image_parts[0], mode=None)
         result_buffered = io.BytesIO()
-        result_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+        save_png(result_img, result_buffered)
+        result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
         
         run_time = time.time() - start_time
         
@@ -822,7 +824,7 @@ async def generate_custom_tryon_v2(
     try:
         # 1. 의상 이미지 전처리
         print("의상 이미지 전처리 시작...")
-        dress_img_processed = preprocess_dress_image(dress_img, target_size=1024)
+        dress_img_processed = await run_cpu_task(preprocess_dress_image, dress_img, 1024)
         print("의상 이미지 전처리 완료")
         
         # 2. SegFormer B2 Garment Parsing - garment_only 이미지 추출
@@ -838,12 +840,12 @@ async def generate_custom_tryon_v2(
             
             # S3에 입력 이미지 업로드 (실패 로그용)
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             dress_buffered = io.BytesIO()
-            dress_img_processed.save(dress_buffered, format="PNG")
-            dress_s3_url = upload_log_to_s3(dress_buffered.getvalue(), model_id, "dress") or ""
+            save_png(dress_img_processed, dress_buffered)
+            dress_s3_url = await upload_log_to_s3_async(dress_buffered.getvalue(), model_id, "dress") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -870,12 +872,12 @@ async def generate_custom_tryon_v2(
             run_time = time.time() - start_time
             
             person_buffered = io.BytesIO()
-            person_img.save(person_buffered, format="PNG")
-            person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+            save_png(person_img, person_buffered)
+            person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
             
             dress_buffered = io.BytesIO()
-            dress_img_processed.save(dress_buffered, format="PNG")
-            dress_s3_url = upload_log_to_s3(dress_buffered.getvalue(), model_id, "dress") or ""
+            save_png(dress_img_processed, dress_buffered)
+            dress_s3_url = await upload_log_to_s3_async(dress_buffered.getvalue(), model_id, "dress") or ""
             
             save_test_log(
                 person_url=person_s3_url or "",
@@ -909,16 +911,16 @@ async def generate_custom_tryon_v2(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         dress_buffered = io.BytesIO()
-        dress_img_processed.save(dress_buffered, format="PNG")
-        dress_s3_url = upload_log_to_s3(dress_buffered.getvalue(), model_id, "dress") or ""
+        save_png(dress_img_processed, dress_buffered)
+        dress_s3_url = await upload_log_to_s3_async(dress_buffered.getvalue(), model_id, "dress") or ""
         
         garment_only_buffered = io.BytesIO()
-        garment_only_img.save(garment_only_buffered, format="PNG")
-        garment_only_s3_url = upload_log_to_s3(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
+        save_png(garment_only_img, garment_only_buffered)
+        garment_only_s3_url = await upload_log_to_s3_async(garment_only_buffered.getvalue(), model_id, "garment_only") or ""
         
         # 3. X.AI 프롬프트 생성 (person_img, garment_only_img 사용)
         print("\n" + "="*80)
@@ -1139,10 +1141,10 @@ BACKGROUND RULES:
         # 5. 결과 이미지 처리 및 S3 업로드
         result_image_base64 = base64.b64encode(image_parts[0]).decode()
         
-        result_img = Image.open(io.BytesIO(image_parts[0]))
+        result_img = decode_image(image_parts[0], mode=None)
         result_buffered = io.BytesIO()
-        result_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+        save_png(result_img, result_buffered)
+        result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
         
         run_time = time.time() - start_time
         
@@ -1210,7 +1212,7 @@ def decode_base64_to_image(image_data: bytes) -> Image.Image:
     Returns:
         Image.Image: 변환된 PIL Image
     """
-    return Image.open(io.BytesIO(image_data))
+    return decode_image(image_data, mode=None)
 
 
 def load_v3_stage2_prompt(xai_prompt: str) -> str:
@@ -1532,16 +1534,16 @@ async def generate_unified_tryon_v3(
         
         # S3에 입력 이미지 업로드
         person_buffered = io.BytesIO()
-        person_img.save(person_buffered, format="PNG")
-        person_s3_url = upload_log_to_s3(person_buffered.getvalue(), model_id, "person") or ""
+        save_png(person_img, person_buffered)
+        person_s3_url = await upload_log_to_s3_async(person_buffered.getvalue(), model_id, "person") or ""
         
         garment_buffered = io.BytesIO()
-        garment_img.save(garment_buffered, format="PNG")
-        garment_s3_url = upload_log_to_s3(garment_buffered.getvalue(), model_id, "garment") or ""
+        save_png(garment_img, garment_buffered)
+        garment_s3_url = await upload_log_to_s3_async(garment_buffered.getvalue(), model_id, "garment") or ""
         
         background_buffered = io.BytesIO()
-        background_img_processed.save(background_buffered, format="PNG")
-        background_s3_url = upload_log_to_s3(background_buffered.getvalue(), model_id, "background") or ""
+        save_png(background_img_processed, background_buffered)
+        background_s3_url = await upload_log_to_s3_async(background_buffered.getvalue(), model_id, "background") or ""
         
         # ============================================================
         # Stage 1: X.AI 프롬프트 생성
@@ -1764,8 +1766,8 @@ async def generate_unified_tryon_v3(
         
         # Stage 2 결과 S3 업로드
         stage2_buffered = io.BytesIO()
-        dressed_person_img.save(stage2_buffered, format="PNG")
-        stage2_result_s3_url = upload_log_to_s3(stage2_buffered.getvalue(), model_id, "stage2_result") or ""
+        save_png(dressed_person_img, stage2_buffered)
+        stage2_result_s3_url = await upload_log_to_s3_async(stage2_buffered.getvalue(), model_id, "stage2_result") or ""
         
         # ============================================================
         # Stage 3: Gemini로 배경 합성 + 조명 보정
@@ -1928,8 +1930,8 @@ async def generate_unified_tryon_v3(
         result_image_base64 = base64.b64encode(stage3_image_parts[0]).decode()
         
         result_buffered = io.BytesIO()
-        final_img.save(result_buffered, format="PNG")
-        result_s3_url = upload_log_to_s3(result_buffered.getvalue(), model_id, "result") or ""
+        save_png(final_img, result_buffered)
+        result_s3_url = await upload_log_to_s3_async(result_buffered.getvalue(), model_id, "result") or ""
         
         run_time = time.time() - start_time
         
@@ -216,8 +216,8 @@ function renderDresses(dresses) {
         // S3 URL만 사용, 로컬 경로는 사용하지 않음
         let imageUrl = null;
         if (dress.url && (dress.url.startsWith('http://') || dress.url.startsWith('https://'))) {
-            // S3 URL이면 프록시 사용
-            imageUrl = `/api/images/${dress.image_name}`;
+            // S3 URL이면 썸네일 파생본 사용 (없으면 원본 프록시)
+            imageUrl = dress.thumbnail_url || `/api/images/${dress.image_name}`;
         }
         // S3 URL이 없으면 null (이미지 없음 표시)
         const styleClass = getStyleClass(dress.style);
@@ -0,0 +1,112 @@
+"""
+CPU 작업 프로세스 풀 스케일링 벤치마크 스크립트
+
+같은 CPU 작업(필터 프리셋 + PNG base64, CLAHE 색상 보정 + PNG base64)을 동시 N개 실행하면서
+기본 스레드 풀(asyncio.to_thread)과 프로세스 풀(core/cpu_pool.run_cpu_task)을 비교합니다.
+
+측정 항목:
+1. 전체 처리 시간 / 처리량 (작업/초)
+2. 이벤트 루프 지연: 10ms 주기 타이머가 실제로 늦게 깨어난 최대 / 평균 시간
+   (다른 요청의 응답 지연에 해당)
+
+사용법:
+    python utils/benchmark_cpu_pool.py [--size 1536] [--concurrency 1 4 8] [--task filter|clahe]
+"""
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.cpu_pool import run_cpu_task, get_cpu_pool_metrics, shutdown_cpu_pool  # noqa: E402
+from config.cpu_pool import CPU_POOL_WORKERS, CPU_POOL_START_METHOD  # noqa: E402
+from core.image_codec import to_base64  # noqa: E402
+from services.image_filter_service import apply_filter_preset, harmonize_colors  # noqa: E402
+
+
+def filter_and_encode(image: Image.Image) -> str:
+    """필터 프리셋 적용 + PNG base64 (/api/apply-image-filters 처리 경로)"""
+    return to_base64(apply_filter_preset(image, "vintage"))
+
+
+def harmonize_and_encode(image: Image.Image) -> str:
+    """CLAHE 자동 색상 보정 + PNG base64 (/api/color-harmonize 처리 경로)"""
+    return to_base64(harmonize_colors(image))
+
+
+def build_sample_image(size: int) -> Image.Image:
+    """그라데이션 + 노이즈 합성 사진"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, size, dtype=np.float32)
+    base = np.stack([x + 0 * x[:, None], x[:, None] + 0 * x, (x + x[:, None]) / 2], axis=-1)
+    noise = rng.normal(0, 12, (size, size, 3)).astype(np.float32)
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8), "RGB")
+
+
+async def run_batch(runner, task, image: Image.Image, concurrency: int):
+    """동시 concurrency개 작업을 실행하며 이벤트 루프 지연 측정"""
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        interval = 0.01
+        while not stop.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lags.append(max(time.perf_counter() - expected, 0.0) * 1000)
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*[runner(task, image) for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker_task
+    return elapsed, max(lags, default=0.0), (sum(lags) / len(lags)) if lags else 0.0
+
+
+async def thread_runner(task, image):
+    return await asyncio.to_thread(task, image)
+
+
+async def process_runner(task, image):
+    return await run_cpu_task(task, image)
+
+
+async def main(args):
+    image = build_sample_image(args.size)
+    task = filter_and_encode if args.task == "filter" else harmonize_and_encode
+
+    print("=" * 72)
+    print(f"작업: {args.task}, 입력 {args.size}x{args.size}, 프로세스 워커 {CPU_POOL_WORKERS}개 ({CPU_POOL_START_METHOD})")
+    print("=" * 72)
+
+    # 워커 기동 / 모듈 import 시간은 측정에서 제외
+    await asyncio.gather(*[process_runner(task, image) for _ in range(CPU_POOL_WORKERS)])
+
+    print(f"{'동시 실행':>8} | {'방식':<8} | {'전체(s)':>8} | {'작업/초':>8} | {'루프 지연 최대(ms)':>18} | {'평균(ms)':>8}")
+    for concurrency in args.concurrency:
+        for name, runner in (("thread", thread_runner), ("process", process_runner)):
+            elapsed, lag_max, lag_avg = await run_batch(runner, task, image, concurrency)
+            print(f"{concurrency:>8} | {name:<8} | {elapsed:8.2f} | {concurrency / elapsed:8.2f} | "
+                  f"{lag_max:18.1f} | {lag_avg:8.1f}")
+
+    metrics = get_cpu_pool_metrics()
+    print(f"\n프로세스 풀: 평균 큐 대기 {metrics['avg_queue_wait_ms']}ms, 평균 실행 {metrics['avg_run_ms']}ms, "
+          f"최대 큐 깊이 {metrics['max_queue_depth']}, 공유 메모리 {metrics['shm_bytes_in'] // 1024}KB 입력 / "
+          f"{metrics['shm_bytes_out'] // 1024}KB 출력")
+    shutdown_cpu_pool()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU 작업 스레드 풀 vs 프로세스 풀 스케일링 벤치마크")
+    parser.add_argument("--size", type=int, default=1536)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--task", choices=["filter", "clahe"], default="filter")
+    asyncio.run(main(parser.parse_args()))
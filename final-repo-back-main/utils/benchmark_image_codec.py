@@ -0,0 +1,128 @@
+"""
+이미지 코덱 전/후 마이크로벤치마크 스크립트
+
+core/image_codec.py 도입 전후의 디코딩 / 인코딩 경로를 같은 입력으로 비교합니다.
+입력은 휴대폰 사진 크기(기본 4032x3024)의 합성 JPEG (EXIF 회전 포함)입니다.
+
+비교 항목:
+1. 드레스 전처리 입력: Image.open().convert("RGB") + preprocess_dress_image
+   vs decode_image(max_side=IMAGE_GARMENT_MAX_SIDE) + preprocess_dress_image
+2. 드레스 판별 / 썸네일: 전체 디코딩 + PNG base64 vs 축소 디코딩 + JPEG 미리보기
+3. 중간 결과 PNG 인코딩: Pillow 기본 압축(6) vs IMAGE_PNG_COMPRESS_LEVEL
+4. 원본 에코: 전체 크기 PNG data URL vs 미리보기 data URL
+
+사용법:
+    python utils/benchmark_image_codec.py [--width 4032 --height 3024] [--repeat 5]
+"""
+import io
+import sys
+import time
+import base64
+import argparse
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.image_codec import decode_image, encode_png, preview_data_url  # noqa: E402
+from services.image_service import preprocess_dress_image  # noqa: E402
+from config.image_codec import (  # noqa: E402
+    IMAGE_GARMENT_MAX_SIDE,
+    IMAGE_PNG_COMPRESS_LEVEL,
+    IMAGE_PREVIEW_FORMAT,
+    IMAGE_PREVIEW_MAX_SIDE
+)
+
+
+def build_sample_jpeg(width: int, height: int) -> bytes:
+    """그라데이션 + 노이즈 합성 사진 (EXIF 방향 6: 90도 회전)"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    noise = rng.normal(0, 12, (height, width, 3)).astype(np.float32)
+    pixels = np.clip(base + noise, 0, 255).astype(np.uint8)
+
+    image = Image.fromarray(pixels, "RGB")
+    exif = image.getexif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=92, exif=exif)
+    return buffer.getvalue()
+
+
+def measure(fn, repeat: int):
+    """repeat회 실행한 중간값 (ms)과 마지막 결과"""
+    fn()  # 워밍업
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return float(np.median(times)), result
+
+
+def png_base64(image: Image.Image) -> str:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def report(name: str, before_ms: float, after_ms: float, before_note: str = "", after_note: str = ""):
+    print(name)
+    print(f"  이전: {before_ms:8.1f} ms {before_note}")
+    print(f"  이후: {after_ms:8.1f} ms {after_note}")
+    print(f"  속도 향상: {before_ms / after_ms:.2f}x")
+
+
+def main(args):
+    data = build_sample_jpeg(args.width, args.height)
+    print("=" * 60)
+    print(f"입력: {args.width}x{args.height} JPEG ({len(data) // 1024}KB), 반복 {args.repeat}회 중간값")
+    print(f"설정: 드레스 {IMAGE_GARMENT_MAX_SIDE}px, PNG 압축 {IMAGE_PNG_COMPRESS_LEVEL}, "
+          f"미리보기 {IMAGE_PREVIEW_FORMAT} {IMAGE_PREVIEW_MAX_SIDE}px")
+    print("=" * 60)
+
+    # 1. 드레스 전처리 입력
+    before, _ = measure(
+        lambda: preprocess_dress_image(Image.open(io.BytesIO(data)).convert("RGB"), target_size=1024), args.repeat
+    )
+    after, _ = measure(
+        lambda: preprocess_dress_image(decode_image(data, max_side=IMAGE_GARMENT_MAX_SIDE), target_size=1024),
+        args.repeat
+    )
+    report("1. 드레스 디코딩 + 전처리 (1024)", before, after)
+
+    # 2. 드레스 판별 / 썸네일
+    before, before_url = measure(lambda: png_base64(Image.open(io.BytesIO(data)).convert("RGB")), args.repeat)
+    after, after_url = measure(
+        lambda: preview_data_url(decode_image(data, max_side=IMAGE_PREVIEW_MAX_SIDE)), args.repeat
+    )
+    report("2. 판별용 디코딩 + 인코딩", before, after,
+           f"({len(before_url) // 1024}KB base64)", f"({len(after_url) // 1024}KB data URL)")
+
+    # 3. 중간 결과 PNG 인코딩 (동일 디코딩 결과)
+    image = decode_image(data)
+    before, before_png = measure(lambda: encode_png(image, compress_level=6), args.repeat)
+    after, after_png = measure(lambda: encode_png(image), args.repeat)
+    report("3. 중간 결과 PNG 인코딩", before, after,
+           f"({len(before_png) // 1024}KB)", f"({len(after_png) // 1024}KB)")
+
+    # 4. 원본 에코
+    before, before_echo = measure(lambda: png_base64(image), args.repeat)
+    after, after_echo = measure(lambda: preview_data_url(image), args.repeat)
+    report("4. 원본 에코 data URL", before, after,
+           f"({len(before_echo) // 1024}KB)", f"({len(after_echo) // 1024}KB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이미지 코덱 전/후 마이크로벤치마크")
+    parser.add_argument("--width", type=int, default=4032)
+    parser.add_argument("--height", type=int, default=3024)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,87 @@
+"""
+로컬 포즈 백엔드 키포인트 비교 스크립트
+
+샘플 이미지마다 원격 HF Space(MediaPipe API)와 로컬 백엔드(MediaPipe CPU / ONNX)의
+33개 키포인트를 비교하여 허용 오차 안에 드는지 확인합니다.
+
+사용법:
+    python utils/compare_pose_backends.py <이미지 폴더> [--backend mediapipe] [--tolerance 0.05]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageOps
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.body_measurements import landmarks_to_array, select_best_person  # noqa: E402
+from services.pose_backends import load_pose_backend  # noqa: E402
+from services.pose_landmark_service import PoseLandmarkService  # noqa: E402
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def main(args):
+    image_paths = sorted(p for p in Path(args.images).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+    if not image_paths:
+        print(f"이미지가 없습니다: {args.images}")
+        sys.exit(1)
+
+    remote = PoseLandmarkService(backend="remote")
+    local_backend = load_pose_backend(args.backend)
+
+    print("=" * 80)
+    print(f"원격 vs 로컬({args.backend}) 키포인트 비교 - 허용 오차 {args.tolerance} (정규화 좌표)")
+    print("=" * 80)
+
+    passed, compared = 0, 0
+    remote_times, local_times = [], []
+    for path in image_paths:
+        image = ImageOps.exif_transpose(Image.open(path)).convert("RGB")
+
+        start = time.perf_counter()
+        remote_landmarks = landmarks_to_array(remote.extract_landmarks(image))
+        remote_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        local_landmarks = select_best_person(local_backend.detect(image))
+        local_times.append(time.perf_counter() - start)
+
+        if remote_landmarks is None or local_landmarks is None:
+            print(f"  {path.name}: 감지 결과 불일치 (원격: {remote_landmarks is not None}, 로컬: {local_landmarks is not None})")
+            continue
+
+        # 양쪽 모두 보이는 키포인트만 비교
+        visible = (remote_landmarks[:, 3] >= args.min_visibility) & (local_landmarks[:, 3] >= args.min_visibility)
+        if not visible.any():
+            print(f"  {path.name}: 비교할 수 있는 키포인트 없음")
+            continue
+
+        errors = np.linalg.norm(remote_landmarks[visible, :2] - local_landmarks[visible, :2], axis=1)
+        ok = float(np.median(errors)) <= args.tolerance
+        compared += 1
+        passed += int(ok)
+        print(
+            f"  {path.name}: 키포인트 {int(visible.sum())}개, 오차 중앙값 {np.median(errors):.4f}, "
+            f"최대 {errors.max():.4f} {'OK' if ok else 'FAIL'}"
+        )
+
+    print("-" * 80)
+    print(f"통과: {passed}/{compared} (비교 가능 {compared}/{len(image_paths)}장)")
+    print(f"평균 추론 시간 - 원격: {np.mean(remote_times) * 1000:.0f} ms, 로컬: {np.mean(local_times) * 1000:.0f} ms")
+    if compared == 0 or passed < compared:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 포즈 백엔드 키포인트 비교")
+    parser.add_argument("images", help="샘플 이미지 폴더")
+    parser.add_argument("--backend", default="mediapipe", choices=["mediapipe", "onnx"])
+    parser.add_argument("--tolerance", type=float, default=0.05, help="키포인트 오차 중앙값 허용치 (정규화 좌표)")
+    parser.add_argument("--min-visibility", type=float, default=0.5)
+    main(parser.parse_args())
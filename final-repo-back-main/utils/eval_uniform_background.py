@@ -0,0 +1,105 @@
+"""
+단색 배경 빠른 누끼 경로 정확도 평가 스크립트
+
+레이블된 로컬 데이터셋으로 단색 배경 판정/마스크 품질을 측정합니다.
+
+데이터셋 구조:
+    <dataset>/images/<name>.(jpg|png)   # 의상 상품컷
+    <dataset>/masks/<name>.png          # 정답 의상 마스크 (흰색: 의상)
+    <dataset>/labels.csv (선택)         # name,uniform (1: 단색 배경, 0: 아님)
+"""
+import sys
+import csv
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.mask_upsampling import upsample_mask  # noqa: E402
+from core.uniform_background import detect_uniform_background  # noqa: E402
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def load_labels(dataset_dir: Path) -> dict:
+    """labels.csv에서 단색 배경 여부 레이블 로드 (없으면 빈 딕셔너리)"""
+    labels_path = dataset_dir / "labels.csv"
+    if not labels_path.exists():
+        return {}
+    with open(labels_path, newline="", encoding="utf-8") as f:
+        return {row["name"]: row["uniform"].strip() == "1" for row in csv.DictReader(f)}
+
+
+def mask_iou(pred: np.ndarray, target: np.ndarray) -> float:
+    """이진 마스크 IoU"""
+    pred = pred > 127
+    target = target > 127
+    union = np.logical_or(pred, target).sum()
+    if union == 0:
+        return 1.0
+    return float(np.logical_and(pred, target).sum() / union)
+
+
+def evaluate(dataset_dir: Path):
+    """데이터셋 평가 후 결과 출력"""
+    images_dir = dataset_dir / "images"
+    masks_dir = dataset_dir / "masks"
+    labels = load_labels(dataset_dir)
+
+    image_paths = sorted(p for p in images_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+    if not image_paths:
+        print(f"❌ 이미지가 없습니다: {images_dir}")
+        return
+
+    print("=" * 88)
+    print(f"{'이름':<30} {'경로':<20} {'신뢰도':>8} {'대비':>8} {'엣지':>8} {'IoU':>8}")
+    print("=" * 88)
+
+    fast_count = 0
+    ious = []
+    decision_correct = 0
+    decision_total = 0
+
+    for image_path in image_paths:
+        img = Image.open(image_path).convert("RGB")
+        detection = detect_uniform_background(img)
+        path = "uniform_background" if detection["uniform"] else "segformer"
+
+        iou_text = "-"
+        mask_path = masks_dir / f"{image_path.stem}.png"
+        if detection["uniform"]:
+            fast_count += 1
+            if mask_path.exists():
+                target = np.array(Image.open(mask_path).convert("L").resize(img.size, Image.Resampling.NEAREST))
+                pred = upsample_mask(detection["mask"], img)
+                iou = mask_iou(pred, target)
+                ious.append(iou)
+                iou_text = f"{iou:.3f}"
+
+        if image_path.stem in labels:
+            decision_total += 1
+            if labels[image_path.stem] == detection["uniform"]:
+                decision_correct += 1
+
+        print(f"{image_path.stem:<30} {path:<20} {detection['confidence']:>8.2f} "
+              f"{detection['contrast']:>8.1f} {detection['edge_strength']:>8.1f} {iou_text:>8}")
+
+    print("=" * 88)
+    print(f"전체 이미지: {len(image_paths)}")
+    print(f"빠른 경로 채택률: {fast_count / len(image_paths):.1%} ({fast_count}/{len(image_paths)})")
+    if ious:
+        print(f"빠른 경로 평균 IoU: {np.mean(ious):.3f}")
+        print(f"IoU ≥ 0.90 비율: {np.mean(np.array(ious) >= 0.9):.1%}")
+    if decision_total:
+        print(f"단색 배경 판정 정확도: {decision_correct / decision_total:.1%} ({decision_correct}/{decision_total})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python utils/eval_uniform_background.py <데이터셋 경로>")
+        sys.exit(1)
+    evaluate(Path(sys.argv[1]))
@@ -0,0 +1,180 @@
+"""
+워커 간 공유 가중치 메모리 측정 스크립트
+
+여러 워커 프로세스가 같은 가중치를 참조할 때 워커당 전용 메모리(USS)가 얼마나 늘어나는지 측정합니다.
+- private 모드: 워커마다 가중치 복사본을 메모리에 로드 (기존 방식)
+- shared 모드 : core/shared_weights.py의 share_npy_file로 /dev/shm 공유 memmap 참조
+  (운영 코드(INSwapper emap)와 같은 경로, 마스터가 기록한 파일을 워커가 원본 파일 지문으로 찾아 매핑하며
+  워커에서는 원본 .npy를 읽지 않음 - 읽으면 종료 코드 1)
+- --onnx 지정 시 ONNX 세션도 비교:
+  - onnx_private: 기본 옵션 InferenceSession (prepacking 사용)
+  - onnx_shared : create_shared_onnx_session (prepacking 끔, 외부 데이터 mmap)
+  워커마다 세션 생성 후 한 번 추론하고, 두 세션의 출력이 같은지 확인 (다르면 종료 코드 1)
+
+사용법:
+    python utils/measure_shared_weights.py [--size-mb 256] [--workers 4] [--onnx 모델경로]
+"""
+import sys
+import time
+import tempfile
+import importlib.util
+import argparse
+import multiprocessing as mp
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.shared_weights import share_array, file_fingerprint, clear_shared_weights, create_shared_onnx_session  # noqa: E402
+
+WEIGHTS_KEY = "benchmark/shared-weights"
+
+
+def read_memory_kb(pid: int) -> dict:
+    """/proc/<pid>/smaps_rollup에서 RSS / PSS / 전용 메모리(USS) 읽기 (KB)"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].rstrip(":") in (
+                "Rss", "Pss", "Private_Clean", "Private_Dirty"
+            ):
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "uss": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0)
+    }
+
+
+def onnx_dummy_inputs(session) -> dict:
+    """세션 입력별 고정 입력 (동적 차원은 1, 실수형은 0.5)"""
+    dtypes = {"tensor(float)": np.float32, "tensor(float16)": np.float16, "tensor(int64)": np.int64, "tensor(int32)": np.int32}
+    inputs = {}
+    for model_input in session.get_inputs():
+        shape = [dim if isinstance(dim, int) and dim > 0 else 1 for dim in model_input.shape]
+        inputs[model_input.name] = np.full(shape, 0.5, dtype=dtypes.get(model_input.type, np.float32))
+    return inputs
+
+
+def load_onnx_session(mode: str, model_path: str):
+    if mode == "onnx_shared":
+        return create_shared_onnx_session(model_path)
+    import onnxruntime as ort
+
+    return ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+
+
+def worker(mode: str, target, ready, done, outputs):
+    """가중치를 로드하고 모든 페이지를 읽은 뒤 측정이 끝날 때까지 대기"""
+    if mode.startswith("onnx"):
+        session = load_onnx_session(mode, target)
+        outputs.put(session.run(None, onnx_dummy_inputs(session))[0])
+    elif mode == "shared":
+        source_path = target
+
+        def load_private():
+            # 마스터가 기록한 공유 파일이 있으면 호출되지 않아야 함
+            outputs.put("loaded")
+            return np.load(source_path)
+
+        weights = share_array(WEIGHTS_KEY, file_fingerprint(source_path), load_private)
+        float(weights.sum())  # 모든 페이지 접근
+    else:
+        weights = np.ones(target * 1024 * 1024 // 4, dtype=np.float32)
+        float(weights.sum())
+    ready.set()
+    done.wait()
+
+
+def measure(mode: str, target, workers: int):
+    """워커들을 띄워 메모리 측정, (워커별 메모리, 워커별 첫 출력) 반환"""
+    ctx = mp.get_context("spawn")
+    done = ctx.Event()
+    outputs = ctx.Queue()
+    procs, readies = [], []
+    for _ in range(workers):
+        ready = ctx.Event()
+        proc = ctx.Process(target=worker, args=(mode, target, ready, done, outputs))
+        proc.start()
+        procs.append(proc)
+        readies.append(ready)
+    for ready in readies:
+        ready.wait()
+    time.sleep(0.2)
+
+    results = [read_memory_kb(proc.pid) for proc in procs]
+    first_outputs = [outputs.get() for _ in procs] if mode.startswith("onnx") else []
+    while not outputs.empty():
+        first_outputs.append(outputs.get())
+    done.set()
+    for proc in procs:
+        proc.join()
+    return results, first_outputs
+
+
+def print_results(mode: str, results: list, workers: int):
+    total_uss = sum(r["uss"] for r in results) / 1024
+    total_pss = sum(r["pss"] for r in results) / 1024
+    print(f"[{mode}]")
+    for i, r in enumerate(results):
+        print(f"  워커 {i}: RSS {r['rss'] / 1024:8.1f}MB  PSS {r['pss'] / 1024:8.1f}MB  USS {r['uss'] / 1024:8.1f}MB")
+    print(f"  합계 PSS: {total_pss:.1f}MB, 워커당 평균 USS: {total_uss / workers:.1f}MB")
+
+
+def measure_onnx(model_path: str, workers: int) -> bool:
+    """ONNX 세션 공유 경로 측정 + 출력 일치 확인"""
+    if importlib.util.find_spec("onnxruntime") is None:
+        print("onnxruntime이 설치되어 있지 않습니다: pip install onnxruntime")
+        return False
+    if not Path(model_path).exists():
+        print(f"ONNX 모델 파일이 없습니다: {model_path}")
+        return False
+
+    print(f"\nONNX 모델: {model_path}")
+    outputs = {}
+    for mode in ("onnx_private", "onnx_shared"):
+        results, outputs[mode] = measure(mode, model_path, workers)
+        print_results(mode, results, workers)
+
+    reference = outputs["onnx_private"][0]
+    ok = all(np.allclose(output, reference, atol=1e-4) for output in outputs["onnx_private"] + outputs["onnx_shared"])
+    print(f"ONNX 공유 세션 출력 일치: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def main(args):
+    # 원본 가중치 .npy 파일과 공유 파일 준비 (마스터에서 한 번 기록, 워커는 원본 파일 지문으로 찾아 매핑)
+    clear_shared_weights("benchmark")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_path = str(Path(tmp_dir) / "weights.npy")
+        np.save(source_path, np.ones(args.size_mb * 1024 * 1024 // 4, dtype=np.float32))
+        share_array(WEIGHTS_KEY, file_fingerprint(source_path), lambda: np.load(source_path))
+
+        print("=" * 70)
+        print(f"가중치 크기: {args.size_mb}MB, 워커 수: {args.workers}")
+        print("=" * 70)
+        results, _ = measure("private", args.size_mb, args.workers)
+        print_results("private", results, args.workers)
+        results, loaded = measure("shared", source_path, args.workers)
+        print_results("shared", results, args.workers)
+
+    clear_shared_weights("benchmark")
+    ok = not loaded
+    print(f"워커의 원본 가중치 로드 없이 공유 파일 매핑: {'OK' if ok else f'FAIL ({len(loaded)}개 워커가 원본 로드)'}")
+
+    if args.onnx and not measure_onnx(args.onnx, args.workers):
+        ok = False
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="워커 간 공유 가중치 메모리 측정")
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--onnx", default=None, help="ONNX 세션 공유 경로도 측정할 모델 경로")
+    main(parser.parse_args())
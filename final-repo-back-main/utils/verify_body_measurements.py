@@ -0,0 +1,146 @@
+"""
+벡터화 체형 측정값 수치 일치 검증 / 속도 비교 스크립트
+
+core/body_measurements.py의 배열 기반 계산이 기존 딕셔너리 순회 방식과
+같은 측정값·체형 분류를 내는지 무작위 랜드마크로 검증하고, 단건 / 배치 처리 속도를 비교합니다.
+로컬 포즈 백엔드는 배열을 그대로 반환하므로 딕셔너리 → 배열 변환은 원격 API 응답에서만 발생합니다.
+
+사용법:
+    python utils/verify_body_measurements.py [--samples 10000]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.body_measurements import (  # noqa: E402
+    BODY_TYPES,
+    MEASUREMENT_KEYS,
+    landmarks_to_array,
+    stack_landmarks,
+    compute_measurements,
+    measure,
+    measurements_to_dicts,
+    classify_body_type_indices
+)
+
+
+def reference_measurements(landmarks: list) -> dict:
+    """기존 BodyAnalysisService.calculate_measurements (딕셔너리 순회) 방식"""
+    def get(idx):
+        lm = landmarks[idx]
+        return lm["x"], lm["y"], lm["z"]
+
+    def distance(p1, p2):
+        return np.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 + (p1[2] - p2[2]) ** 2)
+
+    def mid(p1, p2):
+        return ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2, (p1[2] + p2[2]) / 2)
+
+    ls, rs, lh, rh = get(11), get(12), get(23), get(24)
+    shoulder_width = distance(ls, rs)
+    hip_width = distance(lh, rh)
+    arm_length = (distance(ls, get(13)) + distance(get(13), get(15))
+                  + distance(rs, get(14)) + distance(get(14), get(16))) / 2
+    leg_length = (distance(lh, get(25)) + distance(get(25), get(27))
+                  + distance(rh, get(26)) + distance(get(26), get(28))) / 2
+    estimated_height = distance(get(0), mid(get(31), get(32)))
+    waist_width = (shoulder_width + hip_width) / 2
+    torso_length = distance(mid(ls, rs), mid(lh, rh))
+    return {
+        "shoulder_width": shoulder_width,
+        "hip_width": hip_width,
+        "waist_width": waist_width,
+        "shoulder_hip_ratio": shoulder_width / hip_width if hip_width > 0 else 0,
+        "waist_shoulder_ratio": waist_width / shoulder_width if shoulder_width > 0 else 1.0,
+        "waist_hip_ratio": waist_width / hip_width if hip_width > 0 else 1.0,
+        "arm_length": arm_length,
+        "leg_length": leg_length,
+        "torso_length": torso_length,
+        "lower_body_length": leg_length,
+        "torso_leg_ratio": torso_length / leg_length if leg_length > 0 else 1.0,
+        "arm_leg_ratio": arm_length / leg_length if leg_length > 0 else 1.0,
+        "estimated_height": estimated_height,
+        "body_length": estimated_height
+    }
+
+
+def reference_body_type(m: dict) -> str:
+    """기존 classify_body_type 조건 순서"""
+    if m["waist_shoulder_ratio"] < 0.82 and m["waist_hip_ratio"] < 1.30:
+        return "X라인"
+    if m["shoulder_hip_ratio"] < 1.40:
+        return "A라인"
+    if 1.40 <= m["shoulder_hip_ratio"] <= 1.65 and m["waist_shoulder_ratio"] >= 0.82:
+        return "H라인"
+    if m["shoulder_hip_ratio"] > 1.65:
+        return "O라인"
+    return "균형형"
+
+
+def main(args):
+    rng = np.random.default_rng(0)
+    arrays = rng.random((args.samples, 33, 4)).astype(np.float32)
+    arrays[::50, 23, :3] = arrays[::50, 24, :3]  # 엉덩이 폭 0 (비율 기본값 분기) 포함
+    landmark_dicts = [
+        [{"id": i, "x": float(x), "y": float(y), "z": float(z), "visibility": float(v)}
+         for i, (x, y, z, v) in enumerate(array.tolist())]
+        for array in arrays
+    ]
+
+    start = time.perf_counter()
+    reference = [reference_measurements(lms) for lms in landmark_dicts]
+    reference_time = time.perf_counter() - start
+
+    # 로컬 백엔드 출력과 같은 (33, 4) 배열 (변환 없음)
+    landmark_arrays = list(arrays)
+    start = time.perf_counter()
+    single = [measure(array) for array in landmark_arrays]
+    single_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    columns = compute_measurements(stack_landmarks(landmark_arrays))
+    type_indices = classify_body_type_indices(columns)
+    vectorized_time = time.perf_counter() - start
+    vectorized = measurements_to_dicts(columns)
+
+    # 원격 API 응답(딕셔너리)만 거치는 변환
+    start = time.perf_counter()
+    converted = [landmarks_to_array(lms) for lms in landmark_dicts]
+    convert_time = time.perf_counter() - start
+
+    max_rel_error = max(
+        abs(v[key] - r[key]) / max(abs(r[key]), 1e-12)
+        for results in (single, vectorized) for v, r in zip(results, reference) for key in MEASUREMENT_KEYS
+    )
+    conversion_ok = all(np.array_equal(c, a) for c, a in zip(converted, landmark_arrays))
+    type_mismatches = sum(
+        BODY_TYPES[i]["type"] != reference_body_type(r)
+        for i, r in zip(type_indices.tolist(), reference)
+    )
+
+    print("=" * 60)
+    print(f"샘플 수: {args.samples}")
+    print("=" * 60)
+    print(f"측정값 최대 상대 오차: {max_rel_error:.2e}")
+    print(f"체형 분류 불일치: {type_mismatches}건")
+    print(f"원격 응답 배열 변환 일치: {'OK' if conversion_ok else 'FAIL'}")
+    print(f"딕셔너리 순회 (기존, 건별): {reference_time * 1000:8.1f} ms")
+    print(f"배열 단건 계산 (건별)     : {single_time * 1000:8.1f} ms ({reference_time / single_time:.1f}x)")
+    print(f"벡터화 배치 계산          : {vectorized_time * 1000:8.1f} ms ({reference_time / vectorized_time:.0f}x)")
+    print(f"원격 응답 → 배열 변환     : {convert_time * 1000:8.1f} ms (원격 API 응답만, 로컬 백엔드는 없음)")
+
+    if max_rel_error > 1e-9 or type_mismatches or not conversion_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벡터화 체형 측정값 수치 일치 검증")
+    parser.add_argument("--samples", type=int, default=10000)
+    main(parser.parse_args())
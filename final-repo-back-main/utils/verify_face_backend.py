@@ -0,0 +1,204 @@
+"""
+로컬 얼굴 백엔드 오프라인 검증 스크립트
+
+네트워크 없이 저장소에 포함된 템플릿 이미지(templates/face_swap_templates)로 확인합니다.
+
+1. 정렬 변환(Umeyama)과 NMS 수치 검증 (모델 불필요)
+2. 원격 엔드포인트 콜드 스타트(upstream warmer "warming") 중 라우팅 (모델 불필요)
+   - FACE_BACKEND=remote: 로컬 백엔드 사용, 원격 호출 없음
+   - FACE_BACKEND=local: 로컬 실패 시 원격 폴백 생략
+3. SCRFD 감지, ArcFace 임베딩 정규화/일관성(축소 이미지와 코사인 유사도), 이미지 해시 캐시 적중,
+   INSwapper 결과 크기, warming 중 remote 설정 서비스의 로컬 감지 결과
+
+모델 파일(SCRFD / ArcFace / INSwapper)이나 검증 이미지가 없으면 실패 처리합니다 (종료 코드 1).
+모델 없이 수치 / 라우팅 검증만 하려면 --no-models를 지정합니다.
+
+사용법:
+    python utils/verify_face_backend.py [--images templates/face_swap_templates] [--no-models]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from config.face_backend import (  # noqa: E402
+    FACE_DETECTOR_MODEL_PATH,
+    FACE_RECOGNIZER_MODEL_PATH,
+    FACE_SWAPPER_MODEL_PATH
+)
+from core.upstream_warmer import record_upstream_result, UPSTREAM_INSIGHTFACE, _states  # noqa: E402
+from services import face_analysis_service  # noqa: E402
+from services.face_backends import estimate_similarity_transform, _nms  # noqa: E402
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def check_alignment() -> bool:
+    """임의 유사 변환을 정확히 복원하는지, OpenCV 추정 결과와 일치하는지 확인"""
+    rng = np.random.default_rng(0)
+    ok = True
+    for _ in range(100):
+        angle, scale = rng.uniform(-np.pi, np.pi), rng.uniform(0.2, 3.0)
+        rotation = scale * np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+        shift = rng.uniform(-200, 200, size=2)
+        src = rng.uniform(0, 500, size=(5, 2))
+        dst = src @ rotation.T + shift
+
+        matrix = estimate_similarity_transform(src, dst)
+        expected = np.hstack([rotation, shift[:, np.newaxis]])
+        cv_matrix, _ = cv2.estimateAffinePartial2D(src, dst, method=cv2.LMEDS)
+        ok &= np.allclose(matrix, expected, atol=1e-6) and np.allclose(matrix, cv_matrix, atol=1e-4)
+    print(f"정렬 변환 복원: {'OK' if ok else 'FAIL'}")
+    return bool(ok)
+
+
+def check_nms() -> bool:
+    detections = np.array([
+        [0, 0, 100, 100, 0.9],
+        [5, 5, 105, 105, 0.8],     # 첫 번째와 크게 겹침 -> 제거
+        [200, 200, 260, 260, 0.7]
+    ], dtype=np.float32)
+    ok = _nms(detections, 0.4) == [0, 2]
+    print(f"NMS: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def set_remote_warming(warming: bool):
+    """원격 InsightFace 상태를 warming(콜드 스타트 중) 또는 초기 상태로 설정"""
+    _states.pop(UPSTREAM_INSIGHTFACE, None)
+    if warming:
+        record_upstream_result(UPSTREAM_INSIGHTFACE, 503)
+
+
+def check_warming_routing() -> bool:
+    """원격 warming 중 라우팅 (로컬 / 원격 호출을 기록하는 대체 함수 사용)"""
+    calls = []
+
+    class RecordingBackend:
+        def __init__(self, faces):
+            self.faces = faces
+
+        def detect_faces(self, image):
+            calls.append("local")
+            if self.faces is None:
+                raise RuntimeError("로컬 모델 없음")
+            return self.faces
+
+    def remote(image):
+        calls.append("remote")
+        return [{"bbox": [0, 0, 1, 1]}]
+
+    original = face_analysis_service.get_local_face_backend
+    ok = True
+    try:
+        for index, (backend, local_faces, warming, expected) in enumerate((
+            ("remote", [{"bbox": [0, 0, 2, 2]}], False, ["remote"]),
+            ("remote", [{"bbox": [0, 0, 2, 2]}], True, ["local"]),
+            ("local", None, False, ["local", "remote"]),
+            ("local", None, True, ["local"]),
+        )):
+            face_analysis_service.get_local_face_backend = lambda: RecordingBackend(local_faces)
+            service = face_analysis_service.FaceAnalysisService("http://127.0.0.1:9", "verify", backend=backend)
+            service._detect_faces_remote = remote
+            set_remote_warming(warming)
+            calls.clear()
+            # 캐시 적중을 피하도록 경우마다 다른 이미지
+            service.detect_faces(np.full((8, 8, 3), index, dtype=np.uint8))
+            ok &= calls == expected
+            print(f"  backend={backend}, warming={warming}: 호출 {calls} (기대: {expected})")
+    finally:
+        face_analysis_service.get_local_face_backend = original
+        set_remote_warming(False)
+    print(f"warming 중 로컬 라우팅: {'OK' if ok else 'FAIL'}")
+    return bool(ok)
+
+
+def check_models(image_dir: Path) -> bool:
+    """모델 추론 검증 (모델 / 이미지가 없으면 실패)"""
+    missing = [p for p in (FACE_DETECTOR_MODEL_PATH, FACE_RECOGNIZER_MODEL_PATH, FACE_SWAPPER_MODEL_PATH) if not Path(p).exists()]
+    if missing:
+        print(f"모델 파일이 없습니다 (--no-models로 수치 검증만 실행 가능): {', '.join(missing)} FAIL")
+        return False
+    image_paths = sorted(p for p in image_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS) if image_dir.is_dir() else []
+    if not image_paths:
+        print(f"검증 이미지가 없습니다: {image_dir} FAIL")
+        return False
+
+    from core.model_registry import get_model_registry
+    from services.face_analysis_service import FaceAnalysisService
+    from services.face_backends import LOCAL_FACE_MODEL_NAME, load_local_face_backend
+
+    registry = get_model_registry()
+    if not registry.is_registered(LOCAL_FACE_MODEL_NAME):
+        registry.register(LOCAL_FACE_MODEL_NAME, load_local_face_backend)
+    backend = registry.get(LOCAL_FACE_MODEL_NAME)
+    service = FaceAnalysisService(backend="local")
+    ok = backend.swapper is not None
+    if not ok:
+        print(f"INSwapper를 로드하지 못했습니다: {FACE_SWAPPER_MODEL_PATH} FAIL")
+    for path in image_paths:
+        image = cv2.imread(str(path))
+        start = time.perf_counter()
+        faces = service.detect_faces(image)
+        first_time = time.perf_counter() - start
+        if not faces:
+            print(f"  {path.name}: 얼굴 감지 실패 FAIL")
+            ok = False
+            continue
+
+        face = max(faces, key=lambda f: (f["bbox"][2] - f["bbox"][0]) * (f["bbox"][3] - f["bbox"][1]))
+        norm = float(np.linalg.norm(face["normed_embedding"]))
+
+        # 절반 크기 이미지의 임베딩과 비교 (같은 사람이면 코사인 유사도가 높아야 함)
+        half = cv2.resize(image, (image.shape[1] // 2, image.shape[0] // 2), interpolation=cv2.INTER_AREA)
+        half_faces = backend.detect_faces(half)
+        similarity = max(float(face["normed_embedding"] @ f["normed_embedding"]) for f in half_faces) if half_faces else 0.0
+
+        start = time.perf_counter()
+        cached = service.detect_faces(image)
+        cached_time = time.perf_counter() - start
+
+        item_ok = abs(norm - 1.0) < 1e-3 and similarity > 0.6 and cached is faces
+        if backend.swapper is not None:
+            swapped = backend.swap(image, face, face)
+            item_ok &= swapped.shape == image.shape
+
+        ok &= item_ok
+        print(
+            f"  {path.name}: 얼굴 {len(faces)}개, 임베딩 노름 {norm:.4f}, 축소 이미지 유사도 {similarity:.3f}, "
+            f"감지 {first_time * 1000:.0f} ms / 캐시 {cached_time * 1000:.2f} ms {'OK' if item_ok else 'FAIL'}"
+        )
+
+    # 원격이 warming이면 remote 설정 서비스도 로컬 모델로 감지 (도달할 수 없는 원격 주소 사용)
+    set_remote_warming(True)
+    try:
+        remote_service = FaceAnalysisService("http://127.0.0.1:9", "verify", backend="remote")
+        image = cv2.imread(str(image_paths[0]))
+        warming_faces = remote_service.detect_faces(cv2.flip(image, 1))
+    finally:
+        set_remote_warming(False)
+    warming_ok = bool(warming_faces)
+    print(f"  warming 중 remote 설정 서비스 로컬 감지: 얼굴 {len(warming_faces)}개 {'OK' if warming_ok else 'FAIL'}")
+    return ok and warming_ok
+
+
+def main(args):
+    results = [check_alignment(), check_nms(), check_warming_routing()]
+    if not args.no_models:
+        results.append(check_models(Path(args.images)))
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 얼굴 백엔드 오프라인 검증")
+    parser.add_argument("--images", default=str(PROJECT_ROOT / "templates" / "face_swap_templates"))
+    parser.add_argument("--no-models", action="store_true", help="모델 추론 검증 없이 수치 / 라우팅 검증만 실행")
+    main(parser.parse_args())
@@ -0,0 +1,111 @@
+"""
+로컬 인물/동물 분류기 검증 스크립트
+
+services/image_classifier_service.py의 클래스 인덱스 전제와 실제 모델 동작을 확인합니다.
+
+1. 인물 클래스 인덱스(PERSON_CONTEXT_CLASS_INDICES)가 사물 구간(398~999번) 안에 있는지
+2. 라벨 파일이 1000줄이고 표준 순서인지 (동물 구간 경계 포함), 인물 클래스 인덱스의 라벨 이름 출력
+3. 잘못된 라벨 파일(개수 / 순서)은 로드 시 거부되는지
+4. 번들 페이스스왑 템플릿이 인물 사진으로 통과하는지
+
+모델 / 라벨 / 템플릿 파일이 없으면 실패 처리합니다 (종료 코드 1).
+
+사용법:
+    python utils/verify_image_classifier.py [--model 모델경로] [--labels 라벨경로]
+"""
+import sys
+import argparse
+from pathlib import Path
+
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.image_classifier_service import (  # noqa: E402
+    ImageClassifierService,
+    check_imagenet_labels,
+    PERSON_CONTEXT_CLASS_INDICES,
+    IMAGENET_ANIMAL_CLASS_END,
+    IMAGENET_NUM_CLASSES
+)
+from config.image_classifier import IMAGE_CLASSIFIER_MODEL_PATH, IMAGE_CLASSIFIER_LABELS_PATH  # noqa: E402
+from config.face_swap import FACE_TEMPLATE_DIR  # noqa: E402
+
+TEMPLATE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def report(name: str, ok: bool) -> bool:
+    print(f"{name}: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+def rejects(labels) -> bool:
+    try:
+        check_imagenet_labels(labels)
+    except ValueError as e:
+        print(f"  거부: {e}")
+        return True
+    return False
+
+
+def check_labels(labels_path: Path) -> bool:
+    """라벨 파일 순서 / 인물 클래스 이름 / 잘못된 라벨 거부"""
+    labels = [line.strip() for line in labels_path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    ok = report("라벨 파일 표준 순서", not rejects(labels))
+    if not ok:
+        return False
+
+    print(f"인물 클래스 {len(PERSON_CONTEXT_CLASS_INDICES)}개:")
+    for index in sorted(PERSON_CONTEXT_CLASS_INDICES):
+        print(f"  {index:>4}: {labels[index]}")
+
+    ok &= report("라벨 999개 거부", rejects(labels[:-1]))
+    ok &= report("순서가 밀린 라벨 거부", rejects(labels[1:] + labels[:1]))
+    return ok
+
+
+def check_templates(service: ImageClassifierService) -> bool:
+    """번들 템플릿(인물 사진) 통과 여부"""
+    templates = sorted(p for p in FACE_TEMPLATE_DIR.glob("*") if p.suffix.lower() in TEMPLATE_EXTENSIONS)
+    if not templates:
+        return report(f"번들 템플릿 없음 ({FACE_TEMPLATE_DIR})", False)
+
+    ok = True
+    for path in templates:
+        with Image.open(path) as image:
+            result = service.check_person_image(image.convert("RGB"))
+        top = ", ".join(f"{c['category_name']} {c['score']:.2f}" for c in result["top_categories"])
+        ok &= report(f"템플릿 {path.name} 인물 통과 (동물 확률 {result['animal_score']}, top: {top})", result["valid"])
+    return ok
+
+
+def main(args):
+    model_path, labels_path = Path(args.model), Path(args.labels)
+    ok = report(
+        f"인물 클래스 인덱스 범위 ({IMAGENET_ANIMAL_CLASS_END}~{IMAGENET_NUM_CLASSES - 1})",
+        all(IMAGENET_ANIMAL_CLASS_END <= i < IMAGENET_NUM_CLASSES for i in PERSON_CONTEXT_CLASS_INDICES)
+    )
+
+    missing = [str(p) for p in (model_path, labels_path) if not p.exists()]
+    if missing:
+        report(f"모델 / 라벨 파일 없음: {', '.join(missing)}", False)
+        sys.exit(1)
+
+    ok &= check_labels(labels_path)
+
+    service = ImageClassifierService(str(model_path), str(labels_path))
+    ok &= report("분류기 로드", service.is_initialized)
+    if service.is_initialized:
+        ok &= check_templates(service)
+
+    print("\n모든 검증 통과" if ok else "\n검증 실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 인물/동물 분류기 검증")
+    parser.add_argument("--model", default=IMAGE_CLASSIFIER_MODEL_PATH)
+    parser.add_argument("--labels", default=IMAGE_CLASSIFIER_LABELS_PATH)
+    main(parser.parse_args())
@@ -0,0 +1,121 @@
+"""
+presigned URL 이미지 전달 오프라인 검증 스크립트 (moto)
+
+IMAGE_DELIVERY_MODE=presigned로 services/image_delivery_service.py와 이미지 프록시 리다이렉트를 확인합니다.
+
+1. presigned URL로 객체 다운로드 (드레스 버킷, 로그 버킷)
+2. 만료 직전까지 같은 URL 재사용, 갱신 여유 이후 새 URL 서명
+3. /api/images, /api/admin/s3-image-proxy의 302 리다이렉트 (Location, Cache-Control)
+4. 목록 항목에 *_presigned_url 필드 추가
+
+사용법:
+    pip install "moto[s3]"
+    python utils/verify_image_delivery.py
+"""
+import os
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from moto import mock_aws
+except ImportError:
+    print("moto가 설치되어 있지 않습니다: pip install \"moto[s3]\"")
+    sys.exit(1)
+
+REGION = "ap-northeast-2"
+TEST_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_S3_BUCKET_NAME": "marryday-test-dresses",
+    "AWS_REGION": REGION,
+    "LOGS_AWS_ACCESS_KEY_ID": "testing-logs",
+    "LOGS_AWS_SECRET_ACCESS_KEY": "testing-logs",
+    "LOGS_AWS_S3_BUCKET_NAME": "marryday-test-logs",
+    "LOGS_AWS_REGION": REGION,
+    # 캐시 TTL = 4 - 2 = 2초
+    "IMAGE_DELIVERY_MODE": "presigned",
+    "IMAGE_PRESIGNED_URL_EXPIRES_SEC": "4",
+    "IMAGE_PRESIGNED_URL_REFRESH_MARGIN_SEC": "2"
+}
+
+
+def report(name: str, ok: bool) -> bool:
+    print(f"{name}: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+async def check_redirects(dress_url: str, log_url: str) -> bool:
+    """이미지 프록시 엔드포인트의 302 리다이렉트"""
+    import httpx
+    from fastapi import FastAPI
+    from routers import proxy
+
+    app = FastAPI()
+    app.include_router(proxy.router)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://verify") as client:
+        image = await client.get("/api/images/verify.png")
+        admin_log = await client.get("/api/admin/s3-image-proxy", params={"url": log_url})
+        admin_dress = await client.get("/api/admin/s3-image-proxy", params={"url": dress_url})
+
+    ok = True
+    for response in (image, admin_log, admin_dress):
+        location = response.headers.get("location", "")
+        ok &= response.status_code == 302 and "X-Amz-Signature=" in location
+        ok &= response.headers.get("cache-control", "").startswith("private, max-age=")
+    ok &= image.headers.get("access-control-allow-origin") == "*"
+    return report("프록시 302 리다이렉트", ok)
+
+
+@mock_aws
+def main():
+    os.environ.update(TEST_ENV)
+    import boto3
+    import requests
+    from core import s3_client
+    from services import image_delivery_service as delivery
+
+    for bucket in (TEST_ENV["AWS_S3_BUCKET_NAME"], TEST_ENV["LOGS_AWS_S3_BUCKET_NAME"]):
+        boto3.client("s3", region_name=REGION).create_bucket(
+            Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+
+    results = []
+    dress_url = s3_client.upload_to_s3(b"dress", "verify.png")
+    log_url = s3_client.upload_log_to_s3(b"log", "verify-model", "result")
+
+    # 1. presigned URL 다운로드
+    dress_presigned = delivery.presign_stored_url(dress_url)
+    log_presigned = delivery.presign_stored_url(log_url)
+    ok = requests.get(dress_presigned).content == b"dress" and requests.get(log_presigned).content == b"log"
+    ok &= delivery.presign_stored_url("https://example.com/dresses/verify.png") is None
+    results.append(report("presigned URL 다운로드", ok))
+
+    # 2. URL 캐시 (갱신 여유 전 재사용, 이후 새로 서명)
+    first = delivery.get_presigned_url(s3_client.S3_BUCKET_MAIN, "dresses/verify.png")
+    ok = first["url"] == dress_presigned and 0 <= first["max_age"] <= 2
+    time.sleep(2.1)
+    refreshed = delivery.get_presigned_url(s3_client.S3_BUCKET_MAIN, "dresses/verify.png")
+    ok &= refreshed["url"] != first["url"] and refreshed["expires_at"] > first["expires_at"]
+    results.append(report("presigned URL 캐시 / 만료 전 갱신", ok))
+
+    # 3. 리다이렉트
+    results.append(asyncio.run(check_redirects(dress_url, log_url)))
+
+    # 4. 목록 필드
+    row = delivery.add_presigned_urls({"result_url": log_url, "person_url": None}, ("result_url", "person_url"))
+    ok = row["result_presigned_url"].startswith("https://") and row["person_presigned_url"] is None
+    results.append(report("목록 presigned URL 필드", ok))
+
+    s3_client.shutdown_s3_io()
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+업로드 이미지 입력 검증 스크립트
+
+services/input_validation_service.py가 불량 입력을 기대한 에러 코드로 차단하고
+정상 입력(번들 템플릿, 흰 배경 + 흰 드레스 상품컷)은 통과시키는지 확인합니다.
+
+1. 잘린 JPEG → TRUNCATED
+2. 이미지가 아닌 바이트 → DECODE_FAILED
+3. 단색 이미지 → UNIFORM
+4. 작은 이미지 → TOO_SMALL
+5. 극단적인 비율 → EXTREME_ASPECT_RATIO
+6. 픽셀 수 상한 초과 → TOO_LARGE
+7. 흰 배경 + 흰 드레스 (garment) → 통과
+8. 번들 페이스스왑 템플릿 (face, body) → 통과
+
+사용법:
+    python utils/verify_input_validation.py
+"""
+import io
+import sys
+import warnings
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from services.input_validation_service import (  # noqa: E402
+    validate_image_bytes,
+    ERROR_TRUNCATED,
+    ERROR_DECODE_FAILED,
+    ERROR_UNIFORM,
+    ERROR_TOO_SMALL,
+    ERROR_EXTREME_ASPECT_RATIO,
+    ERROR_TOO_LARGE
+)
+from config.input_validation import INPUT_VALIDATION_MAX_PIXELS  # noqa: E402
+from config.face_swap import FACE_TEMPLATE_DIR  # noqa: E402
+
+TEMPLATE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+
+def encode(image: Image.Image, fmt: str = "JPEG") -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, fmt)
+    return buffer.getvalue()
+
+
+def textured_photo(width: int, height: int) -> Image.Image:
+    """그라데이션 + 노이즈 합성 사진 (품질 검사 통과용)"""
+    rng = np.random.default_rng(0)
+    x = np.linspace(40, 215, width, dtype=np.float32)
+    y = np.linspace(40, 215, height, dtype=np.float32)[:, None]
+    base = np.stack([x + 0 * y, y + 0 * x, (x + y) / 2], axis=-1)
+    noise = rng.normal(0, 20, (height, width, 3)).astype(np.float32)
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8), "RGB")
+
+
+def white_dress_on_white() -> Image.Image:
+    """흰 배경 위 흰 드레스 상품컷 (전체 밝기 표준편차 약 4)"""
+    image = Image.new("RGB", (768, 1024), (251, 251, 251))
+    draw = ImageDraw.Draw(image)
+    draw.polygon([(384, 120), (300, 300), (200, 950), (568, 950), (468, 300)],
+                 fill=(244, 243, 241), outline=(228, 227, 225))
+    for x in range(230, 540, 40):
+        draw.line([(x, 400), (x + 10, 940)], fill=(236, 235, 233), width=3)
+    return image.filter(ImageFilter.GaussianBlur(2))
+
+
+def build_cases():
+    """(이름, 바이트, 규칙 세트, 기대 에러 코드 또는 None)"""
+    photo = encode(textured_photo(800, 1000))
+    side = int((INPUT_VALIDATION_MAX_PIXELS * 1.05) ** 0.5) + 1
+    cases = [
+        ("정상 합성 사진", photo, "body", None),
+        ("잘린 JPEG", photo[:len(photo) // 2], "body", ERROR_TRUNCATED),
+        ("이미지가 아닌 바이트", np.random.default_rng(1).bytes(4096), "body", ERROR_DECODE_FAILED),
+        ("빈 파일", b"", "body", ERROR_DECODE_FAILED),
+        ("단색 이미지", encode(Image.new("RGB", (800, 800), (128, 128, 128))), "garment", ERROR_UNIFORM),
+        ("작은 이미지", encode(textured_photo(120, 160)), "body", ERROR_TOO_SMALL),
+        ("극단적인 비율", encode(textured_photo(2400, 400)), "body", ERROR_EXTREME_ASPECT_RATIO),
+        (f"픽셀 수 상한 초과 ({side}x{side})", encode(Image.new("L", (side, side), 128), "PNG"), "body", ERROR_TOO_LARGE),
+        ("흰 배경 + 흰 드레스", encode(white_dress_on_white(), "PNG"), "garment", None),
+    ]
+
+    templates = sorted(p for p in FACE_TEMPLATE_DIR.glob("*") if p.suffix.lower() in TEMPLATE_EXTENSIONS)
+    if not templates:
+        print(f"번들 템플릿 이미지가 없습니다: {FACE_TEMPLATE_DIR}")
+        sys.exit(1)
+    for path in templates:
+        data = path.read_bytes()
+        cases.append((f"번들 템플릿 {path.name} (face)", data, "face", None))
+        cases.append((f"번들 템플릿 {path.name} (body)", data, "body", None))
+    return cases
+
+
+def main():
+    # 픽셀 수 상한 초과 케이스는 Pillow 압축 폭탄 경고가 함께 발생 (검증 결과와 무관)
+    warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+    failed = 0
+    for name, data, rule_set, expected in build_cases():
+        result = validate_image_bytes(data, rule_set, "verify")
+        ok = result["error_code"] == expected
+        failed += not ok
+        codes = [reason["code"] for reason in result["reasons"]] or ["통과"]
+        print(f"{'OK' if ok else 'FAIL'}: {name} [{rule_set}] → {', '.join(codes)} "
+              f"(기대: {expected or '통과'}, {result['time_ms']}ms)")
+
+    print(f"\n실패 {failed}건" if failed else "\n모든 검증 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
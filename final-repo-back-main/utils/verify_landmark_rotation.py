@@ -0,0 +1,101 @@
+"""
+랜드마크 좌표 공간 방향 보정 검증 스크립트
+
+합성 전신 랜드마크를 0/90/180/270도 회전한 세트로 BodyAnalysisService.extract_landmark_array의
+방향 보정을 검증합니다. 포즈 API는 호출 횟수를 세는 가짜 서비스로 대체합니다.
+- visibility가 충분하면: 포즈 API 1회 호출, 좌표 회전 결과가 똑바로 선 랜드마크와 일치
+- visibility가 낮으면  : 이미지 회전 후 포즈 API 재호출 (2회)
+
+사용법:
+    python utils/verify_landmark_rotation.py
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.body_measurements import (  # noqa: E402
+    rotate_landmarks,
+    estimate_upright_rotation
+)
+from services.body_analysis_service import BodyAnalysisService  # noqa: E402
+from config.body_analysis import BODY_ORIENTATION_MIN_VISIBILITY  # noqa: E402
+
+
+def upright_landmarks(visibility: float) -> np.ndarray:
+    """정면으로 선 사람의 합성 랜드마크 (33, 4)"""
+    rng = np.random.default_rng(0)
+    array = np.zeros((33, 4), dtype=np.float32)
+    array[:, 0] = 0.5 + rng.uniform(-0.05, 0.05, 33)
+    array[:, 1] = np.linspace(0.1, 0.95, 33)
+    array[:, 2] = rng.uniform(-0.1, 0.1, 33)
+    array[:, 3] = visibility
+    # 어깨 / 엉덩이 / 무릎 / 발목 / 코 / 발
+    for idx, (x, y) in {
+        0: (0.5, 0.1), 11: (0.4, 0.25), 12: (0.6, 0.25), 23: (0.43, 0.55), 24: (0.57, 0.55),
+        25: (0.44, 0.72), 26: (0.56, 0.72), 27: (0.45, 0.9), 28: (0.55, 0.9), 31: (0.44, 0.95), 32: (0.56, 0.95)
+    }.items():
+        array[idx, :2] = (x, y)
+    return array
+
+
+class FakePoseLandmarkService:
+    """첫 호출에는 회전된 사진의 랜드마크, 재추론(회전 보정된 이미지)에는 똑바른 랜드마크를 반환"""
+
+    def __init__(self, first: np.ndarray, reinferred: np.ndarray):
+        self.responses = [first, reinferred]
+        self.is_initialized = True
+        self.calls = 0
+
+    def extract_landmark_array(self, image: Image.Image):
+        response = self.responses[min(self.calls, 1)]
+        self.calls += 1
+        return response
+
+
+def check(photo_rotation: int, visibility: float) -> bool:
+    """
+    photo_rotation: 사진이 똑바른 상태에서 반시계 방향으로 누운 각도
+    (보정하려면 시계 방향으로 같은 각도만큼 회전)
+    """
+    upright = upright_landmarks(visibility)
+    # 반시계 회전된 사진에서 모델이 반환할 좌표 = 똑바른 좌표를 반시계(= 360 - 각도 시계) 회전
+    rotated = rotate_landmarks(upright, (360 - photo_rotation) % 360)
+
+    upright_size = (300, 600)
+    photo_size = upright_size if photo_rotation in (0, 180) else upright_size[::-1]
+    pose = FakePoseLandmarkService(rotated, upright)
+
+    service = BodyAnalysisService.__new__(BodyAnalysisService)
+    service.pose_landmark_service = pose
+    service.is_initialized = True
+
+    result = service.extract_landmark_array(Image.new("RGB", photo_size), auto_correct_orientation=True)
+    error = float(np.abs(result[:, :2] - upright[:, :2]).max())
+    expected_calls = 1 if photo_rotation == 0 or visibility >= BODY_ORIENTATION_MIN_VISIBILITY else 2
+    ok = error < 1e-6 and pose.calls == expected_calls
+    print(
+        f"  사진 회전 {photo_rotation:3d}도, visibility {visibility:.1f} → "
+        f"추정 보정 {estimate_upright_rotation(rotated, photo_size):3d}도, "
+        f"포즈 호출 {pose.calls}회 (기대 {expected_calls}회), 좌표 오차 {error:.1e} {'OK' if ok else 'FAIL'}"
+    )
+    return ok
+
+
+def main():
+    print("=" * 60)
+    print("랜드마크 좌표 공간 방향 보정 검증")
+    print("=" * 60)
+    results = [check(rotation, visibility) for visibility in (0.9, 0.2) for rotation in (0, 90, 180, 270)]
+    print(f"결과: {sum(results)}/{len(results)} 통과")
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+마스크 업샘플링 경계 정확도 검증 스크립트
+
+core/mask_upsampling.py의 Guided Filter 업샘플링을 최근접 / 양선형 보간과 경계 IoU(Boundary IoU)로 비교합니다.
+원본 해상도 정답 마스크를 작업 해상도(SEGFORMER_WORKING_RESOLUTION)로 축소해 파싱 결과를 흉내 낸 뒤
+원본 크기로 복원합니다.
+
+1. 합성 이미지 (네트워크 / 모델 불필요)
+   - 대비가 큰 경계: 밝은 배경 위 어두운 드레스
+   - 밝기가 같은 색 경계: 녹색 배경 위 빨간 드레스 (그레이스케일 가이드로는 경계가 보이지 않음)
+2. --dataset 지정 시 레이블된 로컬 데이터셋 (eval_uniform_background.py와 같은 구조)
+    <dataset>/images/<name>.(jpg|png)
+    <dataset>/masks/<name>.png          # 정답 마스크 (흰색: 전경)
+
+합성 이미지에서 RGB 가이드의 경계 IoU가 최근접 보간과 그레이스케일 가이드 이상이 아니면 실패 처리합니다 (종료 코드 1).
+
+사용법:
+    python utils/verify_mask_upsampling.py [--dataset 데이터셋경로] [--dilation-ratio 0.005]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import cv2
+import numpy as np
+from PIL import Image
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.mask_upsampling import downscale_for_parsing, upsample_mask  # noqa: E402
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+METHODS = ("nearest", "bilinear", "guided_gray", "guided_rgb")
+
+
+def boundary_region(mask: np.ndarray, width: int) -> np.ndarray:
+    """마스크 경계에서 안쪽 width 픽셀 띠"""
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * width + 1, 2 * width + 1))
+    padded = cv2.copyMakeBorder(mask, 1, 1, 1, 1, cv2.BORDER_CONSTANT, value=0)
+    eroded = cv2.erode(padded, kernel)[1:-1, 1:-1]
+    return (mask > 127) & (eroded <= 127)
+
+
+def boundary_iou(pred: np.ndarray, target: np.ndarray, dilation_ratio: float) -> float:
+    """Boundary IoU (Cheng et al., 2021): 두 마스크 경계 띠의 IoU, 띠 너비는 대각선 길이 비율"""
+    height, width = target.shape
+    band = max(1, round(dilation_ratio * np.hypot(height, width)))
+    pred_band = boundary_region(pred, band)
+    target_band = boundary_region(target, band)
+    union = np.logical_or(pred_band, target_band).sum()
+    if union == 0:
+        return 1.0
+    return float(np.logical_and(pred_band, target_band).sum() / union)
+
+
+def simulate_parsing(mask: np.ndarray, image: Image.Image) -> np.ndarray:
+    """정답 마스크를 작업 해상도로 축소 (파싱 결과 대용)"""
+    low_w, low_h = downscale_for_parsing(image).size
+    low = cv2.resize(mask, (low_w, low_h), interpolation=cv2.INTER_AREA)
+    return (low >= 128).astype(np.uint8) * 255
+
+
+def upsample(method: str, low_mask: np.ndarray, image: Image.Image) -> np.ndarray:
+    size = image.size
+    if method == "nearest":
+        return cv2.resize(low_mask, size, interpolation=cv2.INTER_NEAREST)
+    if method == "bilinear":
+        resized = cv2.resize(low_mask, size, interpolation=cv2.INTER_LINEAR)
+        return (resized >= 128).astype(np.uint8) * 255
+    if method == "guided_gray":
+        return upsample_mask(low_mask, image.convert("L"))
+    return upsample_mask(low_mask, image.convert("RGB"))
+
+
+def synthetic_case(foreground, background, size=(1536, 2048), seed=0):
+    """물결 모양 드레스 실루엣 + 질감 노이즈 합성 이미지와 정답 마스크"""
+    width, height = size
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, 720, endpoint=False)
+    radius = 1 + 0.08 * np.sin(7 * angles) + 0.04 * np.sin(19 * angles + 1.0)
+    points = np.stack([
+        width / 2 + 0.32 * width * radius * np.cos(angles),
+        height / 2 + 0.42 * height * radius * np.sin(angles)
+    ], axis=1)
+
+    # 4배 해상도로 그린 뒤 축소해 안티앨리어싱 경계 생성
+    scale = 4
+    coverage = np.zeros((height * scale, width * scale), np.uint8)
+    cv2.fillPoly(coverage, [np.round(points * scale).astype(np.int32)], 255)
+    alpha = cv2.resize(coverage, size, interpolation=cv2.INTER_AREA).astype(np.float32) / 255.0
+
+    fg = np.array(foreground, np.float32)
+    bg = np.array(background, np.float32)
+    pixels = alpha[..., np.newaxis] * fg + (1 - alpha[..., np.newaxis]) * bg
+    pixels += rng.normal(0, 6, pixels.shape)
+    image = Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8), "RGB")
+    return image, (alpha >= 0.5).astype(np.uint8) * 255
+
+
+def evaluate(name: str, image: Image.Image, target: np.ndarray, dilation_ratio: float) -> dict:
+    low_mask = simulate_parsing(target, image)
+    scores = {}
+    for method in METHODS:
+        start = time.perf_counter()
+        pred = upsample(method, low_mask, image)
+        elapsed = (time.perf_counter() - start) * 1000
+        scores[method] = boundary_iou(pred, target, dilation_ratio)
+        print(f"  {name:<28} {method:<12} 경계 IoU {scores[method]:.4f}  ({elapsed:.1f} ms)")
+    return scores
+
+
+def load_dataset(dataset_dir: Path):
+    images_dir = dataset_dir / "images"
+    masks_dir = dataset_dir / "masks"
+    for image_path in sorted(p for p in images_dir.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS):
+        mask_path = masks_dir / f"{image_path.stem}.png"
+        if not mask_path.exists():
+            print(f"  {image_path.name}: 정답 마스크 없음, 건너뜀")
+            continue
+        image = Image.open(image_path).convert("RGB")
+        mask = np.asarray(Image.open(mask_path).convert("L").resize(image.size, Image.Resampling.NEAREST))
+        yield image_path.name, image, (mask > 127).astype(np.uint8) * 255
+
+
+def main(args):
+    print(f"경계 띠 너비: 대각선의 {args.dilation_ratio:.3%}")
+    print("합성 이미지")
+    contrast = evaluate("대비가 큰 경계", *synthetic_case((40, 40, 60), (235, 235, 230)), args.dilation_ratio)
+    isoluminant = evaluate("밝기가 같은 색 경계", *synthetic_case((200, 60, 60), (40, 140, 60), seed=1), args.dilation_ratio)
+
+    ok = True
+    for name, scores in (("대비가 큰 경계", contrast), ("밝기가 같은 색 경계", isoluminant)):
+        case_ok = scores["guided_rgb"] >= scores["nearest"] and scores["guided_rgb"] >= scores["guided_gray"] - 1e-3
+        ok &= case_ok
+        print(f"{name}: RGB 가이드 >= 최근접 / 그레이스케일 가이드 {'OK' if case_ok else 'FAIL'}")
+
+    if args.dataset:
+        print(f"\n데이터셋: {args.dataset}")
+        totals = {method: [] for method in METHODS}
+        for name, image, target in load_dataset(Path(args.dataset)):
+            for method, score in evaluate(name, image, target, args.dilation_ratio).items():
+                totals[method].append(score)
+        if totals["nearest"]:
+            print("평균 경계 IoU: " + ", ".join(f"{m} {np.mean(v):.4f}" for m, v in totals.items()))
+        else:
+            print("평가할 이미지가 없습니다 FAIL")
+            ok = False
+
+    print("\n모든 검증 통과" if ok else "\n검증 실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="마스크 업샘플링 경계 정확도 검증")
+    parser.add_argument("--dataset", default=None, help="images/ masks/ 구조의 레이블된 데이터셋 경로")
+    parser.add_argument("--dilation-ratio", type=float, default=0.005, help="경계 띠 너비 (대각선 길이 비율)")
+    main(parser.parse_args())
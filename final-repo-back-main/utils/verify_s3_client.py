@@ -0,0 +1,137 @@
+"""
+S3 클라이언트 오프라인 검증 스크립트 (moto)
+
+실제 AWS 대신 moto의 메모리 S3로 core/s3_client.py를 확인합니다.
+
+1. 자격 증명/리전별 클라이언트 재사용
+2. 업로드 / 다운로드 / 삭제 왕복 (드레스 버킷, 로그 버킷)
+3. S3_MULTIPART_THRESHOLD_MB 이상 객체의 멀티파트 업로드 (ETag에 파트 수 포함)
+4. 비동기 래퍼가 S3 전용 스레드 풀에서 실행되는지
+5. 내용 주소 로그 업로드 (같은 내용은 같은 키, 메모리 캐시 / HEAD로 업로드 생략)
+
+사용법:
+    pip install "moto[s3]"
+    python utils/verify_s3_client.py
+"""
+import os
+import sys
+import asyncio
+import threading
+from pathlib import Path
+
+# 프로젝트 루트를 import 경로에 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+try:
+    from moto import mock_aws
+except ImportError:
+    print("moto가 설치되어 있지 않습니다: pip install \"moto[s3]\"")
+    sys.exit(1)
+
+REGION = "ap-northeast-2"
+TEST_ENV = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_S3_BUCKET_NAME": "marryday-test-dresses",
+    "AWS_REGION": REGION,
+    "LOGS_AWS_ACCESS_KEY_ID": "testing-logs",
+    "LOGS_AWS_SECRET_ACCESS_KEY": "testing-logs",
+    "LOGS_AWS_S3_BUCKET_NAME": "marryday-test-logs",
+    "LOGS_AWS_REGION": REGION
+}
+
+
+def report(name: str, ok: bool) -> bool:
+    print(f"{name}: {'OK' if ok else 'FAIL'}")
+    return ok
+
+
+async def check_async(s3_client) -> bool:
+    """비동기 래퍼 동시 실행 (S3 전용 스레드 풀 사용 여부)"""
+    thread_names = set()
+
+    def current_thread_name():
+        thread_names.add(threading.current_thread().name)
+        return s3_client.get_s3_image("async.png")
+
+    s3_client.upload_to_s3(b"async", "async.png")
+    results = await asyncio.gather(*(s3_client.run_s3_io(current_thread_name) for _ in range(20)))
+    downloaded = await s3_client.get_s3_image_async("async.png")
+    deleted = await s3_client.delete_from_s3_async("async.png")
+    ok = all(r == b"async" for r in results) and downloaded == b"async" and deleted
+    ok &= all(name.startswith("s3-io") for name in thread_names)
+    return report(f"비동기 래퍼 (스레드 {len(thread_names)}개)", ok)
+
+
+def check_log_dedup(s3_client, logs_client) -> bool:
+    """같은 로그 이미지는 한 번만 업로드 (메모리 캐시 → HEAD → PUT)"""
+    before = s3_client.get_log_upload_metrics()
+    first = s3_client.upload_log_to_s3(b"same-person", "model-a", "person")
+    second = s3_client.upload_log_to_s3(b"same-person", "model-b", "person")
+    s3_client._log_exists_cache.clear()
+    third = s3_client.upload_log_to_s3(b"same-person", "model-c", "person")
+    other = s3_client.upload_log_to_s3(b"other-person", "model-a", "person")
+    after = s3_client.get_log_upload_metrics()
+
+    s3_key = first.split(".amazonaws.com/", 1)[1]
+    head = logs_client.head_object(Bucket=TEST_ENV["LOGS_AWS_S3_BUCKET_NAME"], Key=s3_key)
+    ok = first == second == third and other != first and "/logs/sha256/" in first
+    ok &= after["put"] - before["put"] == 2
+    ok &= after["skipped_cached"] - before["skipped_cached"] == 1
+    ok &= after["skipped_existing"] - before["skipped_existing"] == 1
+    ok &= head["Metadata"].get("model-id") == "model-a"
+    return report(f"내용 주소 로그 업로드 ({s3_key})", ok)
+
+
+@mock_aws
+def main():
+    os.environ.update(TEST_ENV)
+    import boto3
+    from core import s3_client
+
+    for bucket in (TEST_ENV["AWS_S3_BUCKET_NAME"], TEST_ENV["LOGS_AWS_S3_BUCKET_NAME"]):
+        boto3.client("s3", region_name=REGION).create_bucket(
+            Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": REGION}
+        )
+
+    results = []
+
+    # 1. 클라이언트 재사용
+    main_client, _ = s3_client.get_s3_client(s3_client.S3_BUCKET_MAIN)
+    logs_client, _ = s3_client.get_s3_client(s3_client.S3_BUCKET_LOGS)
+    results.append(report(
+        "클라이언트 재사용",
+        main_client is s3_client.get_s3_client(s3_client.S3_BUCKET_MAIN)[0] and main_client is not logs_client
+    ))
+
+    # 2. 왕복
+    url = s3_client.upload_to_s3(b"dress", "verify.png")
+    ok = url == f"https://{TEST_ENV['AWS_S3_BUCKET_NAME']}.s3.{REGION}.amazonaws.com/dresses/verify.png"
+    ok &= s3_client.get_s3_image("verify.png") == b"dress"
+    ok &= s3_client.delete_from_s3("verify.png") and s3_client.get_s3_image("verify.png") is None
+    log_url = s3_client.upload_log_to_s3(b"log", "verify-model", "result")
+    ok &= bool(log_url) and s3_client.get_logs_s3_image(log_url.split("/logs/", 1)[1]) == b"log"
+    results.append(report("업로드 / 다운로드 / 삭제", ok))
+
+    # 3. 멀티파트 업로드
+    threshold = s3_client._transfer_config.multipart_threshold
+    payload = os.urandom(threshold + 1024)
+    s3_client.upload_to_s3(payload, "large.bin", "application/octet-stream")
+    head = main_client.head_object(Bucket=TEST_ENV["AWS_S3_BUCKET_NAME"], Key="dresses/large.bin")
+    ok = "-" in head["ETag"] and s3_client.get_s3_image("large.bin") == payload
+    results.append(report(f"멀티파트 업로드 ({len(payload) // (1024 * 1024)}MB, ETag {head['ETag']})", ok))
+
+    # 4. 비동기 래퍼
+    results.append(asyncio.run(check_async(s3_client)))
+
+    # 5. 내용 주소 로그 업로드
+    results.append(check_log_dedup(s3_client, logs_client))
+    s3_client.shutdown_s3_io()
+
+    if not all(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()